@@ -1,21 +1,72 @@
+import os
 import sys
-import re
-from PyQt5.QtCore import Qt, QUrl, QRegExp
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget, QTableWidget, 
-                           QTableWidgetItem, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
+import time
+import logging
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QUrl, QSize, QTime, QTimer, QEvent, pyqtSignal
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget, QTableView, 
+                           QAbstractItemView, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
                            QLineEdit, QFormLayout, QComboBox, QSpinBox, QMessageBox, 
-                           QHeaderView, QDialog, QDialogButtonBox, QGroupBox)
-from PyQt5.QtGui import QPixmap, QRegExpValidator
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from sqlalchemy import create_engine
+                           QHeaderView, QDialog, QDialogButtonBox, QGroupBox, QFileDialog,
+                           QScrollArea, QInputDialog, QCheckBox, QTimeEdit)
+from PyQt5.QtGui import QPixmap, QStandardItemModel, QStandardItem
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from sqlalchemy.orm import sessionmaker
-from models import Video, Page, PageVideo, Config
+import repository
+import catalog_io
+import health_check
+import youtube
+import web_engine
+import schedule
+from settings import CONFIG_FIELDS
+from config_service import get_config_service
+from data_service import DataService
+from video_picker import VideoPicker
+from video_models import (VideoTableModel, VideoChoiceModel, COLUMNS as VIDEO_COLUMNS,
+                          THUMBNAIL_ROLE, column_for_key)
+from thumbnails import ThumbnailCache, ThumbnailDelegate
+
+logger = logging.getLogger("DreamBodyVideo.Admin")
+
+# 영상 목록 행 높이 (썸네일은 이 높이로 디코딩)
+VIDEO_ROW_HEIGHT = 40
+
+# 새 페이지의 기본 영상 칸 수
+DEFAULT_SLOT_COUNT = 3
+
+# 영상 분류 선택 항목
+EXERCISE_TYPES = ["근력", "유산소", "스트레칭", "유연성", "균형", "기타"]
+DIFFICULTIES = ["쉬움", "중간", "어려움"]
+
+
+# 영상 미리보기 높이
+PREVIEW_HEIGHT = 200
+
+# 모든 영상 다이얼로그가 함께 쓰는 미리보기 웹 뷰 (처음 미리보기를 요청할 때 생성)
+_preview_view = None
+
+
+def shared_preview_view(owner=None):
+    global _preview_view
+    if _preview_view is None or sip.isdeleted(_preview_view):
+        started = time.perf_counter()
+        web_engine.configure()
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        _preview_view = QWebEngineView(owner)
+        _preview_view.setFixedHeight(PREVIEW_HEIGHT)
+        _preview_view.hide()
+        logger.debug(f"미리보기 웹 뷰 생성: {(time.perf_counter() - started) * 1000:.1f}ms")
+    return _preview_view
 
 
 class AddEditVideoDialog(QDialog):
     def __init__(self, video=None, parent=None):
+        self._opened_at = time.perf_counter()
         super().__init__(parent)
         self.video = video
+        self.preview_view = None
+        self.network = None
+        self.thumbnail_video_id = None
         self.init_ui()
     
     def init_ui(self):
@@ -39,12 +90,12 @@ class AddEditVideoDialog(QDialog):
         
         # 운동 타입
         self.type_combo = QComboBox()
-        self.type_combo.addItems(["근력", "유산소", "스트레칭", "유연성", "균형", "기타"])
+        self.type_combo.addItems(EXERCISE_TYPES)
         form_layout.addRow("운동 타입:", self.type_combo)
         
         # 난이도
         self.difficulty_combo = QComboBox()
-        self.difficulty_combo.addItems(["쉬움", "중간", "어려움"])
+        self.difficulty_combo.addItems(DIFFICULTIES)
         form_layout.addRow("난이도:", self.difficulty_combo)
         
         # 영상 길이 레이아웃 (분:초)
@@ -85,9 +136,15 @@ class AddEditVideoDialog(QDialog):
         self.preview_btn.clicked.connect(self.load_preview)
         preview_layout.addWidget(self.preview_btn)
         
-        self.web_view = QWebEngineView()
-        self.web_view.setFixedHeight(200)
-        preview_layout.addWidget(self.web_view)
+        # 평소에는 썸네일만 표시하고, 웹 뷰는 미리보기를 요청할 때 붙임
+        self.thumbnail_label = QLabel("썸네일 없음")
+        self.thumbnail_label.setAlignment(Qt.AlignCenter)
+        self.thumbnail_label.setFixedHeight(PREVIEW_HEIGHT)
+        self.thumbnail_label.setStyleSheet("background-color: #222; color: #aaa;")
+        preview_layout.addWidget(self.thumbnail_label)
+        self.preview_layout = preview_layout
+        
+        self.url_edit.editingFinished.connect(self.show_thumbnail)
         
         layout.addWidget(preview_group)
         
@@ -99,27 +156,84 @@ class AddEditVideoDialog(QDialog):
         
         # 기존 데이터 로드
         if self.video:
-            self.url_edit.setText(self.video.url)
-            self.title_edit.setText(self.video.title)
+            self.url_edit.setText(self.video['url'])
+            self.title_edit.setText(self.video['title'])
             
             # 콤보박스 인덱스 설정
-            if self.video.exercise_type:
-                type_index = self.type_combo.findText(self.video.exercise_type)
+            if self.video['exercise_type']:
+                type_index = self.type_combo.findText(self.video['exercise_type'])
                 if type_index >= 0:
                     self.type_combo.setCurrentIndex(type_index)
             
-            if self.video.difficulty:
-                diff_index = self.difficulty_combo.findText(self.video.difficulty)
+            if self.video['difficulty']:
+                diff_index = self.difficulty_combo.findText(self.video['difficulty'])
                 if diff_index >= 0:
                     self.difficulty_combo.setCurrentIndex(diff_index)
             
-            if self.video.duration:
+            if self.video['duration']:
                 # 분과 초 분리
-                minutes = int(self.video.duration)
-                seconds = int((self.video.duration - minutes) * 60)
+                minutes = int(self.video['duration'])
+                seconds = int((self.video['duration'] - minutes) * 60)
                 
                 self.duration_min_spin.setValue(minutes)
                 self.duration_sec_spin.setValue(seconds)
+        
+        self.show_thumbnail()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._opened_at is not None:
+            logger.debug(f"영상 다이얼로그 표시: {(time.perf_counter() - self._opened_at) * 1000:.1f}ms")
+            self._opened_at = None
+    
+    def show_thumbnail(self):
+        video_id = youtube.extract_video_id(self.url_edit.text())
+        if video_id == self.thumbnail_video_id:
+            return
+        self.thumbnail_video_id = video_id
+        
+        if not video_id:
+            self.thumbnail_label.setPixmap(QPixmap())
+            self.thumbnail_label.setText("썸네일 없음")
+            return
+        
+        # 캐시된 썸네일은 바로 표시
+        path = youtube.thumbnail_cache_path(video_id)
+        if os.path.exists(path):
+            self.set_thumbnail(QPixmap(path))
+            return
+        
+        # 없으면 비동기로 내려받아 캐시에 저장
+        self.thumbnail_label.setText("썸네일 불러오는 중...")
+        if self.network is None:
+            self.network = QNetworkAccessManager(self)
+        reply = self.network.get(QNetworkRequest(QUrl(youtube.thumbnail_url(video_id))))
+        reply.finished.connect(lambda: self.on_thumbnail_downloaded(reply, video_id))
+    
+    def on_thumbnail_downloaded(self, reply, video_id):
+        reply.deleteLater()
+        if video_id != self.thumbnail_video_id:
+            return  # 그 사이 URL이 바뀜
+        
+        data = bytes(reply.readAll())
+        pixmap = QPixmap()
+        if reply.error() != QNetworkReply.NoError or not pixmap.loadFromData(data):
+            self.thumbnail_label.setText("썸네일 없음")
+            return
+        
+        try:
+            os.makedirs(youtube.CACHE_DIR, exist_ok=True)
+            with open(youtube.thumbnail_cache_path(video_id), 'wb') as fp:
+                fp.write(data)
+        except OSError as e:
+            logger.warning(f"썸네일 캐시 저장 실패: {e}")
+        self.set_thumbnail(pixmap)
+    
+    def set_thumbnail(self, pixmap):
+        if pixmap.isNull():
+            self.thumbnail_label.setText("썸네일 없음")
+            return
+        self.thumbnail_label.setPixmap(pixmap.scaledToHeight(PREVIEW_HEIGHT, Qt.SmoothTransformation))
     
     def load_preview(self):
         url = self.url_edit.text()
@@ -127,16 +241,35 @@ class AddEditVideoDialog(QDialog):
             return
         
         # YouTube URL을 임베드 URL로 변환
-        if "youtube.com/watch?v=" in url:
-            video_id = url.split("v=")[1].split("&")[0]
-            embed_url = f"https://www.youtube.com/embed/{video_id}"
-        elif "youtu.be/" in url:
-            video_id = url.split("youtu.be/")[1]
-            embed_url = f"https://www.youtube.com/embed/{video_id}"
-        else:
-            embed_url = url
+        video_id = youtube.extract_video_id(url)
+        embed_url = youtube.embed_url(video_id) if video_id else url
+        
+        # 공유 웹 뷰를 썸네일 자리에 붙임
+        if self.preview_view is None:
+            self.preview_view = shared_preview_view(self.parentWidget())
+            self.preview_layout.insertWidget(self.preview_layout.indexOf(self.thumbnail_label), self.preview_view)
+            self.thumbnail_label.hide()
+            self.preview_view.show()
+        
+        self.preview_view.setUrl(QUrl(embed_url))
+    
+    def release_preview(self):
+        # 다이얼로그와 함께 삭제되지 않도록 공유 웹 뷰를 떼어 냄
+        if self.preview_view is None:
+            return
+        view, self.preview_view = self.preview_view, None
+        if sip.isdeleted(view):
+            return
         
-        self.web_view.setUrl(QUrl(embed_url))
+        self.preview_layout.removeWidget(view)
+        view.setUrl(QUrl("about:blank"))  # 재생 중지
+        view.hide()
+        view.setParent(self.parentWidget())
+        self.thumbnail_label.show()
+    
+    def done(self, result):
+        self.release_preview()
+        super().done(result)
     
     def get_video_data(self):
         # 분과 초를 합쳐서 duration 계산 (분 단위로 저장)
@@ -153,11 +286,125 @@ class AddEditVideoDialog(QDialog):
         }
 
 
+class BulkEditDialog(QDialog):
+    """선택한 여러 영상의 운동 타입/난이도/길이를 한 번에 변경"""
+    
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"영상 일괄 수정 ({count}개)")
+        self.setMinimumWidth(400)
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("체크한 항목만 선택한 모든 영상에 적용됩니다."))
+        
+        form_layout = QFormLayout()
+        
+        self.type_check = QCheckBox("운동 타입:")
+        self.type_combo = QComboBox()
+        self.type_combo.addItems(EXERCISE_TYPES)
+        form_layout.addRow(self.type_check, self.type_combo)
+        
+        self.difficulty_check = QCheckBox("난이도:")
+        self.difficulty_combo = QComboBox()
+        self.difficulty_combo.addItems(DIFFICULTIES)
+        form_layout.addRow(self.difficulty_check, self.difficulty_combo)
+        
+        self.duration_check = QCheckBox("길이:")
+        duration_layout = QHBoxLayout()
+        self.duration_min_spin = QSpinBox()
+        self.duration_min_spin.setRange(0, 60)
+        self.duration_min_spin.setValue(5)
+        self.duration_min_spin.setSuffix(" 분")
+        duration_layout.addWidget(self.duration_min_spin)
+        self.duration_sec_spin = QSpinBox()
+        self.duration_sec_spin.setRange(0, 59)
+        self.duration_sec_spin.setSuffix(" 초")
+        duration_layout.addWidget(self.duration_sec_spin)
+        duration_layout.addStretch()
+        form_layout.addRow(self.duration_check, duration_layout)
+        
+        # 체크하지 않은 항목은 비활성화
+        for check, widgets in ((self.type_check, [self.type_combo]),
+                               (self.difficulty_check, [self.difficulty_combo]),
+                               (self.duration_check, [self.duration_min_spin, self.duration_sec_spin])):
+            for widget in widgets:
+                widget.setEnabled(False)
+                check.toggled.connect(widget.setEnabled)
+        
+        layout.addLayout(form_layout)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def get_changes(self):
+        changes = {}
+        if self.type_check.isChecked():
+            changes['exercise_type'] = self.type_combo.currentText()
+        if self.difficulty_check.isChecked():
+            changes['difficulty'] = self.difficulty_combo.currentText()
+        if self.duration_check.isChecked():
+            changes['duration'] = self.duration_min_spin.value() + self.duration_sec_spin.value() / 60.0
+        return changes
+
+
+class PageSlotRow(QWidget):
+    """페이지 할당 한 칸 (N번 영상 선택 + 표시 번호)"""
+    remove_requested = pyqtSignal(object)
+    
+    def __init__(self, order, choice_model, search_service, parent=None):
+        super().__init__(parent)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.order_label = QLabel()
+        self.order_label.setFixedWidth(60)
+        layout.addWidget(self.order_label)
+        
+        self.picker = VideoPicker(choice_model, search_service)
+        layout.addWidget(self.picker, 1)
+        
+        layout.addWidget(QLabel("표시 번호:"))
+        self.display_spin = QSpinBox()
+        self.display_spin.setRange(1, 99)
+        layout.addWidget(self.display_spin)
+        
+        remove_btn = QPushButton("삭제")
+        remove_btn.clicked.connect(lambda: self.remove_requested.emit(self))
+        layout.addWidget(remove_btn)
+        
+        self.set_order(order)
+    
+    def set_order(self, order):
+        self.order = order
+        self.order_label.setText(f"{order}번 영상:")
+
+
 class AdminWindow(QMainWindow):
     def __init__(self, engine):
         super().__init__()
         self.engine = engine
         self.session_maker = sessionmaker(bind=engine)
+        self.config_service = get_config_service(engine)
+        self.data_service = DataService(engine, self)
+        # 오래 걸리는 링크 검사(네트워크)는 별도 워커에서 실행하고, 결과 저장은 data_service에 넘겨
+        # DB 쓰기는 항상 하나의 워커에서만 하도록 함 (SQLite 쓰기 잠금 충돌 방지)
+        self.health_service = DataService(engine, self)
+        # 입력 중 검색은 읽기만 하므로 별도 워커에서 (가져오기 같은 긴 작업 뒤에 밀리지 않도록)
+        self.search_service = DataService(engine, self)
+        self.video_combos_loaded = False
+        self.pending_page_assignments = None
+        # 페이지 할당 편집 상태 (적용 전까지 페이지별로 보관했다가 한 번에 저장)
+        self.stored_assignments = {}  # page_id -> DB에 저장된 할당
+        self.page_edits = {}  # page_id -> 적용 대기 중인 할당
+        self.shown_page_id = None  # 현재 칸에 표시된 페이지
+        self.filling_slots = False
+        self.built_tabs = set()
+        self.workout_page = None
+        self.screen_launcher = None  # 모든 화면 실행 중인 ScreenLauncher
+        self.first_painted = False
         self.init_ui()
     
     def init_ui(self):
@@ -178,56 +425,124 @@ class AdminWindow(QMainWindow):
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
-        # 탭 위젯
+        # 페이지 목록 모델 (페이지 선택 콤보박스들이 공유)
+        self.pages_model = QStandardItemModel(self)
+        self.pages_loaded = False
+        
+        # 모든 영상 선택 칸이 공유하는 목록 모델 (페이지별 설정 탭을 열 때 채움)
+        self.video_choice_model = VideoChoiceModel(self)
+        
+        # 탭 위젯 (각 탭의 내용은 처음 열 때 구성)
         self.tabs = QTabWidget()
         
-        # 영상 목록 탭
         self.videos_tab = QWidget()
-        self.init_videos_tab()
-        self.tabs.addTab(self.videos_tab, "영상 목록")
-        
-        # 페이지별 설정 탭
         self.page_settings_tab = QWidget()
-        self.init_page_settings_tab()
-        self.tabs.addTab(self.page_settings_tab, "페이지별 설정")
-        
-        # 시스템 설정 탭
+        self.schedule_tab = QWidget()
         self.system_settings_tab = QWidget()
-        self.init_system_settings_tab()
+        self.tab_builders = {
+            self.videos_tab: self.init_videos_tab,
+            self.page_settings_tab: self.init_page_settings_tab,
+            self.schedule_tab: self.init_schedule_tab,
+            self.system_settings_tab: self.init_system_settings_tab,
+        }
+        self.tabs.addTab(self.videos_tab, "영상 목록")
+        self.tabs.addTab(self.page_settings_tab, "페이지별 설정")
+        self.tabs.addTab(self.schedule_tab, "편성표")
         self.tabs.addTab(self.system_settings_tab, "시스템 설정")
+        self.tabs.currentChanged.connect(lambda index: self.ensure_tab(self.tabs.widget(index)))
         
         main_layout.addWidget(self.tabs)
         
-        # 페이지 실행 버튼
+        # 페이지 실행 영역 (페이지 목록은 DB에서 생성)
         run_layout = QHBoxLayout()
         run_layout.addStretch()
         
-        self.run_page1_btn = QPushButton("1번 페이지 실행")
-        self.run_page1_btn.clicked.connect(lambda: self.run_page(1))
-        run_layout.addWidget(self.run_page1_btn)
+        run_layout.addWidget(QLabel("실행할 페이지:"))
+        self.run_page_combo = QComboBox()
+        self.run_page_combo.setModel(self.pages_model)
+        self.run_page_combo.setMinimumWidth(200)
+        run_layout.addWidget(self.run_page_combo)
         
-        self.run_page2_btn = QPushButton("2번 페이지 실행")
-        self.run_page2_btn.clicked.connect(lambda: self.run_page(2))
-        run_layout.addWidget(self.run_page2_btn)
+        self.run_page_btn = QPushButton("페이지 실행")
+        self.run_page_btn.setEnabled(False)
+        self.run_page_btn.clicked.connect(lambda: self.run_page(self.run_page_combo.currentData()))
+        run_layout.addWidget(self.run_page_btn)
         
-        self.run_page3_btn = QPushButton("3번 페이지 실행")
-        self.run_page3_btn.clicked.connect(lambda: self.run_page(3))
-        run_layout.addWidget(self.run_page3_btn)
+        # 화면마다 페이지 하나씩 별도 프로세스로 실행 (launcher.py)
+        self.run_screens_btn = QPushButton("모든 화면 실행")
+        self.run_screens_btn.setEnabled(False)
+        self.run_screens_btn.clicked.connect(self.toggle_screens)
+        run_layout.addWidget(self.run_screens_btn)
         
         run_layout.addStretch()
         main_layout.addLayout(run_layout)
+        
+    def event(self, event):
+        # 창을 먼저 그린 뒤 현재 탭 구성과 페이지 목록 로드
+        if event.type() == QEvent.Paint and not self.first_painted:
+            self.first_painted = True
+            QTimer.singleShot(0, self.on_first_shown)
+        return super().event(event)
+    
+    def on_first_shown(self):
+        self.ensure_tab(self.tabs.currentWidget())
+        
+        # 페이지 목록 로드 (페이지별 설정 탭과 실행 영역이 공유)
+        self.load_pages()
+    
+    def is_tab_built(self, tab):
+        return tab in self.built_tabs
+    
+    def ensure_tab(self, tab):
+        if tab is None or tab in self.built_tabs:
+            return
+        
+        started = time.perf_counter()
+        self.built_tabs.add(tab)
+        self.tab_builders[tab]()
+        logger.debug(f"탭 구성 ({self.tabs.tabText(self.tabs.indexOf(tab))}): {(time.perf_counter() - started) * 1000:.1f}ms")
     
     def init_videos_tab(self):
         layout = QVBoxLayout(self.videos_tab)
         
-        # 테이블 위젯
-        self.videos_table = QTableWidget()
-        self.videos_table.setColumnCount(6)
-        self.videos_table.setHorizontalHeaderLabels(["ID", "제목", "URL", "운동 타입", "난이도", "길이(분:초)"])
-        self.videos_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.videos_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        # 테이블 뷰 (스크롤 시 페이지 단위로 가져오는 모델)
+        self.video_model = VideoTableModel(self.data_service, parent=self)
+        self.video_model.loading_changed.connect(self.on_video_loading_changed)
+        self.video_model.total_changed.connect(self.update_video_status)
+        self.video_model.rowsInserted.connect(self.update_video_status)
+        self.video_model.rowsRemoved.connect(self.update_video_status)
+        
+        self.videos_table = QTableView()
+        self.videos_table.setModel(self.video_model)
+        self.videos_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.videos_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.videos_table.doubleClicked.connect(lambda index: self.edit_video())
+        self.videos_table.selectionModel().selectionChanged.connect(self.update_video_status)
+        
+        # 셀 내용을 측정하지 않도록 열 너비와 행 높이를 고정
+        header = self.videos_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, (_, key, width) in enumerate(VIDEO_COLUMNS):
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(column_for_key('url'), QHeaderView.Stretch)
+        self.videos_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.videos_table.verticalHeader().setDefaultSectionSize(VIDEO_ROW_HEIGHT)
+        self.videos_table.verticalHeader().hide()
+        
+        # 썸네일 열 (보이는 행만 비동기로 로드, 행 높이에 맞춰 디코딩)
+        thumbnail_height = VIDEO_ROW_HEIGHT - 4
+        self.thumbnail_cache = ThumbnailCache(QSize(thumbnail_height * 16 // 9, thumbnail_height), parent=self)
+        self.thumbnail_cache.thumbnail_ready.connect(lambda _video_id: self.videos_table.viewport().update())
+        self.videos_table.setItemDelegateForColumn(
+            column_for_key('thumbnail'), ThumbnailDelegate(self.thumbnail_cache, THUMBNAIL_ROLE, self.videos_table)
+        )
         layout.addWidget(self.videos_table)
         
+        # 로딩 상태 표시
+        self.video_status_label = QLabel("")
+        self.video_status_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.video_status_label)
+        
         # 버튼 레이아웃
         button_layout = QHBoxLayout()
         
@@ -247,6 +562,21 @@ class AdminWindow(QMainWindow):
         self.refresh_video_btn.clicked.connect(self.load_videos)
         button_layout.addWidget(self.refresh_video_btn)
         
+        button_layout.addStretch()
+        
+        self.import_videos_btn = QPushButton("목록 가져오기")
+        self.import_videos_btn.clicked.connect(self.import_videos)
+        button_layout.addWidget(self.import_videos_btn)
+        
+        self.export_videos_btn = QPushButton("목록 내보내기")
+        self.export_videos_btn.clicked.connect(self.export_videos)
+        button_layout.addWidget(self.export_videos_btn)
+        
+        self.health_check_btn = QPushButton("링크 검사")
+        self.health_check_btn.setToolTip("선택한 영상(선택이 없으면 전체)이 재생 가능한지 확인합니다.")
+        self.health_check_btn.clicked.connect(self.check_video_links)
+        button_layout.addWidget(self.health_check_btn)
+        
         layout.addLayout(button_layout)
         
         # 초기 데이터 로드
@@ -261,114 +591,176 @@ class AdminWindow(QMainWindow):
         page_select_layout.addWidget(QLabel("페이지 선택:"))
         
         self.page_combo = QComboBox()
-        self.load_pages()
+        self.page_combo.setModel(self.pages_model)
+        self.page_combo.setMinimumWidth(200)
         self.page_combo.currentIndexChanged.connect(self.load_page_videos)
         page_select_layout.addWidget(self.page_combo)
         
+        self.add_page_btn = QPushButton("페이지 추가")
+        self.add_page_btn.clicked.connect(self.add_page)
+        page_select_layout.addWidget(self.add_page_btn)
+        
+        self.rename_page_btn = QPushButton("이름 변경")
+        self.rename_page_btn.clicked.connect(self.rename_page)
+        page_select_layout.addWidget(self.rename_page_btn)
+        
+        self.delete_page_btn = QPushButton("페이지 삭제")
+        self.delete_page_btn.clicked.connect(self.delete_page)
+        page_select_layout.addWidget(self.delete_page_btn)
+        
         page_select_layout.addStretch()
         
         layout.addLayout(page_select_layout)
         
-        # 페이지에 할당된 영상 영역
-        assignments_group = QGroupBox("페이지에 할당된 영상 (3개)")
-        assignments_layout = QVBoxLayout(assignments_group)
-        
-        # 1번 영상 할당
-        self.video1_layout = QHBoxLayout()
-        self.video1_layout.addWidget(QLabel("1번 영상:"))
-        self.video1_combo = QComboBox()
-        self.video1_layout.addWidget(self.video1_combo, 1)
-        
-        # 1번 영상 표시 번호
-        self.video1_layout.addWidget(QLabel("표시 번호:"))
-        self.display_num1_spin = QSpinBox()
-        self.display_num1_spin.setRange(1, 99)
-        self.display_num1_spin.setValue(1)
-        self.video1_layout.addWidget(self.display_num1_spin)
-        
-        assignments_layout.addLayout(self.video1_layout)
-        
-        # 2번 영상 할당
-        self.video2_layout = QHBoxLayout()
-        self.video2_layout.addWidget(QLabel("2번 영상:"))
-        self.video2_combo = QComboBox()
-        self.video2_layout.addWidget(self.video2_combo, 1)
-        
-        # 2번 영상 표시 번호
-        self.video2_layout.addWidget(QLabel("표시 번호:"))
-        self.display_num2_spin = QSpinBox()
-        self.display_num2_spin.setRange(1, 99)
-        self.display_num2_spin.setValue(2)
-        self.video2_layout.addWidget(self.display_num2_spin)
-        
-        assignments_layout.addLayout(self.video2_layout)
-        
-        # 3번 영상 할당
-        self.video3_layout = QHBoxLayout()
-        self.video3_layout.addWidget(QLabel("3번 영상:"))
-        self.video3_combo = QComboBox()
-        self.video3_layout.addWidget(self.video3_combo, 1)
-        
-        # 3번 영상 표시 번호
-        self.video3_layout.addWidget(QLabel("표시 번호:"))
-        self.display_num3_spin = QSpinBox()
-        self.display_num3_spin.setRange(1, 99)
-        self.display_num3_spin.setValue(3)
-        self.video3_layout.addWidget(self.display_num3_spin)
-        
-        assignments_layout.addLayout(self.video3_layout)
-        
-        layout.addWidget(assignments_group)
+        # 페이지에 할당된 영상 영역 (칸 수는 페이지마다 다름)
+        self.assignments_group = QGroupBox("페이지에 할당된 영상")
+        group_layout = QVBoxLayout(self.assignments_group)
+        
+        slots_widget = QWidget()
+        self.slots_layout = QVBoxLayout(slots_widget)
+        self.slots_layout.setContentsMargins(0, 0, 0, 0)
+        self.slots_layout.addStretch()
+        self.slot_rows = []
+        
+        slots_scroll = QScrollArea()
+        slots_scroll.setWidgetResizable(True)
+        slots_scroll.setFrameShape(QScrollArea.NoFrame)
+        slots_scroll.setWidget(slots_widget)
+        group_layout.addWidget(slots_scroll)
+        
+        self.add_slot_btn = QPushButton("영상 칸 추가")
+        self.add_slot_btn.clicked.connect(lambda: self.add_slot_row())
+        group_layout.addWidget(self.add_slot_btn, 0, Qt.AlignLeft)
+        
+        layout.addWidget(self.assignments_group, 1)
         
         # 설명 추가
-        help_label = QLabel("※ 표시 번호는 영상 앞에 표시될 번호입니다. 실제 재생 순서는 왼쪽의 '1번, 2번, 3번' 지정에 의해 결정됩니다.")
+        help_label = QLabel("※ 표시 번호는 영상 앞에 표시될 번호입니다. 실제 재생 순서는 왼쪽의 'N번 영상' 순서에 의해 결정됩니다.")
         help_label.setStyleSheet("color: #666; font-style: italic;")
         layout.addWidget(help_label)
         
-        # 저장 버튼
+        # 저장 버튼 (여러 페이지의 변경 사항을 한 번에 적용)
         save_layout = QHBoxLayout()
+        
+        self.page_edits_label = QLabel()
+        self.page_edits_label.setStyleSheet("color: #c60;")
+        save_layout.addWidget(self.page_edits_label)
         save_layout.addStretch()
         
-        self.save_page_btn = QPushButton("페이지 설정 저장")
+        self.discard_page_btn = QPushButton("변경 취소")
+        self.discard_page_btn.clicked.connect(self.discard_page_edits)
+        save_layout.addWidget(self.discard_page_btn)
+        
+        self.save_page_btn = QPushButton("변경 사항 적용")
         self.save_page_btn.clicked.connect(self.save_page_settings)
         save_layout.addWidget(self.save_page_btn)
         
-        save_layout.addStretch()
         layout.addLayout(save_layout)
+        self.update_page_edits_label()
         
-        # 영상 콤보박스 초기화
+        # 영상 선택 목록 초기화 (페이지 할당 정보는 페이지 목록 로드 후 불러옴)
         self.load_video_combos()
-        
-        # 초기 페이지 영상 로드
-        if self.page_combo.count() > 0:
+        if self.pages_loaded:
+            self.page_combo.blockSignals(True)
+            self.page_combo.setCurrentIndex(max(self.run_page_combo.currentIndex(), 0))
+            self.page_combo.blockSignals(False)
             self.load_page_videos()
     
+    def init_schedule_tab(self):
+        layout = QVBoxLayout(self.schedule_tab)
+        
+        # 편성 목록 (요일, 시작 시각 순)
+        self.schedule_model = QStandardItemModel(self)
+        self.schedule_model.setHorizontalHeaderLabels(["요일", "시작", "종료", "페이지", "우선순위"])
+        
+        self.schedule_table = QTableView()
+        self.schedule_table.setModel(self.schedule_model)
+        self.schedule_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.schedule_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.schedule_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.schedule_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.schedule_table.verticalHeader().hide()
+        layout.addWidget(self.schedule_table, 1)
+        
+        # 현재 편성 표시
+        self.schedule_status_label = QLabel("")
+        self.schedule_status_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.schedule_status_label)
+        
+        # 편성 추가 영역
+        add_group = QGroupBox("편성 추가")
+        add_layout = QHBoxLayout(add_group)
+        
+        add_layout.addWidget(QLabel("요일:"))
+        self.schedule_days_combo = QComboBox()
+        for name, weekdays in schedule.WEEKDAY_PRESETS.items():
+            self.schedule_days_combo.addItem(name, list(weekdays))
+        for weekday, name in enumerate(schedule.WEEKDAY_NAMES):
+            self.schedule_days_combo.addItem(f"{name}요일", [weekday])
+        add_layout.addWidget(self.schedule_days_combo)
+        
+        add_layout.addWidget(QLabel("시간:"))
+        self.schedule_start_edit = QTimeEdit(QTime(6, 0))
+        self.schedule_start_edit.setDisplayFormat("HH:mm")
+        add_layout.addWidget(self.schedule_start_edit)
+        add_layout.addWidget(QLabel("~"))
+        self.schedule_end_edit = QTimeEdit(QTime(7, 0))
+        self.schedule_end_edit.setDisplayFormat("HH:mm")
+        add_layout.addWidget(self.schedule_end_edit)
+        
+        add_layout.addWidget(QLabel("페이지:"))
+        self.schedule_page_combo = QComboBox()
+        self.schedule_page_combo.setModel(self.pages_model)
+        self.schedule_page_combo.setMinimumWidth(200)
+        add_layout.addWidget(self.schedule_page_combo)
+        
+        add_layout.addWidget(QLabel("우선순위:"))
+        self.schedule_priority_spin = QSpinBox()
+        self.schedule_priority_spin.setRange(0, 99)
+        self.schedule_priority_spin.setToolTip("시간이 겹치면 높은 값의 편성이 재생됩니다.")
+        add_layout.addWidget(self.schedule_priority_spin)
+        
+        add_layout.addStretch()
+        
+        self.add_schedule_btn = QPushButton("편성 추가")
+        self.add_schedule_btn.clicked.connect(self.add_schedule)
+        add_layout.addWidget(self.add_schedule_btn)
+        
+        layout.addWidget(add_group)
+        
+        # 설명 및 삭제 버튼
+        bottom_layout = QHBoxLayout()
+        
+        help_label = QLabel("※ 종료 시각이 시작 시각보다 이르면 다음 날 종료됩니다. 편성표는 키오스크 모드(kiosk.py --schedule)에서 적용됩니다.")
+        help_label.setStyleSheet("color: #666; font-style: italic;")
+        bottom_layout.addWidget(help_label)
+        bottom_layout.addStretch()
+        
+        self.delete_schedule_btn = QPushButton("선택 편성 삭제")
+        self.delete_schedule_btn.clicked.connect(self.delete_schedules)
+        bottom_layout.addWidget(self.delete_schedule_btn)
+        
+        layout.addLayout(bottom_layout)
+        
+        # 편성 목록 로드
+        self.schedule_zone = schedule.local_zone()
+        self.load_schedules()
+    
     def init_system_settings_tab(self):
         layout = QVBoxLayout(self.system_settings_tab)
         
         settings_group = QGroupBox("시스템 설정")
         settings_form = QFormLayout(settings_group)
         
-        # 설정 필드
-        self.initial_delay_spin = QSpinBox()
-        self.initial_delay_spin.setRange(1, 10)
-        self.initial_delay_spin.setSuffix(" 초")
-        settings_form.addRow("시작 후 확대까지 대기 시간:", self.initial_delay_spin)
-        
-        self.zoom_duration_spin = QSpinBox()
-        self.zoom_duration_spin.setRange(10, 300)
-        self.zoom_duration_spin.setSuffix(" 초")
-        settings_form.addRow("확대 상태 지속 시간:", self.zoom_duration_spin)
-        
-        self.transition_duration_spin = QSpinBox()
-        self.transition_duration_spin.setRange(1, 5)
-        self.transition_duration_spin.setSuffix(" 초")
-        settings_form.addRow("확대/축소 애니메이션 지속 시간:", self.transition_duration_spin)
-        
-        self.volume_spin = QSpinBox()
-        self.volume_spin.setRange(0, 100)
-        self.volume_spin.setSuffix(" %")
-        settings_form.addRow("기본 볼륨:", self.volume_spin)
+        # 설정 필드 (settings.CONFIG_FIELDS에서 생성)
+        self.setting_spins = {}
+        for field in CONFIG_FIELDS:
+            spin = QSpinBox()
+            spin.setRange(field.minimum, field.maximum)
+            spin.setSuffix(field.suffix)
+            spin.setToolTip(field.description)
+            settings_form.addRow(field.label, spin)
+            self.setting_spins[field.key] = spin
         
         layout.addWidget(settings_group)
         
@@ -387,316 +779,789 @@ class AdminWindow(QMainWindow):
         self.load_system_settings()
     
     def load_videos(self):
-        # 세션 생성
-        session = self.session_maker()
-        
-        # 모든 비디오 가져오기
-        videos = session.query(Video).all()
-        
-        # 테이블 설정
-        self.videos_table.setRowCount(len(videos))
-        
-        # 데이터 표시
-        for i, video in enumerate(videos):
-            self.videos_table.setItem(i, 0, QTableWidgetItem(str(video.id)))
-            self.videos_table.setItem(i, 1, QTableWidgetItem(video.title))
-            self.videos_table.setItem(i, 2, QTableWidgetItem(video.url))
-            self.videos_table.setItem(i, 3, QTableWidgetItem(video.exercise_type or ""))
-            self.videos_table.setItem(i, 4, QTableWidgetItem(video.difficulty or ""))
-            
-            # 길이를 분:초 형식으로 표시
-            if video.duration is not None:
-                minutes = int(video.duration)
-                seconds = int((video.duration - minutes) * 60)
-                duration_text = f"{minutes}:{seconds:02d}"
-            else:
-                duration_text = ""
-            self.videos_table.setItem(i, 5, QTableWidgetItem(duration_text))
-        
-        # 테이블 크기 조정
-        self.videos_table.resizeColumnsToContents()
+        # 첫 페이지만 가져오고 나머지는 스크롤할 때 가져옴
+        self.video_model.refresh()
+    
+    def on_video_loading_changed(self, loading):
+        self.refresh_video_btn.setEnabled(not loading)
+        self.update_video_status()
+    
+    def update_video_status(self, *args):
+        loaded = self.video_model.rowCount()
+        total = self.video_model.total
+        
+        if self.video_model.is_loading() and loaded == 0:
+            text = "영상 목록을 불러오는 중..."
+        elif total is None:
+            text = f"{loaded}개 표시 중"
+        else:
+            text = f"전체 {total}개 중 {loaded}개 표시 중"
         
-        # 세션 종료
-        session.close()
+        selected = len(self.videos_table.selectionModel().selectedRows())
+        if selected > 1:
+            text += f" · {selected}개 선택됨"
+        self.video_status_label.setText(text)
+    
+    def on_data_error(self, error):
+        if self.is_tab_built(self.page_settings_tab):
+            self.save_page_btn.setEnabled(True)
+        QMessageBox.critical(self, "오류", f"데이터베이스 작업에 실패했습니다.\n{error}")
+    
+    def selected_video_records(self):
+        rows = sorted(index.row() for index in self.videos_table.selectionModel().selectedRows())
+        return [self.video_model.record(row) for row in rows]
     
     def add_video(self):
         dialog = AddEditVideoDialog(parent=self)
         if dialog.exec_() == QDialog.Accepted:
             video_data = dialog.get_video_data()
             
-            session = self.session_maker()
-            new_video = Video(
-                title=video_data['title'],
-                url=video_data['url'],
-                exercise_type=video_data['exercise_type'],
-                difficulty=video_data['difficulty'],
-                duration=video_data['duration']
+            self.data_service.submit(
+                repository.add_video, video_data,
+                on_result=self.on_video_added,
+                on_error=self.on_data_error
             )
-            
-            session.add(new_video)
-            session.commit()
-            session.close()
-            
-            # 테이블 새로고침
-            self.load_videos()
-            self.load_video_combos()
     
     def edit_video(self):
-        selected_items = self.videos_table.selectedItems()
-        if not selected_items:
+        videos = self.selected_video_records()
+        if not videos:
             QMessageBox.warning(self, "경고", "수정할 영상을 선택해주세요.")
             return
-        
-        # 선택된 행의 ID 열 텍스트 가져오기
-        row = selected_items[0].row()
-        video_id = int(self.videos_table.item(row, 0).text())
-        
-        session = self.session_maker()
-        video = session.query(Video).filter_by(id=video_id).first()
-        
-        if not video:
-            QMessageBox.warning(self, "오류", "선택한 영상을 찾을 수 없습니다.")
-            session.close()
+        if len(videos) > 1:
+            self.bulk_edit_videos(videos)
             return
         
+        video = videos[0]
         dialog = AddEditVideoDialog(video, parent=self)
         if dialog.exec_() == QDialog.Accepted:
             video_data = dialog.get_video_data()
             
-            video.title = video_data['title']
-            video.url = video_data['url']
-            video.exercise_type = video_data['exercise_type']
-            video.difficulty = video_data['difficulty']
-            video.duration = video_data['duration']
-            
-            session.commit()
+            self.data_service.submit(
+                repository.update_video, video['id'], video_data,
+                on_result=self.on_video_updated,
+                on_error=self.on_data_error
+            )
+    
+    def bulk_edit_videos(self, videos):
+        dialog = BulkEditDialog(len(videos), parent=self)
+        if dialog.exec_() != QDialog.Accepted:
+            return
         
-        session.close()
+        changes = dialog.get_changes()
+        if not changes:
+            return
         
-        # 테이블 새로고침
-        self.load_videos()
-        self.load_video_combos()
+        # 하나의 UPDATE ... WHERE id IN (...) 으로 처리
+        self.data_service.submit(
+            repository.bulk_update_videos, [video['id'] for video in videos], changes,
+            on_result=self.video_model.update_records,
+            on_error=self.on_data_error
+        )
     
     def delete_video(self):
-        selected_items = self.videos_table.selectedItems()
-        if not selected_items:
+        videos = self.selected_video_records()
+        if not videos:
             QMessageBox.warning(self, "경고", "삭제할 영상을 선택해주세요.")
             return
         
-        # 선택된 행의 ID 열 텍스트 가져오기
-        row = selected_items[0].row()
-        video_id = int(self.videos_table.item(row, 0).text())
-        title = self.videos_table.item(row, 1).text()
-        
+        target = f"'{videos[0]['title']}' 영상을" if len(videos) == 1 else f"선택한 영상 {len(videos)}개를"
         reply = QMessageBox.question(
             self, "영상 삭제 확인", 
-            f"'{title}' 영상을 정말 삭제하시겠습니까?\n\n"
+            f"{target} 정말 삭제하시겠습니까?\n\n"
             "이 영상이 페이지에 할당되어 있다면, 해당 할당도 함께 삭제됩니다.",
             QMessageBox.Yes | QMessageBox.No, 
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            session = self.session_maker()
-            
-            # 먼저 페이지 할당 삭제
-            session.query(PageVideo).filter_by(video_id=video_id).delete()
-            
-            # 영상 삭제
-            session.query(Video).filter_by(id=video_id).delete()
+            self.data_service.submit(
+                repository.delete_videos, [video['id'] for video in videos],
+                on_result=self.on_videos_deleted,
+                on_error=self.on_data_error
+            )
+    
+    def set_catalog_io_busy(self, busy):
+        self.import_videos_btn.setEnabled(not busy)
+        self.export_videos_btn.setEnabled(not busy)
+    
+    def import_videos(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "영상 목록 가져오기", "", "영상 목록 (*.csv *.jsonl *.ndjson *.json)"
+        )
+        if not path:
+            return
+        
+        self.set_catalog_io_busy(True)
+        self.video_status_label.setText("가져오는 중...")
+        
+        def on_progress(done, total):
+            self.video_status_label.setText(f"가져오는 중... {done}개 처리")
+        
+        def on_imported(stats):
+            self.set_catalog_io_busy(False)
+            self.load_videos()
+            if self.is_tab_built(self.page_settings_tab):
+                self.load_video_combos()
             
-            session.commit()
-            session.close()
+            message = (f"추가: {stats['inserted']}개\n중복(건너뜀): {stats['duplicates']}개\n"
+                       f"오류: {stats['invalid']}개")
+            if stats['errors']:
+                message += "\n\n" + "\n".join(stats['errors'][:5])
+            QMessageBox.information(self, "가져오기 완료", message)
+        
+        def on_failed(error):
+            self.set_catalog_io_busy(False)
+            self.on_data_error(error)
+        
+        self.data_service.submit(
+            catalog_io.import_file, path,
+            on_result=on_imported,
+            on_error=on_failed,
+            on_progress=on_progress
+        )
+    
+    def export_videos(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "영상 목록 내보내기", "videos.csv", "CSV (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not path:
+            return
+        
+        self.set_catalog_io_busy(True)
+        
+        def on_progress(done, total):
+            self.video_status_label.setText(f"내보내는 중... {done}개")
+        
+        def on_exported(count):
+            self.set_catalog_io_busy(False)
+            self.update_video_status()
+            QMessageBox.information(self, "내보내기 완료", f"{count}개 영상을 저장했습니다.\n{path}")
+        
+        def on_failed(error):
+            self.set_catalog_io_busy(False)
+            self.on_data_error(error)
+        
+        self.data_service.submit(
+            catalog_io.export_file, path,
+            on_result=on_exported,
+            on_error=on_failed,
+            on_progress=on_progress
+        )
+    
+    def check_video_links(self):
+        video_ids = [video['id'] for video in self.selected_video_records()] or None
+        self.health_check_btn.setEnabled(False)
+        self.health_check_btn.setText("링크 검사 중...")
+        
+        def on_progress(done, total):
+            self.health_check_btn.setText(f"링크 검사 중... {done}/{total}")
+        
+        def on_checked(stats):
+            self.health_check_btn.setEnabled(True)
+            self.health_check_btn.setText("링크 검사")
+            self.load_videos()
             
-            # 테이블 새로고침
+            message = (f"검사: {stats['checked']}개\n정상: {stats['ok']}개\n"
+                       f"재생 불가: {stats['broken']}개\n확인 실패: {stats['error']}개")
+            if stats['broken_ids']:
+                message += "\n\n재생 불가 영상 ID: " + ", ".join(map(str, stats['broken_ids'][:20]))
+            QMessageBox.information(self, "링크 검사 완료", message)
+        
+        def on_failed(error):
+            self.health_check_btn.setEnabled(True)
+            self.health_check_btn.setText("링크 검사")
+            self.on_data_error(error)
+        
+        def on_results(results):
+            # 결과 저장은 data_service 큐에서 (완료 후 load_videos도 같은 큐에 들어가므로 저장된 뒤에 읽음)
+            self.data_service.submit(health_check.save_results, results, on_error=self.on_data_error)
+        
+        self.health_service.submit(
+            health_check.check_videos, video_ids,
+            on_result=on_checked,
+            on_error=on_failed,
+            on_progress=on_progress,
+            on_partial=on_results
+        )
+    
+    def on_video_added(self, record):
+        # 추가된 행만 모델에 반영
+        self.video_model.insert_record(record)
+        self.video_choice_model.upsert_choice(record)
+    
+    def on_video_updated(self, record):
+        if record is None:
+            QMessageBox.warning(self, "오류", "선택한 영상을 찾을 수 없습니다.")
             self.load_videos()
-            self.load_video_combos()
+            return
+        
+        self.video_model.update_record(record)
+        self.video_choice_model.upsert_choice(record)
+    
+    def on_videos_deleted(self, result):
+        deleted = result['deleted']
+        if not deleted:
+            return
+        
+        # 삭제된 영상을 참조하던 적용 대기 편집은 더 이상 저장할 수 없으므로 버림
+        deleted_ids = set(deleted)
+        dropped = [page_id for page_id, assignments in self.page_edits.items()
+                   if any(a['video_id'] in deleted_ids for a in assignments)]
+        for page_id in dropped:
+            del self.page_edits[page_id]
+        self.update_page_edits_label()
+        
+        # 현재 페이지의 할당이 바뀌었다면 선택 목록에서 빠지는 것을 편집으로 보지 않도록 한 뒤 다시 불러옴
+        reload_page = self.shown_page_id in result['pages'] or self.shown_page_id in dropped
+        if reload_page:
+            self.shown_page_id = None
+        
+        self.video_model.remove_ids(deleted)
+        self.video_choice_model.remove_ids(deleted)
+        
+        if reload_page:
             self.load_page_videos()
     
     def load_pages(self):
-        self.page_combo.clear()
+        self.pages_model.clear()
+        loading_item = QStandardItem("불러오는 중...")
+        loading_item.setEnabled(False)
+        self.pages_model.appendRow(loading_item)
+        self.pages_loaded = False
+        
+        self.data_service.submit(
+            repository.list_pages,
+            on_result=self.on_pages_loaded,
+            on_error=self.on_data_error
+        )
+    
+    def on_pages_loaded(self, pages, select_page_id=None):
+        page_tab_built = self.is_tab_built(self.page_settings_tab)
+        current_combo = self.page_combo if page_tab_built else self.run_page_combo
+        current_page_id = select_page_id if select_page_id is not None else current_combo.currentData()
+        
+        if page_tab_built:
+            self.page_combo.blockSignals(True)
+        self.pages_model.clear()
+        for page in pages:
+            item = QStandardItem(page['name'])
+            item.setData(page['id'], Qt.UserRole)
+            self.pages_model.appendRow(item)
+        
+        # 이전에 선택한 페이지 유지
+        self.run_page_combo.setCurrentIndex(max(self.run_page_combo.findData(current_page_id), 0) if pages else -1)
+        self.pages_loaded = True
+        self.run_page_btn.setEnabled(bool(pages))
+        self.run_screens_btn.setEnabled(bool(pages) or self.screen_launcher is not None)
+        if self.is_tab_built(self.schedule_tab):
+            self.load_schedules()
+        if not page_tab_built:
+            return
         
-        session = self.session_maker()
-        pages = session.query(Page).all()
+        index = self.page_combo.findData(current_page_id) if current_page_id is not None else -1
+        self.page_combo.setCurrentIndex(max(index, 0) if pages else -1)
+        self.page_combo.blockSignals(False)
+        self.update_page_edits_label()
         
-        for page in pages:
-            self.page_combo.addItem(page.name, page.id)
+        # 초기 페이지 영상 로드
+        if pages:
+            self.load_page_videos()
+        else:
+            self.apply_page_assignments([])
+    
+    def add_page(self):
+        name, ok = QInputDialog.getText(self, "페이지 추가", "페이지 이름:", text=f"운동 페이지 {self.pages_model.rowCount() + 1}")
+        if not ok or not name.strip():
+            return
         
-        session.close()
+        self.data_service.submit(
+            repository.add_page, name.strip(),
+            on_result=lambda page: self.reload_pages(page['id']),
+            on_error=self.on_data_error
+        )
     
-    def load_video_combos(self):
-        # 모든 비디오 콤보박스 초기화
-        for combo in [self.video1_combo, self.video2_combo, self.video3_combo]:
-            combo.clear()
-            combo.addItem("-- 선택 안 함 --", None)
+    def rename_page(self):
+        page_id = self.page_combo.currentData()
+        if page_id is None:
+            return
         
-        session = self.session_maker()
-        videos = session.query(Video).all()
+        name, ok = QInputDialog.getText(self, "이름 변경", "페이지 이름:", text=self.page_combo.currentText())
+        if not ok or not name.strip():
+            return
         
-        for video in videos:
-            for combo in [self.video1_combo, self.video2_combo, self.video3_combo]:
-                combo.addItem(f"{video.id}: {video.title}", video.id)
+        self.data_service.submit(
+            repository.rename_page, page_id, name.strip(),
+            on_result=lambda _page: self.reload_pages(page_id),
+            on_error=self.on_data_error
+        )
+    
+    def delete_page(self):
+        page_id = self.page_combo.currentData()
+        if page_id is None:
+            return
         
-        session.close()
+        reply = QMessageBox.question(
+            self, "페이지 삭제 확인",
+            f"'{self.page_combo.currentText()}' 페이지와 영상 할당을 정말 삭제하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        def on_deleted(_deleted):
+            # 삭제된 페이지의 적용 대기 중인 편집은 버림
+            self.page_edits.pop(page_id, None)
+            self.stored_assignments.pop(page_id, None)
+            if self.shown_page_id == page_id:
+                self.shown_page_id = None
+            self.reload_pages()
+        
+        self.data_service.submit(
+            repository.delete_page, page_id,
+            on_result=on_deleted,
+            on_error=self.on_data_error
+        )
+    
+    def reload_pages(self, select_page_id=None):
+        self.data_service.submit(
+            repository.list_pages,
+            on_result=lambda pages: self.on_pages_loaded(pages, select_page_id),
+            on_error=self.on_data_error
+        )
+    
+    def video_combos(self):
+        return [row.picker for row in self.slot_rows]
+    
+    def add_slot_row(self, video_id=None, display_number=None):
+        order = len(self.slot_rows) + 1
+        row = PageSlotRow(order, self.video_choice_model, self.search_service)
+        row.display_spin.setValue(display_number if display_number is not None else order)
+        row.picker.setEnabled(self.video_combos_loaded)
+        if self.video_combos_loaded:
+            row.picker.set_video_id(video_id)
+        row.remove_requested.connect(self.remove_slot_row)
+        row.picker.video_changed.connect(self.on_slot_edited)
+        row.display_spin.valueChanged.connect(self.on_slot_edited)
+        
+        # 마지막 stretch 앞에 추가
+        self.slots_layout.insertWidget(self.slots_layout.count() - 1, row)
+        self.slot_rows.append(row)
+        self.update_slot_title()
+        self.on_slot_edited()
+        return row
+    
+    def remove_slot_row(self, row):
+        self.slot_rows.remove(row)
+        row.deleteLater()
+        
+        # 칸 번호 다시 매기기
+        for order, slot_row in enumerate(self.slot_rows, 1):
+            slot_row.set_order(order)
+        self.update_slot_title()
+        self.on_slot_edited()
+    
+    def update_slot_title(self):
+        self.assignments_group.setTitle(f"페이지에 할당된 영상 ({len(self.slot_rows)}개)")
+    
+    def load_video_combos(self):
+        # 모든 영상 선택 칸이 공유하는 선택 모델을 한 번만 채움
+        # (다시 채우는 동안 칸이 비므로 편집 내용을 먼저 보관)
+        self.stash_page_edits()
+        self.shown_page_id = None
+        for combo in self.video_combos():
+            combo.setPlaceholderText("불러오는 중...")
+            combo.setCurrentIndex(-1)
+            combo.setEnabled(False)
+        self.video_combos_loaded = False
+        
+        self.data_service.submit(
+            repository.list_video_choices,
+            on_result=self.on_video_combos_loaded,
+            on_error=self.on_data_error
+        )
+    
+    def on_video_combos_loaded(self, choices):
+        self.video_choice_model.set_choices(choices)
+        for combo in self.video_combos():
+            combo.setCurrentIndex(0)
+            combo.setEnabled(True)
+        self.video_combos_loaded = True
+        
+        # 콤보박스 로딩 전에 도착한 할당 정보 반영
+        if self.pending_page_assignments is not None:
+            self.apply_page_assignments(*self.pending_page_assignments)
+        elif self.pages_loaded:
+            self.load_page_videos()
     
     def load_page_videos(self):
+        # 다른 페이지로 넘어가기 전에 현재 편집 내용을 보관
+        self.stash_page_edits()
+        self.shown_page_id = None
+        
         if self.page_combo.count() == 0:
             return
             
         page_id = self.page_combo.currentData()
+        if page_id is None:
+            return
         
-        session = self.session_maker()
+        self.data_service.submit(
+            repository.get_page_assignments, page_id,
+            on_result=lambda assignments: self.on_page_assignments_loaded(page_id, assignments),
+            on_error=self.on_data_error
+        )
+    
+    def on_page_assignments_loaded(self, page_id, assignments):
+        if page_id != self.page_combo.currentData():
+            return  # 그 사이 다른 페이지를 선택함
         
-        # 현재 할당된 영상 정보 찾기
-        video_infos = {1: {'id': None, 'display_number': 1}, 
-                       2: {'id': None, 'display_number': 2}, 
-                       3: {'id': None, 'display_number': 3}}
+        self.stored_assignments[page_id] = assignments
+        # 적용 대기 중인 편집이 있으면 그것을 표시
+        self.apply_page_assignments(self.page_edits.get(page_id, assignments), page_id)
+    
+    def apply_page_assignments(self, assignments, page_id=None):
+        if not self.video_combos_loaded:
+            # 영상 목록이 준비되면 다시 적용
+            self.pending_page_assignments = (assignments, page_id)
+            return
+        self.pending_page_assignments = None
+        self.filling_slots = True
+        
+        # 할당 수에 맞게 칸 수 조정 (새 페이지는 기본 칸 수)
+        slot_count = len(assignments) if assignments else DEFAULT_SLOT_COUNT
+        while len(self.slot_rows) > slot_count:
+            self.remove_slot_row(self.slot_rows[-1])
+        while len(self.slot_rows) < slot_count:
+            self.add_slot_row()
+        
+        # 선택 업데이트 (재생 순서대로)
+        for position, row in enumerate(self.slot_rows):
+            if position < len(assignments):
+                assignment = assignments[position]
+                row.picker.set_video_id(assignment['video_id'])
+                row.display_spin.setValue(assignment['display_number'])
+            else:
+                row.picker.set_video_id(None)
+                row.display_spin.setValue(position + 1)
         
-        page_videos = session.query(PageVideo).filter_by(page_id=page_id).all()
+        self.filling_slots = False
+        self.shown_page_id = page_id
+    
+    def slot_assignments(self):
+        # 현재 칸 내용을 할당 목록으로 변환 (저장된 순서 값 재사용)
+        return repository.build_page_assignments(
+            self.stored_assignments.get(self.shown_page_id, []),
+            [(row.picker.video_id(), row.display_spin.value()) for row in self.slot_rows]
+        )
+    
+    def on_slot_edited(self, *args):
+        if not self.filling_slots:
+            self.stash_page_edits()
+    
+    def stash_page_edits(self):
+        page_id = self.shown_page_id
+        if page_id is None or not self.video_combos_loaded:
+            return
         
-        for pv in page_videos:
-            video_infos[pv.order]['id'] = pv.video_id
-            video_infos[pv.order]['display_number'] = pv.display_number if pv.display_number is not None else pv.order
+        assignments = self.slot_assignments()
+        stored = self.stored_assignments.get(page_id)
+        # 할당이 없는 페이지의 기본 빈 칸을 건드리지 않았으면 편집이 아님
+        if assignments == stored or (not stored and repository.is_untouched_slots(assignments)):
+            self.page_edits.pop(page_id, None)
+        else:
+            self.page_edits[page_id] = assignments
+        self.update_page_edits_label()
+    
+    def page_name(self, page_id):
+        index = self.page_combo.findData(page_id)
+        return self.page_combo.itemText(index) if index >= 0 else f"{page_id}번 페이지"
+    
+    def update_page_edits_label(self):
+        if not self.is_tab_built(self.page_settings_tab):
+            return
+        if self.page_edits:
+            names = ", ".join(self.page_name(page_id) for page_id in self.page_edits)
+            self.page_edits_label.setText(f"적용되지 않은 변경: {names}")
+        else:
+            self.page_edits_label.setText("")
+        self.discard_page_btn.setEnabled(bool(self.page_edits))
+    
+    def discard_page_edits(self):
+        if not self.page_edits:
+            return
         
-        # 콤보박스 선택 업데이트
-        for order, combo, spin in [
-            (1, self.video1_combo, self.display_num1_spin), 
-            (2, self.video2_combo, self.display_num2_spin), 
-            (3, self.video3_combo, self.display_num3_spin)
-        ]:
-            video_id = video_infos[order]['id']
-            display_number = video_infos[order]['display_number']
-            
-            # 스핀 박스 값 설정
-            spin.setValue(display_number)
-            
-            index = 0  # 기본값: 선택 안 함
-            if video_id:
-                # 아이디가 일치하는 인덱스 찾기
-                for i in range(combo.count()):
-                    if combo.itemData(i) == video_id:
-                        index = i
-                        break
-            
-            combo.setCurrentIndex(index)
+        reply = QMessageBox.question(
+            self, "변경 취소 확인",
+            "적용하지 않은 모든 페이지의 변경 사항을 취소하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
         
-        session.close()
+        self.page_edits.clear()
+        self.shown_page_id = None
+        self.update_page_edits_label()
+        self.load_page_videos()
     
     def save_page_settings(self):
-        if self.page_combo.count() == 0:
+        self.stash_page_edits()
+        if not self.page_edits:
+            QMessageBox.information(self, "알림", "적용할 변경 사항이 없습니다.")
             return
-            
-        page_id = self.page_combo.currentData()
-        
-        video1_id = self.video1_combo.currentData()
-        video2_id = self.video2_combo.currentData()
-        video3_id = self.video3_combo.currentData()
-        
-        display_num1 = self.display_num1_spin.value()
-        display_num2 = self.display_num2_spin.value()
-        display_num3 = self.display_num3_spin.value()
-        
-        # 필수 영상 확인
-        missing_videos = []
-        if not video1_id:
-            missing_videos.append("1번")
-        if not video2_id:
-            missing_videos.append("2번")
-        if not video3_id:
-            missing_videos.append("3번")
         
-        if missing_videos:
+        # 필수 영상 확인 (적용 대기 중인 모든 페이지)
+        problems = []
+        for page_id, assignments in self.page_edits.items():
+            if not assignments:
+                problems.append(f"{self.page_name(page_id)}: 최소 1개의 영상이 필요합니다.")
+                continue
+            missing_videos = [f"{position}번" for position, a in enumerate(assignments, 1) if not a['video_id']]
+            if missing_videos:
+                problems.append(f"{self.page_name(page_id)}: 영상이 없는 칸 {', '.join(missing_videos)}")
+        
+        if problems:
             QMessageBox.warning(
                 self, "경고", 
-                f"각 페이지에는 3개의 영상이 모두 필요합니다. 영상을 선택해주세요: {', '.join(missing_videos)}"
+                "모든 칸에 영상이 필요합니다. 영상을 선택하거나 칸을 삭제해주세요.\n\n" + "\n".join(problems)
             )
             return
         
-        session = self.session_maker()
+        # 모든 페이지를 한 트랜잭션으로 적용 (실패하면 전체 롤백, 편집 내용은 유지)
+        changes = {page_id: list(assignments) for page_id, assignments in self.page_edits.items()}
+        self.save_page_btn.setEnabled(False)
         
-        # 기존 할당 삭제
-        session.query(PageVideo).filter_by(page_id=page_id).delete()
+        def on_saved(results):
+            self.save_page_btn.setEnabled(True)
+            for page_id in results:
+                if self.page_edits.get(page_id) == changes[page_id]:
+                    self.page_edits.pop(page_id)
+            
+            # 저장된 상태를 다시 불러와 비교 기준 갱신
+            self.stored_assignments.clear()
+            self.shown_page_id = None
+            self.update_page_edits_label()
+            self.load_page_videos()
+            
+            totals = {key: sum(stats[key] for stats in results.values()) for key in ('inserted', 'updated', 'deleted')}
+            QMessageBox.information(
+                self, "성공", 
+                f"{len(results)}개 페이지의 변경 사항을 적용했습니다.\n"
+                f"추가 {totals['inserted']}개, 수정 {totals['updated']}개, 삭제 {totals['deleted']}개"
+            )
         
-        # 새로운 할당 추가
-        new_assignments = [
-            PageVideo(page_id=page_id, video_id=video1_id, order=1, display_number=display_num1),
-            PageVideo(page_id=page_id, video_id=video2_id, order=2, display_number=display_num2),
-            PageVideo(page_id=page_id, video_id=video3_id, order=3, display_number=display_num3)
-        ]
+        self.data_service.submit(
+            repository.apply_page_changes, changes,
+            on_result=on_saved,
+            on_error=self.on_data_error
+        )
+    
+    def load_schedules(self):
+        self.data_service.submit(
+            repository.list_schedules,
+            on_result=self.on_schedules_loaded,
+            on_error=self.on_data_error
+        )
+    
+    def on_schedules_loaded(self, records):
+        self.schedule_model.removeRows(0, self.schedule_model.rowCount())
+        for record in records:
+            items = [
+                QStandardItem(schedule.WEEKDAY_NAMES[record['weekday']]),
+                QStandardItem(schedule.format_minute(record['start_minute'])),
+                QStandardItem(schedule.format_minute(record['end_minute'])),
+                QStandardItem(record['page_name']),
+                QStandardItem(str(record['priority'])),
+            ]
+            items[0].setData(record['id'], Qt.UserRole)
+            self.schedule_model.appendRow(items)
+        
+        # 지금 재생할 편성과 다음 변경 시각
+        fields = schedule.ScheduleEntry._fields
+        timetable = schedule.Schedule(
+            [schedule.ScheduleEntry(**{key: record[key] for key in fields}) for record in records],
+            self.schedule_zone
+        )
+        page_names = {record['page_id']: record['page_name'] for record in records}
         
-        session.add_all(new_assignments)
-        session.commit()
-        session.close()
+        def label(entry):
+            return f"{schedule.describe(entry)} {page_names[entry.page_id]}" if entry else "편성 없음"
         
-        QMessageBox.information(
-            self, "성공", 
-            f"페이지 '{self.page_combo.currentText()}'에 영상이 성공적으로 할당되었습니다."
+        text = f"시간대 {timetable.zone} · 지금: {label(timetable.at())}"
+        change = timetable.next_change()
+        if change:
+            when, upcoming = change
+            text += f" · 다음 변경 {when.astimezone(timetable.zone):%m-%d %H:%M}: {label(upcoming)}"
+        self.schedule_status_label.setText(text)
+    
+    def add_schedule(self):
+        page_id = self.schedule_page_combo.currentData()
+        if page_id is None:
+            QMessageBox.warning(self, "경고", "편성할 페이지를 선택해주세요.")
+            return
+        
+        start = self.schedule_start_edit.time()
+        end = self.schedule_end_edit.time()
+        if start == end:
+            QMessageBox.warning(self, "경고", "시작 시각과 종료 시각이 같습니다.")
+            return
+        
+        self.data_service.submit(
+            repository.add_schedules,
+            self.schedule_days_combo.currentData(),
+            start.hour() * 60 + start.minute(),
+            end.hour() * 60 + end.minute(),
+            page_id,
+            self.schedule_priority_spin.value(),
+            on_result=lambda _records: self.load_schedules(),
+            on_error=self.on_data_error
         )
     
-    def load_system_settings(self):
-        session = self.session_maker()
+    def delete_schedules(self):
+        rows = self.schedule_table.selectionModel().selectedRows()
+        if not rows:
+            return
         
-        # 모든 설정값 가져오기
-        configs = {}
-        for config in session.query(Config).all():
-            configs[config.key] = config.value
+        schedule_ids = [self.schedule_model.item(index.row(), 0).data(Qt.UserRole) for index in rows]
+        self.data_service.submit(
+            repository.delete_schedules, schedule_ids,
+            on_result=lambda _deleted: self.load_schedules(),
+            on_error=self.on_data_error
+        )
+    
+    def load_system_settings(self):
+        snapshot = self.config_service.snapshot()
         
         # 스핀박스 값 설정
-        self.initial_delay_spin.setValue(int(configs.get("initial_delay", 3)))
-        self.zoom_duration_spin.setValue(int(configs.get("zoom_duration", 60)))
-        self.transition_duration_spin.setValue(int(configs.get("transition_duration", 1)))
-        self.volume_spin.setValue(int(configs.get("volume", 50)))
-        
-        session.close()
+        for key, spin in self.setting_spins.items():
+            spin.setValue(snapshot[key])
     
     def save_system_settings(self):
-        session = self.session_maker()
-        
-        # 설정 업데이트
-        settings = {
-            "initial_delay": str(self.initial_delay_spin.value()),
-            "zoom_duration": str(self.zoom_duration_spin.value()),
-            "transition_duration": str(self.transition_duration_spin.value()),
-            "volume": str(self.volume_spin.value())
-        }
-        
-        for key, value in settings.items():
-            config = session.query(Config).filter_by(key=key).first()
-            if config:
-                config.value = value
+        # 설정 업데이트 (한 번의 UPSERT)
+        settings = {key: spin.value() for key, spin in self.setting_spins.items()}
         
-        session.commit()
-        session.close()
+        try:
+            self.config_service.save(settings)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"시스템 설정 저장에 실패했습니다.\n{e}")
+            return
         
         QMessageBox.information(self, "성공", "시스템 설정이 저장되었습니다.")
     
     def run_page(self, page_id):
-        # 해당 페이지에 영상이 할당되어 있는지 확인
-        session = self.session_maker()
-        page_videos = session.query(PageVideo).filter_by(page_id=page_id).all()
-        session.close()
+        if page_id is None:
+            return
+        
+        # 해당 페이지에 영상이 할당되어 있는지, 재생할 수 없는 영상이 있는지 확인 (워커 스레드)
+        self.data_service.submit(
+            repository.page_run_status, page_id, health_check.BROKEN_STATUSES,
+            on_result=lambda status: self.on_page_run_status(page_id, status),
+            on_error=self.on_data_error
+        )
+    
+    def on_page_run_status(self, page_id, status):
+        if status['broken']:
+            lines = [
+                f"{video['order']}번 칸: {video['title']} ({health_check.STATUS_LABELS[video['health_status']]})"
+                for video in status['broken']
+            ]
+            reply = QMessageBox.question(
+                self, "재생할 수 없는 영상",
+                "링크 검사에서 재생할 수 없는 것으로 확인된 영상이 있습니다.\n\n"
+                + "\n".join(lines) + "\n\n그래도 페이지를 실행하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
         
-        if len(page_videos) < 3:
+        self.launch_page(page_id, status['count'])
+    
+    def launch_page(self, page_id, video_count):
+        if video_count < 1:
             QMessageBox.warning(
                 self, "경고", 
-                f"{page_id}번 페이지에는 3개의 영상이 모두 필요합니다. 페이지를 먼저 설정해주세요."
+                f"{page_id}번 페이지에 할당된 영상이 없습니다. 페이지를 먼저 설정해주세요."
             )
             return
         
         # 페이지 실행
         from page import WorkoutPage
         
+        if self.workout_page is not None and not self.workout_page.is_torn_down:
+            # 실행 중인 페이지 창이 있으면 새로 만들지 않고 다른 페이지를 불러옴
+            self.workout_page.load_page(page_id)
+            self.workout_page.setWindowTitle(f"운동 페이지 {page_id}")
+            self.workout_page.raise_()
+            self.workout_page.activateWindow()
+            return
+        
         # 메인 윈도우는 그대로 유지하면서 페이지를 별도 창으로 실행
         self.workout_page = WorkoutPage(self.engine, page_id)
         self.workout_page.setWindowTitle(f"운동 페이지 {page_id}")
         self.workout_page.resize(1080, 1920)  # 세로 화면
         self.workout_page.show()
         
-        # 페이지 종료 시그널 연결
+        # 페이지 종료 시그널 연결 (창을 닫으면 페이지가 스스로 정리/삭제됨)
         self.workout_page.page_completed.connect(self.on_page_completed)
+        self.workout_page.destroyed.connect(self.on_workout_page_destroyed)
+    
+    def toggle_screens(self):
+        if self.screen_launcher is not None:
+            self.stop_screens()
+            return
+        
+        # 영상이 있는 페이지를 화면 순서대로 배정 (워커 스레드에서 조회)
+        self.run_screens_btn.setEnabled(False)
+        self.data_service.submit(
+            repository.list_playable_page_ids,
+            on_result=self.launch_screens,
+            on_error=self.on_launch_screens_failed
+        )
+    
+    def on_launch_screens_failed(self, error):
+        self.run_screens_btn.setEnabled(True)
+        self.on_data_error(error)
+    
+    def launch_screens(self, page_ids):
+        from launcher import ScreenLauncher, default_assignments
+        
+        self.run_screens_btn.setEnabled(True)
+        if not page_ids:
+            QMessageBox.warning(self, "경고", "영상이 할당된 페이지가 없습니다. 페이지를 먼저 설정해주세요.")
+            return
+        
+        assignments = default_assignments(page_ids, len(QApplication.screens()))
+        logger.info(f"모든 화면 실행: {assignments}")
+        # 단체 수업용: 모든 화면의 카운트다운과 영상 전환을 같은 시각에 맞춤
+        self.screen_launcher = ScreenLauncher(self.engine, assignments, processes=True, sync=True, parent=self)
+        try:
+            self.screen_launcher.start()
+        except RuntimeError as e:
+            self.screen_launcher = None
+            QMessageBox.critical(self, "오류", f"화면 실행에 실패했습니다.\n{e}")
+            return
+        self.run_screens_btn.setText("모든 화면 정지")
+    
+    def stop_screens(self):
+        self.screen_launcher.shutdown()
+        self.screen_launcher.deleteLater()
+        self.screen_launcher = None
+        self.run_screens_btn.setText("모든 화면 실행")
+    
+    def closeEvent(self, event):
+        # 관리자 창을 닫으면 화면 프로세스도 종료
+        if self.screen_launcher is not None:
+            self.stop_screens()
+        super().closeEvent(event)
+    
+    def on_workout_page_destroyed(self):
+        self.workout_page = None
     
     def on_page_completed(self, page_id):
         self.workout_page.close()
+        self.workout_page = None
         QMessageBox.information(
             self, "페이지 완료", 
             f"{page_id}번 페이지의 영상 재생이 완료되었습니다."
@@ -706,6 +1571,7 @@ class AdminWindow(QMainWindow):
 if __name__ == "__main__":
     from models import init_db
     
+    web_engine.preload()
     app = QApplication(sys.argv)
     
     # DB 초기화
@@ -0,0 +1,225 @@
+import os
+import sys
+import json
+import time
+import statistics
+
+# 벤치마크 공통 도구 - 저장소 루트 모듈을 import하고 화면 없이(offscreen) 실행
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SAMPLE_URLS = [
+    "https://www.youtube.com/watch?v=Tz9d7By2ytQ",
+    "https://www.youtube.com/watch?v=f9N5xA3LPBg",
+    "https://www.youtube.com/watch?v=AnYl6Nk9GOA",
+    "https://www.youtube.com/watch?v=UBMk30rjy0o",
+]
+
+
+_app = None
+
+
+def get_app(web_engine=True):
+    """
+    QApplication을 한 번만 생성. QtWebEngineWidgets는 QApplication보다 먼저 import해야 한다.
+    """
+    if web_engine:
+        import PyQt5.QtWebEngineWidgets  # noqa: F401
+    from PyQt5.QtWidgets import QApplication
+
+    global _app
+    app = QApplication.instance()
+    if app is None:
+        # 호출한 쪽이 참조를 버려도 여러 벤치마크에서 계속 쓸 수 있도록 모듈에서 보관
+        app = _app = QApplication([sys.argv[0]])
+    return app
+
+
+def process_events(app, duration_ms=0):
+    deadline = time.perf_counter() + duration_ms / 1000.0
+    app.processEvents()
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def create_test_db(path, page_segments, video_count=None, duration=1.0):
+    """
+    page_segments: {페이지 ID: 영상 칸 수} 형태로 테스트 DB를 만든다.
+    """
+    from models import init_db, Video, Page, PageVideo
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    engine = init_db(path)
+    video_count = video_count or max(page_segments.values(), default=1)
+
+    with engine.begin() as connection:
+        connection.execute(Video.__table__.insert(), [
+            {
+                'title': f"벤치마크 영상 {i + 1}",
+                'url': SAMPLE_URLS[i % len(SAMPLE_URLS)],
+                'exercise_type': "근력",
+                'difficulty': "중간",
+                'duration': duration
+            }
+            for i in range(video_count)
+        ])
+        connection.execute(Page.__table__.insert(), [
+            {'id': page_id, 'name': f"벤치마크 페이지 {page_id}"} for page_id in page_segments
+        ])
+        connection.execute(PageVideo.__table__.insert(), [
+            {'page_id': page_id, 'video_id': (i % video_count) + 1, 'order': i + 1, 'display_number': i + 1}
+            for page_id, segments in page_segments.items()
+            for i in range(segments)
+        ])
+
+    return engine
+
+
+def prepare_thumbnail_cache(video_ids):
+    """
+    네트워크 없이 측정하도록 임시 캐시 디렉터리에 썸네일을 만들고 youtube.CACHE_DIR을 바꾼다.
+    """
+    import tempfile
+    from PyQt5.QtGui import QImage, QColor
+    import youtube
+
+    youtube.CACHE_DIR = tempfile.mkdtemp(prefix="dreambody_thumbs_")
+    image = QImage(320, 180, QImage.Format_RGB32)
+    image.fill(QColor("#446688"))
+    for video_id in video_ids:
+        image.save(youtube.thumbnail_cache_path(video_id), "JPG")
+    return youtube.CACHE_DIR
+
+
+def read_rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as fp:
+            for line in fp:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def descendant_pids(root):
+    # /proc의 부모 PID로 자식 프로세스(QtWebEngineProcess 등)를 모두 찾음
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as fp:
+                ppid = int(fp.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+
+    found, stack = [], [root]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def read_pss_kb(pid):
+    # 공유 메모리를 프로세스 수로 나눈 PSS (KB) - 여러 프로세스의 합을 비교할 때 사용. 없으면 None
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fp:
+            for line in fp:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def read_cpu_seconds(pid):
+    # 프로세스가 사용한 CPU 시간 (user + system, 초)
+    try:
+        with open(f"/proc/{pid}/stat") as fp:
+            fields = fp.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return 0.0
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def measure(fn, repeat=5, warmup=1, teardown=None):
+    """
+    fn을 repeat번 실행한 시간(ms) 통계. teardown(결과)은 시간에 포함하지 않는다.
+    """
+    for _ in range(warmup):
+        result = fn()
+        if teardown:
+            teardown(result)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if teardown:
+            teardown(result)
+
+    return summarize(samples)
+
+
+def summarize(samples):
+    """
+    측정값 목록(ms) 통계
+    """
+    return {
+        'min_ms': round(min(samples), 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'mean_ms': round(statistics.mean(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'repeat': len(samples)
+    }
+
+
+def report(name, result):
+    print(json.dumps({'name': name, **result}, ensure_ascii=False))
+
+
+# 기준값(baseline) 파일 - 측정 환경마다 다르므로 대상 장비에서 --save-baseline으로 저장
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def load_baseline(name):
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def save_baseline(name, results):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), 'w', encoding='utf-8') as fp:
+        json.dump(results, fp, ensure_ascii=False, indent=2)
+        fp.write("\n")
+
+
+def compare_to_baseline(results, baseline, metric='median_ms', tolerance=0.2):
+    """
+    기준값보다 tolerance(비율) 이상 느려진 항목 목록 [(이름, 기준값, 현재값)]
+    """
+    regressions = []
+    for name, result in results.items():
+        base = (baseline or {}).get(name)
+        if not base or metric not in base or metric not in result:
+            continue
+        if result[metric] > base[metric] * (1.0 + tolerance):
+            regressions.append((name, base[metric], result[metric]))
+    return regressions
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import (get_app, process_events, create_test_db, measure, report,
+                                prepare_thumbnail_cache, SAMPLE_URLS)
+
+# 관리자 창 / 재생 페이지 생성 시간 (같은 프로세스 안에서 반복 측정)
+# - page_db_load: 페이지 재생 목록 조회만
+# - page_construct_cached: 실제 플레이어 포함 전체 생성 (썸네일은 캐시에서)
+# - page_construct_stub_players: 웹 뷰 없는 가짜 플레이어로 생성 (레이아웃/타이머 비용만)
+
+VIDEO_COUNT = 5000
+PAGE_SEGMENTS = 10
+
+
+def run(repeat=5):
+    app = get_app()
+    import youtube
+    import repository
+    from sqlalchemy.orm import sessionmaker
+    from admin import AdminWindow
+    from page import WorkoutPage
+    from simulation import SimulatedPlayer
+
+    prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_bench_"), "bench.db")
+    engine = create_test_db(db_path, {1: PAGE_SEGMENTS}, video_count=VIDEO_COUNT)
+    Session = sessionmaker(bind=engine)
+
+    def open_admin():
+        window = AdminWindow(engine)
+        window.show()
+        process_events(app)
+        return window
+
+    def close_admin(window):
+        window.data_service.wait_for_done()
+        window.health_service.wait_for_done()
+        window.close()
+        window.deleteLater()
+        process_events(app)
+
+    def load_playlist():
+        session = Session()
+        try:
+            return repository.load_page_playlist(session, 1)
+        finally:
+            session.close()
+
+    def stub_player(order, url, title, parent):
+        return SimulatedPlayer(order, url, title, lambda event, player: None, parent)
+
+    def construct_page(player_factory=None):
+        page = WorkoutPage(engine, 1, player_factory=player_factory)
+        page.resize(1080, 1920)
+        return page
+
+    def close_page(page):
+        page.complete_page()
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+
+    return {
+        'admin_window_construct': measure(open_admin, repeat=repeat, teardown=close_admin),
+        'page_db_load': measure(load_playlist, repeat=repeat * 4),
+        'page_construct_cached': measure(construct_page, repeat=repeat, teardown=close_page),
+        'page_construct_stub_players': measure(lambda: construct_page(stub_player), repeat=repeat, teardown=close_page),
+    }
+
+
+def main():
+    """
+    관리자 창 / 재생 페이지 생성 벤치마크
+    """
+    logging.disable(logging.INFO)
+    for name, result in run().items():
+        report(name, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import logging
+import tempfile
+import itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import create_test_db, measure, report
+
+# init_db 시간 측정
+# - cold: 파일이 없는 상태에서 테이블/인덱스/기본 설정 생성
+# - warm: 영상이 들어 있는 기존 DB에서 스키마 확인만 (앱을 켤 때마다 실행되는 경로)
+
+VIDEO_COUNT = 5000
+
+
+def run(repeat=10):
+    from models import init_db
+
+    work_dir = tempfile.mkdtemp(prefix="dreambody_bench_")
+    counter = itertools.count()
+
+    def cold():
+        return init_db(os.path.join(work_dir, f"cold_{next(counter)}.db"))
+
+    def dispose(engine):
+        engine.dispose()
+        os.remove(engine.url.database)
+
+    warm_path = os.path.join(work_dir, "warm.db")
+    create_test_db(warm_path, {1: 10, 2: 10}, video_count=VIDEO_COUNT).dispose()
+
+    return {
+        'init_db_cold': measure(cold, repeat=repeat, teardown=dispose),
+        'init_db_warm': measure(lambda: init_db(warm_path), repeat=repeat, teardown=lambda engine: engine.dispose()),
+    }
+
+
+def main():
+    """
+    DB 초기화 벤치마크
+    """
+    logging.disable(logging.INFO)
+    for name, result in run().items():
+        report(name, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import get_app, create_test_db, measure, report, prepare_thumbnail_cache, SAMPLE_URLS
+
+# 영상 칸 수에 따른 WorkoutPage 생성 시간 측정
+SEGMENT_COUNTS = (3, 10, 50)
+
+
+def run(repeat=5):
+    app = get_app()
+    import youtube
+    from page import WorkoutPage
+
+    prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_bench_"), "bench.db")
+    engine = create_test_db(db_path, {count: count for count in SEGMENT_COUNTS})
+
+    results = {}
+    for count in SEGMENT_COUNTS:
+        def construct():
+            page = WorkoutPage(engine, count)
+            page.resize(1080, 1920)
+            return page
+
+        def teardown(page):
+            page.complete_page()
+            page.close()
+            page.deleteLater()
+            app.processEvents()
+
+        result = measure(construct, repeat=repeat, teardown=teardown)
+        result['segments'] = count
+        results[f"page_construct_{count}_segments"] = result
+
+    return results
+
+
+def main():
+    """
+    페이지 구성 시간 벤치마크 (3, 10, 50칸)
+    """
+    logging.disable(logging.INFO)
+    for name, result in run().items():
+        report(name, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import (get_app, process_events, create_test_db, measure, summarize, report,
+                                prepare_thumbnail_cache, SAMPLE_URLS)
+
+# 재생 관련 시간 측정
+# - first_tile_play: 첫 영상 확대부터 플레이어가 PLAYING 상태가 될 때까지 (로컬 YouTube 대역 서버 사용)
+# - video_timer_tick_N: update_video_timer 1회 비용 (N칸 페이지, 가상 시계로 첫 영상까지 진행한 뒤 측정)
+
+TICK_SEGMENTS = (10, 50)
+TICKS = 100
+STANDIN_LATENCY_MS = 50
+PLAY_TIMEOUT = 10.0
+
+# 임베드 iframe이 보내는 상태 메시지를 바깥 문서 제목으로 옮김 (titleChanged로 감지)
+LISTENER_JS = """
+window.addEventListener("message", function (event) {
+  if (event.data && event.data.standin) document.title = "standin:" + event.data.standin;
+});
+"""
+
+
+def measure_ticks(engine, page_id, repeat):
+    from simulation import PageSimulation
+
+    simulation = PageSimulation(engine, page_id)
+    page = simulation.page
+    simulation.clock.run(stop=page.video_timer.isActive)
+    for player in page.video_players:
+        player.remaining_time = 10 ** 9  # 측정 중에 페이지가 끝나지 않도록
+
+    def ticks():
+        for _ in range(TICKS):
+            page.update_video_timer()
+
+    result = measure(ticks, repeat=repeat)
+    simulation.close()
+
+    # 1회당 시간으로 환산
+    for key in ('min_ms', 'median_ms', 'mean_ms', 'max_ms'):
+        result[key] = round(result[key] / TICKS, 4)
+    result['ticks'] = TICKS
+    return result
+
+
+def wait_until_playing(app, player):
+    state = {}
+    player.web_view.titleChanged.connect(lambda title: state.update(playing=True) if title == "standin:state:1" else None)
+
+    deadline = time.perf_counter() + PLAY_TIMEOUT
+    while not state.get('playing'):
+        if time.perf_counter() > deadline:
+            raise RuntimeError("재생 시작을 확인하지 못했습니다 (대역 서버/QtWebEngine 확인)")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def measure_first_tile(app, engine, page_id, repeat):
+    from PyQt5.QtWebEngineWidgets import QWebEngineScript
+    from page import WorkoutPage
+
+    samples = []
+    for _ in range(repeat):
+        page = WorkoutPage(engine, page_id)
+        page.resize(1080, 1920)
+        page.show()
+        process_events(app)
+
+        player = page.video_players[0]
+        script = QWebEngineScript()
+        script.setName("standin-listener")
+        script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        script.setWorldId(QWebEngineScript.MainWorld)
+        script.setSourceCode(LISTENER_JS)
+        player.web_view.page().scripts().insert(script)
+
+        started = time.perf_counter()
+        page.zoom_video(0)
+        wait_until_playing(app, player)
+        samples.append((time.perf_counter() - started) * 1000.0)
+
+        page.complete_page()
+        page.close()
+        page.deleteLater()
+        process_events(app)
+
+    return summarize(samples)
+
+
+def prepare(counts):
+    import youtube
+
+    prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_bench_"), "bench.db")
+    return create_test_db(db_path, {count: count for count in counts})
+
+
+def run_ticks(repeat=5):
+    get_app()
+    engine = prepare(TICK_SEGMENTS)
+    return {
+        f"video_timer_tick_{count}_segments": measure_ticks(engine, count, repeat)
+        for count in TICK_SEGMENTS
+    }
+
+
+def run_first_tile(repeat=5):
+    app = get_app()
+    import youtube
+    from youtube_standin import YouTubeStandin
+
+    engine = prepare((3,))
+    with YouTubeStandin(latency_ms=STANDIN_LATENCY_MS, seed=0) as standin:
+        youtube.set_base(standin.base_url)
+        try:
+            result = measure_first_tile(app, engine, 3, repeat)
+        finally:
+            youtube.set_base(os.environ.get(youtube.BASE_ENV))
+    result['standin_latency_ms'] = STANDIN_LATENCY_MS
+    return {'first_tile_play': result}
+
+
+def run(repeat=5):
+    return {**run_ticks(repeat), **run_first_tile(repeat)}
+
+
+def main():
+    """
+    재생 벤치마크 (첫 영상 재생 시작 시간, 영상 타이머 1회 비용)
+    """
+    logging.disable(logging.INFO)
+    for name, result in run().items():
+        report(name, result)
+
+
+if __name__ == "__main__":
+    main()
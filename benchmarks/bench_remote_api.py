@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import http.client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import get_app, process_events, create_test_db, prepare_thumbnail_cache, summarize, SAMPLE_URLS
+
+# 원격 제어 API 응답성 (remote_api.py)
+# - 키오스크 모드로 페이지를 재생하면서 여러 클라이언트 스레드가 status/volume/skip 명령을 연속으로 보냄
+# - 측정: HTTP 왕복 시간, 명령이 GUI 스레드에서 실행되기까지 걸린 시간(dispatch), 이벤트 스트림 구독자가 받은 이벤트 수,
+#   그리고 같은 시간 동안 GUI 스레드의 16ms 타이머 간격 (API 처리 때문에 GUI가 멈추면 간격이 커짐)
+# - dispatch의 95번째 백분위가 한 프레임(60Hz)을 넘으면 종료 코드 1
+
+PAGE_SEGMENTS = {1: 4, 2: 4}
+VIDEO_DURATION = 0.05  # 분 (3초마다 영상 전환)
+START_COUNTDOWN = 1  # 초
+FRAME_MS = 1000 / 60
+BENCH_TOKEN = "bench"  # 사용자 토큰 파일을 건드리지 않도록 고정 토큰 사용
+MIX = ('status', 'status', 'status', 'volume', 'skip')  # 클라이언트가 순서대로 반복하는 명령
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+
+def stats(values):
+    if not values:
+        return None
+    return {**summarize(values), 'p95_ms': percentile(values, 0.95)}
+
+
+def run_client(port, token, count, samples, errors):
+    # 연결을 유지하면서 명령을 연속으로 보냄
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    headers = {'Authorization': f"Bearer {token}", 'Content-Type': 'application/json'}
+    for i in range(count):
+        command = MIX[i % len(MIX)]
+        body = json.dumps({'volume': 30 + i % 40}) if command == 'volume' else None
+        started = time.perf_counter()
+        connection.request("GET" if command == 'status' else "POST", f"/{command}", body=body, headers=headers)
+        reply = json.loads(connection.getresponse().read())
+        samples.append((time.perf_counter() - started) * 1000)
+        if not reply['ok']:
+            errors.append(reply['error'])  # 페이지가 끝난 순간의 skip 등
+    connection.close()
+
+
+def run_subscriber(port, token, events, stop):
+    # 이벤트 스트림(text/event-stream) 구독자
+    # (측정이 끝나 서버가 멈추면 연결이 닫혀 끝남)
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.request("GET", "/events", headers={'Authorization': f"Bearer {token}"})
+    response = connection.getresponse()
+    while not stop.is_set():
+        line = response.fp.readline()
+        if not line:
+            break
+        if line.startswith(b"data: "):
+            events.append(json.loads(line[6:]))
+    connection.close()
+
+
+def run(clients=4, requests=200, stub_players=False):
+    app = get_app(web_engine=not stub_players)
+    import youtube
+    from settings import save_config
+    from sqlalchemy.orm import sessionmaker
+    from PyQt5.QtCore import Qt, QTimer, QEventLoop
+    from youtube_standin import YouTubeStandin
+    from kiosk import KioskController
+    from launcher import stub_player_factory
+    from remote_api import RemoteControlServer
+
+    prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_remote_"), "remote.db")
+    engine = create_test_db(db_path, PAGE_SEGMENTS, duration=VIDEO_DURATION)
+    session = sessionmaker(bind=engine)()
+    save_config(session, {'start_countdown': START_COUNTDOWN})
+    session.commit()
+    session.close()
+
+    with YouTubeStandin(seed=0) as standin:
+        youtube.set_base(standin.base_url)
+        controller = KioskController(engine, sorted(PAGE_SEGMENTS),
+                                     player_factory=stub_player_factory if stub_players else None)
+        controller.start(fullscreen=False)
+        server = RemoteControlServer(controller, token=BENCH_TOKEN)
+        server.start()
+
+        # GUI 스레드 응답성: 16ms 정밀 타이머의 실제 간격
+        gaps, last = [], [time.perf_counter()]
+
+        def on_frame():
+            now = time.perf_counter()
+            gaps.append((now - last[0]) * 1000)
+            last[0] = now
+
+        frame_timer = QTimer()
+        frame_timer.setTimerType(Qt.PreciseTimer)
+        frame_timer.timeout.connect(on_frame)
+
+        samples, errors, events = [], [], []
+        stop = threading.Event()
+        subscriber = threading.Thread(target=run_subscriber, args=(server.port, server.token, events, stop), daemon=True)
+        threads = [threading.Thread(target=run_client, args=(server.port, server.token, requests, samples, errors), daemon=True)
+                   for _ in range(clients)]
+        try:
+            process_events(app, 500)
+            subscriber.start()
+            process_events(app, 200)
+            frame_timer.start(round(FRAME_MS))
+            last[0] = time.perf_counter()
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            # 실제 앱처럼 Qt 이벤트 루프를 돌리면서 클라이언트가 끝날 때까지 기다림
+            loop = QEventLoop()
+            watcher = QTimer()
+            watcher.timeout.connect(lambda: None if any(thread.is_alive() for thread in threads) else loop.quit())
+            watcher.start(100)
+            loop.exec_()
+            watcher.stop()
+            elapsed = time.perf_counter() - started
+            frame_timer.stop()
+        finally:
+            stop.set()
+            server.stop()
+            controller.stop()
+            process_events(app, 200)
+            youtube.set_base(None)
+
+    return {
+        'clients': clients,
+        'requests': len(samples),
+        'requests_per_second': round(len(samples) / elapsed, 1),
+        'errors': len(errors),
+        'round_trip': stats(samples),
+        'dispatch': stats(list(server.dispatch_ms)),
+        'frame_gap': stats(gaps),
+        'events': len(events),
+    }
+
+
+def main(argv=None):
+    """
+    원격 제어 API 왕복 시간과 GUI 스레드 전달 지연 측정. dispatch p95가 한 프레임을 넘으면 종료 코드 1.
+    """
+    parser = argparse.ArgumentParser(description="원격 제어 API 응답성 측정")
+    parser.add_argument("--clients", type=int, default=4, help="동시에 명령을 보내는 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=200, help="클라이언트당 명령 수")
+    parser.add_argument("--stub-players", action="store_true", help="웹 뷰 없는 가짜 플레이어 사용")
+    parser.add_argument("--max-dispatch-ms", type=float, default=FRAME_MS,
+                        help=f"허용하는 GUI 전달 지연 p95 (기본값: {FRAME_MS:.1f}ms = 60Hz 한 프레임)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    result = run(args.clients, args.requests, args.stub_players)
+
+    print(f"명령 {result['requests']}개 ({result['requests_per_second']}/초, 클라이언트 {result['clients']}개), "
+          f"실패 {result['errors']}개, 받은 이벤트 {result['events']}개")
+    print(f"{'항목':<12}  {'중앙값':>9}  {'p95':>9}  {'최대':>9}")
+    for name in ('round_trip', 'dispatch', 'frame_gap'):
+        value = result[name]
+        print(f"{name:<12}  {value['median_ms']:>7.2f}ms  {value['p95_ms']:>7.2f}ms  {value['max_ms']:>7.2f}ms")
+
+    exceeded = result['dispatch']['p95_ms'] > args.max_dispatch_ms
+    if exceeded:
+        print(f"GUI 전달 지연 p95가 {args.max_dispatch_ms:.1f}ms를 넘었습니다.")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(result, fp, ensure_ascii=False, indent=2)
+            fp.write("\n")
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
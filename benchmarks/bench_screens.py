@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import (get_app, process_events, create_test_db, prepare_thumbnail_cache, read_rss_kb,
+                                read_pss_kb, read_cpu_seconds, descendant_pids, SAMPLE_URLS)
+
+# 여러 화면 실행 자원 사용량 (launcher.py)
+# - 단일 프로세스(inprocess)와 화면별 프로세스(processes) 모드로 같은 페이지들을 나란히 실행하고
+#   모든 화면이 시작된 뒤 일정 시간 동안의 CPU 사용률과 메모리(RSS, PSS)를 측정
+# - 화면별 프로세스 모드는 화면 프로세스마다(웹 엔진 자식 프로세스 포함) 따로 측정하고 실행기 자체는 별도로 표시
+# - 단일 프로세스 모드는 화면별로 나눌 수 없으므로 전체를 화면 수로 나눈 평균을 표시
+# - 여러 프로세스의 메모리 합은 공유 라이브러리를 나눠 계산하는 PSS로 비교 (RSS 합은 공유 메모리를 중복 계산)
+
+PAGE_SEGMENTS = {1: 3, 2: 5, 3: 10}
+VIDEO_DURATION = 0.1  # 분 (6초마다 영상 전환)
+START_COUNTDOWN = 2  # 초
+READY_TIMEOUT = 60.0
+MODES = ("processes", "inprocess")  # 실행기 메모리가 앞 측정에 영향받지 않도록 화면별 프로세스 모드를 먼저 측정
+
+
+def tree_usage(pid):
+    """
+    프로세스와 자식 프로세스의 (CPU 초, RSS KB, PSS KB)
+    """
+    pids = [pid] + descendant_pids(pid)
+    pss = [read_pss_kb(p) for p in pids]
+    return (
+        sum(read_cpu_seconds(p) for p in pids),
+        sum(read_rss_kb(p) for p in pids),
+        sum(pss) if None not in pss else None,
+    )
+
+
+def wait_for(app, condition, timeout):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        process_events(app, 50)
+    return True
+
+
+def run_mode(app, engine, page_ids, processes, seconds, stub_players):
+    from launcher import ScreenLauncher, ProcessScreen
+
+    ProcessScreen.forward_output = False
+    launcher = ScreenLauncher(engine, list(enumerate(page_ids)), processes=processes, windowed=True,
+                              loop=True, stub_players=stub_players)
+    own_pid = os.getpid()
+    try:
+        launcher.start()
+        started = lambda: sum(1 for status in launcher.statuses.values()
+                              if status.get('state') in ('countdown', 'playing')) == len(page_ids)
+        if not wait_for(app, started, READY_TIMEOUT):
+            raise RuntimeError(f"화면이 시작되지 않았습니다: {launcher.statuses}")
+
+        # 측정 대상: 화면별 프로세스 모드는 화면 프로세스 트리, 단일 프로세스 모드는 이 프로세스 트리 전체
+        roots = {screen: launcher.screens[screen].pid for screen in launcher.screens} if processes else {None: own_pid}
+        before = {screen: tree_usage(pid)[0] for screen, pid in roots.items()}
+        own_before = read_cpu_seconds(own_pid)
+        measure_started = time.perf_counter()
+        process_events(app, seconds * 1000)
+        elapsed = time.perf_counter() - measure_started
+
+        screens = []
+        for screen, pid in roots.items():
+            cpu, rss, pss = tree_usage(pid)
+            screens.append({
+                'screen': screen,
+                'cpu_percent': round((cpu - before[screen]) / elapsed * 100, 2),
+                'rss_kb': rss,
+                'pss_kb': pss,
+            })
+        launcher_cpu = (read_cpu_seconds(own_pid) - own_before) / elapsed * 100
+        launcher_memory = (read_rss_kb(own_pid), read_pss_kb(own_pid))
+    finally:
+        launcher.shutdown()
+        process_events(app, 200)
+
+    count = len(page_ids)
+    if processes:
+        total_cpu = sum(screen['cpu_percent'] for screen in screens) + launcher_cpu
+        total_pss = (sum(screen['pss_kb'] for screen in screens) + launcher_memory[1]
+                     if launcher_memory[1] is not None and all(screen['pss_kb'] is not None for screen in screens)
+                     else None)
+        total_rss = sum(screen['rss_kb'] for screen in screens) + launcher_memory[0]
+    else:
+        total_cpu, total_rss, total_pss = screens[0]['cpu_percent'], screens[0]['rss_kb'], screens[0]['pss_kb']
+        screens = []
+
+    return {
+        'screens': count,
+        'seconds': round(elapsed, 1),
+        'cpu_percent_total': round(total_cpu, 2),
+        'cpu_percent_per_screen': round(total_cpu / count, 2),
+        'rss_kb_total': total_rss,
+        'pss_kb_total': total_pss,
+        'pss_kb_per_screen': round(total_pss / count) if total_pss is not None else None,
+        'launcher_cpu_percent': round(launcher_cpu, 2) if processes else None,
+        'launcher_rss_kb': launcher_memory[0] if processes else None,
+        'per_screen': screens,
+    }
+
+
+def run(modes=MODES, seconds=20, stub_players=False):
+    app = get_app(web_engine=not stub_players)
+    import youtube
+    from settings import save_config
+    from sqlalchemy.orm import sessionmaker
+    from youtube_standin import YouTubeStandin
+
+    # 화면 프로세스도 같은 썸네일 캐시와 YouTube 대역 서버를 쓰도록 환경 변수로 전달
+    os.environ['DREAMBODY_CACHE_DIR'] = prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_screens_"), "screens.db")
+    engine = create_test_db(db_path, PAGE_SEGMENTS, duration=VIDEO_DURATION)
+    session = sessionmaker(bind=engine)()
+    save_config(session, {'start_countdown': START_COUNTDOWN})
+    session.commit()
+    session.close()
+
+    results = {}
+    with YouTubeStandin(seed=0) as standin:
+        youtube.set_base(standin.base_url)
+        os.environ[youtube.BASE_ENV] = standin.base_url
+        try:
+            for mode in modes:
+                print(f"[{mode}] 측정 중 ({seconds}초)...", file=sys.stderr, flush=True)
+                results[mode] = run_mode(app, engine, sorted(PAGE_SEGMENTS), mode == "processes", seconds, stub_players)
+        finally:
+            os.environ.pop(youtube.BASE_ENV, None)
+            youtube.set_base(None)
+    return results
+
+
+def print_results(results):
+    def kb(value):
+        return f"{value / 1024:.1f}MB" if value is not None else "-"
+
+    print(f"{'모드':<10}  {'CPU 합계':>9}  {'화면당 CPU':>10}  {'PSS 합계':>10}  {'화면당 PSS':>10}  {'RSS 합계':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<10}  {result['cpu_percent_total']:>8.1f}%  {result['cpu_percent_per_screen']:>9.1f}%  "
+              f"{kb(result['pss_kb_total']):>10}  {kb(result['pss_kb_per_screen']):>10}  {kb(result['rss_kb_total']):>10}")
+        for screen in result['per_screen']:
+            print(f"  화면 {screen['screen'] + 1}: CPU {screen['cpu_percent']:.1f}%, PSS {kb(screen['pss_kb'])}, "
+                  f"RSS {kb(screen['rss_kb'])}")
+        if result['launcher_cpu_percent'] is not None:
+            print(f"  실행기: CPU {result['launcher_cpu_percent']:.1f}%, RSS {kb(result['launcher_rss_kb'])}")
+
+
+def main(argv=None):
+    """
+    단일 프로세스 / 화면별 프로세스 모드의 화면당 CPU, 메모리 비교
+    """
+    parser = argparse.ArgumentParser(description="여러 화면 실행 모드별 CPU/메모리 측정")
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seconds", type=float, default=20, help="측정 시간 (초)")
+    parser.add_argument("--stub-players", action="store_true", help="웹 뷰 없는 가짜 플레이어 사용")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir("/proc"):
+        print("/proc이 없는 환경에서는 측정할 수 없습니다.", file=sys.stderr)
+        return 1
+
+    logging.disable(logging.INFO)
+    results = run([mode for mode in MODES if mode in args.mode], args.seconds, args.stub_players)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, ensure_ascii=False, indent=2)
+            fp.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import (create_test_db, report, summarize, load_baseline, save_baseline,
+                                compare_to_baseline)
+
+# 관리자 창 시작 시간 (프로세스 시작 → 첫 화면 그리기)
+# 매 측정마다 새 프로세스를 띄워 import 비용까지 포함한다.
+
+NAME = "startup"
+VIDEO_COUNT = 5000
+
+
+def child(db_path):
+    # 측정 대상 프로세스: main.py와 같은 순서로 시작하고 첫 Paint 이벤트에서 결과를 출력
+    started = time.perf_counter()
+    marks = {}
+
+    import web_engine
+    web_engine.preload()
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+    from PyQt5.QtWidgets import QApplication
+    from admin import AdminWindow
+    from models import init_db
+    marks['imports_ms'] = time.perf_counter() - started
+
+    app = QApplication([sys.argv[0]])
+    engine = init_db(db_path)
+    marks['init_db_ms'] = time.perf_counter() - started
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint_ms' not in marks:
+                marks['first_paint_ms'] = time.perf_counter() - started
+                # 첫 그리기 뒤에 예약된 탭 구성이 끝날 때까지 기다린 뒤 종료
+                QTimer.singleShot(0, lambda: QTimer.singleShot(0, finish))
+            return False
+
+    def finish():
+        marks['first_tab_ms'] = time.perf_counter() - started
+        print(json.dumps({key: round(value * 1000.0, 3) for key, value in marks.items()}), flush=True)
+        window.data_service.wait_for_done()
+        app.quit()
+
+    window = AdminWindow(engine)
+    paint_filter = FirstPaint()
+    window.installEventFilter(paint_filter)
+    marks['window_ms'] = time.perf_counter() - started
+    window.show()
+    app.exec_()
+
+
+def run(repeat=5, db_path=None):
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_bench_"), "bench.db")
+        create_test_db(db_path, {1: 3, 2: 3}, video_count=VIDEO_COUNT)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", db_path],
+            capture_output=True, text=True, check=True
+        ).stdout
+        wall_ms = (time.perf_counter() - started) * 1000.0
+        marks = json.loads(output.strip().splitlines()[-1])
+        marks['process_exit_ms'] = wall_ms
+        samples.append(marks)
+
+    results = {}
+    for key in samples[0]:
+        results[f"{NAME}_{key[:-3]}"] = summarize([sample[key] for sample in samples])
+    return results
+
+
+def main():
+    """
+    시작 시간 벤치마크. 기준값이 있으면 비교해 20% 이상 느려진 항목이 있으면 실패(종료 코드 1).
+    """
+    parser = argparse.ArgumentParser(description="관리자 창 시작 시간 측정")
+    parser.add_argument("--child", metavar="DB_PATH", help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.child:
+        child(args.child)
+        return 0
+
+    results = run(args.repeat)
+    for name, result in results.items():
+        report(name, result)
+
+    if args.save_baseline:
+        save_baseline(NAME, results)
+        return 0
+
+    regressions = compare_to_baseline(results, load_baseline(NAME), tolerance=args.tolerance)
+    for name, base, current in regressions:
+        print(f"느려짐: {name} 기준 {base:.1f}ms → {current:.1f}ms", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
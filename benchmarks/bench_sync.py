@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import statistics
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import get_app, process_events, create_test_db, prepare_thumbnail_cache, SAMPLE_URLS
+
+# 여러 화면 동기화 정확도 (launcher.py --sync)
+# - 같은 길이의 페이지 1~3을 나란히 끝까지 실행하고, 같은 예정 시각에 일어난 영상 전환의 화면 간 차이(skew)를 측정
+# - 동기화하지 않은 실행(free: 화면마다 창이 준비되는 대로 시작)과 공통 시작 시각을 쓰는 실행(sync)을 비교
+# - sync 실행은 예정 시각보다 얼마나 늦게 전환했는지(지연)도 함께 표시
+# - sync 실행의 최대 차이가 한 프레임(60Hz)을 넘으면 종료 코드 1
+
+PAGE_SEGMENTS = {1: 4, 2: 4, 3: 4}
+VIDEO_DURATION = 0.05  # 분 (3초마다 영상 전환)
+START_COUNTDOWN = 2  # 초
+RUN_TIMEOUT = 120.0
+MODES = ("processes", "inprocess")
+
+
+def stats(values):
+    if not values:
+        return None
+    return {
+        'median_ms': round(statistics.median(values), 3),
+        'max_ms': round(max(values), 3),
+        'count': len(values),
+    }
+
+
+def run_once(app, engine, page_ids, processes, sync, stub_players):
+    from launcher import ScreenLauncher, ProcessScreen
+
+    ProcessScreen.forward_output = False
+    launcher = ScreenLauncher(engine, list(enumerate(page_ids)), processes=processes, windowed=True,
+                              stub_players=stub_players, sync=sync)
+    try:
+        launcher.start()
+        deadline = time.perf_counter() + RUN_TIMEOUT
+        while len(launcher.completed) < len(page_ids):
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"페이지가 끝나지 않았습니다: {launcher.statuses}")
+            process_events(app, 50)
+
+        # 모든 화면이 전환한 예정 시각만 비교
+        skews = [launcher.skews[offset] for offset, times in launcher.boundaries.items()
+                 if len(times) == len(page_ids)]
+        lateness = []
+        if sync:
+            lateness = [(at - launcher.start_at) * 1000 - offset
+                        for offset, times in launcher.boundaries.items() for at in times.values()]
+    finally:
+        launcher.shutdown()
+        process_events(app, 200)
+
+    return {'skew': stats(skews), 'lateness': stats(lateness)}
+
+
+def run(modes=MODES, stub_players=False):
+    app = get_app(web_engine=not stub_players)
+    import youtube
+    from settings import save_config
+    from sqlalchemy.orm import sessionmaker
+    from youtube_standin import YouTubeStandin
+
+    # 화면 프로세스도 같은 썸네일 캐시와 YouTube 대역 서버를 쓰도록 환경 변수로 전달
+    os.environ['DREAMBODY_CACHE_DIR'] = prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_sync_"), "sync.db")
+    engine = create_test_db(db_path, PAGE_SEGMENTS, duration=VIDEO_DURATION)
+    session = sessionmaker(bind=engine)()
+    save_config(session, {'start_countdown': START_COUNTDOWN})
+    session.commit()
+    session.close()
+
+    results = {}
+    with YouTubeStandin(seed=0) as standin:
+        youtube.set_base(standin.base_url)
+        os.environ[youtube.BASE_ENV] = standin.base_url
+        try:
+            for mode in modes:
+                for sync in (False, True):
+                    name = f"{mode}_{'sync' if sync else 'free'}"
+                    print(f"[{name}] 실행 중...", file=sys.stderr, flush=True)
+                    results[name] = run_once(app, engine, sorted(PAGE_SEGMENTS), mode == "processes", sync, stub_players)
+        finally:
+            os.environ.pop(youtube.BASE_ENV, None)
+            youtube.set_base(None)
+    return results
+
+
+def main(argv=None):
+    """
+    화면 간 영상 전환 차이 측정. 동기화 실행의 최대 차이가 한 프레임을 넘으면 종료 코드 1.
+    """
+    from launcher import FRAME_MS
+
+    parser = argparse.ArgumentParser(description="여러 화면 동기화 정확도 측정")
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--stub-players", action="store_true", help="웹 뷰 없는 가짜 플레이어 사용")
+    parser.add_argument("--max-skew-ms", type=float, default=FRAME_MS,
+                        help=f"동기화 실행에서 허용하는 화면 간 최대 차이 (기본값: {FRAME_MS:.1f}ms = 60Hz 한 프레임)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    results = run([mode for mode in MODES if mode in args.mode], args.stub_players)
+
+    failed = False
+    print(f"{'실행':<18}  {'차이 중앙값':>10}  {'차이 최대':>10}  {'지연 중앙값':>10}  {'지연 최대':>10}")
+    for name, result in results.items():
+        skew, lateness = result['skew'], result['lateness']
+        exceeded = name.endswith("_sync") and (skew is None or skew['max_ms'] > args.max_skew_ms)
+        failed = failed or exceeded
+        columns = [skew and skew['median_ms'], skew and skew['max_ms'],
+                   lateness and lateness['median_ms'], lateness and lateness['max_ms']]
+        print(f"{name:<18}  " + "  ".join(f"{value:>9.1f}ms" if value is not None else f"{'-':>11}" for value in columns)
+              + ("  ← 초과" if exceeded else ""))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, ensure_ascii=False, indent=2)
+            fp.write("\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
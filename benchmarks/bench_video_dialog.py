@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import get_app, process_events, measure, report, prepare_thumbnail_cache, SAMPLE_URLS
+
+# 영상 추가/수정 다이얼로그 열기 시간과 미리보기 웹 뷰 생성/재사용 시간 측정
+
+
+def run(repeat=10):
+    app = get_app()
+    import youtube
+    from PyQt5.QtWidgets import QWidget
+    from admin import AddEditVideoDialog
+
+    url = SAMPLE_URLS[0]
+    prepare_thumbnail_cache([youtube.extract_video_id(url)])
+    record = {'id': 1, 'title': "벤치마크 영상", 'url': url,
+              'exercise_type': "근력", 'difficulty': "중간", 'duration': 5.0}
+    owner = QWidget()
+
+    def open_dialog():
+        dialog = AddEditVideoDialog(record, parent=owner)
+        dialog.show()
+        process_events(app)
+        return dialog
+
+    def close_dialog(dialog):
+        dialog.reject()
+        dialog.deleteLater()
+        process_events(app)
+
+    results = {'dialog_open': measure(open_dialog, repeat=repeat, teardown=close_dialog)}
+
+    # 미리보기: 첫 요청은 웹 뷰 생성, 이후는 공유 뷰 재사용
+    def open_with_preview():
+        dialog = open_dialog()
+        dialog.load_preview()
+        process_events(app)
+        return dialog
+
+    results['dialog_preview_first'] = measure(open_with_preview, repeat=1, warmup=0, teardown=close_dialog)
+    results['dialog_preview_reuse'] = measure(open_with_preview, repeat=repeat, teardown=close_dialog)
+
+    return results
+
+
+def main():
+    """
+    영상 다이얼로그 벤치마크
+    """
+    logging.disable(logging.INFO)
+    for name, result in run().items():
+        report(name, result)
+
+
+if __name__ == "__main__":
+    main()
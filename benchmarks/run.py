@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import logging
+import argparse
+import importlib
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import baseline_path, load_baseline, save_baseline, compare_to_baseline
+
+# 전체 벤치마크 실행 및 기준값 비교
+#
+#   python benchmarks/run.py run [--only init_db playback] [--output result.json] [--save-baseline]
+#   python benchmarks/run.py compare 기준.json 현재.json [--tolerance 0.2]
+#
+# 결과는 {항목 이름: {min_ms, median_ms, ...}} 형태의 JSON이며, 기준값은 benchmarks/baselines/suite.json
+
+BASELINE_NAME = "suite"
+
+# (이름, 모듈, 함수) - 함수는 repeat을 받아 결과 dict를 반환
+SUITE = [
+    ("init_db", "bench_init_db", "run"),
+    ("construction", "bench_construction", "run"),
+    ("page_scaling", "bench_page_scaling", "run"),
+    ("timer_tick", "bench_playback", "run_ticks"),
+    ("first_tile", "bench_playback", "run_first_tile"),
+    ("video_dialog", "bench_video_dialog", "run"),
+    ("startup", "bench_startup", "run"),
+]
+
+
+def run_suite(names=None, repeat=5):
+    """
+    선택한 벤치마크를 실행하고 (결과, 실패한 벤치마크 목록)을 반환. 하나가 실패해도 나머지는 계속 실행한다.
+    """
+    results, failures = {}, []
+    for name, module_name, function in SUITE:
+        if names and name not in names:
+            continue
+
+        print(f"[{name}] 실행 중...", file=sys.stderr, flush=True)
+        try:
+            module = importlib.import_module(f"benchmarks.{module_name}")
+            results.update(getattr(module, function)(repeat=repeat))
+        except Exception:
+            traceback.print_exc()
+            failures.append(name)
+    return results, failures
+
+
+def print_comparison(results, baseline, metric="median_ms", tolerance=0.2):
+    """
+    항목별 기준값 대비 변화를 출력하고 느려진 항목 목록을 반환
+    """
+    regressions = {name for name, _, _ in compare_to_baseline(results, baseline, metric, tolerance)}
+    width = max((len(name) for name in results), default=10)
+
+    print(f"{'항목':<{width}}  {'기준':>10}  {'현재':>10}  {'변화':>8}")
+    for name in sorted(results):
+        current = results[name].get(metric)
+        base = (baseline or {}).get(name, {}).get(metric)
+        if current is None:
+            continue
+        if base:
+            change = f"{(current - base) / base * 100:+.1f}%"
+            flag = "  ← 느려짐" if name in regressions else ""
+            print(f"{name:<{width}}  {base:>10.3f}  {current:>10.3f}  {change:>8}{flag}")
+        else:
+            print(f"{name:<{width}}  {'-':>10}  {current:>10.3f}  {'':>8}")
+    return sorted(regressions)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def cmd_run(args):
+    logging.disable(logging.INFO)
+    results, failures = run_suite(args.only, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, ensure_ascii=False, indent=2)
+            fp.write("\n")
+
+    if args.save_baseline:
+        save_baseline(BASELINE_NAME, results)
+        print(f"기준값 저장: {baseline_path(BASELINE_NAME)}")
+        regressions = []
+    else:
+        baseline = load_baseline(BASELINE_NAME)
+        if baseline is None:
+            print("기준값이 없습니다. --save-baseline으로 먼저 저장하세요.", file=sys.stderr)
+        regressions = print_comparison(results, baseline, args.metric, args.tolerance)
+
+    for name in failures:
+        print(f"실패: {name}", file=sys.stderr)
+    return 1 if regressions or failures else 0
+
+
+def cmd_compare(args):
+    regressions = print_comparison(load_results(args.current), load_results(args.baseline), args.metric, args.tolerance)
+    if regressions:
+        print(f"{args.tolerance:.0%} 이상 느려진 항목: {', '.join(regressions)}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    """
+    벤치마크 모음 실행/비교. 느려진 항목이나 실패한 벤치마크가 있으면 종료 코드 1.
+    """
+    parser = argparse.ArgumentParser(description="벤치마크 모음 실행 및 기준값 비교")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("run", help="벤치마크 실행 (기준값이 있으면 비교)")
+    p.add_argument("--only", nargs="+", choices=[name for name, _, _ in SUITE], help="실행할 벤치마크")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--output", help="결과를 저장할 JSON 파일")
+    p.add_argument("--save-baseline", action="store_true", help=f"결과를 기준값({BASELINE_NAME}.json)으로 저장")
+    p.set_defaults(func=cmd_run)
+
+    p = commands.add_parser("compare", help="두 결과 파일 비교")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.set_defaults(func=cmd_compare)
+
+    for p in (commands.choices["run"], commands.choices["compare"]):
+        p.add_argument("--metric", default="median_ms", choices=["min_ms", "median_ms", "mean_ms", "max_ms"])
+        p.add_argument("--tolerance", type=float, default=0.2, help="허용하는 느려짐 비율 (기본값: 0.2)")
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import gc
+import sys
+import json
+import logging
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks._common import (get_app, process_events, create_test_db, prepare_thumbnail_cache, read_rss_kb,
+                                descendant_pids, SAMPLE_URLS)
+
+# 페이지 반복 실행 메모리 누수 점검 (soak)
+# - 관리자 창과 같은 방식으로 페이지를 만들고 닫기를 수백 번 반복 (가상 시계로 일정은 즉시 진행)
+# - 일정 간격마다 Python 힙(tracemalloc), Qt 위젯/객체 수, 프로세스 RSS(웹 엔진 자식 프로세스 포함) 기록
+# - --kiosk: 키오스크 모드(KioskController)로 한 창에서 페이지를 계속 전환하며 같은 항목 기록 (반복 = 페이지 1개)
+# - 워밍업 이후 반복당 증가량(최소제곱 기울기)이 기준을 넘으면 종료 코드 1
+
+PAGE_SEGMENTS = {1: 3, 2: 5, 3: 10}
+VIDEO_DURATION = 0.05  # 분 (가상 시간이므로 실행 시간과 무관)
+
+# 반복당 허용 증가량
+THRESHOLDS = {
+    'rss_kb': 64.0,
+    'heap_kb': 16.0,
+    'widgets': 0.1,
+    'qobjects': 0.1,
+}
+
+
+def process_rss_kb():
+    """
+    (이 프로세스 RSS, 자식 프로세스 포함 RSS) KB. /proc이 없으면 (None, None)
+    """
+    if not os.path.isdir("/proc"):
+        return None, None
+    own = read_rss_kb(os.getpid())
+    return own, own + sum(read_rss_kb(pid) for pid in descendant_pids(os.getpid()))
+
+
+def count_qobjects():
+    # Python 쪽에서 참조 중인 Qt 객체 수 (참조가 남아 해제되지 않는 객체 확인용)
+    from PyQt5.QtCore import QObject
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, QObject))
+
+
+def take_sample(app, iteration):
+    from PyQt5.QtCore import QEvent
+
+    # 예약된 deleteLater를 처리한 뒤 측정
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+    gc.collect()
+
+    own_rss, total_rss = process_rss_kb()
+    widgets = app.allWidgets()
+    return {
+        'iteration': iteration,
+        'heap_kb': round(tracemalloc.get_traced_memory()[0] / 1024.0, 1),
+        'rss_kb': total_rss,
+        'own_rss_kb': own_rss,
+        'widgets': len(widgets),
+        'web_views': sum(1 for widget in widgets if type(widget).__name__ == "QWebEngineView"),
+        'qobjects': count_qobjects(),
+    }
+
+
+def stub_player_factory(order, url, title, parent):
+    from simulation import SimulatedPlayer
+    return SimulatedPlayer(order, url, title, lambda event, player: None, parent)
+
+
+def slope(points):
+    # 최소제곱 기울기 (반복당 증가량)
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+class PageRunner:
+    """
+    관리자 창(AdminWindow.launch_page/on_page_completed)과 같은 순서로 페이지를 열고 닫는다.
+    """
+
+    def __init__(self, app, engine, stub_players):
+        self.app = app
+        self.engine = engine
+        self.stub_players = stub_players
+        self.workout_page = None
+
+    def run_page(self, page_id):
+        from page import WorkoutPage
+        from simulation import VirtualClock
+
+        clock = VirtualClock()
+        player_factory = stub_player_factory if self.stub_players else None
+
+        completed = []
+        self.workout_page = WorkoutPage(self.engine, page_id, timer_factory=clock.timer, player_factory=player_factory)
+        self.workout_page.resize(540, 960)
+        self.workout_page.show()
+        self.workout_page.page_completed.connect(completed.append)
+
+        clock.run(stop=lambda: bool(completed))
+        process_events(self.app)
+        if not completed:
+            raise RuntimeError(f"페이지 {page_id}가 끝나지 않았습니다.")
+
+        self.close_page()
+
+    def close_page(self):
+        self.workout_page.close()
+
+
+class KioskRunner:
+    """
+    키오스크 모드로 한 창에서 페이지를 계속 전환한다 (run_page는 다음 페이지 하나가 끝날 때까지 실행).
+    """
+
+    def __init__(self, app, engine, page_ids, stub_players):
+        from kiosk import KioskController
+        from simulation import VirtualClock
+
+        self.app = app
+        self.clock = VirtualClock()
+        self.controller = KioskController(
+            engine, page_ids,
+            timer_factory=self.clock.timer,
+            player_factory=stub_player_factory if stub_players else None
+        )
+        self.controller.start(fullscreen=False).resize(540, 960)
+        self.switch_ms = []
+
+    def run_page(self, page_id):
+        target = self.controller.pages_played + 1
+        self.clock.run(stop=lambda: self.controller.pages_played >= target)
+        process_events(self.app)
+        if self.controller.pages_played < target:
+            raise RuntimeError(f"페이지 {page_id}가 끝나지 않았습니다.")
+        self.switch_ms.append(self.controller.last_switch_ms)
+
+    def close(self):
+        self.controller.stop()
+
+
+def run(iterations=200, warmup=20, sample_every=10, stub_players=False, kiosk=False):
+    app = get_app(web_engine=not stub_players)
+    import youtube
+    from youtube_standin import YouTubeStandin
+
+    prepare_thumbnail_cache([youtube.extract_video_id(url) for url in SAMPLE_URLS])
+    db_path = os.path.join(tempfile.mkdtemp(prefix="dreambody_soak_"), "soak.db")
+    engine = create_test_db(db_path, PAGE_SEGMENTS, duration=VIDEO_DURATION)
+    page_ids = sorted(PAGE_SEGMENTS)
+
+    # 마지막 페이지는 다음 실행 전까지 살아 있으므로 항상 같은 페이지 뒤에서 측정
+    sample_every = max(1, round(sample_every / len(page_ids))) * len(page_ids)
+
+    samples = []
+    with YouTubeStandin(seed=0) as standin:
+        youtube.set_base(standin.base_url)
+        try:
+            if kiosk:
+                runner = KioskRunner(app, engine, page_ids, stub_players)
+            else:
+                runner = PageRunner(app, engine, stub_players)
+            tracemalloc.start()
+            for iteration in range(1, iterations + 1):
+                runner.run_page(page_ids[(iteration - 1) % len(page_ids)])
+                if iteration % sample_every == 0 or iteration == iterations:
+                    samples.append(take_sample(app, iteration))
+                    print(json.dumps(samples[-1]), file=sys.stderr, flush=True)
+            tracemalloc.stop()
+
+            if kiosk:
+                switch_ms = sorted(runner.switch_ms)
+                print(f"페이지 전환 중앙값 {switch_ms[len(switch_ms) // 2]:.1f}ms, 최대 {switch_ms[-1]:.1f}ms")
+                runner.close()
+        finally:
+            youtube.set_base(os.environ.get(youtube.BASE_ENV))
+
+    return samples, growth(samples, warmup)
+
+
+def growth(samples, warmup):
+    """
+    워밍업 이후 항목별 반복당 증가량
+    """
+    steady = [sample for sample in samples if sample['iteration'] > warmup]
+    result = {}
+    for key in THRESHOLDS:
+        points = [(sample['iteration'], sample[key]) for sample in steady if sample[key] is not None]
+        result[key] = round(slope(points), 4) if points else None
+    return result
+
+
+def main(argv=None):
+    """
+    페이지 반복 실행 메모리 점검. 반복당 증가량이 기준을 넘으면 종료 코드 1.
+    """
+    parser = argparse.ArgumentParser(description="페이지 반복 실행 메모리 누수 점검")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20, help="증가량 계산에서 제외할 처음 반복 수")
+    parser.add_argument("--sample-every", type=int, default=10)
+    parser.add_argument("--stub-players", action="store_true", help="웹 뷰 없는 가짜 플레이어 사용")
+    parser.add_argument("--kiosk", action="store_true", help="키오스크 모드로 한 창에서 페이지 전환")
+    parser.add_argument("--output", help="측정값을 저장할 JSON 파일")
+    for key, default in THRESHOLDS.items():
+        parser.add_argument(f"--max-{key.replace('_', '-')}", type=float, default=default,
+                            help=f"반복당 허용 {key} 증가량 (기본값: {default})")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    samples, per_iteration = run(args.iterations, args.warmup, args.sample_every, args.stub_players, args.kiosk)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump({'samples': samples, 'growth_per_iteration': per_iteration}, fp, indent=2)
+            fp.write("\n")
+
+    failed = []
+    for key, value in per_iteration.items():
+        limit = getattr(args, f"max_{key}")
+        exceeded = value is not None and value > limit
+        print(f"{key:10s} 반복당 {value if value is not None else '-':>10}  (기준 {limit}){'  ← 초과' if exceeded else ''}")
+        if exceeded:
+            failed.append(key)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
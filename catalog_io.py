@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import csv
+import json
+import time
+import logging
+import argparse
+from sqlalchemy.orm import sessionmaker
+from models import Video
+from youtube import normalize_url, extract_video_id
+
+logger = logging.getLogger("DreamBodyVideo.CatalogIO")
+
+# 영상 목록 가져오기/내보내기 (CSV, JSON Lines)
+# - 입력은 한 줄씩 읽어 배치 단위로 executemany INSERT (메모리 사용량 일정)
+# - URL은 표준 형태로 정규화하고 YouTube ID 기준으로 중복 제거 (배치마다 해당 영상만 DB에서 확인)
+
+FIELDS = ('title', 'url', 'exercise_type', 'difficulty', 'duration')
+FORMATS = ('csv', 'jsonl')
+BATCH_SIZE = 1000
+LOOKUP_CHUNK = 500  # 중복 확인 쿼리 하나에 넣는 영상 수 (SQLite 변수 개수 제한)
+
+# 같은 영상으로 보는 기존 URL 형태 (관리자 화면에서 직접 입력한 URL 포함, videos.url 인덱스로 조회)
+URL_FORMS = (
+    "https://www.youtube.com/watch?v={}", "https://youtube.com/watch?v={}", "https://m.youtube.com/watch?v={}",
+    "http://www.youtube.com/watch?v={}", "http://youtube.com/watch?v={}",
+    "www.youtube.com/watch?v={}", "youtube.com/watch?v={}",
+    "https://youtu.be/{}", "http://youtu.be/{}", "youtu.be/{}",
+    "https://www.youtube.com/embed/{}", "https://www.youtube.com/shorts/{}", "{}",
+)
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (csv, jsonl)")
+
+
+def iter_raw_records(fp, fmt):
+    if fmt == 'csv':
+        for row in csv.DictReader(fp):
+            yield row
+    else:
+        for line_number, line in enumerate(fp, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"{line_number}번째 줄 JSON 오류: {e}")
+
+
+def parse_duration(value):
+    """
+    영상 길이를 분 단위 실수로 변환 ("5", "5.5", "5:30" 모두 허용)
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    value = str(value).strip()
+    if ":" in value:
+        minutes, seconds = value.split(":", 1)
+        return int(minutes) + int(seconds) / 60.0
+    return float(value)
+
+
+def text_field(raw, key):
+    # JSON Lines는 숫자 등 문자열이 아닌 값도 올 수 있음
+    value = raw.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def normalize_record(raw):
+    if isinstance(raw, Exception):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ValueError("레코드 형식이 올바르지 않습니다.")
+
+    title = text_field(raw, 'title')
+    if not title:
+        raise ValueError("제목이 없습니다.")
+
+    video_id, url = normalize_url(text_field(raw, 'url'))
+
+    try:
+        duration = parse_duration(raw.get('duration'))
+    except (TypeError, ValueError):
+        raise ValueError(f"영상 길이 형식 오류: {raw.get('duration')!r}")
+
+    record = {
+        'title': title[:100],
+        'url': url,
+        'exercise_type': text_field(raw, 'exercise_type') or None,
+        'difficulty': text_field(raw, 'difficulty') or None,
+        'duration': duration
+    }
+    return video_id, record
+
+
+def existing_video_ids(session, video_ids):
+    # video_ids 중 이미 등록된 영상의 YouTube ID
+    video_ids = list(video_ids)
+    found = set()
+    for start in range(0, len(video_ids), LOOKUP_CHUNK):
+        urls = [form.format(video_id) for video_id in video_ids[start:start + LOOKUP_CHUNK] for form in URL_FORMS]
+        for (url,) in session.query(Video.url).filter(Video.url.in_(urls)):
+            found.add(extract_video_id(url))
+    return found
+
+
+def import_records(session, raw_records, batch_size=BATCH_SIZE, progress=None):
+    """
+    레코드를 검증·정규화해 배치 단위로 저장하고 통계를 반환
+    """
+    stats = {'read': 0, 'inserted': 0, 'duplicates': 0, 'invalid': 0, 'errors': []}
+    insert = Video.__table__.insert()
+    batch = {}  # YouTube ID -> 레코드 (배치 안의 중복은 처음 것만)
+
+    def flush():
+        if batch:
+            existing = existing_video_ids(session, batch)
+            records = [record for video_id, record in batch.items() if video_id not in existing]
+            if records:
+                session.execute(insert, records)  # executemany
+                session.commit()
+            stats['duplicates'] += len(existing)
+            stats['inserted'] += len(records)
+            batch.clear()
+        if progress:
+            progress(stats['read'], 0)
+
+    for raw in raw_records:
+        stats['read'] += 1
+        try:
+            video_id, record = normalize_record(raw)
+        except ValueError as e:
+            stats['invalid'] += 1
+            if len(stats['errors']) < 20:
+                stats['errors'].append(f"{stats['read']}번째 레코드: {e}")
+            continue
+
+        if video_id in batch:
+            stats['duplicates'] += 1
+            continue
+
+        batch[video_id] = record
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+    logger.info(
+        f"가져오기 완료: 읽음 {stats['read']}, 추가 {stats['inserted']}, "
+        f"중복 {stats['duplicates']}, 오류 {stats['invalid']}"
+    )
+    return stats
+
+
+def import_file(session, path, fmt=None, batch_size=BATCH_SIZE, progress=None):
+    fmt = fmt or detect_format(path)
+    with open(path, newline='', encoding='utf-8-sig') as fp:
+        return import_records(session, iter_raw_records(fp, fmt), batch_size, progress)
+
+
+def export_file(session, path, fmt=None, progress=None):
+    fmt = fmt or detect_format(path)
+    columns = [getattr(Video, field) for field in ('id',) + FIELDS]
+    count = 0
+
+    with open(path, 'w', newline='', encoding='utf-8') as fp:
+        writer = csv.writer(fp) if fmt == 'csv' else None
+        if writer:
+            writer.writerow(('id',) + FIELDS)
+
+        for row in session.query(*columns).order_by(Video.id).yield_per(BATCH_SIZE):
+            if writer:
+                writer.writerow(row)
+            else:
+                fp.write(json.dumps(dict(zip(('id',) + FIELDS, row)), ensure_ascii=False) + "\n")
+            count += 1
+            if progress and count % BATCH_SIZE == 0:
+                progress(count, 0)
+
+    if progress:
+        progress(count, count)
+    logger.info(f"내보내기 완료: {count}개 → {path}")
+    return count
+
+
+def main(argv=None):
+    """
+    영상 목록 가져오기/내보내기 명령
+    """
+    from models import init_db
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    parser = argparse.ArgumentParser(description="영상 목록 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=FORMATS, help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    engine = init_db()
+    session = sessionmaker(bind=engine)()
+    started = time.perf_counter()
+
+    def report(done, total):
+        logger.info(f"진행: {done}개 처리")
+
+    try:
+        if args.command == "import":
+            stats = import_file(session, args.path, args.format, args.batch_size, progress=report)
+            for error in stats['errors']:
+                logger.warning(error)
+        else:
+            export_file(session, args.path, args.format, progress=report)
+    finally:
+        session.close()
+
+    logger.info(f"소요 시간: {time.perf_counter() - started:.2f}초")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import time
+import sqlite3
+import logging
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from config_service import get_config_service
+from models import CHANGE_TABLE, WATCHED_TABLES
+
+logger = logging.getLogger("DreamBodyVideo.ChangeWatcher")
+
+# 실행 중인 페이지가 DB 변경(영상 정보, 페이지 할당, 설정, 편성표)을 알 수 있도록 주기적으로 확인
+# - 별도 SQLite 연결에서 PRAGMA data_version만 읽음 (다른 연결/프로세스가 커밋하면 값이 바뀜, 쿼리 없이 몇 μs)
+# - 바뀌면 테이블별 변경 번호(models.ensure_change_tracking 트리거)를 읽어 재생과 관계있는 테이블이 바뀐 경우만 알림
+#   링크 검사 결과 저장이나 영상 가져오기는 번호를 바꾸지 않으므로 페이지를 깨우지 않음
+# - 여러 번 나눠 커밋하는 작업은 변경이 멈출 때까지(최대 MAX_SETTLE_MS) 모아서 한 번만 알림
+# - 설정이 바뀌었으면 다시 읽어 config_changed로 알리고(ConfigService), database_changed(바뀐 테이블)를 보냄
+#   페이지는 자기 재생 목록만 다시 읽어 비교함 (WorkoutPage.on_database_changed)
+# - 관리자 창/cli.py/다른 프로세스의 변경을 모두 같은 방식으로 감지
+
+POLL_INTERVAL_MS = 1000
+SETTLE_INTERVAL_MS = 250  # 변경을 감지한 뒤에는 이 간격으로 확인하다가 변경이 멈추면 알림
+MAX_SETTLE_MS = 3000  # 변경이 계속되어도 이 시간이 지나면 알림
+
+
+class ChangeWatcher(QObject):
+    """
+    DB 파일 하나의 변경 감시. 사용하는 쪽이 있는 동안만(acquire/release) 확인한다.
+    """
+    database_changed = pyqtSignal(object)  # 바뀐 테이블 이름 (frozenset)
+
+    def __init__(self, engine, parent=None, interval_ms=POLL_INTERVAL_MS):
+        super().__init__(parent)
+        self.engine = engine
+        self.path = engine.url.database
+        self.connection = None
+        self.version = None
+        self.table_versions = {}
+        self.pending = set()  # 아직 알리지 않은 변경 테이블
+        self.pending_since = None
+        self.users = 0
+        self.interval_ms = interval_ms
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    @property
+    def enabled(self):
+        # 메모리 DB는 다른 연결과 공유되지 않으므로 감시할 수 없음
+        return bool(self.path) and self.path != ":memory:"
+
+    def acquire(self):
+        self.users += 1
+        if self.users == 1 and self.enabled:
+            self.version = None
+            self.read_changes()  # 지금 상태를 기준으로 삼음
+            self.timer.start()
+
+    def release(self):
+        self.users = max(self.users - 1, 0)
+        if self.users == 0:
+            self.timer.stop()
+            self.timer.setInterval(self.interval_ms)
+            self.pending.clear()
+            self.close()
+
+    def read_version(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def read_changes(self):
+        # 마지막 확인 이후 바뀐 테이블
+        version = self.read_version()
+        if version == self.version:
+            return set()
+        self.version = version
+        try:
+            versions = dict(self.connection.execute(f"SELECT name, version FROM {CHANGE_TABLE}"))
+        except sqlite3.OperationalError:
+            return set(WATCHED_TABLES)  # 변경 기록 테이블이 없는 DB - 모두 바뀐 것으로 봄
+        changed = {name for name, value in versions.items() if self.table_versions.get(name) != value}
+        self.table_versions = versions
+        return changed
+
+    def poll(self):
+        try:
+            changed = self.read_changes()
+        except sqlite3.Error as e:
+            logger.warning(f"DB 변경 확인 실패: {e}")
+            self.close()  # 다음 확인 때 다시 연결
+            return
+
+        if changed:
+            if not self.pending:
+                self.pending_since = time.monotonic()
+                self.timer.setInterval(SETTLE_INTERVAL_MS)
+            self.pending |= changed
+            if (time.monotonic() - self.pending_since) * 1000 < MAX_SETTLE_MS:
+                return
+        if self.pending:
+            self.notify()
+
+    def notify(self):
+        tables, self.pending = frozenset(self.pending), set()
+        self.timer.setInterval(self.interval_ms)
+        logger.info(f"DB 변경 감지: {', '.join(sorted(tables))}")
+        if 'config' in tables:
+            get_config_service(self.engine).reload()  # 설정이 바뀌었으면 config_changed
+        self.database_changed.emit(tables)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+_watchers = {}
+
+
+def get_change_watcher(engine):
+    # 엔진별로 하나의 감시자를 공유 (페이지가 여러 개여도 확인은 한 번)
+    watcher = _watchers.get(engine)
+    if watcher is None:
+        watcher = ChangeWatcher(engine)
+        _watchers[engine] = watcher
+    return watcher
@@ -0,0 +1,533 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.orm import sessionmaker
+import models
+import repository
+from catalog_io import FORMATS, BATCH_SIZE
+from settings import CONFIG_FIELDS, seed_defaults, load_config, save_config
+
+logger = logging.getLogger("DreamBodyVideo.CLI")
+
+# 명령줄 관리 도구 (Qt를 import하지 않으므로 화면 없이 빠르게 실행됨)
+#
+#   python cli.py videos list|search|add|delete|import|export
+#   python cli.py pages list|show|assign|validate
+#   python cli.py schedule list|add|delete|now
+#   python cli.py config get|set
+#   python cli.py migrate
+#   python cli.py remote status|start|stop|skip|volume --url URL [--url URL ...]  (DB를 쓰지 않음)
+#
+# --json을 주면 결과를 JSON으로 출력한다 (스크립트/자동화용).
+
+VIDEO_COLUMNS = ('id', 'title', 'exercise_type', 'difficulty', 'duration', 'health_status', 'url')
+
+
+class CommandError(Exception):
+    """사용자에게 보여 줄 명령 실행 오류"""
+
+
+def print_json(data):
+    print(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+
+
+def print_table(rows, columns):
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if row.get(column) is None else str(row[column]) for column in columns))
+
+
+def output(args, data, columns=None):
+    if args.json:
+        print_json(data)
+    elif columns is not None:
+        print_table(data, columns)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            print(f"{key}\t{value}")
+    else:
+        print(data)
+
+
+# --- 영상 ---
+
+def cmd_videos_list(session, args):
+    if args.broken:
+        from health_check import BROKEN_STATUSES
+        query = session.query(models.Video).filter(models.Video.health_status.in_(BROKEN_STATUSES))
+        videos = [repository.video_to_record(video) for video in query.order_by(models.Video.id).limit(args.limit)]
+    else:
+        videos = repository.fetch_videos_page(session, args.after, args.limit)
+    output(args, videos, VIDEO_COLUMNS)
+
+
+def cmd_videos_search(session, args):
+    output(args, repository.search_videos(session, args.keyword, args.limit), ('id', 'title', 'exercise_type', 'difficulty'))
+
+
+def cmd_videos_add(session, args):
+    from catalog_io import normalize_record
+
+    try:
+        _, record = normalize_record({
+            'title': args.title, 'url': args.url, 'exercise_type': args.exercise_type,
+            'difficulty': args.difficulty, 'duration': args.duration
+        })
+    except ValueError as e:
+        raise CommandError(str(e))
+
+    video = repository.add_video(session, record)
+    session.commit()
+    output(args, video)
+
+
+def cmd_videos_delete(session, args):
+    result = repository.delete_videos(session, args.ids)
+    session.commit()
+    output(args, result)
+
+
+def cmd_videos_import(session, args):
+    import catalog_io
+
+    if not os.path.exists(args.path):
+        raise CommandError(f"파일이 없습니다: {args.path}")
+    stats = catalog_io.import_file(session, args.path, args.format, args.batch_size)
+    output(args, stats)
+
+
+def cmd_videos_export(session, args):
+    import catalog_io
+
+    count = catalog_io.export_file(session, args.path, args.format)
+    output(args, {'exported': count, 'path': args.path})
+
+
+# --- 페이지 ---
+
+def require_page(session, page_id):
+    page = session.query(models.Page).filter_by(id=page_id).first()
+    if not page:
+        raise CommandError(f"페이지가 없습니다: {page_id}")
+    return page
+
+
+def cmd_pages_list(session, args):
+    pages = repository.list_pages(session)
+    for page in pages:
+        page['videos'] = repository.count_page_videos(session, page['id'])
+    output(args, pages, ('id', 'name', 'videos'))
+
+
+def cmd_pages_show(session, args):
+    require_page(session, args.page_id)
+    output(args, repository.load_page_playlist(session, args.page_id),
+           ('order', 'display_number', 'video_id', 'title', 'duration'))
+
+
+def parse_slot(text):
+    # "영상ID" 또는 "영상ID:표시번호"
+    video_id, _, display_number = text.partition(":")
+    try:
+        return int(video_id), int(display_number) if display_number else None
+    except ValueError:
+        raise CommandError(f"칸 형식 오류: {text!r} (영상ID 또는 영상ID:표시번호)")
+
+
+def cmd_pages_assign(session, args):
+    require_page(session, args.page_id)
+    slots = [parse_slot(text) for text in args.slots]
+    slots = [(video_id, display_number or position) for position, (video_id, display_number) in enumerate(slots, 1)]
+
+    stored = repository.get_page_assignments(session, args.page_id)
+    assignments = repository.build_page_assignments(stored, slots)
+    try:
+        stats = repository.apply_page_changes(session, {args.page_id: assignments})[args.page_id]
+    except ValueError as e:
+        session.rollback()
+        raise CommandError(str(e))
+    session.commit()
+    output(args, stats)
+
+
+def validate_page(session, page_id, broken_statuses):
+    """
+    페이지 실행 가능 여부 검사 결과 {'page_id', 'ok', 'errors', 'warnings'}
+    """
+    errors, warnings = [], []
+    status = repository.page_run_status(session, page_id, broken_statuses)
+    assigned = repository.count_page_videos(session, page_id)
+
+    if status['count'] < 1:
+        errors.append("할당된 영상이 없습니다.")
+    if assigned != status['count']:
+        errors.append(f"존재하지 않는 영상이 할당된 칸이 {assigned - status['count']}개 있습니다.")
+    for video in status['broken']:
+        errors.append(f"{video['order']}번 칸 영상(ID={video['video_id']})을 재생할 수 없습니다: {video['health_status']}")
+
+    display_numbers = [a['display_number'] for a in repository.get_page_assignments(session, page_id)]
+    duplicates = sorted({number for number in display_numbers if display_numbers.count(number) > 1})
+    if duplicates:
+        warnings.append(f"표시 번호가 중복되었습니다: {duplicates}")
+
+    return {'page_id': page_id, 'ok': not errors, 'errors': errors, 'warnings': warnings}
+
+
+def cmd_pages_validate(session, args):
+    from health_check import BROKEN_STATUSES
+
+    page_ids = args.page_ids or [page['id'] for page in repository.list_pages(session)]
+    results = []
+    for page_id in page_ids:
+        require_page(session, page_id)
+        results.append(validate_page(session, page_id, BROKEN_STATUSES))
+
+    if args.json:
+        print_json(results)
+    else:
+        for result in results:
+            print(f"페이지 {result['page_id']}: {'정상' if result['ok'] else '오류'}")
+            for message in result['errors']:
+                print(f"  오류: {message}")
+            for message in result['warnings']:
+                print(f"  경고: {message}")
+    return 0 if all(result['ok'] for result in results) else 1
+
+
+# --- 편성표 ---
+
+SCHEDULE_COLUMNS = ('id', 'weekday', 'start', 'end', 'page_id', 'page_name', 'priority')
+
+
+def schedule_row(record):
+    from schedule import WEEKDAY_NAMES, format_minute
+
+    return {
+        **record,
+        'weekday': WEEKDAY_NAMES[record['weekday']],
+        'start': format_minute(record['start_minute']),
+        'end': format_minute(record['end_minute']),
+    }
+
+
+def cmd_schedule_list(session, args):
+    records = repository.list_schedules(session)
+    output(args, records if args.json else [schedule_row(record) for record in records], SCHEDULE_COLUMNS)
+
+
+def cmd_schedule_add(session, args):
+    from schedule import parse_weekdays, parse_time
+
+    try:
+        records = repository.add_schedules(
+            session, parse_weekdays(args.days), parse_time(args.start), parse_time(args.end),
+            args.page_id, args.priority
+        )
+    except ValueError as e:
+        session.rollback()
+        raise CommandError(str(e))
+    session.commit()
+    output(args, records if args.json else [schedule_row(record) for record in records], SCHEDULE_COLUMNS[:5] + ('priority',))
+
+
+def cmd_schedule_delete(session, args):
+    deleted = repository.delete_schedules(session, args.ids)
+    session.commit()
+    output(args, {'deleted': deleted})
+
+
+def cmd_schedule_now(session, args):
+    from schedule import load_schedule, local_zone, describe
+
+    schedule = load_schedule(session, local_zone(args.timezone))
+    current = schedule.at()
+    change = schedule.next_change()
+    result = {
+        'timezone': str(schedule.zone),
+        'current': current._asdict() if current else None,
+        'next_change_at': change[0].astimezone(schedule.zone).isoformat() if change else None,
+        'next': change[1]._asdict() if change and change[1] else None,
+    }
+    if args.json:
+        print_json(result)
+        return
+
+    def label(entry):
+        return f"{describe(entry)} (페이지 {entry.page_id})" if entry else "편성 없음"
+
+    print(f"시간대\t{result['timezone']}")
+    print(f"현재\t{label(current)}")
+    if change:
+        print(f"다음 변경\t{result['next_change_at']}\t{label(change[1])}")
+
+
+# --- 설정/마이그레이션 ---
+
+def cmd_config_get(session, args):
+    snapshot = load_config(session)
+    if args.key:
+        output(args, {args.key: snapshot[args.key]})
+    else:
+        output(args, snapshot.as_dict())
+
+
+def cmd_config_set(session, args):
+    values = {}
+    for pair in args.pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise CommandError(f"설정 형식 오류: {pair!r} (키=값)")
+        values[key.strip()] = value.strip()
+
+    try:
+        snapshot = save_config(session, values)
+    except KeyError as e:
+        raise CommandError(e.args[0])
+    session.commit()
+    output(args, {key: snapshot[key] for key in values})
+
+
+def cmd_migrate(session, args):
+    # 테이블 생성과 스키마 보완은 main()에서 모든 명령 전에 이미 실행됨
+    output(args, {'db': args.db, 'added_columns': args.added_columns})
+
+
+# --- 원격 제어 ---
+
+REMOTE_TIMEOUT = 10  # 초
+REMOTE_WORKERS = 32
+REMOTE_TOKEN_FILE = os.environ.get("DREAMBODY_API_TOKEN_FILE") or os.path.join(os.path.expanduser("~"), ".dreambody_api_token")
+
+
+def default_remote_token():
+    # DREAMBODY_API_TOKEN, 없으면 이 장비의 키오스크/실행기가 만든 토큰 파일 (remote_api.TOKEN_FILE)
+    token = os.environ.get("DREAMBODY_API_TOKEN")
+    if token:
+        return token
+    try:
+        with open(REMOTE_TOKEN_FILE, encoding="utf-8") as fp:
+            return fp.read().strip() or None
+    except OSError:
+        return None
+
+
+def remote_request(url, command, params, token=None, timeout=REMOTE_TIMEOUT):
+    """
+    원격 제어 API(remote_api.py)에 명령 하나를 보내고 응답({"ok": ..., "result"/"error": ...})을 반환
+    """
+    import urllib.error
+    import urllib.parse
+    import urllib.request
+
+    target = f"{url.rstrip('/')}/{command}"
+    if command == 'status':
+        request = urllib.request.Request(f"{target}?{urllib.parse.urlencode(params)}" if params else target)
+    else:
+        request = urllib.request.Request(target, data=json.dumps(params).encode("utf-8"), method="POST",
+                                         headers={'Content-Type': 'application/json'})
+    if token:
+        request.add_header('Authorization', f"Bearer {token}")
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        try:
+            return json.loads(e.read())
+        except ValueError:
+            return {'ok': False, 'error': f"HTTP {e.code}"}
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return {'ok': False, 'error': str(getattr(e, 'reason', e))}
+
+
+def remote_summary(result):
+    # 키오스크는 상태 하나, 여러 화면 실행기는 화면별 상태 목록
+    parts = []
+    for status in result.get('screens', [result]):
+        text = f"페이지 {status.get('page_id')} {status.get('state')}"
+        if status.get('segment'):
+            text += f" {status['segment']}/{status.get('segments')}번 영상 {status.get('remaining_seconds')}초 남음"
+        elif status.get('countdown') is not None:
+            text += f" {status['countdown']}초"
+        if 'screen' in status:
+            text = f"화면 {status['screen']}: {text}"
+        parts.append(text)
+    return ", ".join(parts)
+
+
+def cmd_remote(session, args):
+    params = {key: value for key, value in (('page_id', args.page_id), ('volume', args.volume), ('screen', args.screen))
+              if value is not None}
+    token = args.token or default_remote_token()
+    # 여러 키오스크에 동시에 보냄 (한 곳이 응답하지 않아도 나머지는 바로 처리)
+    with ThreadPoolExecutor(max_workers=min(len(args.urls), REMOTE_WORKERS)) as pool:
+        replies = list(pool.map(lambda url: remote_request(url, args.command, params, token), args.urls))
+
+    results = [{'url': url, **reply} for url, reply in zip(args.urls, replies)]
+    if args.json:
+        print_json(results)
+    else:
+        for result in results:
+            detail = remote_summary(result['result']) if result.get('ok') else f"오류: {result.get('error')}"
+            print(f"{result['url']}\t{detail}")
+    return 0 if all(result.get('ok') for result in results) else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="운동 영상 관리 명령줄 도구")
+    parser.add_argument("--db", default=models.DB_PATH, help="데이터베이스 파일 (기본값: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="로그 출력")
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    # 영상
+    videos = groups.add_parser("videos", help="영상 목록 관리").add_subparsers(dest="command", required=True)
+
+    p = videos.add_parser("list", help="영상 목록")
+    p.add_argument("--after", type=int, help="이 ID 다음부터")
+    p.add_argument("--limit", type=int, default=100)
+    p.add_argument("--broken", action="store_true", help="링크 검사에서 재생 불가로 확인된 영상만")
+    p.set_defaults(func=cmd_videos_list)
+
+    p = videos.add_parser("search", help="영상 검색")
+    p.add_argument("keyword")
+    p.add_argument("--limit", type=int, default=50)
+    p.set_defaults(func=cmd_videos_search)
+
+    p = videos.add_parser("add", help="영상 추가")
+    p.add_argument("--title", required=True)
+    p.add_argument("--url", required=True)
+    p.add_argument("--type", dest="exercise_type")
+    p.add_argument("--difficulty")
+    p.add_argument("--duration", help="분 또는 분:초")
+    p.set_defaults(func=cmd_videos_add)
+
+    p = videos.add_parser("delete", help="영상 삭제 (페이지 할당 포함)")
+    p.add_argument("ids", nargs="+", type=int)
+    p.set_defaults(func=cmd_videos_delete)
+
+    p = videos.add_parser("import", help="CSV/JSONL 파일에서 가져오기")
+    p.add_argument("path")
+    p.add_argument("--format", choices=FORMATS)
+    p.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    p.set_defaults(func=cmd_videos_import)
+
+    p = videos.add_parser("export", help="CSV/JSONL 파일로 내보내기")
+    p.add_argument("path")
+    p.add_argument("--format", choices=FORMATS)
+    p.set_defaults(func=cmd_videos_export)
+
+    # 페이지
+    pages = groups.add_parser("pages", help="페이지 관리").add_subparsers(dest="command", required=True)
+
+    p = pages.add_parser("list", help="페이지 목록")
+    p.set_defaults(func=cmd_pages_list)
+
+    p = pages.add_parser("show", help="페이지 재생 목록")
+    p.add_argument("page_id", type=int)
+    p.set_defaults(func=cmd_pages_show)
+
+    p = pages.add_parser("assign", help="페이지 영상 할당 (재생 순서대로, 바뀐 칸만 저장)")
+    p.add_argument("page_id", type=int)
+    p.add_argument("slots", nargs="+", metavar="VIDEO_ID[:DISPLAY_NUMBER]")
+    p.set_defaults(func=cmd_pages_assign)
+
+    p = pages.add_parser("validate", help="페이지 실행 가능 여부 검사 (문제가 있으면 종료 코드 1)")
+    p.add_argument("page_ids", nargs="*", type=int)
+    p.set_defaults(func=cmd_pages_validate)
+
+    # 편성표
+    schedule = groups.add_parser("schedule", help="시간대별 페이지 편성표").add_subparsers(dest="command", required=True)
+
+    p = schedule.add_parser("list", help="편성 목록")
+    p.set_defaults(func=cmd_schedule_list)
+
+    p = schedule.add_parser("add", help="편성 추가 (종료가 시작보다 이르면 다음 날 종료)")
+    p.add_argument("page_id", type=int)
+    p.add_argument("start", metavar="HH:MM")
+    p.add_argument("end", metavar="HH:MM")
+    p.add_argument("--days", default="매일", help="요일 (예: 월,수,금 / 매일 / 평일 / 주말, 기본값: 매일)")
+    p.add_argument("--priority", type=int, default=0, help="시간이 겹치면 높은 값 우선")
+    p.set_defaults(func=cmd_schedule_add)
+
+    p = schedule.add_parser("delete", help="편성 삭제")
+    p.add_argument("ids", nargs="+", type=int)
+    p.set_defaults(func=cmd_schedule_delete)
+
+    p = schedule.add_parser("now", help="지금 편성과 다음 변경 시각")
+    p.add_argument("--timezone", help="시간대 (예: Asia/Seoul, 기본값: 시스템 시간대)")
+    p.set_defaults(func=cmd_schedule_now)
+
+    # 설정
+    config = groups.add_parser("config", help="시스템 설정").add_subparsers(dest="command", required=True)
+
+    p = config.add_parser("get", help="설정 조회")
+    p.add_argument("key", nargs="?", choices=[field.key for field in CONFIG_FIELDS])
+    p.set_defaults(func=cmd_config_get)
+
+    p = config.add_parser("set", help="설정 변경")
+    p.add_argument("pairs", nargs="+", metavar="KEY=VALUE")
+    p.set_defaults(func=cmd_config_set)
+
+    # 마이그레이션
+    p = groups.add_parser("migrate", help="DB 스키마 생성/업데이트")
+    p.set_defaults(func=cmd_migrate)
+
+    # 원격 제어 (kiosk.py/launcher.py --api)
+    target = argparse.ArgumentParser(add_help=False)
+    target.add_argument("--url", dest="urls", action="append", required=True,
+                        help="API 주소 (예: http://10.0.0.5:8765, 여러 번 지정하면 모두에 동시에 보냄)")
+    target.add_argument("--screen", type=int, help="여러 화면 실행기에서 한 화면만 지정 (0부터)")
+    target.add_argument("--token",
+                        help="API 토큰 (기본값: DREAMBODY_API_TOKEN 환경 변수 또는 ~/.dreambody_api_token)")
+    target.set_defaults(func=cmd_remote, uses_db=False, page_id=None, volume=None)
+    remote = groups.add_parser("remote", help="실행 중인 키오스크/화면 원격 제어").add_subparsers(dest="command", required=True)
+
+    remote.add_parser("status", parents=[target], help="현재 상태")
+    p = remote.add_parser("start", parents=[target], help="페이지 실행 (페이지를 생략하면 지금 페이지를 처음부터)")
+    p.add_argument("page_id", type=int, nargs="?")
+    remote.add_parser("stop", parents=[target], help="정지")
+    remote.add_parser("skip", parents=[target], help="다음 영상으로")
+    p = remote.add_parser("volume", parents=[target], help="볼륨 변경 (설정은 바꾸지 않음)")
+    p.add_argument("volume", type=int)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+    if not getattr(args, 'uses_db', True):
+        return args.func(None, args) or 0
+
+    # 모든 명령 전에 스키마를 최신으로 맞춤 (기존 DB에도 안전)
+    engine = models.create_engine(f'sqlite:///{args.db}')
+    models.Base.metadata.create_all(engine)
+    args.added_columns = models.ensure_schema(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        seed_defaults(session)
+        session.commit()
+        return args.func(session, args) or 0
+    except CommandError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
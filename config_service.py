@@ -0,0 +1,77 @@
+import logging
+from PyQt5.QtCore import QObject, pyqtSignal
+from sqlalchemy.orm import sessionmaker
+from settings import load_config, save_config
+
+logger = logging.getLogger("DreamBodyVideo.ConfigService")
+
+
+class ConfigService(QObject):
+    """
+    설정 스냅샷을 한 번만 읽어 캐시하고, 값이 바뀌면 구독자에게 알린다.
+    """
+    config_changed = pyqtSignal(object, object)  # 새 스냅샷, 변경된 키 집합
+
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.session_maker = sessionmaker(bind=engine)
+        self._snapshot = None
+
+    def snapshot(self):
+        if self._snapshot is None:
+            session = self.session_maker()
+            try:
+                self._snapshot = load_config(session)
+            finally:
+                session.close()
+            logger.info(f"설정 로드: {self._snapshot.as_dict()}")
+        return self._snapshot
+
+    def reload(self):
+        session = self.session_maker()
+        try:
+            snapshot = load_config(session)
+        finally:
+            session.close()
+        self._publish(snapshot)
+        return snapshot
+
+    def save(self, values):
+        session = self.session_maker()
+        try:
+            snapshot = save_config(session, values)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        logger.info(f"설정 저장: {values}")
+        self._publish(snapshot)
+        return snapshot
+
+    def _publish(self, snapshot):
+        previous = self._snapshot
+        self._snapshot = snapshot
+
+        if previous is None:
+            return
+
+        changed = snapshot.changed_keys(previous)
+        if changed:
+            logger.info(f"설정 변경 알림: {', '.join(sorted(changed))}")
+            self.config_changed.emit(snapshot, changed)
+
+
+_services = {}
+
+
+def get_config_service(engine):
+    # 엔진별로 하나의 서비스를 공유해 관리자 창과 실행 중인 페이지가 같은 스냅샷을 본다
+    service = _services.get(engine)
+    if service is None:
+        service = ConfigService(engine)
+        _services[engine] = service
+    return service
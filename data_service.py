@@ -0,0 +1,95 @@
+import logging
+import traceback
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger("DreamBodyVideo.DataService")
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    progress = pyqtSignal(int, int)  # 처리 수, 전체 수 (모르면 0)
+    partial = pyqtSignal(object)  # 작업 도중 넘겨주는 중간 결과
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, session_maker, fn, args, kwargs, signals):
+        super().__init__()
+        self.session_maker = session_maker
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+
+    def run(self):
+        session = self.session_maker()
+        try:
+            result = self.fn(session, *self.args, **self.kwargs)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"DB 작업 실패 ({self.fn.__name__}): {e}\n{traceback.format_exc()}")
+            self._emit('failed', e)
+        else:
+            self._emit('finished', result)
+        finally:
+            session.close()
+
+    def _emit(self, name, value):
+        try:
+            getattr(self.signals, name).emit(value)
+        except RuntimeError:
+            # 애플리케이션 종료 중 수신 객체가 먼저 삭제된 경우
+            logger.debug(f"작업 결과를 전달할 대상이 없습니다 ({self.fn.__name__})")
+
+
+class DataService(QObject):
+    """
+    DB 작업을 GUI 스레드 밖의 전용 스레드에서 실행하고 결과를 시그널로 돌려준다.
+
+    SQLite 쓰기 잠금 충돌을 피하기 위해 작업은 하나의 워커 스레드에서 순서대로 실행된다.
+    작업 함수는 session을 첫 인자로 받아 dict 레코드 같은 순수 데이터를 반환해야 한다.
+    """
+
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.session_maker = sessionmaker(bind=engine, expire_on_commit=False)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._pending = set()
+
+    def submit(self, fn, *args, on_result=None, on_error=None, on_progress=None, on_partial=None, **kwargs):
+        signals = _TaskSignals()
+        self._pending.add(signals)
+
+        if on_progress is not None:
+            # 진행 상황 보고 함수를 작업에 전달
+            kwargs['progress'] = signals.progress.emit
+            signals.progress.connect(on_progress)
+        if on_partial is not None:
+            # 중간 결과 전달 함수 (GUI 스레드에서 on_partial 호출)
+            kwargs['partial'] = signals.partial.emit
+            signals.partial.connect(on_partial)
+
+        def finished(result):
+            self._pending.discard(signals)
+            if on_result is not None:
+                on_result(result)
+
+        def failed(error):
+            self._pending.discard(signals)
+            if on_error is not None:
+                on_error(error)
+
+        signals.finished.connect(finished)
+        signals.failed.connect(failed)
+
+        self.pool.start(_QueryTask(self.session_maker, fn, args, kwargs, signals))
+
+    def is_busy(self):
+        return bool(self._pending)
+
+    def wait_for_done(self, msecs=-1):
+        return self.pool.waitForDone(msecs)
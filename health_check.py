@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import time
+import logging
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from sqlalchemy import bindparam
+from sqlalchemy.orm import sessionmaker
+from models import Video
+import youtube
+
+logger = logging.getLogger("DreamBodyVideo.HealthCheck")
+
+# 영상 링크 검사
+# - 모든 영상 URL을 제한된 스레드 풀에서 동시에 oEmbed로 확인 (초당 요청 수 제한)
+# - oEmbed가 응답하지 않으면 썸네일 주소로 영상 존재 여부만 확인
+# - 결과는 videos.health_status / health_checked_at에 배치 단위로 저장
+
+STATUS_OK = 'ok'
+STATUS_NOT_FOUND = 'not_found'  # 삭제/비공개 영상 (플레이어 오류 100)
+STATUS_EMBED_DISABLED = 'embed_disabled'  # 퍼가기 금지 영상 (플레이어 오류 101/150)
+STATUS_INVALID_URL = 'invalid_url'  # YouTube URL이 아님
+STATUS_ERROR = 'error'  # 네트워크 오류 등으로 판단할 수 없음
+
+# 재생할 수 없는 상태
+BROKEN_STATUSES = (STATUS_NOT_FOUND, STATUS_EMBED_DISABLED, STATUS_INVALID_URL)
+
+STATUS_LABELS = {
+    STATUS_OK: "정상",
+    STATUS_NOT_FOUND: "영상 없음",
+    STATUS_EMBED_DISABLED: "퍼가기 금지",
+    STATUS_INVALID_URL: "잘못된 URL",
+    STATUS_ERROR: "확인 실패",
+}
+
+WORKERS = 8
+RATE = 5.0  # 초당 요청 수
+TIMEOUT = 10
+MAX_RETRIES = 3
+BATCH_SIZE = 50
+USER_AGENT = "DreamBodyVideo-HealthCheck/1.0"
+
+
+def is_broken(status):
+    return status in BROKEN_STATUSES
+
+
+class RateLimiter:
+    """
+    스레드 간 공유하는 요청 간격 제한. 429 응답을 받으면 pause()로 모든 요청을 잠시 멈춘다.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_time = time.monotonic()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self.lock:
+            self.next_time = max(self.next_time, time.monotonic() + seconds)
+
+
+def _retry_after(error, attempt):
+    value = error.headers.get('Retry-After') if error.headers else None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 2.0 ** attempt
+
+
+def _request(url, limiter, timeout, method='GET'):
+    """
+    HTTP 상태 코드를 반환 (429는 Retry-After만큼 기다렸다가 재시도). 네트워크 오류는 예외.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            if e.code == 429 and attempt < MAX_RETRIES:
+                delay = _retry_after(e, attempt)
+                logger.warning(f"요청 제한(429), {delay:.1f}초 후 재시도")
+                limiter.pause(delay)
+                continue
+            return e.code
+
+
+def probe_url(url, limiter, timeout=TIMEOUT, oembed_base=None, thumbnail_base=None):
+    """
+    영상 URL 하나를 검사해 상태를 반환
+    """
+    video_id = youtube.extract_video_id(url)
+    if not video_id:
+        return STATUS_INVALID_URL
+
+    try:
+        code = _request(youtube.oembed_url(video_id, oembed_base), limiter, timeout)
+    except (urllib.error.URLError, OSError) as e:
+        logger.debug(f"oEmbed 요청 실패 ({video_id}): {e}")
+        code = None
+
+    if code == 200:
+        return STATUS_OK
+    if code in (401, 403):
+        return STATUS_EMBED_DISABLED
+    if code in (400, 404):
+        return STATUS_NOT_FOUND
+
+    # oEmbed를 확인할 수 없으면 썸네일로 영상 존재 여부만 확인
+    try:
+        code = _request(youtube.thumbnail_url(video_id, thumbnail_base), limiter, timeout, method='HEAD')
+    except (urllib.error.URLError, OSError) as e:
+        logger.debug(f"썸네일 요청 실패 ({video_id}): {e}")
+        return STATUS_ERROR
+    return STATUS_NOT_FOUND if code == 404 else STATUS_ERROR
+
+
+def save_results(session, results):
+    # 검사 결과 저장 ({'video_id', 'status', 'checked_at'} 목록)
+    update = Video.__table__.update().where(Video.id == bindparam('video_id')).values(
+        health_status=bindparam('status'), health_checked_at=bindparam('checked_at')
+    )
+    session.execute(update, results)  # executemany
+
+
+def check_videos(session, video_ids=None, only_unchecked=False, workers=WORKERS, rate=RATE,
+                 timeout=TIMEOUT, oembed_base=None, thumbnail_base=None, progress=None, partial=None):
+    """
+    영상 링크를 동시에 검사하고 결과를 저장한 뒤 통계를 반환.
+    결과는 BATCH_SIZE개마다 커밋하므로 검사가 길어져도 DB 잠금을 오래 잡지 않는다.
+    partial을 주면 결과를 저장하지 않고 배치마다 partial(결과 목록)로 넘긴다 (저장은 호출한 쪽에서).
+    """
+    query = session.query(Video.id, Video.url).order_by(Video.id)
+    if video_ids is not None:
+        query = query.filter(Video.id.in_(list(video_ids)))
+    if only_unchecked:
+        query = query.filter(Video.health_checked_at.is_(None))
+    targets = query.all()
+    session.commit()  # 네트워크 검사 동안 읽기 트랜잭션을 열어 두지 않음
+
+    stats = {'checked': 0, 'ok': 0, 'broken': 0, 'error': 0, 'broken_ids': []}
+    total = len(targets)
+    limiter = RateLimiter(rate)
+    batch = []
+
+    def flush():
+        if batch:
+            if partial is not None:
+                partial(list(batch))
+            else:
+                save_results(session, batch)
+                session.commit()
+            batch.clear()
+
+    logger.info(f"링크 검사 시작: {total}개 (동시 {workers}개, 초당 {rate}회)")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(probe_url, url, limiter, timeout, oembed_base, thumbnail_base): video_id
+            for video_id, url in targets
+        }
+        for future in as_completed(futures):
+            video_id = futures[future]
+            try:
+                status = future.result()
+            except Exception as e:
+                logger.error(f"링크 검사 오류 (ID={video_id}): {e}")
+                status = STATUS_ERROR
+
+            stats['checked'] += 1
+            if status == STATUS_OK:
+                stats['ok'] += 1
+            elif is_broken(status):
+                stats['broken'] += 1
+                stats['broken_ids'].append(video_id)
+            else:
+                stats['error'] += 1
+
+            batch.append({'video_id': video_id, 'status': status, 'checked_at': datetime.utcnow()})
+            if len(batch) >= BATCH_SIZE:
+                flush()
+            if progress:
+                progress(stats['checked'], total)
+
+    flush()
+    stats['broken_ids'].sort()
+    logger.info(
+        f"링크 검사 완료: 검사 {stats['checked']}, 정상 {stats['ok']}, "
+        f"재생 불가 {stats['broken']}, 확인 실패 {stats['error']}"
+    )
+    return stats
+
+
+def main(argv=None):
+    """
+    영상 링크 검사 명령
+    """
+    from models import init_db
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    parser = argparse.ArgumentParser(description="영상 링크 검사")
+    parser.add_argument("ids", nargs="*", type=int, help="검사할 영상 ID (기본값: 전체)")
+    parser.add_argument("--only-unchecked", action="store_true", help="검사한 적 없는 영상만 검사")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--rate", type=float, default=RATE, help="초당 요청 수")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument("--oembed-base", help=f"oEmbed 주소 (기본값: {youtube.OEMBED_BASE})")
+    parser.add_argument("--thumbnail-base", help=f"썸네일 주소 (기본값: {youtube.THUMBNAIL_BASE})")
+    args = parser.parse_args(argv)
+
+    engine = init_db()
+    session = sessionmaker(bind=engine)()
+
+    def report(done, total):
+        if done % 100 == 0 or done == total:
+            logger.info(f"진행: {done}/{total}")
+
+    try:
+        stats = check_videos(
+            session, args.ids or None, args.only_unchecked, args.workers, args.rate,
+            args.timeout, args.oembed_base, args.thumbnail_base, progress=report
+        )
+    finally:
+        session.close()
+
+    for video_id in stats['broken_ids']:
+        logger.warning(f"재생할 수 없는 영상: ID={video_id}")
+    return 1 if stats['broken'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
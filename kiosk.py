@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import time
+import logging
+import argparse
+from datetime import datetime, timedelta, timezone
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+from sqlalchemy.orm import sessionmaker
+import repository
+from schedule import describe, load_schedule
+from change_watcher import get_change_watcher
+
+logger = logging.getLogger("DreamBodyVideo.Kiosk")
+
+# 키오스크 모드 (무인 연속 재생)
+# - 하나의 전체 화면 창에서 지정한 순서대로 페이지를 끝없이 반복 실행 (완료 알림 창 없음)
+# - 현재 페이지의 마지막 영상이 시작되면 다음 페이지의 재생 목록과 영상 칸을 미리 만들어 둠 (WorkoutPage.prepare_page)
+# - 페이지 전환 시 창을 다시 만들지 않고 영상 칸만 교체 (WorkoutPage.load_page) - 전환이 빠르고 메모리가 늘지 않음
+# - 편성표(schedule.py)를 주면 편성 시간에는 그 페이지를 반복하고, 편성이 없는 시간에는 지정한 순서로 실행
+#   관리자 창/cli.py에서 편성표를 바꾸면 다시 읽어 바로 반영 (change_watcher.py)
+# - --api: 원격 제어 API(remote_api.py)로 실행/정지/건너뛰기/볼륨/상태 조회 (execute, event_occurred)
+
+EMPTY_PAGE_WAIT_MS = 10 * 1000  # 영상이 없는 페이지는 대기 메시지를 잠시 보여 준 뒤 넘어감
+PREFETCH_LEAD_MS = 2 * 60 * 1000  # 다음 편성 시작 전에 미리 준비하는 시간
+MAX_SCHEDULE_WAIT_MS = 60 * 1000  # 시계 변경/절전 복귀에 대비해 최소 1분마다 편성을 다시 확인
+
+
+class ScheduleRunner(QObject):
+    """
+    편성표에 따라 지금 재생할 편성이 바뀌면 알리고, 다음 편성 시작 전에 미리 준비하도록 알린다.
+
+    대기 시간은 매번 현재 시각으로 다시 계산하므로 서머타임 전환이나 시계 변경 후에도 맞는 편성을 찾는다.
+    """
+    program_changed = pyqtSignal(object)  # 지금 재생할 ScheduleEntry (없으면 None)
+    prefetch_requested = pyqtSignal(object)  # 곧 시작할 ScheduleEntry
+
+    def __init__(self, schedule, parent=None, timer_factory=None, clock=None, prefetch_lead_ms=PREFETCH_LEAD_MS):
+        super().__init__(parent)
+        self.schedule = schedule
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.prefetch_lead = timedelta(milliseconds=prefetch_lead_ms)
+        self.current = None
+        self.prefetched = None
+        self.announced = False
+
+        self.timer = (timer_factory or QTimer)(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.update)
+
+    def start(self):
+        self.announced = False
+        self.update()
+
+    def stop(self):
+        self.timer.stop()
+
+    def set_schedule(self, schedule):
+        # 편성표가 바뀌면 바로 다시 확인 (미리 준비한 편성도 다시 준비)
+        self.schedule = schedule
+        self.prefetched = None
+        self.update()
+
+    def update(self):
+        now = self.clock()
+        entry = self.schedule.at(now)
+        if not self.announced or entry != self.current:
+            self.announced = True
+            self.current = entry
+            self.prefetched = None
+            label = f"{describe(entry)} 페이지 {entry.page_id}" if entry else "편성 없음"
+            logger.info(f"편성 변경: {label}")
+            self.program_changed.emit(entry)
+
+        wait = timedelta(milliseconds=MAX_SCHEDULE_WAIT_MS)
+        change = self.schedule.next_change(now)
+        if change is not None:
+            when, upcoming = change
+            until = when - now
+            if upcoming is not None and upcoming != self.prefetched:
+                if until <= self.prefetch_lead:
+                    self.prefetched = upcoming
+                    logger.info(f"다음 편성 준비: {describe(upcoming)} 페이지 {upcoming.page_id}")
+                    self.prefetch_requested.emit(upcoming)
+                else:
+                    until -= self.prefetch_lead
+            wait = min(wait, until)
+
+        # 이미 지난 변경 시각이 나오면 (시계가 뒤로 간 경우 등) 잠시 후 다시 확인
+        self.timer.start(int(wait.total_seconds() * 1000) + 1 if wait > timedelta(0) else 1000)
+
+
+class KioskController(QObject):
+    """
+    WorkoutPage 하나로 페이지 순서(편성이 있으면 편성 페이지)를 반복 실행한다.
+    """
+    page_started = pyqtSignal(int)  # 페이지 번호
+    event_occurred = pyqtSignal(dict)  # 원격 제어 API로 내보낼 이벤트 (페이지 시작/영상 전환/완료/상태)
+
+    def __init__(self, engine, page_ids, parent=None, timer_factory=None, player_factory=None,
+                 schedule=None, clock=None):
+        super().__init__(parent)
+        if not page_ids:
+            raise ValueError("키오스크 모드로 실행할 페이지가 없습니다.")
+
+        self.engine = engine
+        self.page_ids = list(page_ids)
+        self.position = 0
+        self.pages_played = 0
+        self.last_switch_ms = None
+        self.page = None
+        self.stopped = False  # 원격 제어로 정지한 상태 (start 명령까지 페이지를 넘기지 않음)
+        self.program = None  # 지금 편성 (ScheduleEntry)
+        self.upcoming = None  # 미리 준비한 다음 편성
+        self.timer_factory = timer_factory or QTimer
+        self.player_factory = player_factory
+
+        self.empty_page_timer = self.timer_factory(self)
+        self.empty_page_timer.setSingleShot(True)
+        self.empty_page_timer.timeout.connect(self.advance)
+
+        self.schedule_runner = None
+        self.change_watcher = None
+        if schedule is not None:
+            self.schedule_runner = ScheduleRunner(schedule, self, timer_factory=self.timer_factory, clock=clock)
+            self.schedule_runner.program_changed.connect(self.on_program_changed)
+            self.schedule_runner.prefetch_requested.connect(self.on_prefetch_requested)
+
+    @property
+    def sequence(self):
+        return [self.program.page_id] if self.program is not None else self.page_ids
+
+    @property
+    def next_page_id(self):
+        sequence = self.sequence
+        return sequence[(self.position + 1) % len(sequence)]
+
+    def start(self, fullscreen=True):
+        from page import WorkoutPage
+
+        if self.schedule_runner is not None:
+            self.schedule_runner.start()  # 시작 시각의 편성 확인
+            self.watch_schedule()
+
+        page_id = self.sequence[self.position]
+        logger.info(f"키오스크 모드 시작: 페이지 순서 {self.page_ids}")
+        self.page = WorkoutPage(
+            self.engine, page_id,
+            timer_factory=self.timer_factory,
+            player_factory=self.player_factory
+        )
+        self.page.setWindowTitle("DREAMBODY")
+        self.page.page_completed.connect(self.on_page_completed)
+        self.page.last_segment_started.connect(self.on_last_segment_started)
+        self.page.segment_started.connect(self.on_segment_started)
+        self.page.destroyed.connect(self.on_page_destroyed)
+
+        if fullscreen:
+            self.page.setCursor(Qt.BlankCursor)
+            self.page.showFullScreen()
+        else:
+            self.page.resize(1080, 1920)
+            self.page.show()
+
+        self.on_page_loaded()
+        return self.page
+
+    def stop(self):
+        self.empty_page_timer.stop()
+        if self.schedule_runner is not None:
+            self.schedule_runner.stop()
+        self.unwatch_schedule()
+        if self.page is not None:
+            self.page.close()  # WorkoutPage.teardown()
+
+    def watch_schedule(self):
+        self.change_watcher = get_change_watcher(self.engine)
+        self.change_watcher.database_changed.connect(self.reload_schedule)
+        self.change_watcher.acquire()
+
+    def unwatch_schedule(self):
+        watcher, self.change_watcher = self.change_watcher, None
+        if watcher is None:
+            return
+        try:
+            watcher.database_changed.disconnect(self.reload_schedule)
+        except TypeError:
+            pass  # 이미 연결 해제됨
+        watcher.release()
+
+    def reload_schedule(self, tables):
+        if 'schedules' not in tables:
+            return
+        runner = self.schedule_runner
+        session = sessionmaker(bind=self.engine)()
+        try:
+            schedule = load_schedule(session, runner.schedule.zone)
+        finally:
+            session.close()
+        if set(schedule.entries) != set(runner.schedule.entries):
+            logger.info(f"편성표 변경 감지: 편성 {len(schedule)}개")
+            runner.set_schedule(schedule)
+
+    def on_last_segment_started(self, page_id):
+        # 마지막 영상이 재생되는 동안 다음 페이지 준비 (곧 시작할 편성을 준비해 둔 경우는 그대로 둠)
+        if self.upcoming is None:
+            self.page.prepare_page(self.next_page_id)
+
+    def on_prefetch_requested(self, entry):
+        self.upcoming = entry
+        if self.page is not None:
+            self.page.prepare_page(entry.page_id)
+
+    def on_program_changed(self, entry):
+        self.program = entry
+        self.upcoming = None
+        self.position = 0
+        if self.page is not None and not self.stopped:
+            # 편성 시작/종료 시각에 바로 전환
+            self.switch_to(self.sequence[0])
+
+    def on_segment_started(self, page_id, index):
+        self.event_occurred.emit({'event': 'segment', 'page_id': page_id, 'segment': index + 1})
+
+    def on_page_completed(self, page_id):
+        self.pages_played += 1
+        self.event_occurred.emit({'event': 'completed', 'page_id': page_id})
+        self.advance()
+
+    def advance(self):
+        if self.page is None or self.stopped:
+            return
+
+        sequence = self.sequence
+        self.position = (self.position + 1) % len(sequence)
+        self.switch_to(sequence[self.position])
+
+    def switch_to(self, page_id):
+        self.empty_page_timer.stop()
+
+        started = time.perf_counter()
+        self.page.load_page(page_id)
+        self.last_switch_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"페이지 {page_id}로 전환 ({self.last_switch_ms:.1f}ms)")
+
+        self.on_page_loaded()
+
+    def on_page_loaded(self):
+        page_id = self.page.page_id
+        if not self.page.videos:
+            logger.warning(f"페이지 {page_id}에 영상이 없어 {EMPTY_PAGE_WAIT_MS // 1000}초 후 다음 페이지로 넘어갑니다.")
+            self.empty_page_timer.start(EMPTY_PAGE_WAIT_MS)
+        self.page_started.emit(page_id)
+        self.event_occurred.emit({'event': 'page_started', 'page_id': page_id})
+
+    def execute(self, message):
+        """
+        원격 제어 명령 처리 (remote_api.py). 처리 후 상태를 돌려줌.
+
+        start는 page_id가 없으면 순서상 지금 페이지를 처음부터, 있으면 그 페이지를 실행한 뒤 순서대로 이어서 실행
+        """
+        if self.page is None:
+            raise RuntimeError("키오스크 화면이 닫혔습니다.")
+
+        command = message['command']
+        if command == 'start':
+            sequence = self.sequence
+            page_id = message.get('page_id')
+            page_id = int(page_id) if page_id is not None else sequence[self.position]
+            if page_id in sequence:
+                self.position = sequence.index(page_id)
+            self.stopped = False
+            self.switch_to(page_id)
+        elif command == 'stop':
+            self.stopped = True
+            self.empty_page_timer.stop()
+            self.page.stop_playback()
+        elif command == 'skip':
+            self.page.skip_segment()
+        elif command == 'volume':
+            self.page.set_volume(message['volume'])
+        elif command != 'status':
+            raise ValueError(f"알 수 없는 명령: {command}")
+
+        status = self.status()
+        if command != 'status':
+            self.event_occurred.emit({'event': 'status', **status})
+        return status
+
+    def status(self):
+        return {
+            **self.page.playback_status(),
+            'mode': 'kiosk',
+            'sequence': self.sequence,
+            'program': describe(self.program) if self.program is not None else None,
+            'pages_played': self.pages_played,
+        }
+
+    def on_page_destroyed(self):
+        self.page = None
+        self.empty_page_timer.stop()
+        if self.schedule_runner is not None:
+            self.schedule_runner.stop()
+        self.unwatch_schedule()
+
+
+def default_page_ids(engine):
+    """
+    영상이 할당된 모든 페이지 (ID 순)
+    """
+    session = sessionmaker(bind=engine)()
+    try:
+        return repository.list_playable_page_ids(session)
+    finally:
+        session.close()
+
+
+def main(argv=None):
+    """
+    키오스크 모드 실행
+    """
+    parser = argparse.ArgumentParser(description="키오스크 모드 - 페이지를 전체 화면에서 끝없이 반복 실행")
+    parser.add_argument("page_ids", nargs="*", type=int, help="실행 순서대로 페이지 ID (기본값: 영상이 있는 모든 페이지)")
+    parser.add_argument("--db", help="데이터베이스 파일 (기본값: 앱 DB)")
+    parser.add_argument("--windowed", action="store_true", help="전체 화면 대신 창으로 실행")
+    parser.add_argument("--schedule", action="store_true", help="편성표에 따라 실행 (편성이 없는 시간에는 페이지 순서대로)")
+    parser.add_argument("--timezone", help="편성표 시간대 (예: Asia/Seoul, 기본값: 시스템 시간대)")
+    parser.add_argument("--api", metavar="[HOST:]PORT", help="원격 제어 API 열기 (기본 주소 127.0.0.1, remote_api.py)")
+    parser.add_argument("--api-token", help="원격 제어 API 토큰 (기본값: DREAMBODY_API_TOKEN 환경 변수 또는 ~/.dreambody_api_token)")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtGui import QKeySequence
+    from PyQt5.QtWidgets import QShortcut
+    from main import create_application
+    from models import init_db
+    from schedule import local_zone
+
+    app = create_application()
+    engine = init_db(args.db)
+    page_ids = args.page_ids or default_page_ids(engine)
+    if not page_ids:
+        print("영상이 할당된 페이지가 없습니다.", file=sys.stderr)
+        return 1
+
+    schedule = None
+    if args.schedule:
+        session = sessionmaker(bind=engine)()
+        try:
+            schedule = load_schedule(session, local_zone(args.timezone))
+        finally:
+            session.close()
+        logger.info(f"편성 {len(schedule)}개, 시간대 {schedule.zone}")
+
+    controller = KioskController(engine, page_ids, schedule=schedule)
+    page = controller.start(fullscreen=not args.windowed)
+
+    if args.api:
+        from remote_api import serve
+        try:
+            serve(controller, args.api, args.api_token)
+        except (ValueError, OSError) as e:
+            print(e, file=sys.stderr)
+            controller.stop()
+            return 1
+
+    # 관리자용 종료 단축키
+    QShortcut(QKeySequence("Ctrl+Q"), page, controller.stop)
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,808 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+from PyQt5.QtCore import Qt, QObject, QTimer, QProcess, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from sqlalchemy.orm import sessionmaker
+import repository
+from settings import check_value
+
+logger = logging.getLogger("DreamBodyVideo.Launcher")
+
+# 여러 화면 동시 실행 (화면마다 페이지 하나)
+# - 연결된 화면(QGuiApplication.screens())마다 WorkoutPage 하나를 전체 화면으로 배치 (화면 순서대로 페이지 1, 2, 3 ...)
+# - --processes: 화면마다 별도 프로세스로 실행 - 한 화면의 웹 엔진이 멈춰도 다른 화면과 관리자 창은 계속 동작
+#   (화면 프로세스가 비정상 종료되거나 응답이 없으면 다시 시작해 같은 페이지를 실행)
+# - 실행기와 화면 프로세스는 QLocalSocket으로 JSON 메시지를 한 줄에 하나씩 주고받음
+#     실행기 -> 화면: {"command": "start", "page_id": 1} / {"command": "stop"} / {"command": "status"} / {"command": "quit"}
+#                    {"command": "skip"} / {"command": "volume", "volume": 30}
+#     화면 -> 실행기: {"event": "hello", "screen": 0, "pid": ...} / {"event": "status", ...} / {"event": "completed", ...}
+#   명령을 받으면 화면은 항상 현재 상태(status)로 응답한다 (처리하지 못한 명령은 상태의 error에 이유)
+# - --sync: 모든 화면이 연결되면 실행기가 공통 시작 시각(start_at, time.monotonic 기준 초)을 정해 start 명령에 담아 보내고,
+#   각 화면은 카운트다운과 영상 전환 시각을 모두 그 시각 기준으로 계산 (같은 장비의 monotonic 시계는 프로세스 간에 공유됨)
+#   화면은 영상이 바뀔 때마다 {"event": "segment", "offset_ms": 예정 시각, "at": 실제 시각, ...}을 보내고
+#   실행기는 같은 예정 시각의 화면 간 차이(skew)를 기록한다
+
+LAUNCHER_PATH = os.path.abspath(__file__)
+STATUS_INTERVAL_MS = 2 * 1000  # 화면 상태 확인 주기
+UNRESPONSIVE_MS = 10 * 1000  # 이 시간 동안 응답이 없으면 응답 없음으로 표시
+HUNG_RESTART_MS = 30 * 1000  # 이 시간 동안 응답이 없으면 화면 프로세스를 다시 시작
+RESTART_DELAY_MS = 1000
+QUIT_TIMEOUT_MS = 5 * 1000  # 종료 명령 후 모든 화면 프로세스가 끝나기를 기다리는 시간 (화면 수와 무관)
+KILL_TIMEOUT_MS = 1000
+MAX_MESSAGE_BYTES = 64 * 1024
+SYNC_LEAD_MS = 2 * 1000  # 공통 시작 시각은 명령을 보내고 이 시간 후 (모든 화면이 페이지를 준비할 시간)
+FRAME_MS = 1000 / 60  # 화면 간 허용 오차 (60Hz 한 프레임)
+
+
+def process_rss_kb():
+    # 이 프로세스의 RSS (KB) - /proc이 없으면 None
+    try:
+        with open("/proc/self/status") as fp:
+            for line in fp:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def stub_player_factory(order, url, title, parent):
+    # 웹 뷰 없는 가짜 플레이어 (벤치마크/점검용)
+    from simulation import SimulatedPlayer
+    return SimulatedPlayer(order, url, title, lambda event, player: None, parent)
+
+
+def place_window(widget, screen_index, windowed=False, tile_count=1):
+    """
+    창을 screen_index번 화면에 전체 화면으로 배치. windowed이면 기본 화면을 tile_count칸으로 나눠 나란히 배치
+    """
+    from PyQt5.QtGui import QGuiApplication
+
+    if windowed:
+        area = QGuiApplication.primaryScreen().availableGeometry()
+        width = area.width() // max(tile_count, 1)
+        widget.setGeometry(area.x() + width * screen_index, area.y(), width, area.height())
+        widget.show()
+        return
+
+    screens = QGuiApplication.screens()
+    if screen_index >= len(screens):
+        logger.warning(f"화면 {screen_index + 1}이 없어 화면 {screen_index % len(screens) + 1}에 겹쳐 표시합니다.")
+    screen = screens[screen_index % len(screens)]
+
+    widget.setGeometry(screen.geometry())
+    widget.winId()  # 네이티브 창을 먼저 만들어야 화면을 지정할 수 있음
+    widget.windowHandle().setScreen(screen)
+    widget.setCursor(Qt.BlankCursor)
+    widget.showFullScreen()
+
+
+class MessageChannel(QObject):
+    """
+    QLocalSocket 위의 JSON 메시지 채널 (한 줄에 메시지 하나)
+    """
+    message_received = pyqtSignal(dict)
+    disconnected = pyqtSignal()
+
+    def __init__(self, socket, parent=None):
+        super().__init__(parent)
+        self.socket = socket
+        self.socket.setParent(self)
+        self.buffer = b""
+        self.socket.readyRead.connect(self.on_ready_read)
+        self.socket.disconnected.connect(self.disconnected)
+
+    def send(self, message):
+        if self.socket.state() != QLocalSocket.ConnectedState:
+            return False
+        self.socket.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.socket.flush()
+        return True
+
+    def on_ready_read(self):
+        self.buffer += bytes(self.socket.readAll())
+        *lines, self.buffer = self.buffer.split(b"\n")
+        if len(self.buffer) > MAX_MESSAGE_BYTES:
+            logger.warning("메시지가 너무 길어 연결을 끊습니다.")
+            self.socket.abort()
+            return
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                logger.warning(f"잘못된 메시지: {line[:100]!r}")
+                continue
+            if isinstance(message, dict):
+                self.message_received.emit(message)
+
+    def close(self):
+        self.socket.disconnectFromServer()
+
+
+class ScreenHost(QObject):
+    """
+    화면 하나에 WorkoutPage를 띄우고 명령(start/stop/status)을 처리한다. 창은 페이지가 바뀌어도 재사용.
+    """
+    event = pyqtSignal(dict)  # 실행기로 보낼 메시지 (status/completed)
+
+    def __init__(self, engine, screen_index, windowed=False, tile_count=1, loop=False,
+                 timer_factory=None, player_factory=None, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.screen_index = screen_index
+        self.windowed = windowed
+        self.tile_count = tile_count
+        self.loop = loop
+        self.timer_factory = timer_factory
+        self.player_factory = player_factory
+        self.page = None
+
+    def handle(self, message):
+        command = message.get('command')
+        error = None
+        try:
+            if command == 'start':
+                start_at = message.get('start_at')
+                self.start(int(message['page_id']), float(start_at) if start_at is not None else None)
+            elif command in ('stop', 'quit'):
+                self.stop()
+            elif command == 'skip':
+                self.current_page().skip_segment()
+            elif command == 'volume':
+                self.current_page().set_volume(message['volume'])
+            elif command != 'status':
+                logger.warning(f"알 수 없는 명령: {command}")
+        except (KeyError, TypeError, ValueError, RuntimeError) as e:
+            # 실패한 명령은 상태 응답의 error로 알림
+            logger.warning(f"명령 처리 실패: {message} ({e})")
+            error = str(e)
+        status = self.status()
+        if error is not None:
+            status['error'] = error
+        self.event.emit(status)
+
+    def current_page(self):
+        if self.page is None:
+            raise RuntimeError(f"화면 {self.screen_index + 1}에 실행 중인 페이지가 없습니다.")
+        return self.page
+
+    def start(self, page_id, start_at=None):
+        if start_at is not None:
+            wait_ms = (start_at - time.monotonic()) * 1000
+            if wait_ms >= 0:
+                logger.info(f"화면 {self.screen_index + 1}: {wait_ms:.0f}ms 후 동기화 시작")
+            else:
+                logger.info(f"화면 {self.screen_index + 1}: {-wait_ms:.0f}ms 전에 시작한 동기화 실행에 합류")
+        if self.page is not None and not self.page.is_torn_down:
+            self.page.load_page(page_id, start_at)
+            return
+
+        from page import WorkoutPage
+
+        logger.info(f"화면 {self.screen_index + 1}: 페이지 {page_id} 실행")
+        self.page = WorkoutPage(
+            self.engine, page_id,
+            timer_factory=self.timer_factory,
+            player_factory=self.player_factory,
+            start_at=start_at
+        )
+        self.page.setWindowTitle(f"DREAMBODY - 화면 {self.screen_index + 1}")
+        self.page.page_completed.connect(self.on_page_completed)
+        self.page.segment_started.connect(self.on_segment_started)
+        self.page.destroyed.connect(self.on_page_destroyed)
+        place_window(self.page, self.screen_index, self.windowed, self.tile_count)
+
+    def stop(self):
+        if self.page is not None:
+            self.page.close()  # WorkoutPage.teardown()
+            self.page = None
+
+    def status(self):
+        playback = self.page.playback_status() if self.page is not None else {'page_id': None, 'state': 'idle'}
+        return {
+            'event': 'status',
+            'screen': self.screen_index,
+            'pid': os.getpid(),
+            **playback,
+            'rss_kb': process_rss_kb(),
+        }
+
+    def on_segment_started(self, page_id, index):
+        page = self.page
+        late_ms = None
+        if page.start_at is not None:
+            late_ms = round((page.segment_started_at - page.start_at) * 1000 - page.segment_offset_ms, 2)
+        self.event.emit({
+            'event': 'segment',
+            'screen': self.screen_index,
+            'page_id': page_id,
+            'segment': index + 1,
+            'offset_ms': page.segment_offset_ms,
+            'at': page.segment_started_at,
+            'late_ms': late_ms,
+        })
+
+    def on_page_completed(self, page_id):
+        self.event.emit({**self.status(), 'event': 'completed'})
+        if self.loop:
+            self.page.load_page(page_id)
+
+    def on_page_destroyed(self):
+        self.page = None
+
+
+class LocalScreen(QObject):
+    """
+    실행기와 같은 프로세스에서 실행하는 화면
+    """
+    message_received = pyqtSignal(dict)
+
+    def __init__(self, host, parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.host.setParent(self)
+        self.host.event.connect(self.message_received)
+
+    @property
+    def pid(self):
+        return os.getpid()
+
+    @property
+    def ready(self):
+        return True
+
+    @property
+    def failed(self):
+        return False
+
+    def send(self, message):
+        self.host.handle(message)
+
+    def check(self):
+        pass  # 같은 프로세스이므로 응답 확인이 필요 없음
+
+    def close(self):
+        self.host.stop()
+
+    def wait(self, timeout_ms):
+        pass
+
+    def kill(self):
+        pass
+
+
+class ProcessScreen(QObject):
+    """
+    별도 프로세스에서 실행하는 화면. 연결 전에 보낸 명령은 모아 두었다가 연결되면 보낸다.
+    """
+    message_received = pyqtSignal(dict)
+    forward_output = True  # 화면 프로세스의 출력(로그)을 실행기 출력으로 전달
+    program = sys.executable  # 화면 프로세스를 실행할 인터프리터
+
+    def __init__(self, screen_index, arguments, parent=None):
+        super().__init__(parent)
+        self.screen_index = screen_index
+        self.arguments = arguments
+        self.process = None
+        self.channel = None
+        self.pending = []
+        self.start_message = None  # 실행 중인 페이지의 start 명령 (다시 시작하면 같은 명령으로 이어서 실행)
+        self.closing = False
+        self.failed = False  # 프로세스를 시작하지 못함 (동기화 시작/반복 실행에서 제외)
+        self.restarts = 0
+        self.last_reply = time.monotonic()
+        self.unresponsive = False
+
+    @property
+    def pid(self):
+        return int(self.process.processId()) if self.process is not None else None
+
+    @property
+    def ready(self):
+        return self.channel is not None
+
+    @property
+    def page_id(self):
+        return self.start_message.get('page_id') if self.start_message is not None else None
+
+    def spawn(self):
+        self.process = QProcess(self)
+        if self.forward_output:
+            self.process.setProcessChannelMode(QProcess.ForwardedChannels)
+        else:
+            self.process.setStandardOutputFile(QProcess.nullDevice())
+            self.process.setStandardErrorFile(QProcess.nullDevice())
+        self.process.finished.connect(self.on_finished)
+        self.process.errorOccurred.connect(self.on_error)
+        self.process.start(self.program, [LAUNCHER_PATH, "--child", str(self.screen_index)] + self.arguments)
+        self.last_reply = time.monotonic()
+        logger.info(f"화면 {self.screen_index + 1} 프로세스 시작")
+
+    def attach(self, channel):
+        self.channel = channel
+        self.last_reply = time.monotonic()
+        self.unresponsive = False
+        pending, self.pending = self.pending, []
+        for message in pending:
+            channel.send(message)
+
+    def send(self, message):
+        if self.failed:
+            return
+        command = message.get('command')
+        if command == 'start':
+            self.start_message = message
+        elif command in ('stop', 'quit'):
+            self.start_message = None
+
+        if self.channel is None or not self.channel.send(message):
+            self.pending.append(message)
+
+    def on_message(self, message):
+        self.last_reply = time.monotonic()
+        if self.unresponsive:
+            self.unresponsive = False
+            logger.info(f"화면 {self.screen_index + 1} 응답 복구")
+        self.message_received.emit(message)
+
+    def check(self):
+        # 상태 요청에 오래 응답하지 않으면 표시하고, 더 오래 멈춰 있으면 프로세스를 다시 시작
+        if self.channel is None:
+            return
+        silent_ms = (time.monotonic() - self.last_reply) * 1000
+        if silent_ms >= HUNG_RESTART_MS:
+            logger.error(f"화면 {self.screen_index + 1}이 {silent_ms / 1000:.0f}초 동안 응답이 없어 다시 시작합니다.")
+            self.process.kill()  # on_finished에서 다시 시작
+        elif silent_ms >= UNRESPONSIVE_MS and not self.unresponsive:
+            self.unresponsive = True
+            logger.warning(f"화면 {self.screen_index + 1} 응답 없음")
+            self.message_received.emit(self.placeholder_status('unresponsive'))
+
+    def placeholder_status(self, state):
+        return {'event': 'status', 'screen': self.screen_index, 'pid': self.pid,
+                'page_id': self.page_id, 'state': state}
+
+    def on_finished(self, exit_code, exit_status):
+        if self.channel is not None:
+            self.channel.deleteLater()
+            self.channel = None
+        if self.closing:
+            return
+
+        self.restarts += 1
+        logger.error(f"화면 {self.screen_index + 1} 프로세스 종료 (코드 {exit_code}), {self.restarts}번째 다시 시작")
+        # 동기화 모드에서는 같은 공통 시작 시각으로 다시 실행하므로 다른 화면과 같은 영상 위치로 합류
+        self.pending = [self.start_message] if self.start_message is not None else []
+        self.message_received.emit(self.placeholder_status('restarting'))
+        QTimer.singleShot(RESTART_DELAY_MS, self.respawn)
+
+    def on_error(self, error):
+        # 시작하지 못한 프로세스는 finished가 오지 않음 - 다시 시작해도 같은 이유로 실패하므로 화면을 제외
+        # (실행 중 비정상 종료(Crashed)는 on_finished에서 다시 시작)
+        if error != QProcess.FailedToStart or self.closing:
+            return
+        self.failed = True
+        self.pending = []
+        logger.error(f"화면 {self.screen_index + 1} 프로세스를 시작할 수 없습니다: {self.process.errorString()}")
+        self.message_received.emit({**self.placeholder_status('failed'), 'error': self.process.errorString()})
+
+    def respawn(self):
+        if not self.closing:
+            self.spawn()
+
+    def close(self):
+        self.closing = True
+        if self.process is None or self.process.state() == QProcess.NotRunning:
+            return
+        if self.channel is None or not self.channel.send({'command': 'quit'}):
+            self.process.terminate()
+
+    def wait(self, timeout_ms):
+        if self.process is not None and self.process.state() != QProcess.NotRunning:
+            self.process.waitForFinished(max(int(timeout_ms), 0))
+
+    def kill(self):
+        if self.process is None or self.process.state() == QProcess.NotRunning:
+            return
+        logger.warning(f"화면 {self.screen_index + 1} 프로세스가 끝나지 않아 강제 종료합니다.")
+        self.process.kill()
+        self.process.waitForFinished(KILL_TIMEOUT_MS)
+
+
+class ScreenLauncher(QObject):
+    """
+    화면별 페이지 실행기. assignments는 [(화면 번호, 페이지 ID), ...]
+
+    processes가 참이면 화면마다 별도 프로세스(launcher.py --child)로 실행하고 로컬 소켓으로 명령을 보낸다.
+    sync가 참이면 모든 화면이 연결된 뒤 공통 시작 시각으로 시작하고, loop이면 모든 화면이 끝날 때 함께 다시 시작한다.
+    """
+    status_changed = pyqtSignal(int, dict)  # 화면 번호, 상태 메시지
+    skew_measured = pyqtSignal(int, float)  # 예정 시각(ms), 그 시각의 화면 간 차이(ms)
+    event_occurred = pyqtSignal(dict)  # 원격 제어 API로 내보낼 이벤트 (상태 변화/영상 전환/완료)
+
+    def __init__(self, engine, assignments, processes=False, windowed=False, loop=False,
+                 stub_players=False, sync=False, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.assignments = list(assignments)
+        self.processes = processes
+        self.windowed = windowed
+        self.loop = loop
+        self.stub_players = stub_players
+        self.sync = sync
+        self.sync_pending = False  # 모든 화면이 연결되면 동기화 시작
+        self.start_at = None  # 동기화 모드의 공통 시작 시각 (monotonic 초)
+        self.completed = set()  # 이번 회차에 페이지가 끝난 화면
+        self.boundaries = {}  # 영상 전환 예정 시각(ms) -> {화면 번호: 실제 monotonic 시각}
+        self.skews = {}  # 예정 시각(ms) -> 화면 간 차이(ms) (두 화면 이상 전환한 시각만)
+        self.screens = {}  # 화면 번호 -> LocalScreen/ProcessScreen
+        self.statuses = {}  # 화면 번호 -> 마지막 상태 메시지
+        self.server = None
+        self.channels = {}  # 연결 -> 화면 번호 (hello를 받기 전에는 None)
+
+        self.status_timer = QTimer(self)
+        self.status_timer.timeout.connect(self.request_status)
+
+    def start(self):
+        if self.processes:
+            self.listen()
+        for screen_index, page_id in self.assignments:
+            screen = self.screens.get(screen_index)
+            if screen is None:
+                screen = self.screens[screen_index] = self.create_screen(screen_index)
+                screen.message_received.connect(self.on_screen_message)
+            if not self.sync:
+                screen.send({'command': 'start', 'page_id': page_id})
+        self.status_timer.start(STATUS_INTERVAL_MS)
+
+        if self.sync:
+            self.sync_pending = True
+            self.start_when_ready()
+
+    def running_screens(self):
+        # 시작하지 못한 화면 프로세스는 동기화 시작과 반복 실행을 기다리지 않음
+        return {screen_index for screen_index, screen in self.screens.items() if not screen.failed}
+
+    def start_when_ready(self):
+        # 화면 프로세스가 모두 연결되어야 같은 시각에 시작할 수 있음 (연결되거나 실패할 때마다 다시 확인)
+        if self.sync_pending and all(self.screens[screen_index].ready for screen_index in self.running_screens()):
+            self.sync_pending = False
+            self.start_synchronized()
+
+    def start_synchronized(self):
+        """
+        공통 시작 시각을 정해 모든 화면에 보냄 (페이지를 준비할 시간을 두고 SYNC_LEAD_MS 후)
+        """
+        self.sync_pending = False
+        self.start_at = time.monotonic() + SYNC_LEAD_MS / 1000
+        self.completed.clear()
+        self.boundaries.clear()
+        self.skews.clear()
+        logger.info(f"동기화 시작: {SYNC_LEAD_MS}ms 후 화면 {len(self.assignments)}개 동시 시작")
+        for screen_index, page_id in self.assignments:
+            self.send(screen_index, {'command': 'start', 'page_id': page_id, 'start_at': self.start_at})
+
+    def create_screen(self, screen_index):
+        tile_count = len(self.assignments)
+        loop = self.loop and not self.sync  # 동기화 모드에서는 실행기가 모든 화면을 함께 다시 시작
+        if not self.processes:
+            host = ScreenHost(
+                self.engine, screen_index, self.windowed, tile_count, loop,
+                player_factory=stub_player_factory if self.stub_players else None
+            )
+            return LocalScreen(host, self)
+
+        arguments = ["--server", self.server.fullServerName(), "--db", self.engine.url.database,
+                     "--tiles", str(tile_count)]
+        arguments += [flag for flag, enabled in (("--windowed", self.windowed), ("--loop", loop),
+                                                 ("--stub-players", self.stub_players)) if enabled]
+        screen = ProcessScreen(screen_index, arguments, self)
+        screen.spawn()
+        return screen
+
+    def listen(self):
+        if self.server is not None:
+            return
+        name = f"dreambody-launcher-{os.getpid()}"
+        QLocalServer.removeServer(name)  # 이전 실행이 남긴 소켓 파일 정리
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        if not self.server.listen(name):
+            raise RuntimeError(f"로컬 소켓을 열 수 없습니다: {self.server.errorString()}")
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            channel = MessageChannel(self.server.nextPendingConnection(), self)
+            self.channels[channel] = None
+            channel.message_received.connect(lambda message, channel=channel: self.on_channel_message(channel, message))
+            channel.disconnected.connect(lambda channel=channel: self.channels.pop(channel, None))
+
+    def on_channel_message(self, channel, message):
+        screen_index = self.channels.get(channel)
+        if screen_index is None:
+            # 첫 메시지(hello)로 어느 화면의 연결인지 확인
+            screen = self.screens.get(message.get('screen'))
+            if message.get('event') != 'hello' or not isinstance(screen, ProcessScreen):
+                logger.warning(f"알 수 없는 연결의 메시지: {message}")
+                channel.close()
+                return
+            self.channels[channel] = message['screen']
+            logger.info(f"화면 {message['screen'] + 1} 연결 (PID {message.get('pid')})")
+            screen.attach(channel)
+            self.start_when_ready()
+            return
+        screen = self.screens.get(screen_index)
+        if screen is not None:  # 종료 중에 도착한 응답은 무시
+            screen.on_message(message)
+
+    def on_screen_message(self, message):
+        screen_index = message.get('screen')
+        if screen_index not in self.screens:
+            return
+        if message.get('event') == 'segment':
+            self.record_boundary(screen_index, message)
+            self.event_occurred.emit(message)
+            return
+        if message.get('event') not in ('status', 'completed'):
+            return
+
+        previous = self.statuses.get(screen_index, {})
+        self.statuses[screen_index] = message
+        if message['event'] == 'completed':
+            logger.info(f"화면 {screen_index + 1}: 페이지 {message.get('page_id')} 완료")
+            self.completed.add(screen_index)
+            if self.sync and self.loop and self.completed >= self.running_screens():
+                self.start_synchronized()
+        elif message.get('state') == 'failed':
+            logger.error(f"화면 {screen_index + 1}을 제외하고 실행합니다.")
+            self.start_when_ready()
+        elif (previous.get('state'), previous.get('page_id')) != (message.get('state'), message.get('page_id')):
+            logger.info(f"화면 {screen_index + 1}: 페이지 {message.get('page_id')} {message.get('state')}")
+        self.status_changed.emit(screen_index, message)
+
+        # 주기적인 상태 응답은 바뀐 것이 있을 때만 내보냄
+        keys = ('state', 'page_id', 'segment', 'volume')
+        if (message['event'] == 'completed' or 'error' in message
+                or any(previous.get(key) != message.get(key) for key in keys)):
+            self.event_occurred.emit(message)
+
+    def record_boundary(self, screen_index, message):
+        # 같은 예정 시각에 전환한 화면들의 실제 시각 차이
+        offset_ms = message.get('offset_ms')
+        if offset_ms is None or message.get('at') is None:
+            return
+        times = self.boundaries.setdefault(offset_ms, {})
+        times[screen_index] = message['at']
+        if len(times) < 2:
+            return
+
+        skew_ms = (max(times.values()) - min(times.values())) * 1000
+        self.skews[offset_ms] = skew_ms
+        if self.sync and skew_ms > FRAME_MS:
+            logger.warning(f"화면 간 전환 차이 {skew_ms:.1f}ms (예정 {offset_ms / 1000:.1f}초, 화면 {len(times)}개)")
+        self.skew_measured.emit(offset_ms, skew_ms)
+
+    def send(self, screen_index, message):
+        self.screens[screen_index].send(message)
+
+    def start_page(self, screen_index, page_id):
+        self.send(screen_index, {'command': 'start', 'page_id': page_id})
+
+    def stop(self):
+        for screen in self.screens.values():
+            screen.send({'command': 'stop'})
+
+    def execute(self, message):
+        """
+        원격 제어 명령 처리 (remote_api.py). screen(0부터)을 주면 그 화면에만, 없으면 모든 화면에 보냄.
+
+        화면 프로세스의 처리 결과는 기다리지 않으므로 돌려주는 상태는 명령을 보낸 시점의 마지막 상태
+        (처리 후 상태와 실패(error)는 이벤트로 전달)
+        """
+        command = message['command']
+        targets = self.targets(message.get('screen'))
+        if command == 'start':
+            page_id = message.get('page_id')
+            assigned = dict(self.assignments)
+            pages = {screen_index: int(page_id) if page_id is not None else assigned[screen_index]
+                     for screen_index in targets}
+            # 시작한 페이지를 배정으로 기록 (동기화 반복 실행은 배정대로 다시 시작)
+            self.assignments = [(screen_index, pages.get(screen_index, page)) for screen_index, page in self.assignments]
+            if self.sync and self.start_at is not None and len(targets) < len(self.screens):
+                # 일부 화면만 다시 시작하면 진행 중인 공통 일정에 합류
+                for screen_index, page in pages.items():
+                    self.send(screen_index, {'command': 'start', 'page_id': page, 'start_at': self.start_at})
+            elif self.sync:
+                self.start_synchronized()
+            else:
+                for screen_index, page in pages.items():
+                    self.start_page(screen_index, page)
+        elif command == 'skip':
+            if self.sync:
+                raise RuntimeError("동기화 실행 중에는 영상을 건너뛸 수 없습니다. (화면 간 전환 시각이 어긋남)")
+            for screen_index in targets:
+                self.send(screen_index, {'command': 'skip'})
+        elif command == 'volume':
+            volume = check_value('volume', message['volume'])
+            for screen_index in targets:
+                self.send(screen_index, {'command': 'volume', 'volume': volume})
+        elif command == 'stop':
+            for screen_index in targets:
+                self.send(screen_index, {'command': 'stop'})
+        elif command != 'status':
+            raise ValueError(f"알 수 없는 명령: {command}")
+        return self.status()
+
+    def targets(self, screen):
+        if screen is None:
+            return sorted(self.screens)
+        screen = int(screen)
+        if screen not in self.screens:
+            raise ValueError(f"화면 {screen}이 없습니다. (0~{len(self.screens) - 1})")
+        return [screen]
+
+    def status(self):
+        return {
+            'mode': 'launcher',
+            'sync': self.sync,
+            'screens': [self.statuses.get(screen_index, {'screen': screen_index, 'state': 'starting'})
+                        for screen_index in sorted(self.screens)],
+        }
+
+    def request_status(self):
+        for screen in self.screens.values():
+            screen.check()
+            screen.send({'command': 'status'})
+
+    def shutdown(self):
+        """
+        모든 화면 종료 (화면 프로세스는 종료될 때까지 기다림)
+        """
+        self.status_timer.stop()
+        # 모든 화면에 종료를 먼저 알린 뒤 함께 기다림 (기다리는 시간은 화면 수와 관계없이 QUIT_TIMEOUT_MS까지)
+        for screen in self.screens.values():
+            screen.close()
+        deadline = time.monotonic() + QUIT_TIMEOUT_MS / 1000
+        for screen in self.screens.values():
+            screen.wait((deadline - time.monotonic()) * 1000)
+        for screen in self.screens.values():
+            screen.kill()
+        self.screens.clear()
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+
+
+def default_assignments(page_ids, screen_count):
+    """
+    화면 순서대로 페이지 배정 [(화면 번호, 페이지 ID), ...] (화면 수만큼)
+    """
+    return list(enumerate(page_ids[:screen_count]))
+
+
+def run_child(args):
+    """
+    화면 프로세스: 실행기에 연결해 명령을 받아 화면 하나를 실행. 실행기와 연결이 끊기면 종료.
+    """
+    from main import create_application
+    from models import init_db
+
+    # Ctrl+C 등 종료 신호는 실행기가 받아 quit 명령으로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    app = create_application()
+    engine = init_db(args.db)
+    host = ScreenHost(
+        engine, args.child, args.windowed, args.tiles, args.loop,
+        player_factory=stub_player_factory if args.stub_players else None
+    )
+
+    socket = QLocalSocket()
+    socket.connectToServer(args.server)
+    if not socket.waitForConnected(QUIT_TIMEOUT_MS):
+        logger.error(f"실행기에 연결할 수 없습니다: {socket.errorString()}")
+        return 1
+
+    def on_message(message):
+        host.handle(message)
+        if message.get('command') == 'quit':
+            app.quit()
+
+    channel = MessageChannel(socket)
+    host.event.connect(channel.send)
+    channel.message_received.connect(on_message)
+    channel.disconnected.connect(app.quit)
+    channel.send({'event': 'hello', 'screen': args.child, 'pid': os.getpid()})
+
+    app.setQuitOnLastWindowClosed(False)
+    result = app.exec_()
+    host.stop()
+    return result
+
+
+def main(argv=None):
+    """
+    화면별 페이지 실행
+    """
+    parser = argparse.ArgumentParser(description="여러 화면 동시 실행 - 화면마다 페이지 하나를 전체 화면으로 실행")
+    parser.add_argument("page_ids", nargs="*", type=int, help="화면 순서대로 페이지 ID (기본값: 영상이 있는 페이지를 화면 수만큼)")
+    parser.add_argument("--db", help="데이터베이스 파일 (기본값: 앱 DB)")
+    parser.add_argument("--processes", action="store_true", help="화면마다 별도 프로세스로 실행")
+    parser.add_argument("--windowed", action="store_true", help="전체 화면 대신 기본 화면에 창을 나란히 배치")
+    parser.add_argument("--loop", action="store_true", help="페이지가 끝나면 처음부터 다시 실행")
+    parser.add_argument("--sync", action="store_true", help="모든 화면의 카운트다운과 영상 전환을 같은 시각에 맞춤")
+    parser.add_argument("--api", metavar="[HOST:]PORT", help="원격 제어 API 열기 (기본 주소 127.0.0.1, remote_api.py)")
+    parser.add_argument("--api-token", help="원격 제어 API 토큰 (기본값: DREAMBODY_API_TOKEN 환경 변수 또는 ~/.dreambody_api_token)")
+    parser.add_argument("--stub-players", action="store_true", help=argparse.SUPPRESS)
+    # 화면 프로세스용 (실행기가 지정)
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--server", help=argparse.SUPPRESS)
+    parser.add_argument("--tiles", type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        return run_child(args)
+
+    from PyQt5.QtGui import QGuiApplication
+    from main import create_application
+    from models import init_db
+
+    app = create_application()
+    engine = init_db(args.db)
+
+    screen_count = len(QGuiApplication.screens())
+    page_ids = args.page_ids
+    if not page_ids:
+        session = sessionmaker(bind=engine)()
+        try:
+            page_ids = repository.list_playable_page_ids(session)
+        finally:
+            session.close()
+    if not page_ids:
+        print("영상이 할당된 페이지가 없습니다.", file=sys.stderr)
+        return 1
+
+    assignments = list(enumerate(page_ids)) if args.windowed else default_assignments(page_ids, screen_count)
+    if len(assignments) < len(page_ids):
+        logger.warning(f"화면이 {screen_count}개뿐이라 페이지 {page_ids[screen_count:]}는 실행하지 않습니다.")
+    logger.info(f"화면 {screen_count}개, 배정 {assignments}, {'화면별 프로세스' if args.processes else '단일 프로세스'}")
+
+    launcher = ScreenLauncher(engine, assignments, args.processes, args.windowed, args.loop, args.stub_players, args.sync)
+    launcher.start()
+
+    if args.api:
+        from remote_api import serve
+        try:
+            serve(launcher, args.api, args.api_token)
+        except (ValueError, OSError) as e:
+            print(e, file=sys.stderr)
+            launcher.shutdown()
+            return 1
+
+    # 실행기 창이 없어도 Ctrl+C/종료 신호로 끝낼 수 있도록 (Python 신호 처리기가 돌 수 있게 주기적으로 깨움)
+    app.setQuitOnLastWindowClosed(not args.processes)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    wakeup = QTimer()
+    wakeup.timeout.connect(lambda: None)
+    wakeup.start(500)
+
+    result = app.exec_()
+    launcher.shutdown()
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
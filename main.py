@@ -6,7 +6,7 @@ import os
 import logging
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt, QCoreApplication
-from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+import web_engine
 from admin import AdminWindow
 from models import init_db
 
@@ -20,12 +20,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("DreamBodyVideo")
 
-def main():
+def create_application():
     """
-    운동 영상 재생 시스템 시작 함수
+    렌더링/웹 엔진 설정을 마친 QApplication 생성 (관리자 창, 키오스크 모드 공용)
     """
-    logger.info("애플리케이션 시작")
-    
     # PyQT 디버깅 활성화
     os.environ["QT_DEBUG_PLUGINS"] = "1"
     
@@ -46,28 +44,26 @@ def main():
     sys.argv.append("--no-sandbox")
     sys.argv.append("--allow-file-access-from-files")
     
+    # QtWebEngine 모듈은 QApplication보다 먼저 로드해야 함 (전역 웹 설정은 첫 웹 뷰 생성 시 적용)
+    web_engine.preload()
+    
     logger.info("QApplication 생성")
     # 기본 YouTube 접근을 위한 CORS 설정
     app = QApplication(sys.argv)
-    
-    # 글로벌 웹 설정
-    logger.info("WebEngine 설정 구성")
-    settings = QWebEngineSettings.globalSettings()
-    settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
-    settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
-    settings.setAttribute(QWebEngineSettings.PluginsEnabled, True)
-    settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-    settings.setAttribute(QWebEngineSettings.JavascriptCanAccessClipboard, True)
-    settings.setAttribute(QWebEngineSettings.FullScreenSupportEnabled, True)
-    settings.setAttribute(QWebEngineSettings.PlaybackRequiresUserGesture, False)
-    settings.setAttribute(QWebEngineSettings.WebGLEnabled, True)
-    settings.setAttribute(QWebEngineSettings.Accelerated2dCanvasEnabled, True)
+    return app
+
+def main():
+    """
+    운동 영상 재생 시스템 시작 함수
+    """
+    logger.info("애플리케이션 시작")
+    app = create_application()
     
     # 데이터베이스 초기화
     logger.info("데이터베이스 초기화")
     engine = init_db()
     
-    # 관리자 창 시작
+    # 관리자 창 시작 (각 탭은 처음 열 때 구성)
     logger.info("관리자 창 생성")
     admin = AdminWindow(engine)
     admin.show()
@@ -1,7 +1,11 @@
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Float, ForeignKey, Text
+import logging
+from sqlalchemy import create_engine, Column, Integer, String, Float, ForeignKey, Text, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger("DreamBodyVideo.Models")
 
 # 기본 경로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +23,8 @@ class Video(Base):
     exercise_type = Column(String(50))  # 근력, 유산소 등
     difficulty = Column(String(20))  # 쉬움, 중간, 어려움 등
     duration = Column(Float)  # 영상 길이 (분 단위)
+    health_status = Column(String(20))  # 링크 검사 결과 (health_check.py), 미검사는 NULL
+    health_checked_at = Column(DateTime)  # 마지막 링크 검사 시각 (UTC)
     
     page_videos = relationship("PageVideo", back_populates="video")
     
@@ -45,7 +51,7 @@ class PageVideo(Base):
     page_id = Column(Integer, ForeignKey('pages.id'), nullable=False)
     video_id = Column(Integer, ForeignKey('videos.id'), nullable=False)
     order = Column(Integer, nullable=False)  # 1, 2, 3 (페이지 내 표시 순서)
-    display_number = Column(Integer)  # 화면에 표시될 번호 (미설정 시 order+1 사용)
+    display_number = Column(Integer)  # 화면에 표시될 번호 (미설정 시 재생 목록에서의 위치, 1부터)
     
     page = relationship("Page", back_populates="page_videos")
     video = relationship("Video", back_populates="page_videos")
@@ -53,6 +59,21 @@ class PageVideo(Base):
     def __repr__(self):
         return f"<PageVideo(page_id={self.page_id}, video_id={self.video_id}, order={self.order})>"
 
+class Schedule(Base):
+    __tablename__ = 'schedules'
+    
+    id = Column(Integer, primary_key=True)
+    weekday = Column(Integer, nullable=False)  # 0=월요일 ... 6=일요일
+    start_minute = Column(Integer, nullable=False)  # 시작 시각 (자정부터 분, 현지 시각)
+    end_minute = Column(Integer, nullable=False)  # 종료 시각 (시작보다 이르면 다음 날 종료)
+    page_id = Column(Integer, ForeignKey('pages.id'), nullable=False)
+    priority = Column(Integer, nullable=False, default=0)  # 시간이 겹치면 높은 값 우선
+    
+    page = relationship("Page")
+    
+    def __repr__(self):
+        return f"<Schedule(weekday={self.weekday}, {self.start_minute}-{self.end_minute}, page_id={self.page_id})>"
+
 class Config(Base):
     __tablename__ = 'config'
     
@@ -64,31 +85,161 @@ class Config(Base):
     def __repr__(self):
         return f"<Config(key='{self.key}', value='{self.value}')>"
 
-def init_db():
-    # SQLite 데이터베이스 엔진 생성
-    engine = create_engine(f'sqlite:///{DB_PATH}')
+# 영상 검색용 FTS5 인덱스 (videos 테이블을 외부 콘텐츠로 사용, 트리거로 동기화)
+SEARCH_TABLE = 'video_search'
+
+SEARCH_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS videos_search_ai AFTER INSERT ON videos BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, exercise_type, difficulty)
+        VALUES (new.id, new.title, new.exercise_type, new.difficulty);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS videos_search_ad AFTER DELETE ON videos BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, exercise_type, difficulty)
+        VALUES ('delete', old.id, old.title, old.exercise_type, old.difficulty);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS videos_search_au AFTER UPDATE OF title, exercise_type, difficulty ON videos BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, exercise_type, difficulty)
+        VALUES ('delete', old.id, old.title, old.exercise_type, old.difficulty);
+        INSERT INTO {SEARCH_TABLE}(rowid, title, exercise_type, difficulty)
+        VALUES (new.id, new.title, new.exercise_type, new.difficulty);
+    END""",
+]
+
+
+def ensure_search_index(connection):
+    """
+    영상 검색 인덱스가 없으면 생성하고 기존 데이터로 채운다.
+    trigram 토크나이저(SQLite 3.34+)를 우선 사용하고, 없으면 unicode61을 사용한다.
+    """
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).first()
+    
+    if not exists:
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                connection.exec_driver_sql(
+                    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+                    f"title, exercise_type, difficulty, content='videos', content_rowid='id', tokenize='{tokenizer}')"
+                )
+                break
+            except OperationalError:
+                continue
+        else:
+            return False
+        
+        connection.exec_driver_sql(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+    
+    for trigger in SEARCH_TRIGGERS:
+        connection.exec_driver_sql(trigger)
+    return True
+
+
+# 페이지 안의 재생 순서는 하나의 영상만 가질 수 있음 (할당 upsert의 충돌 기준)
+PAGE_ORDER_INDEX = 'ux_page_videos_page_order'
+
+
+def ensure_page_order_index(connection):
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (PAGE_ORDER_INDEX,)
+    ).first()
+    if exists:
+        return
+    
+    # 기존 DB에 같은 순서 값이 중복된 페이지는 지금 재생 순서(order, id)대로 순서 값을 다시 매김 (행은 모두 유지)
+    duplicated = connection.exec_driver_sql(
+        'SELECT DISTINCT page_id FROM page_videos GROUP BY page_id, "order" HAVING COUNT(*) > 1'
+    ).fetchall()
+    for page_id, in duplicated:
+        rows = connection.exec_driver_sql(
+            'SELECT id, "order", video_id FROM page_videos WHERE page_id = ? ORDER BY "order", id', (page_id,)
+        ).fetchall()
+        for new_order, (row_id, order, video_id) in enumerate(rows, rows[0][1]):
+            if new_order != order:
+                connection.exec_driver_sql('UPDATE page_videos SET "order" = ? WHERE id = ?', (new_order, row_id))
+                logger.warning(f"페이지 {page_id}의 중복 순서 정리: 영상 {video_id} 순서 {order} -> {new_order}")
+    connection.exec_driver_sql(
+        f'CREATE UNIQUE INDEX {PAGE_ORDER_INDEX} ON page_videos (page_id, "order")'
+    )
+
+
+# 가져오기 중복 확인(catalog_io)에서 URL로 영상을 찾음
+VIDEO_URL_INDEX = 'ix_videos_url'
+
+
+def ensure_video_url_index(connection):
+    connection.exec_driver_sql(f"CREATE INDEX IF NOT EXISTS {VIDEO_URL_INDEX} ON videos (url)")
+
+
+# 실행 중인 페이지/키오스크가 다시 읽어야 하는 변경을 테이블별 번호로 기록 (change_watcher.py)
+# 재생과 관계없는 쓰기(링크 검사 결과, 가져오기로 추가된 영상 등)는 기록하지 않음
+CHANGE_TABLE = 'table_versions'
+WATCHED_CHANGES = [
+    ('page_videos', 'INSERT'), ('page_videos', 'UPDATE'), ('page_videos', 'DELETE'),
+    ('videos', 'UPDATE OF title, url, exercise_type, difficulty, duration'), ('videos', 'DELETE'),
+    ('config', 'INSERT'), ('config', 'UPDATE'), ('config', 'DELETE'),
+    ('schedules', 'INSERT'), ('schedules', 'UPDATE'), ('schedules', 'DELETE'),
+]
+WATCHED_TABLES = frozenset(table for table, _ in WATCHED_CHANGES)
+
+
+def ensure_change_tracking(connection):
+    connection.exec_driver_sql(
+        f"CREATE TABLE IF NOT EXISTS {CHANGE_TABLE} (name TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+    )
+    for table, event in WATCHED_CHANGES:
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_changes_{event.split()[0].lower()} AFTER {event} ON {table} BEGIN "
+            f"INSERT INTO {CHANGE_TABLE} (name, version) VALUES ('{table}', 1) "
+            f"ON CONFLICT (name) DO UPDATE SET version = version + 1; END"
+        )
+
+
+# 기존 DB에 나중에 추가된 열 (테이블, 열 이름, 열 정의)
+ADDED_COLUMNS = [
+    ('page_videos', 'display_number', 'INTEGER'),
+    ('videos', 'health_status', 'VARCHAR(20)'),
+    ('videos', 'health_checked_at', 'DATETIME'),
+]
+
+
+def ensure_added_columns(connection):
+    added = []
+    for table, column, definition in ADDED_COLUMNS:
+        existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+        if column not in existing:
+            connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            added.append(f"{table}.{column}")
+    return added
+
+
+def ensure_schema(engine):
+    # create_all로 만들 수 없는 추가 스키마 (기존 DB에도 적용), 추가된 열 목록 반환
+    with engine.begin() as connection:
+        added = ensure_added_columns(connection)
+        ensure_search_index(connection)
+        ensure_page_order_index(connection)
+        ensure_video_url_index(connection)
+        ensure_change_tracking(connection)
+    return added
+
+
+def init_db(db_path=None):
+    # SQLite 데이터베이스 엔진 생성 (경로를 지정하지 않으면 기본 DB 사용)
+    engine = create_engine(f'sqlite:///{db_path or DB_PATH}')
     
     # 모든 테이블 생성
     Base.metadata.create_all(engine)
+    ensure_schema(engine)
     
     # 기본 설정값 추가
     Session = sessionmaker(bind=engine)
     session = Session()
     
-    # Config 테이블에 기본값 설정
-    default_configs = [
-        {"key": "initial_delay", "value": "3"},
-        {"key": "zoom_duration", "value": "60"},
-        {"key": "transition_duration", "value": "1"},
-        {"key": "volume", "value": "50"}
-    ]
-    
-    # 기존 값 확인 후 없는 경우에만 추가
-    for config in default_configs:
-        existing = session.query(Config).filter_by(key=config["key"]).first()
-        if not existing:
-            session.add(Config(key=config["key"], value=config["value"]))
-            
+    # Config 테이블에 기본값 설정 (없는 키만 추가)
+    from settings import seed_defaults
+    seed_defaults(session)
+    
     session.commit()
     session.close()
     
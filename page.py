@@ -1,15 +1,19 @@
 import sys
 import time
 import os
+import json
 import urllib.request
 import logging
-import re
-from PyQt5.QtCore import Qt, QUrl, QTimer, QPropertyAnimation, QEasingCurve, QRect, pyqtSignal
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy, QPushButton
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy
 from PyQt5.QtGui import QFont, QColor, QPalette, QPixmap
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
 from sqlalchemy.orm import sessionmaker
-from models import Video, Page, PageVideo, Config
+import repository
+from config_service import get_config_service
+from change_watcher import get_change_watcher
+from settings import check_value
+import youtube
+import web_engine
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,6 +27,70 @@ logging.basicConfig(
 
 logger = logging.getLogger("DreamBodyVideo.Page")
 
+# 축소된 영상의 최소 높이 (영상 수가 많을 때)
+MIN_TILE_HEIGHT = 40
+
+# 카운트다운 종료 후 첫 영상 확대까지 (ms)
+FIRST_ZOOM_DELAY_MS = 100
+
+# 임베드 플레이어 페이지 - enablejsapi=1로 연 iframe에 postMessage로 명령을 보내 볼륨을 적용
+# (플레이어가 준비되면(onReady) 다시 적용, 재생 중 변경은 VideoPlayer.set_volume에서 setVolume() 호출)
+EMBED_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {{ margin: 0; padding: 0; background-color: white; overflow: hidden; }}
+        .container {{ width: 100%; height: 100vh; display: flex; justify-content: center; align-items: center; }}
+        iframe {{ width: 100%; height: 100%; border: none; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <iframe id="player"
+            src="{src}?autoplay=1&controls=1&modestbranding=1&rel=0&enablejsapi=1"
+            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
+            allowfullscreen>
+        </iframe>
+    </div>
+    <script>
+        var volume = {volume};
+        var player = document.getElementById("player");
+        function post(message) {{
+            player.contentWindow.postMessage(JSON.stringify(message), "*");
+        }}
+        function setVolume(value) {{
+            volume = value;
+            if (volume !== null) post({{event: "command", func: "setVolume", args: [volume]}});
+        }}
+        player.addEventListener("load", function () {{
+            post({{event: "listening", id: "player"}});
+            setVolume(volume);
+        }});
+        window.addEventListener("message", function (event) {{
+            var data;
+            try {{ data = typeof event.data === "string" ? JSON.parse(event.data) : event.data; }} catch (e) {{ return; }}
+            if (data && data.event === "onReady") setVolume(volume);
+        }});
+    </script>
+</body>
+</html>
+"""
+
+
+def embed_html(video_id, volume=None):
+    return EMBED_HTML.format(src=youtube.embed_url(video_id), volume=json.dumps(volume))
+
+
+def volume_script(volume):
+    return f"setVolume({json.dumps(volume)});"
+
+
+# 재생 목록에 영향을 주는 테이블 (change_watcher.py가 알려 준 변경 중 이 테이블만 다시 읽음)
+PLAYLIST_TABLES = frozenset(('page_videos', 'videos'))
+
 class VideoPlayer(QFrame):
     finished = pyqtSignal()
     
@@ -35,6 +103,7 @@ class VideoPlayer(QFrame):
         self.parent = parent
         self.is_zoomed = False
         self.is_playing = False
+        self.volume = None
         self.init_ui()
         self.load_thumbnail()
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -72,7 +141,9 @@ class VideoPlayer(QFrame):
         self.thumbnail_label.setMinimumHeight(200)
         media_layout.addWidget(self.thumbnail_label)
         
-        # 웹 엔진 뷰 (실제 비디오 플레이어)
+        # 웹 엔진 뷰 (실제 비디오 플레이어) - 시뮬레이션 등 웹 뷰가 필요 없는 경우 QtWebEngine을 불러오지 않도록 여기서 import
+        from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings
+        web_engine.configure()
         self.web_view = QWebEngineView()
         self.web_view.page().settings().setAttribute(QWebEngineSettings.PlaybackRequiresUserGesture, False)
         self.web_view.setStyleSheet("""
@@ -107,22 +178,13 @@ class VideoPlayer(QFrame):
         if not url:
             logger.warning("URL이 제공되지 않았습니다.")
             return None
-            
-        # 유튜브 URL 패턴
-        patterns = [
-            r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/watch\?v=([^&\s]+)',
-            r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([^\?\s]+)',
-            r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/embed\/([^\?\s]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                logger.info(f"비디오 ID 추출 성공: {match.group(1)}")
-                return match.group(1)
-        
-        logger.warning(f"URL에서 비디오 ID를 찾을 수 없습니다: {url}")
-        return None
+        
+        video_id = youtube.extract_video_id(url)
+        if video_id:
+            logger.info(f"비디오 ID 추출 성공: {video_id}")
+        else:
+            logger.warning(f"URL에서 비디오 ID를 찾을 수 없습니다: {url}")
+        return video_id
         
     def load_thumbnail(self):
         if not self.video_id:
@@ -131,12 +193,11 @@ class VideoPlayer(QFrame):
             return
         
         # 캐시 디렉토리 확인/생성
-        cache_dir = os.path.join(os.path.expanduser('~'), '.dreambody_cache')
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        if not os.path.exists(youtube.CACHE_DIR):
+            os.makedirs(youtube.CACHE_DIR)
             
         # 썸네일 파일 경로
-        thumbnail_path = os.path.join(cache_dir, f"{self.video_id}.jpg")
+        thumbnail_path = youtube.thumbnail_cache_path(self.video_id)
         
         # 이미 다운로드된 썸네일이 있는지 확인
         if os.path.exists(thumbnail_path):
@@ -145,7 +206,7 @@ class VideoPlayer(QFrame):
             return
             
         # 썸네일 URL 생성 및 다운로드
-        thumbnail_url = f"https://img.youtube.com/vi/{self.video_id}/mqdefault.jpg"
+        thumbnail_url = youtube.thumbnail_url(self.video_id)
         
         try:
             logger.info(f"썸네일 다운로드 시작: {thumbnail_url}")
@@ -179,37 +240,15 @@ class VideoPlayer(QFrame):
             logger.warning("비디오 ID가 없어 영상을 로드할 수 없습니다.")
             return False
             
-        # 임베드 HTML 생성
-        embed_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{ margin: 0; padding: 0; background-color: white; overflow: hidden; }}
-                .container {{ width: 100%; height: 100vh; display: flex; justify-content: center; align-items: center; }}
-                iframe {{ width: 100%; height: 100%; border: none; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <iframe
-                    src="https://www.youtube.com/embed/{self.video_id}?autoplay=1&controls=1&modestbranding=1&rel=0"
-                    allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
-                    allowfullscreen>
-                </iframe>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # 웹 뷰에 HTML 로드
-        self.web_view.setHtml(embed_html)
+        # 웹 뷰에 임베드 HTML 로드 (현재 볼륨으로 시작)
+        self.web_view.setHtml(embed_html(self.video_id, self.volume))
         logger.info(f"비디오 {self.order+1} 로드됨: ID={self.video_id}")
         return True
         
     def toggle_play(self):
+        if self.web_view is None:
+            return  # 해제된 플레이어
+        
         if not self.is_playing:
             # 비디오 재생 시작
             if self.load_video():
@@ -224,16 +263,28 @@ class VideoPlayer(QFrame):
             self.is_playing = False
             logger.info(f"비디오 {self.order+1} 재생 정지")
         
+    def release(self):
+        # 웹 뷰(렌더러)와 썸네일 이미지를 바로 해제 - 페이지 정리/재사용 시 호출
+        self.is_playing = False
+        if self.web_view is not None:
+            self.web_view.stop()
+            self.web_view.deleteLater()
+            self.web_view = None
+        self.thumbnail_label.clear()
+        logger.info(f"비디오 {self.order+1} 해제")
+        
     def set_volume(self, volume):
-        # 볼륨 설정 (실제 비디오 로드 시 필요)
+        # 재생 중이면 플레이어에 바로 적용, 아니면 다음 load_video 때 적용
         self.volume = volume
+        if self.is_playing and self.web_view is not None:
+            self.web_view.page().runJavaScript(volume_script(volume))
         logger.info(f"볼륨 설정: {volume}")
         
     def resizeEvent(self, event):
         super().resizeEvent(event)
         # 크기가 변경되면 썸네일 다시 조정 - 캐시 활용
         if hasattr(self, 'thumbnail_label') and hasattr(self.thumbnail_label, 'pixmap') and self.thumbnail_label.pixmap() and self.video_id:
-            thumbnail_path = os.path.join(os.path.expanduser('~'), '.dreambody_cache', f"{self.video_id}.jpg")
+            thumbnail_path = youtube.thumbnail_cache_path(self.video_id)
             if os.path.exists(thumbnail_path) and self.thumbnail_label.isVisible():
                 try:
                     pixmap = QPixmap(thumbnail_path)
@@ -262,73 +313,170 @@ class VideoPlayer(QFrame):
 
 class WorkoutPage(QWidget):
     page_completed = pyqtSignal(int)  # 페이지 번호 전달
+    last_segment_started = pyqtSignal(int)  # 마지막 영상 확대 시작 (페이지 번호) - 다음 페이지 준비용
+    segment_started = pyqtSignal(int, int)  # 영상 확대 시작 (페이지 번호, 영상 인덱스)
     
-    def __init__(self, engine, page_id, parent=None):
+    def __init__(self, engine, page_id, parent=None, timer_factory=None, player_factory=None,
+                 start_at=None, monotonic=None):
         super().__init__(parent)
         self.engine = engine
         self.page_id = page_id
+        # 동기화 모드: 여러 화면이 공유하는 시작 시각(monotonic 기준 초)에서 모든 전환 시각을 계산 (launcher.py --sync)
+        self.start_at = start_at
+        self.monotonic = monotonic or time.monotonic
+        self.segment_offset_ms = None  # 현재 영상의 예정 시작 시각 (카운트다운 시작 기준 ms)
+        self.segment_started_at = None  # 현재 영상이 실제로 시작된 monotonic 시각
+        # 시뮬레이션에서는 가상 시계의 타이머와 가짜 플레이어를 주입함 (simulation.py)
+        self.timer_factory = timer_factory or QTimer
+        self.player_factory = player_factory or VideoPlayer
         self.current_zoom_index = 0
         self.video_players = []
-        self.start_countdown = 30  # 시작 카운트다운 (30초)
         self.is_page_completed = False  # 페이지 종료 여부 플래그
+        self.is_torn_down = False
+        self.is_stopped = False  # stop_playback()으로 멈춘 상태 (load_page로 다시 시작)
+        self.pending_videos = None  # 실행 중에 바뀐 재생 목록 (다음 영상 전환 때 반영)
+        self.prepared_page = None  # prepare_page()로 미리 만든 다음 페이지 (page_id, videos, container, players)
+        
+        # 창을 닫으면 Qt 객체까지 삭제 (closeEvent에서 teardown)
+        self.setAttribute(Qt.WA_DeleteOnClose)
         
         self.load_config()
         self.load_videos()
         self.init_ui()
         self.setup_timers()
+        self.watch_changes()
     
     def load_config(self):
-        Session = sessionmaker(bind=self.engine)
-        session = Session()
+        self.config_service = get_config_service(self.engine)
+        self.apply_config(self.config_service.snapshot())
+        self.start_countdown = self.config.start_countdown
+        
+        # 설정이 바뀌면 실행 중인 페이지에도 반영
+        self.config_service.config_changed.connect(self.on_config_changed)
+    
+    def apply_config(self, snapshot):
+        self.config = snapshot
+        self.initial_delay = snapshot.initial_delay
+        self.zoom_duration = snapshot.zoom_duration
+        self.transition_duration = snapshot.transition_duration
+        self.volume = snapshot.volume
+    
+    def on_config_changed(self, snapshot, changed_keys):
+        logger.info(f"설정 변경 반영: {', '.join(sorted(changed_keys))}")
+        self.apply_config(snapshot)
         
-        configs = {}
-        for config in session.query(Config).all():
-            configs[config.key] = config.value
+        if "volume" in changed_keys:
+            for player in self.video_players:
+                player.set_volume(self.volume)
+    
+    def watch_changes(self):
+        # 관리자 창, cli.py, 다른 프로세스에서 바꾼 영상/할당/설정을 실행 중인 페이지에 반영 (change_watcher.py)
+        self.change_watcher = get_change_watcher(self.engine)
+        self.change_watcher.database_changed.connect(self.on_database_changed)
+        self.change_watcher.acquire()
+    
+    def on_database_changed(self, tables):
+        if not tables & PLAYLIST_TABLES:
+            return  # 설정(config_changed로 따로 받음)이나 편성표만 바뀜
+        
+        videos = self.query_playlist(self.page_id)
+        if videos == self.videos:
+            self.pending_videos = None  # 바뀌었다가 되돌아감
+        elif videos != self.pending_videos:
+            self.pending_videos = videos
+            logger.info(f"페이지 {self.page_id} 재생 목록 변경 감지")
         
-        self.initial_delay = int(configs.get("initial_delay", 3))
-        self.zoom_duration = int(configs.get("zoom_duration", 60))
-        self.transition_duration = int(configs.get("transition_duration", 1))
-        self.volume = int(configs.get("volume", 50))
+        # 재생 중인 영상은 끊지 않고 다음 전환 때 반영 (카운트다운/정지/완료 상태면 바로 반영)
+        if self.pending_videos is not None and self.playback_status()['state'] != 'playing':
+            self.apply_pending_playlist()
         
-        session.close()
+        # 미리 만든 다음 페이지가 바뀌었으면 버림 (load_page에서 새로 읽음)
+        if self.prepared_page is not None and self.query_playlist(self.prepared_page[0]) != self.prepared_page[1]:
+            logger.info(f"미리 준비한 페이지 {self.prepared_page[0]}의 재생 목록이 바뀌어 버립니다.")
+            self.discard_prepared_page()
     
-    def load_videos(self):
-        Session = sessionmaker(bind=self.engine)
-        session = Session()
-        
-        self.videos = []
-        
-        # 페이지에 할당된 영상을 순서대로 가져옴
-        logger.info(f"페이지 {self.page_id}의 영상을 로딩합니다.")
-        page_videos = session.query(PageVideo).filter_by(page_id=self.page_id).order_by(PageVideo.order).all()
-        
-        if not page_videos:
-            logger.warning(f"페이지 {self.page_id}에 할당된 영상이 없습니다.")
-        
-        for pv in page_videos:
-            video = session.query(Video).filter_by(id=pv.video_id).first()
-            if video:
-                # 표시 번호 계산 (display_number가 설정되어 있으면 그 값을, 아니면 order+1 사용)
-                display_num = pv.display_number if pv.display_number is not None else (pv.order + 1)
-                logger.info(f"영상 {pv.order}: {video.title} ({video.url}), 길이: {video.duration}분, 표시번호: {display_num}")
-                self.videos.append({
-                    'order': pv.order,
-                    'title': video.title,
-                    'url': video.url,
-                    'exercise_type': video.exercise_type, 
-                    'difficulty': video.difficulty,
-                    'duration': video.duration,  # 영상 길이 정보 추가 (분 단위)
-                    'display_number': display_num  # 표시 번호 추가
-                })
+    def apply_pending_playlist(self):
+        """
+        바뀐 재생 목록 반영 - 영상이 바뀐 칸만 다시 만들고(길이/표시 번호만 바뀐 칸은 레이블만 갱신), 나머지 칸과 타이머는 그대로 둠
+        """
+        videos, self.pending_videos = self.pending_videos, None
+        if videos is None:
+            return
+        
+        previous = self.videos
+        self.videos = videos
+        if not previous or not videos:
+            # 대기 메시지 <-> 영상 칸: 영상 칸 전체를 다시 구성
+            self.release_players()
+            self.main_layout.removeWidget(self.videos_container)
+            self.videos_container.deleteLater()
+            self.videos_container, self.video_players = self.build_video_tiles(videos)
+            self.main_layout.addWidget(self.videos_container, 1)
+            logger.info(f"페이지 {self.page_id} 영상 칸 다시 구성 ({len(videos)}개)")
+            return
+        
+        layout = self.videos_container.layout()
+        changed = []
+        for index, video in enumerate(videos):
+            old = previous[index] if index < len(previous) else None
+            if old is None:
+                container, player = self.build_video_tile(video)
+                layout.addWidget(container)
+                self.video_players.append(player)
+            elif (video['order'], video['url'], video['title']) != (old['order'], old['url'], old['title']):
+                # 영상이 바뀐 칸은 플레이어를 새로 만듦
+                container, player = self.build_video_tile(video)
+                old_container = layout.itemAt(index).widget()
+                layout.replaceWidget(old_container, container)
+                self.video_players[index].release()
+                old_container.deleteLater()
+                self.video_players[index] = player
+            elif video != old:
+                player = self.video_players[index]
+                player.number_label.setText(f"{video['display_number']:02d}")
+                player.timer_label.setText(f"{self.video_duration_seconds(video)}s")
             else:
-                logger.warning(f"영상 ID {pv.video_id}를 찾을 수 없습니다.")
+                continue
+            changed.append(index + 1)
+        
+        # 빠진 칸은 뒤에서부터 제거
+        for index in range(len(previous) - 1, len(videos) - 1, -1):
+            self.video_players.pop().release()
+            old_container = layout.itemAt(index).widget()
+            layout.removeWidget(old_container)
+            old_container.deleteLater()
+            changed.append(index + 1)
         
-        logger.info(f"총 {len(self.videos)}개 영상이 로드되었습니다.")
-        session.close()
+        self.layout_players()
+        logger.info(f"페이지 {self.page_id} 재생 목록 반영: {sorted(changed)}번 칸")
+    
+    def load_videos(self):
+        self.videos = self.fetch_playlist(self.page_id)
+    
+    def fetch_playlist(self, page_id):
+        # 페이지에 할당된 영상을 순서대로 가져옴 (영상 정보까지 한 번의 쿼리)
+        logger.info(f"페이지 {page_id}의 영상을 로딩합니다.")
+        videos = self.query_playlist(page_id)
+        
+        if not videos:
+            logger.warning(f"페이지 {page_id}에 할당된 영상이 없습니다.")
+        
+        for video in videos:
+            logger.info(f"영상 {video['order']}: {video['title']} ({video['url']}), 길이: {video['duration']}분, 표시번호: {video['display_number']}")
+        
+        logger.info(f"총 {len(videos)}개 영상이 로드되었습니다.")
+        return videos
+    
+    def query_playlist(self, page_id):
+        session = sessionmaker(bind=self.engine)()
+        try:
+            return repository.load_page_playlist(session, page_id)
+        finally:
+            session.close()
     
     def init_ui(self):
         # 세로 레이아웃 설정
-        main_layout = QVBoxLayout(self)
+        main_layout = self.main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(2) # 간격을 줄여 이미지처럼 붙어보이게
         
@@ -360,7 +508,7 @@ class WorkoutPage(QWidget):
         timer_label1.setAlignment(Qt.AlignRight)
         timer_label1.setStyleSheet("color: white;")
         
-        self.timer_display = QLabel("00:30")
+        self.timer_display = QLabel(f"{self.start_countdown // 60:02d}:{self.start_countdown % 60:02d}")
         self.timer_display.setFont(QFont("Arial", 32, QFont.Bold))
         self.timer_display.setAlignment(Qt.AlignRight)
         self.timer_display.setStyleSheet("color: white;")
@@ -371,7 +519,14 @@ class WorkoutPage(QWidget):
         
         main_layout.addWidget(header_frame)
         
-        # 영상 컨테이너 (검은 배경에 흰색 영상)
+        self.videos_container, self.video_players = self.build_video_tiles(self.videos)
+        main_layout.addWidget(self.videos_container, 1)
+        
+        self.update()
+    
+    def build_video_tiles(self, videos):
+        # 영상 컨테이너 (검은 배경에 흰색 영상) - 페이지를 바꿀 때는 이 부분만 다시 만듦
+        # 반환값: (컨테이너, 플레이어 목록)
         videos_container = QFrame()
         videos_container.setStyleSheet("background-color: #000000;")
         videos_layout = QVBoxLayout(videos_container)
@@ -379,92 +534,183 @@ class WorkoutPage(QWidget):
         videos_layout.setSpacing(2)
         
         # 영상 플레이어 추가
-        logger.info(f"영상 플레이어 {len(self.videos)}개 추가")
-        for video in self.videos:
-            # 비디오 컨테이너 (번호 + 썸네일)
-            video_container = QFrame()
-            video_container.setStyleSheet("background-color: #000000;")
-            video_layout = QHBoxLayout(video_container)
-            video_layout.setContentsMargins(0, 0, 0, 0)
-            
-            # 번호 표시 (왼쪽)
-            number_frame = QFrame()
-            number_frame.setFixedWidth(60)
-            number_frame.setStyleSheet("background-color: #000000;")
-            number_layout = QVBoxLayout(number_frame)
-            number_layout.setSpacing(2)
-            number_layout.setContentsMargins(0, 5, 0, 5)
-            
-            # 번호 레이블
-            number_label = QLabel(f"{video['display_number']:02d}")
-            number_label.setFont(QFont("Arial", 30, QFont.Bold))
-            number_label.setAlignment(Qt.AlignCenter)
-            number_label.setStyleSheet("color: white;")
-            number_layout.addWidget(number_label)
-            
-            # 타이머 레이블 추가
-            # 영상 길이를 초 단위로 변환 (데이터베이스에는 분 단위로 저장)
-            duration_seconds = int(video['duration'] * 60) if 'duration' in video and video['duration'] else self.zoom_duration
-            timer_label = QLabel(f"{duration_seconds}s")
-            timer_label.setFont(QFont("Arial", 16, QFont.Bold))
-            timer_label.setAlignment(Qt.AlignCenter)
-            timer_label.setStyleSheet("color: #AAAAAA;")
-            number_layout.addWidget(timer_label)
-            
-            video_layout.addWidget(number_frame)
-            
-            # 비디오 플레이어
-            player = VideoPlayer(video['order'], video['url'], video['title'], self)
-            player.set_volume(self.volume)
-            # 타이머 레이블 객체 저장
-            player.timer_label = timer_label
-            player.remaining_time = self.zoom_duration
-            
-            self.video_players.append(player)
-            video_layout.addWidget(player, 1)
-            
+        logger.info(f"영상 플레이어 {len(videos)}개 추가")
+        players = []
+        for video in videos:
+            video_container, player = self.build_video_tile(video)
+            players.append(player)
             videos_layout.addWidget(video_container)
         
-        main_layout.addWidget(videos_container, 1)
-        
         # 대기 메시지
-        if not self.videos:
+        if not videos:
             no_video_label = QLabel("페이지에 할당된 영상이 없습니다.\n관리자 페이지에서 영상을 추가해주세요.")
             no_video_label.setFont(QFont("Arial", 18, QFont.Bold))
             no_video_label.setAlignment(Qt.AlignCenter)
             no_video_label.setStyleSheet("color: white; padding: 50px;")
-            main_layout.addWidget(no_video_label)
+            videos_layout.addWidget(no_video_label)
             logger.warning("영상이 없어 대기 메시지 표시")
         
-        self.update()
+        return videos_container, players
+    
+    def build_video_tile(self, video):
+        # 영상 칸 하나 (번호 + 썸네일) - 반환값: (칸 컨테이너, 플레이어)
+        video_container = QFrame()
+        video_container.setStyleSheet("background-color: #000000;")
+        video_layout = QHBoxLayout(video_container)
+        video_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # 번호 표시 (왼쪽)
+        number_frame = QFrame()
+        number_frame.setFixedWidth(60)
+        number_frame.setStyleSheet("background-color: #000000;")
+        number_layout = QVBoxLayout(number_frame)
+        number_layout.setSpacing(2)
+        number_layout.setContentsMargins(0, 5, 0, 5)
+        
+        # 번호 레이블
+        number_label = QLabel(f"{video['display_number']:02d}")
+        number_label.setFont(QFont("Arial", 30, QFont.Bold))
+        number_label.setAlignment(Qt.AlignCenter)
+        number_label.setStyleSheet("color: white;")
+        number_layout.addWidget(number_label)
+        
+        # 타이머 레이블 추가
+        timer_label = QLabel(f"{self.video_duration_seconds(video)}s")
+        timer_label.setFont(QFont("Arial", 16, QFont.Bold))
+        timer_label.setAlignment(Qt.AlignCenter)
+        timer_label.setStyleSheet("color: #AAAAAA;")
+        number_layout.addWidget(timer_label)
+        
+        video_layout.addWidget(number_frame)
+        
+        # 비디오 플레이어
+        player = self.player_factory(video['order'], video['url'], video['title'], self)
+        player.set_volume(self.volume)
+        # 레이블 객체 저장
+        player.number_label = number_label
+        player.timer_label = timer_label
+        player.remaining_time = self.zoom_duration
+        
+        video_layout.addWidget(player, 1)
+        return video_container, player
+    
+    def video_duration_seconds(self, video):
+        # 영상 길이를 초 단위로 변환 (데이터베이스에는 분 단위로 저장, 없으면 확대 유지 시간)
+        return int(video['duration'] * 60) if 'duration' in video and video['duration'] else self.zoom_duration
     
     def setup_timers(self):
         # 초기 타이머 설정 로깅
         logger.info(f"타이머 설정: 초기 딜레이 {self.initial_delay}초, 줌 지속시간 {self.zoom_duration}초")
         
         # 카운트다운 타이머
-        self.countdown_timer = QTimer(self)
+        self.countdown_timer = self.timer_factory(self)
         self.countdown_timer.timeout.connect(self.update_countdown)
-        self.countdown_timer.start(1000)  # 1초마다 업데이트
-        logger.info("카운트다운 타이머 시작")
         
         # 초기 딜레이 타이머는 카운트다운 종료 후 시작됨
-        self.initial_timer = QTimer(self)
+        self.initial_timer = self.timer_factory(self)
         self.initial_timer.timeout.connect(self.zoom_first_video)
         self.initial_timer.setSingleShot(True)
         
         # 줌 전환 타이머
-        self.zoom_timer = QTimer(self)
+        self.zoom_timer = self.timer_factory(self)
         self.zoom_timer.timeout.connect(self.switch_zoomed_video)
         
         # 영상 타이머 (1초마다 남은 시간 표시 업데이트)
-        self.video_timer = QTimer(self)
+        self.video_timer = self.timer_factory(self)
         self.video_timer.timeout.connect(self.update_video_timer)
         
         # 전체 프로세스 타이머 (마지막 영상 종료 후)
-        self.completion_timer = QTimer(self)
+        self.completion_timer = self.timer_factory(self)
         self.completion_timer.timeout.connect(self.complete_page)
         self.completion_timer.setSingleShot(True)
+        
+        # 동기화 모드에서 진행 중인 일정에 합류 (생성/load_page가 끝나고 시그널이 연결된 뒤 실행)
+        self.join_timer = self.timer_factory(self)
+        self.join_timer.timeout.connect(self.join_schedule)
+        self.join_timer.setSingleShot(True)
+        
+        # 초 표시와 전환 시각이 밀리지 않도록 정밀 타이머 사용 (기본 CoarseTimer는 간격의 5%까지 오차 허용)
+        for timer in (self.countdown_timer, self.initial_timer, self.zoom_timer, self.video_timer, self.completion_timer,
+                      self.join_timer):
+            timer.setTimerType(Qt.PreciseTimer)
+        
+        self.start_countdown_timer()
+    
+    def start_countdown_timer(self):
+        self.tick_offset_ms = 1000
+        if self.start_at is not None and self.elapsed_ms() >= self.tick_offset_ms:
+            self.join_timer.start(0)  # 이미 진행 중인 공통 일정에 합류
+            return
+        self.schedule(self.countdown_timer, self.tick_offset_ms, 1000)  # 1초마다 업데이트
+        logger.info("카운트다운 타이머 시작")
+    
+    def elapsed_ms(self):
+        # 동기화 모드: 공통 시작 시각부터 지난 시간
+        return (self.monotonic() - self.start_at) * 1000
+    
+    def join_schedule(self):
+        """
+        동기화 모드에서 늦게 시작한 화면(다시 시작한 화면 프로세스 등): 지난 시간으로 현재 영상과 남은 시간을 계산해 바로 이동
+        (지난 카운트다운 초와 영상 전환을 하나씩 실행하지 않으므로 지나간 영상의 웹 뷰를 불러오지 않음)
+        """
+        elapsed_ms = self.elapsed_ms()
+        countdown_ms = self.start_countdown * 1000
+        if elapsed_ms < countdown_ms:
+            ticks = int(elapsed_ms // 1000)
+            self.start_countdown -= ticks
+            self.timer_display.setText(f"{self.start_countdown // 60:02d}:{self.start_countdown % 60:02d}")
+            self.tick_offset_ms = (ticks + 1) * 1000
+            self.schedule(self.countdown_timer, self.tick_offset_ms, 1000)
+            logger.info(f"진행 중인 카운트다운에 합류 ({self.start_countdown}초 남음)")
+            return
+        
+        self.start_countdown = 0
+        self.timer_display.setText("START")
+        self.tick_offset_ms = countdown_ms
+        self.segment_offset_ms = countdown_ms + FIRST_ZOOM_DELAY_MS
+        if elapsed_ms < self.segment_offset_ms or not self.video_players:
+            self.schedule(self.initial_timer, self.segment_offset_ms, FIRST_ZOOM_DELAY_MS)
+            return
+        
+        # 지금 재생 중이어야 할 영상 찾기
+        index = 0
+        offset_ms = self.segment_offset_ms
+        for index, video in enumerate(self.videos):
+            end_ms = offset_ms + self.video_duration_seconds(video) * 1000
+            if elapsed_ms < end_ms:
+                break
+            offset_ms = end_ms
+        else:
+            logger.info(f"페이지 {self.page_id}의 공통 일정이 이미 끝나 바로 완료합니다.")
+            self.complete_page()
+            return
+        
+        logger.info(f"진행 중인 일정에 합류: 영상 {index + 1} ({(elapsed_ms - offset_ms) / 1000:.1f}초 지남)")
+        if index == 0:
+            self.zoom_first_video()
+        else:
+            for player in self.video_players[:index]:
+                player.timer_label.setText("DONE")
+            # 바로 앞 영상이 offset_ms에 끝난 것으로 두고 전환 (전환 타이머/종료 타이머도 같이 설정됨)
+            self.current_zoom_index = index - 1
+            self.segment_end_ms = offset_ms
+            self.switch_zoomed_video()
+        
+        # 지난 초만큼 남은 시간을 줄이고 다음 초부터 표시
+        passed = int((elapsed_ms - self.segment_offset_ms) // 1000)
+        player = self.video_players[index]
+        player.remaining_time -= passed
+        player.timer_label.setText(f"{player.remaining_time}s")
+        self.tick_offset_ms = self.segment_offset_ms + (passed + 1) * 1000
+        self.schedule(self.video_timer, self.tick_offset_ms, 1000)
+    
+    def schedule(self, timer, offset_ms, delay_ms):
+        """
+        timer를 delay_ms 후에 실행. 동기화 모드에서는 공유 시작 시각 + offset_ms까지 남은 시간으로 실행 (지연이 누적되지 않음)
+        """
+        if self.start_at is not None:
+            delay_ms = max(0, round((self.start_at - self.monotonic()) * 1000 + offset_ms))
+        timer.start(delay_ms)
     
     def update_countdown(self):
         self.start_countdown -= 1
@@ -481,13 +727,20 @@ class WorkoutPage(QWidget):
             
             # 첫 영상 확대 타이머 시작
             logger.info("첫 영상 확대 타이머 시작")
-            self.initial_timer.start(100)  # 거의 즉시 시작 (0.1초 후)
+            self.segment_offset_ms = self.tick_offset_ms + FIRST_ZOOM_DELAY_MS
+            self.schedule(self.initial_timer, self.segment_offset_ms, FIRST_ZOOM_DELAY_MS)  # 거의 즉시 시작
+        else:
+            self.tick_offset_ms += 1000
+            self.schedule(self.countdown_timer, self.tick_offset_ms, 1000)
     
     def update_video_timer(self):
         # 이미 종료된 페이지인 경우 타이머 중지
         if self.is_page_completed:
             self.video_timer.stop()
             return
+        
+        self.tick_offset_ms += 1000
+        self.schedule(self.video_timer, self.tick_offset_ms, 1000)
             
         # 현재 확대된 비디오의 남은 시간 업데이트
         if 0 <= self.current_zoom_index < len(self.video_players):
@@ -541,20 +794,29 @@ class WorkoutPage(QWidget):
                 
             # 첫 번째 영상 확대 및 타이머 시작
             self.zoom_video(0)
-            self.video_timer.start(1000)  # 1초마다 타이머 업데이트
+            self.tick_offset_ms = self.segment_offset_ms + 1000
+            self.schedule(self.video_timer, self.tick_offset_ms, 1000)  # 1초마다 타이머 업데이트
             
             # 첫 번째 영상의 길이에 맞춰 다음 전환 타이머 설정
             if 'duration' in self.videos[0] and self.videos[0]['duration']:
                 first_video_duration = int(self.videos[0]['duration'] * 60) * 1000  # 밀리초 단위로 변환
                 logger.info(f"다음 영상 전환 타이머 시작 ({first_video_duration/1000}초)")
-                self.zoom_timer.start(first_video_duration)
+                self.schedule_segment_end(self.zoom_timer, first_video_duration)
             else:
                 logger.info(f"다음 영상 전환 타이머 시작 ({self.zoom_duration}초)")
-                self.zoom_timer.start(self.zoom_duration * 1000)
+                self.schedule_segment_end(self.zoom_timer, self.zoom_duration * 1000)
         else:
             logger.warning("영상 플레이어가 없어 확대 불가")
     
+    def schedule_segment_end(self, timer, duration_ms):
+        # 현재 영상의 예정 시작 시각 + 길이 (다음 영상은 이 시각에 시작한 것으로 계산)
+        self.segment_end_ms = self.segment_offset_ms + duration_ms
+        self.schedule(timer, self.segment_end_ms, duration_ms)
+    
     def switch_zoomed_video(self):
+        # 실행 중에 바뀐 재생 목록은 영상 전환 시점에 반영
+        self.apply_pending_playlist()
+        
         # 다음 영상으로 전환
         next_index = self.current_zoom_index + 1
         
@@ -566,6 +828,7 @@ class WorkoutPage(QWidget):
         
         if next_index < len(self.video_players):
             logger.info(f"다음 영상({next_index + 1}) 확대 시작")
+            self.segment_offset_ms = self.segment_end_ms
             
             # 다음 비디오 타이머 초기화 - 실제 영상 길이 사용
             next_player = self.video_players[next_index]
@@ -592,20 +855,20 @@ class WorkoutPage(QWidget):
                     logger.info(f"마지막 영상 확대 중, 종료 타이머 설정 ({last_video_duration/1000}초)")
                     self.zoom_timer.stop()
                     # 타이머는 설정하지만 백업으로 남겨두고 update_video_timer에서도 체크
-                    self.completion_timer.start(last_video_duration + 1000)  # 1초 더 여유를 둠
+                    self.schedule_segment_end(self.completion_timer, last_video_duration + 1000)  # 1초 더 여유를 둠
                 else:
                     logger.info(f"마지막 영상 확대 중, 종료 타이머 설정 ({self.zoom_duration}초)")
                     self.zoom_timer.stop()
-                    self.completion_timer.start(self.zoom_duration * 1000 + 1000)  # 1초 더 여유를 둠
+                    self.schedule_segment_end(self.completion_timer, self.zoom_duration * 1000 + 1000)  # 1초 더 여유를 둠
             else:
                 # 다음 전환 타이머 설정 - 다음 영상의 실제 길이 사용
                 if next_index < len(self.videos) and 'duration' in self.videos[next_index] and self.videos[next_index]['duration']:
                     next_video_duration = int(self.videos[next_index]['duration'] * 60) * 1000
                     logger.info(f"다음 영상 전환 타이머 시작 ({next_video_duration/1000}초)")
-                    self.zoom_timer.start(next_video_duration)
+                    self.schedule_segment_end(self.zoom_timer, next_video_duration)
                 else:
                     logger.info(f"다음 영상 전환 타이머 시작 ({self.zoom_duration}초)")
-                    self.zoom_timer.start(self.zoom_duration * 1000)
+                    self.schedule_segment_end(self.zoom_timer, self.zoom_duration * 1000)
         else:
             # 모든 타이머 정지
             self.video_timer.stop()
@@ -618,16 +881,15 @@ class WorkoutPage(QWidget):
             return
             
         logger.info(f"비디오 {index + 1} 확대 시작")
+        self.segment_started_at = self.monotonic()
         
         # 현재 줌 인덱스 업데이트
         self.current_zoom_index = index
         
-        # 화면 높이 계산 - 세 영상이 동일한 크기로 표시
+        # 영상 수에 맞게 높이 배분
+        self.layout_players()
+        
         for i, player in enumerate(self.video_players):
-            # 모든 플레이어에 동일한 설정 적용
-            player.setMinimumHeight(220)
-            player.setMaximumHeight(220)
-            
             if i == index:
                 # 확대된 영상은 특별한 처리 없이 기본 크기 유지
                 player.zoom_in()
@@ -646,6 +908,12 @@ class WorkoutPage(QWidget):
         # UI 업데이트
         self.update()
         logger.info(f"비디오 {index + 1} 확대 완료")
+        
+        self.segment_started.emit(self.page_id, index)
+        
+        # 마지막 영상이 시작되면 알림 (키오스크 모드에서 다음 페이지 준비)
+        if index == len(self.video_players) - 1:
+            self.last_segment_started.emit(self.page_id)
     
     def complete_page(self):
         # 이미 종료 처리된 페이지인 경우 중복 실행 방지
@@ -656,16 +924,7 @@ class WorkoutPage(QWidget):
         self.is_page_completed = True
         
         # 모든 타이머 정지
-        if hasattr(self, 'countdown_timer'):
-            self.countdown_timer.stop()
-        if hasattr(self, 'initial_timer'):
-            self.initial_timer.stop()
-        if hasattr(self, 'zoom_timer'):
-            self.zoom_timer.stop()
-        if hasattr(self, 'video_timer'):
-            self.video_timer.stop()
-        if hasattr(self, 'completion_timer'):
-            self.completion_timer.stop()
+        self.stop_timers()
             
         # 모든 영상 플레이어 정지
         for player in self.video_players:
@@ -681,22 +940,220 @@ class WorkoutPage(QWidget):
         if __name__ == "__main__":
             self.close()
     
+    def stop_timers(self):
+        for name in ('countdown_timer', 'initial_timer', 'zoom_timer', 'video_timer', 'completion_timer', 'join_timer'):
+            if hasattr(self, name):
+                getattr(self, name).stop()
+    
+    def release_players(self):
+        for player in self.video_players:
+            player.release()
+        self.video_players = []
+    
+    def playback_status(self):
+        """
+        현재 재생 상태 (원격 제어 API, 화면 실행기 상태 보고용)
+        """
+        if self.is_stopped:
+            state = 'stopped'
+        elif self.is_page_completed:
+            state = 'completed'
+        elif self.countdown_timer.isActive() or self.initial_timer.isActive() or self.join_timer.isActive():
+            state = 'countdown'
+        else:
+            state = 'playing'
+        
+        player = None
+        if state == 'playing' and 0 <= self.current_zoom_index < len(self.video_players):
+            player = self.video_players[self.current_zoom_index]
+        
+        return {
+            'page_id': self.page_id,
+            'state': state,
+            'segment': self.current_zoom_index + 1 if player is not None else None,
+            'segments': len(self.video_players),
+            'remaining_seconds': max(player.remaining_time, 0) if player is not None else None,
+            'countdown': self.start_countdown if state == 'countdown' else None,
+            'player': ('playing' if player.is_playing else 'paused') if player is not None else None,
+            'video_id': youtube.extract_video_id(player.url) if player is not None else None,
+            'volume': self.volume,
+        }
+    
+    def advance_clock(self, offset_ms):
+        # 동기화 모드: 예정 시각 offset_ms가 지금이 되도록 시작 시각을 옮김 (건너뛴 만큼 이후 일정도 앞당김)
+        if self.start_at is not None:
+            self.start_at = self.monotonic() - offset_ms / 1000
+    
+    def skip_segment(self):
+        """
+        다음 영상으로 바로 전환 (카운트다운 중이면 첫 영상 시작, 마지막 영상이면 페이지 완료)
+        """
+        if self.is_stopped or self.is_page_completed:
+            raise RuntimeError("재생 중인 페이지가 없습니다.")
+        if not self.video_players:
+            raise RuntimeError(f"페이지 {self.page_id}에 영상이 없습니다.")
+        
+        in_countdown = self.countdown_timer.isActive() or self.initial_timer.isActive()
+        if self.countdown_timer.isActive():
+            # 남은 카운트다운을 건너뜀 (마지막 초 예정 시각 + 첫 영상 확대 지연)
+            self.countdown_timer.stop()
+            self.segment_offset_ms = self.tick_offset_ms + (self.start_countdown - 1) * 1000 + FIRST_ZOOM_DELAY_MS
+            self.start_countdown = 0
+            self.timer_display.setText("START")
+        
+        if in_countdown:
+            logger.info("카운트다운 건너뛰기")
+            self.initial_timer.stop()
+            self.advance_clock(self.segment_offset_ms)
+            self.zoom_first_video()
+            return
+        
+        logger.info(f"비디오 {self.current_zoom_index + 1} 건너뛰기")
+        self.zoom_timer.stop()
+        self.video_timer.stop()
+        self.completion_timer.stop()
+        self.advance_clock(self.segment_end_ms)
+        self.switch_zoomed_video()
+        if not self.is_page_completed:
+            # 초 표시도 새 영상 시작 시각 기준으로 다시 맞춤
+            self.tick_offset_ms = self.segment_offset_ms + 1000
+            self.schedule(self.video_timer, self.tick_offset_ms, 1000)
+    
+    def set_volume(self, volume):
+        """
+        실행 중인 페이지의 볼륨 변경 (설정은 바꾸지 않음 - 관리자에서 볼륨 설정을 바꾸면 그 값으로 돌아감)
+        """
+        volume = check_value('volume', volume)
+        self.volume = volume
+        for player in self.video_players:
+            player.set_volume(volume)
+    
+    def stop_playback(self):
+        """
+        타이머와 영상을 멈추고 정지 화면으로 (창과 영상 칸은 유지 - load_page로 다시 시작)
+        """
+        self.stop_timers()
+        for player in self.video_players:
+            if player.is_playing:
+                player.toggle_play()
+        self.is_stopped = True
+        self.timer_display.setText("STOP")
+        logger.info(f"페이지 {self.page_id} 정지")
+    
+    def prepare_page(self, page_id):
+        """
+        다음 페이지의 재생 목록을 읽고 영상 칸(플레이어, 썸네일)을 숨긴 채 미리 만들어 둠 - load_page에서 바로 사용
+        """
+        if self.prepared_page is not None and self.prepared_page[0] == page_id:
+            return
+        self.discard_prepared_page()
+        
+        logger.info(f"다음 페이지 {page_id} 미리 준비")
+        videos = self.fetch_playlist(page_id)
+        container, players = self.build_video_tiles(videos)
+        container.setParent(self)
+        container.hide()
+        self.prepared_page = (page_id, videos, container, players)
+    
+    def discard_prepared_page(self):
+        if self.prepared_page is None:
+            return
+        _, _, container, players = self.prepared_page
+        self.prepared_page = None
+        for player in players:
+            player.release()
+        container.deleteLater()
+    
+    def load_page(self, page_id, start_at=None):
+        """
+        창을 다시 만들지 않고 다른 페이지를 처음부터 실행 (헤더/타이머는 재사용, 영상 칸만 다시 구성)
+        
+        start_at을 주면 그 시각(monotonic 기준 초)에 카운트다운을 시작한 것으로 보고 전환 시각을 맞춤
+        """
+        logger.info(f"페이지 {page_id} 불러오기 (창 재사용)")
+        self.stop_timers()
+        self.release_players()
+        self.main_layout.removeWidget(self.videos_container)
+        self.videos_container.deleteLater()
+        
+        self.page_id = page_id
+        self.start_at = start_at
+        self.current_zoom_index = 0
+        self.is_page_completed = False
+        self.is_stopped = False
+        self.pending_videos = None
+        self.start_countdown = self.config.start_countdown
+        self.timer_display.setText(f"{self.start_countdown // 60:02d}:{self.start_countdown % 60:02d}")
+        
+        if self.prepared_page is not None and self.prepared_page[0] == page_id:
+            # 미리 만든 영상 칸 사용 (준비 후 바뀐 볼륨 반영)
+            _, self.videos, self.videos_container, self.video_players = self.prepared_page
+            self.prepared_page = None
+            for player in self.video_players:
+                player.set_volume(self.volume)
+        else:
+            # 다른 페이지를 준비해 둔 경우 그대로 남겨 둠 (다음 prepare_page/teardown 때 해제)
+            self.load_videos()
+            self.videos_container, self.video_players = self.build_video_tiles(self.videos)
+        
+        self.main_layout.addWidget(self.videos_container, 1)
+        self.videos_container.show()
+        self.start_countdown_timer()
+    
+    def teardown(self):
+        """
+        타이머/시그널/웹 뷰/썸네일을 즉시 해제하고 위젯 삭제를 예약. 여러 번 호출해도 안전.
+        """
+        if self.is_torn_down:
+            return
+        self.is_torn_down = True
+        
+        self.stop_timers()
+        try:
+            self.config_service.config_changed.disconnect(self.on_config_changed)
+        except TypeError:
+            pass  # 이미 연결 해제됨
+        try:
+            self.change_watcher.database_changed.disconnect(self.on_database_changed)
+        except TypeError:
+            pass
+        finally:
+            self.change_watcher.release()
+        self.release_players()
+        self.discard_prepared_page()
+        self.deleteLater()
+        logger.info(f"페이지 {self.page_id} 정리 완료")
+    
+    def closeEvent(self, event):
+        self.teardown()
+        super().closeEvent(event)
+    
+    def layout_players(self):
+        # 확대된 영상은 60%, 나머지 영상은 남은 높이를 나눠 가짐 (영상 수와 무관)
+        count = len(self.video_players)
+        if count == 0:
+            return
+        
+        total_height = max(self.height() - 100, 0)  # 헤더 영역 고려
+        if count == 1:
+            zoomed_height = normal_height = total_height
+        else:
+            zoomed_height = int(total_height * 0.6)
+            normal_height = max(int((total_height - zoomed_height) / (count - 1)) - 2, MIN_TILE_HEIGHT)
+        
+        for i, player in enumerate(self.video_players):
+            if i == self.current_zoom_index:
+                player.setFixedHeight(zoomed_height)
+            else:
+                player.setFixedHeight(normal_height)
+    
     def resizeEvent(self, event):
         # 윈도우 크기가 변경될 때 영상 크기 즉시 조정 (애니메이션 없이)
-        if hasattr(self, 'current_zoom_index') and len(self.video_players) > 0:
-            total_height = self.height() - 100  # 헤더 영역 고려
-            zoomed_height = int(total_height * 0.6)
-            normal_height = int(total_height * 0.2)
-            
-            for i, player in enumerate(self.video_players):
-                if i == self.current_zoom_index:
-                    player.setFixedHeight(zoomed_height)
-                else:
-                    player.setFixedHeight(normal_height)
+        if hasattr(self, 'current_zoom_index'):
+            self.layout_players()
                     
         super().resizeEvent(event)
 
-
 if __name__ == "__main__":
     from models import init_db
     
@@ -0,0 +1,505 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import hmac
+import secrets
+import base64
+import struct
+import asyncio
+import hashlib
+import logging
+import ipaddress
+import threading
+from collections import deque
+from concurrent.futures import Future
+from urllib.parse import urlsplit, parse_qsl
+from PyQt5.QtCore import Qt, QObject, QCoreApplication, pyqtSignal
+
+logger = logging.getLogger("DreamBodyVideo.RemoteAPI")
+
+# 원격 제어 API (선택 기능 - kiosk.py / launcher.py --api [HOST:]PORT)
+# - 표준 라이브러리 asyncio로 만든 작은 HTTP/WebSocket 서버를 별도 스레드에서 실행 (추가 패키지 없음)
+# - 명령은 Qt 시그널(QueuedConnection)로 GUI 스레드에 전달되어 다음 이벤트 루프 순회에서 실행됨
+#   GUI 스레드는 소켓을 읽거나 기다리지 않고, API 스레드는 결과(Future)만 기다림
+# - 기본은 127.0.0.1에서만 접속 가능. 항상 토큰이 필요 ("Authorization: Bearer 토큰" 헤더)
+#   --api-token이나 DREAMBODY_API_TOKEN이 없으면 ~/.dreambody_api_token의 토큰을 사용 (없으면 새로 만들어 저장)
+# - 브라우저/웹 페이지(키오스크 안의 YouTube 포함)에서 오는 요청은 받지 않음
+#   Origin 헤더가 있으면 거부, Host는 연 주소여야 함 (DNS rebinding 방지), POST 본문은 Content-Type: application/json
+#
+#   GET  /status                    현재 상태 (페이지, 영상 번호, 남은 시간, 플레이어 상태, 볼륨)
+#   POST /start   {"page_id": 2}    페이지 실행 (page_id가 없으면 지금 페이지를 처음부터)
+#   POST /stop                      정지
+#   POST /skip                      다음 영상으로 (카운트다운 중이면 첫 영상 바로 시작)
+#   POST /volume  {"volume": 30}    볼륨 (0-100, 설정은 바꾸지 않음)
+#   GET  /events                    이벤트 스트림 - WebSocket 또는 text/event-stream (Upgrade 헤더가 없을 때)
+#
+# - 인자는 JSON 본문 또는 쿼리 문자열(?page_id=2)로 전달. 여러 화면 실행기에서는 screen(0부터)으로 한 화면만 지정
+# - 응답: {"ok": true, "result": 상태} / {"ok": false, "error": "..."} (400 잘못된 인자, 409 지금 할 수 없는 명령)
+# - WebSocket으로 {"command": "skip"} 같은 명령을 보내면 같은 연결로 {"reply": "skip", "ok": ...}을 받음
+
+TOKEN_ENV = "DREAMBODY_API_TOKEN"
+TOKEN_FILE = os.environ.get("DREAMBODY_API_TOKEN_FILE") or os.path.join(os.path.expanduser("~"), ".dreambody_api_token")
+DEFAULT_HOST = "127.0.0.1"
+COMMANDS = ('status', 'start', 'stop', 'skip', 'volume')
+COMMAND_TIMEOUT = 5.0  # 초 - GUI 스레드가 이 시간 안에 처리하지 못하면 503
+MAX_BODY_BYTES = 64 * 1024
+MAX_HEADERS = 100
+EVENT_QUEUE_SIZE = 256  # 이벤트를 이만큼 못 받아 간 구독자는 연결을 끊음
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found",
+               405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 415: "Unsupported Media Type",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+
+# WebSocket 프레임 종류
+OP_TEXT = 0x1
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# 업그레이드 후 오류를 알리는 WebSocket 종료 코드 (HTTP 상태 -> 종료 코드)
+CLOSE_CODES = {400: 1002, 413: 1009, 503: 1013}
+CLOSE_INTERNAL_ERROR = 1011
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_address(value):
+    """
+    "8765" 또는 "HOST:8765" -> (host, port)
+    """
+    host, _, port = value.rpartition(":")
+    host = host.strip("[]") or DEFAULT_HOST
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError(f"잘못된 API 주소: {value} ([HOST:]PORT)")
+    if not 0 <= port <= 65535:
+        raise ValueError(f"잘못된 포트 번호: {port}")
+    return host, port
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def is_wildcard(host):
+    try:
+        return ipaddress.ip_address(host).is_unspecified
+    except ValueError:
+        return False
+
+
+def load_token(path=TOKEN_FILE):
+    """
+    토큰 파일의 토큰을 읽고, 없으면 새로 만들어 저장 (본인만 읽을 수 있게)
+    """
+    try:
+        with open(path, encoding="utf-8") as fp:
+            token = fp.read().strip()
+        if token:
+            return token
+    except FileNotFoundError:
+        pass
+    token = secrets.token_urlsafe(24)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fp:
+        fp.write(token + "\n")
+    logger.info(f"원격 제어 API 토큰을 새로 만들었습니다: {path}")
+    return token
+
+
+def websocket_accept(key):
+    return base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+
+
+def encode_frame(opcode, payload):
+    # 서버가 보내는 프레임은 마스크 없음, 조각 나누지 않음
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_frame(reader):
+    """
+    WebSocket 프레임 하나 읽기 -> (opcode, payload). 명령은 작으므로 조각난 메시지는 지원하지 않음
+    """
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_BODY_BYTES:
+        raise ApiError(413, "메시지가 너무 큽니다.")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask and length:
+        key = (mask * (length // 4 + 1))[:length]
+        payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+    return opcode, payload
+
+
+class RemoteControlServer(QObject):
+    """
+    target(KioskController/ScreenLauncher)의 execute(message)와 event_occurred 시그널을 HTTP/WebSocket으로 제공한다.
+
+    GUI 스레드에서 만들고 start()/stop()을 호출한다. 소켓 처리는 모두 API 스레드의 asyncio 루프에서 한다.
+    """
+    command_received = pyqtSignal(object)  # (메시지, Future, 보낸 시각) - API 스레드에서 보내고 GUI 스레드에서 처리
+
+    def __init__(self, target, host=DEFAULT_HOST, port=0, token=None, parent=None):
+        super().__init__(parent)
+        token = token or os.environ.get(TOKEN_ENV) or None
+        if not is_loopback(host) and not token:
+            raise ValueError(f"{host}에서 원격 제어 API를 열려면 토큰이 필요합니다. (--api-token 또는 {TOKEN_ENV})")
+        if not token:
+            token = load_token()
+
+        self.target = target
+        self.host = host
+        self.port = port
+        self.token = token
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.error = None
+        self.started = threading.Event()
+        self.subscribers = set()  # 이벤트 구독자별 asyncio.Queue (API 스레드에서만 사용)
+        self.dispatch_ms = deque(maxlen=1000)  # 명령이 GUI 스레드에서 실행되기까지 걸린 시간 (최근 1000개)
+
+        self.command_received.connect(self.on_command_received, Qt.QueuedConnection)
+        target.event_occurred.connect(self.publish)
+
+    @property
+    def url(self):
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"http://{host}:{self.port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run_loop, name="RemoteAPI", daemon=True)
+        self.thread.start()
+        self.started.wait()
+        if self.error is not None:
+            raise self.error
+        logger.info(f"원격 제어 API 시작: {self.url}")
+
+    def stop(self):
+        if self.thread is None:
+            return
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(COMMAND_TIMEOUT)
+        self.thread = None
+        logger.info("원격 제어 API 종료")
+
+    def run_loop(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self.server = loop.run_until_complete(asyncio.start_server(self.handle_client, self.host, self.port))
+        except OSError as e:
+            self.error = OSError(f"원격 제어 API를 열 수 없습니다 ({self.host}:{self.port}): {e.strerror or e}")
+            loop.close()
+            self.started.set()
+            return
+
+        self.port = self.server.sockets[0].getsockname()[1]  # 포트 0이면 실제로 받은 포트
+        self.loop = loop
+        self.started.set()
+        try:
+            loop.run_forever()
+        finally:
+            # 남은 연결을 닫고 루프 정리
+            self.server.close()
+            tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(self.server.wait_closed())
+            loop.close()
+
+    # --- GUI 스레드 ---
+
+    def on_command_received(self, request):
+        message, future, sent = request
+        self.dispatch_ms.append((time.perf_counter() - sent) * 1000)
+        if not future.set_running_or_notify_cancel():
+            return  # 이미 시간 초과로 취소됨
+        try:
+            future.set_result(self.target.execute(message))
+        except (KeyError, TypeError, ValueError) as e:
+            future.set_exception(ApiError(400, str(e)))
+        except RuntimeError as e:
+            future.set_exception(ApiError(409, str(e)))
+        except Exception as e:
+            logger.exception(f"원격 명령 처리 오류: {message}")
+            future.set_exception(ApiError(500, f"명령 처리 오류: {e}"))
+
+    def publish(self, event):
+        loop = self.loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self.broadcast, event)
+
+    # --- API 스레드 ---
+
+    def broadcast(self, event):
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 너무 느린 구독자는 끊음 (GUI 쪽 이벤트가 밀리지 않도록)
+                logger.warning("이벤트를 받아 가지 않는 구독자 연결을 끊습니다.")
+                self.subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def call(self, message):
+        """
+        GUI 스레드에서 target.execute(message)를 실행하고 결과를 기다림
+        """
+        if message.get('command') not in COMMANDS:
+            raise ApiError(404, f"알 수 없는 명령: {message.get('command')}")
+        future = Future()
+        self.command_received.emit((message, future, time.perf_counter()))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise ApiError(503, "화면이 응답하지 않습니다.")
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, path, query, headers, body = request
+                self.check_origin(headers)
+                self.authorize(headers)
+                if path == "/events":
+                    await self.serve_events(reader, writer, headers)
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.serve_command(writer, method, path, query, headers, body, keep_alive)
+                if not keep_alive:
+                    break
+        except ApiError as e:
+            self.write_response(writer, e.status, {'ok': False, 'error': str(e)}, keep_alive=False)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except asyncio.CancelledError:
+            pass  # 서버 종료
+        finally:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split()
+        except ValueError:
+            raise ApiError(400, "잘못된 요청입니다.")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise ApiError(400, "헤더가 너무 많습니다.")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise ApiError(400, "잘못된 Content-Length입니다.")
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "요청 본문이 너무 큽니다.")
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        return method.upper(), url.path.rstrip("/") or "/", dict(parse_qsl(url.query)), headers, body
+
+    def check_origin(self, headers):
+        # 브라우저가 보낸 요청(Origin 있음)과 다른 이름으로 접속한 요청(DNS rebinding)은 거부
+        if "origin" in headers:
+            raise ApiError(403, "웹 페이지에서 보낸 요청은 받지 않습니다.")
+        if is_wildcard(self.host):
+            return  # 모든 주소에서 받는 경우 Host로 구분할 수 없음 (토큰으로만 확인)
+        url = urlsplit(f"//{headers.get('host', '')}")
+        try:
+            name, port = url.hostname, url.port or 80
+        except ValueError:
+            name, port = None, None
+        names = {self.host.lower(), "localhost"} if is_loopback(self.host) else {self.host.lower()}
+        if name not in names or port != self.port:
+            raise ApiError(403, f"잘못된 Host 헤더: {headers.get('host', '')}")
+
+    def authorize(self, headers):
+        scheme, _, credential = headers.get("authorization", "").partition(" ")
+        supplied = credential.strip() if scheme.lower() == "bearer" else ""
+        if not hmac.compare_digest(supplied.encode(), self.token.encode()):
+            raise ApiError(401, "토큰이 올바르지 않습니다.")
+
+    async def serve_command(self, writer, method, path, query, headers, body, keep_alive):
+        command = path.lstrip("/")
+        if command not in COMMANDS:
+            raise ApiError(404, f"없는 경로: {path}")
+        if command != 'status' and method != "POST":
+            raise ApiError(405, f"{path}는 POST로 요청해야 합니다.")
+        if method == "POST" and headers.get("content-type", "").partition(";")[0].strip().lower() != "application/json":
+            raise ApiError(415, "POST 요청은 Content-Type: application/json이어야 합니다.")
+
+        message = dict(query)
+        if body.strip():
+            try:
+                data = json.loads(body)
+            except ValueError:
+                raise ApiError(400, "본문이 올바른 JSON이 아닙니다.")
+            if not isinstance(data, dict):
+                raise ApiError(400, "본문은 JSON 객체여야 합니다.")
+            message.update(data)
+        message['command'] = command
+
+        try:
+            result = await self.call(message)
+        except ApiError as e:
+            self.write_response(writer, e.status, {'ok': False, 'error': str(e)}, keep_alive)
+        else:
+            self.write_response(writer, 200, {'ok': True, 'result': result}, keep_alive)
+        await writer.drain()
+
+    def write_response(self, writer, status, payload, keep_alive=True):
+        if writer.is_closing():
+            return
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+
+    async def serve_events(self, reader, writer, headers):
+        websocket = headers.get("upgrade", "").lower() == "websocket"
+        if websocket:
+            key = headers.get("sec-websocket-key")
+            if not key:
+                raise ApiError(400, "Sec-WebSocket-Key 헤더가 없습니다.")
+            writer.write(
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n".encode("latin-1")
+            )
+        else:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+                b"Cache-Control: no-cache\r\nConnection: close\r\n\r\n"
+            )
+
+        def send(data):
+            text = json.dumps(data, ensure_ascii=False)
+            writer.write(encode_frame(OP_TEXT, text.encode("utf-8")) if websocket else f"data: {text}\n\n".encode("utf-8"))
+
+        queue = asyncio.Queue(EVENT_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        # WebSocket은 받은 명령을 처리하고, SSE는 클라이언트가 연결을 닫는지만 확인
+        receiver = asyncio.ensure_future(self.receive_commands(reader, writer, send) if websocket else reader.read())
+        error = None
+        try:
+            # 연결 직후 현재 상태를 먼저 보냄
+            send({'event': 'status', 'result': await self.call({'command': 'status'})})
+            await writer.drain()
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    break  # 클라이언트가 연결을 닫음
+                event = getter.result()
+                if event is None:
+                    break  # 느린 구독자
+                send(event)
+                await writer.drain()
+        except ApiError as e:
+            error = e
+        finally:
+            self.subscribers.discard(queue)
+            if receiver.done():
+                if not receiver.cancelled() and isinstance(receiver.exception(), ApiError):
+                    error = error or receiver.exception()  # 너무 큰 메시지 등 (연결 끊김은 그냥 닫음)
+            else:
+                receiver.cancel()
+        if error is not None:
+            self.close_stream(writer, websocket, error)
+
+    def close_stream(self, writer, websocket, error):
+        # 이미 101/200 응답을 보냈으므로 HTTP 응답 대신 종료 프레임(WebSocket) 또는 오류 이벤트(SSE)로 알림
+        if writer.is_closing():
+            return
+        if websocket:
+            reason = str(error).encode("utf-8")[:120].decode("utf-8", "ignore").encode("utf-8")  # 종료 사유는 123바이트까지
+            code = CLOSE_CODES.get(error.status, CLOSE_INTERNAL_ERROR)
+            writer.write(encode_frame(OP_CLOSE, struct.pack("!H", code) + reason))
+        else:
+            writer.write(f"data: {json.dumps({'event': 'error', 'error': str(error)}, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+    async def receive_commands(self, reader, writer, send):
+        # WebSocket으로 받은 명령을 실행하고 같은 연결로 결과를 보냄
+        while True:
+            opcode, payload = await read_frame(reader)
+            if opcode == OP_CLOSE:
+                writer.write(encode_frame(OP_CLOSE, payload[:2]))
+                return
+            if opcode == OP_PING:
+                writer.write(encode_frame(OP_PONG, payload))
+                continue
+            if opcode != OP_TEXT:
+                continue
+
+            try:
+                message = json.loads(payload)
+                if not isinstance(message, dict):
+                    raise ValueError
+            except ValueError:
+                send({'reply': None, 'ok': False, 'error': "명령은 JSON 객체여야 합니다."})
+                continue
+            try:
+                result = await self.call(message)
+            except ApiError as e:
+                send({'reply': message.get('command'), 'ok': False, 'error': str(e)})
+            else:
+                send({'reply': message.get('command'), 'ok': True, 'result': result})
+            await writer.drain()
+
+
+def serve(target, address, token=None):
+    """
+    --api [HOST:]PORT 옵션 처리: 서버를 시작하고 앱이 끝날 때 정리. 열 수 없으면 ValueError/OSError
+    """
+    host, port = parse_address(address)
+    server = RemoteControlServer(target, host, port, token, parent=target)
+    server.start()
+    QCoreApplication.instance().aboutToQuit.connect(server.stop)
+    return server
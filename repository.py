@@ -0,0 +1,467 @@
+import logging
+from sqlalchemy import or_, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import Video, Page, PageVideo, Schedule, SEARCH_TABLE
+
+logger = logging.getLogger("DreamBodyVideo.Repository")
+
+# 데이터 접근 함수 모음
+# - 모든 함수는 세션을 인자로 받고, ORM 객체 대신 dict 레코드를 반환한다
+#   (세션이 닫힌 뒤나 다른 스레드에서도 안전하게 사용할 수 있도록)
+# - 커밋은 호출하는 쪽(DataService 등)에서 처리한다
+
+VIDEO_FIELDS = ('title', 'url', 'exercise_type', 'difficulty', 'duration')
+
+
+def video_to_record(video):
+    return {
+        'id': video.id,
+        'title': video.title,
+        'url': video.url,
+        'exercise_type': video.exercise_type,
+        'difficulty': video.difficulty,
+        'duration': video.duration,
+        'health_status': video.health_status,
+        'health_checked_at': video.health_checked_at
+    }
+
+
+def list_videos(session):
+    return [video_to_record(video) for video in session.query(Video).order_by(Video.id).all()]
+
+
+def list_video_choices(session):
+    # 선택 목록용 (ID, 제목)만 가져옴
+    return [{'id': video_id, 'title': title} for video_id, title in session.query(Video.id, Video.title).order_by(Video.id)]
+
+
+def get_video(session, video_id):
+    video = session.query(Video).filter_by(id=video_id).first()
+    return video_to_record(video) if video else None
+
+
+def add_video(session, data):
+    video = Video(**{field: data.get(field) for field in VIDEO_FIELDS})
+    session.add(video)
+    session.flush()
+    logger.info(f"영상 추가: ID={video.id}, 제목={video.title}")
+    return video_to_record(video)
+
+
+def update_video(session, video_id, data):
+    video = session.query(Video).filter_by(id=video_id).first()
+    if not video:
+        return None
+
+    # URL이 바뀌면 이전 링크 검사 결과는 의미가 없음
+    if 'url' in data and data['url'] != video.url:
+        video.health_status = None
+        video.health_checked_at = None
+    
+    for field in VIDEO_FIELDS:
+        if field in data:
+            setattr(video, field, data[field])
+    session.flush()
+    logger.info(f"영상 수정: ID={video.id}, 제목={video.title}")
+    return video_to_record(video)
+
+
+def delete_video(session, video_id):
+    # 먼저 페이지 할당 삭제
+    session.query(PageVideo).filter_by(video_id=video_id).delete()
+
+    # 영상 삭제
+    deleted = session.query(Video).filter_by(id=video_id).delete()
+    logger.info(f"영상 삭제: ID={video_id}")
+    return video_id if deleted else None
+
+
+def _chunks(values, size=500):
+    # SQLite 바인드 변수 수 제한을 넘지 않도록 IN 목록을 나눔
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def delete_videos(session, video_ids):
+    """
+    여러 영상을 한 번에 삭제 (페이지 할당 포함).
+    반환값: {'deleted': [삭제된 영상 ID], 'pages': [할당이 지워진 페이지 ID]}
+    """
+    deleted, pages = [], set()
+    for chunk in _chunks(set(video_ids)):
+        deleted.extend(video_id for (video_id,) in session.query(Video.id).filter(Video.id.in_(chunk)))
+        pages.update(page_id for (page_id,) in
+                     session.query(PageVideo.page_id).filter(PageVideo.video_id.in_(chunk)).distinct())
+        
+        session.query(PageVideo).filter(PageVideo.video_id.in_(chunk)).delete(synchronize_session=False)
+        session.query(Video).filter(Video.id.in_(chunk)).delete(synchronize_session=False)
+    
+    logger.info(f"영상 일괄 삭제: {len(deleted)}개, 할당이 변경된 페이지 {sorted(pages)}")
+    return {'deleted': sorted(deleted), 'pages': sorted(pages)}
+
+
+# 여러 영상에 한 번에 적용할 수 있는 필드
+BULK_FIELDS = ('exercise_type', 'difficulty', 'duration')
+
+
+def bulk_update_videos(session, video_ids, values):
+    """
+    여러 영상의 운동 타입/난이도/길이를 한 번에 변경하고 변경된 레코드를 반환
+    """
+    unknown = set(values) - set(BULK_FIELDS)
+    if unknown:
+        raise KeyError(f"일괄 변경할 수 없는 필드입니다: {sorted(unknown)}")
+    if not values:
+        return []
+    
+    records = []
+    for chunk in _chunks(set(video_ids)):
+        session.query(Video).filter(Video.id.in_(chunk)).update(values, synchronize_session=False)
+        records.extend(video_to_record(video) for video in
+                       session.query(Video).filter(Video.id.in_(chunk)).populate_existing())
+    
+    logger.info(f"영상 일괄 수정: {len(records)}개, {values}")
+    return sorted(records, key=lambda record: record['id'])
+
+
+def list_pages(session):
+    return [{'id': page.id, 'name': page.name} for page in session.query(Page).order_by(Page.id).all()]
+
+
+def add_page(session, name):
+    page = Page(name=name)
+    session.add(page)
+    session.flush()
+    logger.info(f"페이지 추가: ID={page.id}, 이름={page.name}")
+    return {'id': page.id, 'name': page.name}
+
+
+def rename_page(session, page_id, name):
+    page = session.query(Page).filter_by(id=page_id).first()
+    if not page:
+        return None
+    page.name = name
+    return {'id': page.id, 'name': page.name}
+
+
+def delete_page(session, page_id):
+    # 먼저 영상 할당과 편성 삭제
+    session.query(PageVideo).filter_by(page_id=page_id).delete()
+    session.query(Schedule).filter_by(page_id=page_id).delete()
+    deleted = session.query(Page).filter_by(id=page_id).delete()
+    logger.info(f"페이지 삭제: ID={page_id}")
+    return page_id if deleted else None
+
+
+def display_number_or_position(display_number, position):
+    # 표시 번호가 없으면(NULL) 재생 목록에서의 위치(1부터, 관리자 화면의 칸 번호) 사용
+    # order는 DB에 따라 0부터 또는 1부터 시작하므로 기준으로 쓰지 않음
+    return display_number if display_number is not None else position
+
+
+def get_page_assignments(session, page_id):
+    page_videos = session.query(PageVideo).filter_by(page_id=page_id).order_by(PageVideo.order).all()
+    return [
+        {
+            'order': pv.order,
+            'video_id': pv.video_id,
+            'display_number': display_number_or_position(pv.display_number, position)
+        }
+        for position, pv in enumerate(page_videos, 1)
+    ]
+
+
+def load_page_playlist(session, page_id):
+    """
+    페이지 재생 목록 (재생 순서대로, 영상 정보 포함) - 한 번의 JOIN 쿼리
+    """
+    rows = (
+        session.query(PageVideo, Video)
+        .join(Video, Video.id == PageVideo.video_id)
+        .filter(PageVideo.page_id == page_id)
+        .order_by(PageVideo.order)
+        .all()
+    )
+    return [
+        {
+            'order': pv.order,
+            'video_id': video.id,
+            'title': video.title,
+            'url': video.url,
+            'exercise_type': video.exercise_type,
+            'difficulty': video.difficulty,
+            'duration': video.duration,  # 분 단위
+            'display_number': display_number_or_position(pv.display_number, position)
+        }
+        for position, (pv, video) in enumerate(rows, 1)
+    ]
+
+
+def count_page_videos(session, page_id):
+    return session.query(PageVideo).filter_by(page_id=page_id).count()
+
+
+def list_playable_page_ids(session):
+    """
+    영상이 하나 이상 할당된 페이지 ID 목록 (ID 순)
+    """
+    rows = session.query(PageVideo.page_id).distinct().order_by(PageVideo.page_id).all()
+    return [page_id for page_id, in rows]
+
+
+def page_run_status(session, page_id, broken_statuses):
+    """
+    페이지 실행 전 확인용: 할당된 영상 수와 링크 검사에서 재생 불가로 표시된 영상 목록
+    """
+    rows = (
+        session.query(PageVideo.order, Video.id, Video.title, Video.health_status)
+        .join(Video, Video.id == PageVideo.video_id)
+        .filter(PageVideo.page_id == page_id)
+        .order_by(PageVideo.order)
+        .all()
+    )
+    return {
+        'count': len(rows),
+        'broken': [
+            {'order': order, 'video_id': video_id, 'title': title, 'health_status': status}
+            for order, video_id, title, status in rows if status in broken_statuses
+        ]
+    }
+
+
+def build_page_assignments(stored, slots):
+    """
+    칸 목록 [(video_id, display_number), ...]을 할당 목록으로 변환.
+    저장된 순서 값을 칸 위치대로 재사용해 바뀐 칸만 저장되도록 한다.
+    """
+    stored_orders = [a['order'] for a in stored]
+    next_order = max(stored_orders) + 1 if stored_orders else 1
+    
+    assignments = []
+    for position, (video_id, display_number) in enumerate(slots):
+        if position < len(stored_orders):
+            order = stored_orders[position]
+        else:
+            order = next_order
+            next_order += 1
+        assignments.append({'order': order, 'video_id': video_id, 'display_number': display_number})
+    return assignments
+
+
+def is_untouched_slots(assignments):
+    """
+    새 페이지에 기본으로 보여주는 빈 칸(영상 없음, 기본 표시 번호)을 그대로 두었는지 확인
+    """
+    return all(a['video_id'] is None and a['display_number'] == position
+               for position, a in enumerate(assignments, 1))
+
+
+def diff_page_assignments(stored, assignments):
+    """
+    저장된 할당과 편집한 할당을 재생 순서(order) 기준으로 비교한다.
+    반환값: (추가할 행, 변경할 행, 삭제할 순서 목록, 변경 없는 행 수)
+    
+    표시 번호가 없는(NULL) 행은 저장 후의 위치로 표시되므로 양쪽 모두 그 값으로 바꿔 비교한다.
+    """
+    stored_by_order = {a['order']: a for a in stored}
+    positions = {order: position for position, order in enumerate(sorted({a['order'] for a in assignments}), 1)}
+    edited_orders = set()
+    inserts, updates = [], []
+    
+    for assignment in assignments:
+        order = assignment['order']
+        if order in edited_orders:
+            raise ValueError(f"재생 순서가 중복되었습니다: {order}")
+        edited_orders.add(order)
+        
+        if order not in stored_by_order:
+            inserts.append(assignment)
+            continue
+        current = stored_by_order[order]
+        position = positions[order]
+        stored_values = (current['video_id'], display_number_or_position(current['display_number'], position))
+        edited_values = (assignment['video_id'], display_number_or_position(assignment['display_number'], position))
+        if stored_values != edited_values:
+            updates.append(assignment)
+    
+    deletes = sorted(set(stored_by_order) - edited_orders)
+    unchanged = len(assignments) - len(inserts) - len(updates)
+    return inserts, updates, deletes, unchanged
+
+
+def save_page_assignments(session, page_id, assignments):
+    """
+    assignments: [{'order': 1, 'video_id': 3, 'display_number': 1}, ...]
+    
+    바뀐 칸만 반영한다 (변경 없는 행은 그대로 두어 행 ID가 유지됨).
+    반환값: {'inserted': n, 'updated': n, 'deleted': n, 'unchanged': n}
+    """
+    stored = session.query(PageVideo.order, PageVideo.video_id, PageVideo.display_number).filter_by(page_id=page_id)
+    stored = [{'order': order, 'video_id': video_id, 'display_number': display_number}
+              for order, video_id, display_number in stored]
+    inserts, updates, deletes, unchanged = diff_page_assignments(stored, assignments)
+    
+    if deletes:
+        session.query(PageVideo).filter(
+            PageVideo.page_id == page_id, PageVideo.order.in_(deletes)
+        ).delete(synchronize_session=False)
+    
+    changed = inserts + updates
+    if changed:
+        # (page_id, order) 고유 인덱스 기준 upsert
+        statement = sqlite_insert(PageVideo.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=['page_id', 'order'],
+            set_={
+                'video_id': statement.excluded.video_id,
+                'display_number': statement.excluded.display_number
+            }
+        )
+        session.execute(statement, [
+            {
+                'page_id': page_id,
+                'video_id': assignment['video_id'],
+                'order': assignment['order'],
+                'display_number': assignment['display_number']
+            }
+            for assignment in changed
+        ])
+    
+    stats = {'inserted': len(inserts), 'updated': len(updates), 'deleted': len(deletes), 'unchanged': unchanged}
+    logger.info(
+        f"페이지 {page_id} 할당 저장: 추가 {stats['inserted']}, 수정 {stats['updated']}, "
+        f"삭제 {stats['deleted']}, 유지 {stats['unchanged']}"
+    )
+    return stats
+
+
+def apply_page_changes(session, changes):
+    """
+    여러 페이지의 할당 변경을 한 트랜잭션으로 적용한다.
+    changes: {page_id: [assignment, ...]}
+    
+    하나라도 실패하면 예외를 그대로 올려 호출하는 쪽에서 전체를 롤백하게 한다.
+    """
+    page_ids = set(changes)
+    video_ids = {a['video_id'] for assignments in changes.values() for a in assignments}
+    
+    missing_pages = page_ids - {page_id for (page_id,) in session.query(Page.id).filter(Page.id.in_(page_ids))}
+    if missing_pages:
+        raise ValueError(f"존재하지 않는 페이지입니다: {sorted(missing_pages)}")
+    
+    missing_videos = video_ids - {video_id for (video_id,) in session.query(Video.id).filter(Video.id.in_(video_ids))}
+    if missing_videos:
+        raise ValueError(f"존재하지 않는 영상입니다: {sorted(missing_videos, key=str)}")
+    
+    return {page_id: save_page_assignments(session, page_id, assignments)
+            for page_id, assignments in changes.items()}
+
+
+def schedule_to_record(schedule):
+    return {
+        'id': schedule.id,
+        'weekday': schedule.weekday,
+        'start_minute': schedule.start_minute,
+        'end_minute': schedule.end_minute,
+        'page_id': schedule.page_id,
+        'priority': schedule.priority,
+    }
+
+
+def list_schedules(session):
+    """
+    편성 목록 (요일, 시작 시각 순) - 페이지 이름 포함
+    """
+    rows = (
+        session.query(Schedule, Page.name)
+        .join(Page, Page.id == Schedule.page_id)
+        .order_by(Schedule.weekday, Schedule.start_minute, Schedule.priority.desc(), Schedule.id)
+        .all()
+    )
+    return [{**schedule_to_record(schedule), 'page_name': name} for schedule, name in rows]
+
+
+def list_schedule_entries(session):
+    from schedule import ScheduleEntry
+    return [ScheduleEntry(**schedule_to_record(schedule)) for schedule in session.query(Schedule).all()]
+
+
+def add_schedules(session, weekdays, start_minute, end_minute, page_id, priority=0):
+    """
+    여러 요일에 같은 시간대 편성을 추가하고 추가된 레코드를 반환
+    """
+    from schedule import validate_entry
+    
+    if not session.query(Page.id).filter_by(id=page_id).first():
+        raise ValueError(f"존재하지 않는 페이지입니다: {page_id}")
+    for weekday in weekdays:
+        validate_entry(weekday, start_minute, end_minute)
+    
+    schedules = [
+        Schedule(weekday=weekday, start_minute=start_minute, end_minute=end_minute, page_id=page_id, priority=priority)
+        for weekday in weekdays
+    ]
+    session.add_all(schedules)
+    session.flush()
+    logger.info(f"편성 추가: 페이지 {page_id}, 요일 {list(weekdays)}, {start_minute}-{end_minute}분")
+    return [schedule_to_record(schedule) for schedule in schedules]
+
+
+def delete_schedules(session, schedule_ids):
+    deleted = session.query(Schedule).filter(Schedule.id.in_(schedule_ids)).delete(synchronize_session=False)
+    logger.info(f"편성 {deleted}개 삭제")
+    return deleted
+
+
+def count_videos(session):
+    return session.query(Video).count()
+
+
+def fetch_videos_page(session, after_id=None, limit=200):
+    """
+    ID 순으로 after_id 다음의 영상을 limit개 가져온다 (키셋 페이지네이션, OFFSET 미사용)
+    """
+    query = session.query(Video).order_by(Video.id)
+    if after_id is not None:
+        query = query.filter(Video.id > after_id)
+    return [video_to_record(video) for video in query.limit(limit).all()]
+
+
+def _search_record(video_id, title, exercise_type, difficulty):
+    return {'id': video_id, 'title': title, 'exercise_type': exercise_type, 'difficulty': difficulty}
+
+
+def search_videos(session, keyword, limit=50):
+    """
+    제목/운동 타입/난이도로 영상을 검색한다.
+    3글자 이상은 FTS5 trigram 인덱스, 그보다 짧으면 ID 또는 LIKE 검색을 사용한다.
+    """
+    keyword = (keyword or "").strip()
+    if not keyword:
+        return []
+
+    columns = (Video.id, Video.title, Video.exercise_type, Video.difficulty)
+
+    if len(keyword) >= 3:
+        # 전체 문자열을 하나의 구문으로 검색 (따옴표 이스케이프)
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        try:
+            rows = session.execute(text(
+                f"SELECT v.id, v.title, v.exercise_type, v.difficulty "
+                f"FROM {SEARCH_TABLE} s JOIN videos v ON v.id = s.rowid "
+                f"WHERE {SEARCH_TABLE} MATCH :phrase ORDER BY s.rank LIMIT :limit"
+            ), {'phrase': phrase, 'limit': limit}).fetchall()
+            return [_search_record(*row) for row in rows]
+        except OperationalError as e:
+            # 검색 인덱스가 없는 DB는 LIKE 검색으로 대체 (실패한 SELECT는 트랜잭션에 영향이 없으므로 롤백하지 않음)
+            logger.warning(f"전문 검색 실패, LIKE 검색 사용: {e}")
+
+    query = session.query(*columns)
+    pattern = f"%{keyword}%"
+    conditions = [Video.title.like(pattern), Video.exercise_type.like(pattern), Video.difficulty.like(pattern)]
+    if keyword.isdigit():
+        conditions.insert(0, Video.id == int(keyword))
+    rows = query.filter(or_(*conditions)).order_by(Video.id).limit(limit).all()
+    return [_search_record(*row) for row in rows]
@@ -0,0 +1,234 @@
+import os
+import bisect
+import heapq
+import logging
+from collections import namedtuple
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger("DreamBodyVideo.Schedule")
+
+# 시간대별 페이지 편성표 (Qt 없이 사용 가능 - 명령줄 도구/키오스크 공용)
+# - 편성은 (요일, 시작~종료 현지 시각, 페이지, 우선순위). 종료가 시작보다 이르면 다음 날 종료
+# - 주간 편성을 겹치지 않는 구간으로 미리 정리해 두고 "지금 재생할 편성"을 이진 탐색으로 찾음 (O(log n))
+# - 시각은 현지 벽시계 기준이므로 서머타임 전환 후에도 같은 시각에 시작하며,
+#   전환으로 건너뛴 시각에 시작하는 편성은 전환 직후에 시작한다
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]  # datetime.weekday() 순서
+WEEKDAY_PRESETS = {"매일": tuple(range(7)), "평일": tuple(range(5)), "주말": (5, 6)}
+
+# 편성표 시간대 (IANA 이름, 예: Asia/Seoul) - 없으면 TZ, /etc/localtime 순서로 찾음
+TIMEZONE_ENV = "DREAMBODY_TIMEZONE"
+
+ScheduleEntry = namedtuple("ScheduleEntry", ["id", "weekday", "start_minute", "end_minute", "page_id", "priority"])
+
+
+def parse_time(text):
+    """
+    "HH:MM" -> 자정부터 분
+    """
+    hours, sep, minutes = text.strip().partition(":")
+    try:
+        hours, minutes = int(hours), int(minutes)
+    except ValueError:
+        raise ValueError(f"시각 형식 오류: {text!r} (HH:MM)")
+    if not sep or not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"시각 형식 오류: {text!r} (HH:MM)")
+    return hours * 60 + minutes
+
+
+def parse_weekdays(text):
+    """
+    "월,수,금" / "매일" / "평일" / "주말" / "0,1" -> 요일 번호 목록
+    """
+    text = text.strip()
+    if text in WEEKDAY_PRESETS:
+        return list(WEEKDAY_PRESETS[text])
+
+    weekdays = []
+    for part in text.replace(" ", "").split(","):
+        if part in WEEKDAY_NAMES:
+            weekdays.append(WEEKDAY_NAMES.index(part))
+        elif part.isdigit() and int(part) < 7:
+            weekdays.append(int(part))
+        else:
+            raise ValueError(f"요일 형식 오류: {part!r} (월-일, 0-6, 매일, 평일, 주말)")
+    return sorted(set(weekdays))
+
+
+def format_minute(minute):
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def describe(entry):
+    return f"{WEEKDAY_NAMES[entry.weekday]} {format_minute(entry.start_minute)}-{format_minute(entry.end_minute)}"
+
+
+def validate_entry(weekday, start_minute, end_minute):
+    if not 0 <= weekday < 7:
+        raise ValueError(f"요일 값 오류: {weekday} (0=월 ... 6=일)")
+    for minute in (start_minute, end_minute):
+        if not 0 <= minute < MINUTES_PER_DAY:
+            raise ValueError(f"시각 값 오류: {minute} (0-{MINUTES_PER_DAY - 1}분)")
+    if start_minute == end_minute:
+        raise ValueError("시작 시각과 종료 시각이 같습니다.")
+
+
+def entry_intervals(entry):
+    """
+    편성의 주간 구간 [(시작, 종료), ...] (주 시작 월요일 00:00부터 분). 일요일 밤에서 월요일로 넘어가면 둘로 나눔
+    """
+    start = entry.weekday * MINUTES_PER_DAY + entry.start_minute
+    length = (entry.end_minute - entry.start_minute) % MINUTES_PER_DAY
+    end = start + length
+    if end <= MINUTES_PER_WEEK:
+        return [(start, end)]
+    return [(start, MINUTES_PER_WEEK), (0, end - MINUTES_PER_WEEK)]
+
+
+class ScheduleIndex:
+    """
+    주간 편성표의 구간 인덱스.
+
+    겹치는 편성은 우선순위(같으면 나중에 추가된 편성)로 미리 정리해 경계 시각과 그 구간의 편성만 남긴다.
+    조회는 경계 목록의 이진 탐색 한 번이다.
+    """
+
+    def __init__(self, entries):
+        starts, ends = {}, {}
+        for entry in entries:
+            for start, end in entry_intervals(entry):
+                starts.setdefault(start, []).append(entry)
+                ends.setdefault(end, []).append(entry)
+
+        # 경계 시각을 차례로 지나가며 그 시점에 이기는 편성을 기록 (지나간 편성은 힙에서 늦게 제거)
+        self.boundaries = []
+        self.winners = []
+        active = {}  # 편성 id -> 진행 중인 구간 수
+        heap = []
+        for minute in sorted(set(starts) | set(ends) | {0}):
+            if minute >= MINUTES_PER_WEEK:
+                break
+            for entry in ends.get(minute, []):
+                active[entry.id] -= 1
+            for entry in starts.get(minute, []):
+                active[entry.id] = active.get(entry.id, 0) + 1
+                heapq.heappush(heap, (-entry.priority, -entry.id, entry))
+            while heap and not active.get(heap[0][2].id):
+                heapq.heappop(heap)
+
+            winner = heap[0][2] if heap else None
+            if self.winners and self.winners[-1] == winner:
+                continue
+            self.boundaries.append(minute)
+            self.winners.append(winner)
+
+    def lookup(self, week_minute):
+        """
+        해당 시각(주 시작부터 분)의 편성, 없으면 None
+        """
+        return self.winners[bisect.bisect_right(self.boundaries, week_minute % MINUTES_PER_WEEK) - 1]
+
+    def next_change(self, week_minute):
+        """
+        week_minute 다음으로 편성이 바뀌는 시각과 그때의 편성 (다음 주면 MINUTES_PER_WEEK 이상). 바뀌지 않으면 None
+        """
+        week_minute %= MINUTES_PER_WEEK
+        current = self.lookup(week_minute)
+        count = len(self.boundaries)
+        first = bisect.bisect_right(self.boundaries, week_minute)
+        for position in range(first, first + count):
+            index = position % count
+            if self.winners[index] != current:
+                return self.boundaries[index] + (position // count) * MINUTES_PER_WEEK, self.winners[index]
+        return None
+
+
+def local_zone(name=None):
+    """
+    편성표 시간대 (서머타임 규칙이 있는 IANA 시간대). 찾지 못하면 UTC
+    """
+    candidates = [name, os.environ.get(TIMEZONE_ENV), (os.environ.get("TZ") or "").lstrip(":")]
+    try:
+        path = os.path.realpath("/etc/localtime")
+        if "zoneinfo/" in path:
+            candidates.append(path.split("zoneinfo/", 1)[1])
+    except OSError:
+        pass
+
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return ZoneInfo(candidate)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"알 수 없는 시간대: {candidate}")
+    logger.warning("시간대를 찾지 못해 UTC를 사용합니다.")
+    return timezone.utc
+
+
+class Schedule:
+    """
+    편성표 조회. 시각은 시간대가 있는 datetime (없으면 현재 시각)
+    """
+
+    def __init__(self, entries, zone=None):
+        self.entries = list(entries)
+        self.index = ScheduleIndex(self.entries)
+        self.zone = zone or local_zone()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def week_minute(self, now):
+        local = now.astimezone(self.zone)
+        return local.weekday() * MINUTES_PER_DAY + local.hour * 60 + local.minute
+
+    def at(self, now=None):
+        """
+        지금 재생할 편성 (없으면 None)
+        """
+        return self.index.lookup(self.week_minute(now or datetime.now(timezone.utc)))
+
+    def next_change(self, now=None):
+        """
+        (다음 편성 변경 시각, 그때의 편성) - 변경이 없으면 None
+        """
+        now = now or datetime.now(timezone.utc)
+        change = self.index.next_change(self.week_minute(now))
+        if change is None:
+            return None
+
+        week_minute, entry = change
+        local = now.astimezone(self.zone)
+        week_start = local.date() - timedelta(days=local.weekday())
+        return self.instant(week_start, week_minute, now), entry
+
+    def instant(self, week_start, week_minute, now):
+        """
+        주 시작일 기준 현지 시각(분)이 now 이후 처음 도래하는 순간 (UTC)
+        """
+        day = week_start + timedelta(days=week_minute // MINUTES_PER_DAY)
+        wall = datetime.combine(day, time(week_minute % MINUTES_PER_DAY // 60, week_minute % 60))
+
+        # 반복되는 시각(서머타임 종료)은 아직 지나지 않은 쪽, 건너뛴 시각(서머타임 시작)은 전환 순간
+        earlier, later = sorted(wall.replace(tzinfo=self.zone, fold=fold).astimezone(timezone.utc) for fold in (0, 1))
+        if self.local_wall(earlier) >= wall:
+            return earlier if earlier > now else later
+        while later - earlier > timedelta(seconds=1):
+            middle = earlier + (later - earlier) / 2
+            if self.local_wall(middle) >= wall:
+                later = middle
+            else:
+                earlier = middle
+        return later
+
+    def local_wall(self, instant):
+        return instant.astimezone(self.zone).replace(tzinfo=None)
+
+
+def load_schedule(session, zone=None):
+    import repository
+    return Schedule(repository.list_schedule_entries(session), zone)
@@ -0,0 +1,142 @@
+import logging
+from collections import namedtuple
+from types import MappingProxyType
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import Config
+
+logger = logging.getLogger("DreamBodyVideo.Settings")
+
+# 설정 항목 정의 - 새 설정은 이 목록에만 추가하면 DB 기본값, 관리자 화면, 페이지에 모두 반영됨
+ConfigField = namedtuple(
+    "ConfigField",
+    ["key", "type", "default", "minimum", "maximum", "label", "suffix", "description"]
+)
+
+CONFIG_FIELDS = [
+    ConfigField("start_countdown", int, 30, 1, 600, "시작 카운트다운:", " 초", "페이지 시작 전 카운트다운 시간 (초)"),
+    ConfigField("initial_delay", int, 3, 1, 10, "시작 후 확대까지 대기 시간:", " 초", "첫 영상 확대까지 대기 시간 (초)"),
+    ConfigField("zoom_duration", int, 60, 10, 300, "확대 상태 지속 시간:", " 초", "영상 길이가 없을 때 확대 유지 시간 (초)"),
+    ConfigField("transition_duration", int, 1, 1, 5, "확대/축소 애니메이션 지속 시간:", " 초", "확대/축소 애니메이션 시간 (초)"),
+    ConfigField("volume", int, 50, 0, 100, "기본 볼륨:", " %", "영상 재생 기본 볼륨 (0-100)"),
+]
+
+FIELDS_BY_KEY = {field.key: field for field in CONFIG_FIELDS}
+
+
+def _coerce(field, raw):
+    """DB의 텍스트 값을 설정 타입으로 변환하고 범위를 검증한다."""
+    if raw is None:
+        return field.default
+
+    try:
+        if field.type is bool:
+            value = raw if isinstance(raw, bool) else str(raw).strip().lower() in ("1", "true", "yes", "on")
+        elif field.type is int:
+            value = int(float(raw))
+        else:
+            value = field.type(raw)
+    except (TypeError, ValueError):
+        logger.warning(f"설정값 형식 오류: {field.key}={raw!r}, 기본값 {field.default} 사용")
+        return field.default
+
+    if field.minimum is not None and value < field.minimum:
+        logger.warning(f"설정값이 최소값보다 작음: {field.key}={value}, {field.minimum}로 조정")
+        value = field.minimum
+    if field.maximum is not None and value > field.maximum:
+        logger.warning(f"설정값이 최대값보다 큼: {field.key}={value}, {field.maximum}로 조정")
+        value = field.maximum
+
+    return value
+
+
+def check_value(key, value):
+    """설정 타입으로 변환하고 범위를 벗어나면 ValueError (실행 중 값 변경용 - DB 값처럼 조정하지 않음)"""
+    field = FIELDS_BY_KEY[key]
+    value = field.type(value)
+    if (field.minimum is not None and value < field.minimum) or (field.maximum is not None and value > field.maximum):
+        raise ValueError(f"{field.key} 값은 {field.minimum}~{field.maximum} 사이여야 합니다: {value}")
+    return value
+
+
+class ConfigSnapshot:
+    """검증된 설정값의 불변 스냅샷 (snapshot.zoom_duration 또는 snapshot["zoom_duration"])"""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, raw_values=None):
+        raw_values = raw_values or {}
+        values = {field.key: _coerce(field, raw_values.get(field.key)) for field in CONFIG_FIELDS}
+        object.__setattr__(self, "_values", MappingProxyType(values))
+
+    def __getattr__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("ConfigSnapshot은 수정할 수 없습니다.")
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __eq__(self, other):
+        return isinstance(other, ConfigSnapshot) and dict(self._values) == dict(other._values)
+
+    def __hash__(self):
+        return hash(tuple(sorted(self._values.items())))
+
+    def __repr__(self):
+        return f"<ConfigSnapshot({dict(self._values)})>"
+
+    def as_dict(self):
+        return dict(self._values)
+
+    def replace(self, **changes):
+        values = self.as_dict()
+        values.update(changes)
+        return ConfigSnapshot(values)
+
+    def changed_keys(self, other):
+        return {key for key in self._values if self._values[key] != other[key]}
+
+
+def default_rows():
+    return [
+        {"key": field.key, "value": str(field.default), "description": field.description}
+        for field in CONFIG_FIELDS
+    ]
+
+
+def seed_defaults(session):
+    # 없는 키만 한 번의 INSERT로 추가
+    stmt = sqlite_insert(Config.__table__).values(default_rows())
+    session.execute(stmt.on_conflict_do_nothing(index_elements=["key"]))
+
+
+def load_config(session):
+    rows = session.query(Config.key, Config.value).all()
+    return ConfigSnapshot(dict(rows))
+
+
+def save_config(session, values):
+    """
+    설정값을 검증한 뒤 한 번의 UPSERT로 저장하고 새 스냅샷을 반환
+    """
+    unknown = set(values) - set(FIELDS_BY_KEY)
+    if unknown:
+        raise KeyError(f"알 수 없는 설정 키: {', '.join(sorted(unknown))}")
+
+    current = load_config(session)
+    snapshot = current.replace(**values)
+
+    rows = [
+        {"key": key, "value": str(snapshot[key]), "description": FIELDS_BY_KEY[key].description}
+        for key in values
+    ]
+    if rows:
+        stmt = sqlite_insert(Config.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(index_elements=["key"], set_={"value": stmt.excluded.value})
+        session.execute(stmt)
+
+    return snapshot
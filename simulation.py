@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import heapq
+import time
+import logging
+import argparse
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QFrame, QSizePolicy
+
+logger = logging.getLogger("DreamBodyVideo.Simulation")
+
+# 페이지 실행 시뮬레이션
+# - WorkoutPage에 가상 시계의 타이머와 가짜 플레이어를 주입해 실제 시간을 기다리지 않고 전체 일정을 실행
+# - 화면 없이(QT_QPA_PLATFORM=offscreen) 실행되며 QtWebEngine과 네트워크를 사용하지 않음
+# - 영상 전환, 레이블 변화, 페이지 완료를 가상 시각(ms)과 함께 기록 (회귀 확인/벤치마크용)
+
+MAX_VIRTUAL_MS = 24 * 60 * 60 * 1000  # 끝나지 않는 페이지를 막기 위한 상한
+
+
+class VirtualTimer(QObject):
+    """
+    QTimer와 같은 인터페이스의 가상 타이머. 시간은 VirtualClock.run()이 진행시킨다.
+    """
+    timeout = pyqtSignal()
+
+    def __init__(self, clock, parent=None):
+        super().__init__(parent)
+        self.clock = clock
+        self._interval = 0
+        self._single_shot = False
+        self._active = False
+        self._due = None
+        self._generation = 0  # stop/start 시 이전 예약을 무효화
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def isSingleShot(self):
+        return self._single_shot
+
+    def setTimerType(self, timer_type):
+        pass  # 가상 시간은 항상 정확함
+
+    def setInterval(self, msec):
+        self._interval = msec
+
+    def interval(self):
+        return self._interval
+
+    def isActive(self):
+        return self._active
+
+    def remainingTime(self):
+        return max(self._due - self.clock.now, 0) if self._active else -1
+
+    def start(self, msec=None):
+        if msec is not None:
+            self._interval = msec
+        self._active = True
+        self._schedule()
+
+    def stop(self):
+        self._active = False
+        self._generation += 1
+
+    def _schedule(self):
+        self._generation += 1
+        self._due = self.clock.now + self._interval
+        self.clock.schedule(self, self._due, self._generation)
+
+    def _fire(self):
+        if self._single_shot:
+            self._active = False
+            self._generation += 1
+        else:
+            self._schedule()
+        self.timeout.emit()
+
+
+class VirtualClock:
+    """
+    가상 시계. 예약된 타이머를 만료 시각 순서대로(같은 시각이면 예약 순서대로) 즉시 실행한다.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.fired = 0
+        self.on_fire = None  # 타이머 실행 직후 호출 (timer)
+        self._queue = []
+        self._seq = 0
+
+    def timer(self, parent=None):
+        # WorkoutPage의 timer_factory로 사용
+        return VirtualTimer(self, parent)
+
+    def monotonic(self):
+        # WorkoutPage의 monotonic으로 사용 (동기화 모드의 시작 시각 계산, 초)
+        return self.now / 1000
+
+    def schedule(self, timer, due, generation):
+        self._seq += 1
+        heapq.heappush(self._queue, (due, self._seq, generation, timer))
+
+    def run(self, until=MAX_VIRTUAL_MS, stop=None):
+        """
+        예약된 타이머가 없거나 until(ms)에 도달하거나 stop()이 참이 될 때까지 실행
+        """
+        while self._queue:
+            due, seq, generation, timer = self._queue[0]
+            if due > until:
+                self.now = until
+                break
+            heapq.heappop(self._queue)
+
+            # 중지/재시작되었거나 삭제된 타이머의 예약은 건너뜀
+            if sip.isdeleted(timer) or not timer._active or generation != timer._generation:
+                continue
+
+            self.now = due
+            self.fired += 1
+            timer._fire()
+            if self.on_fire:
+                self.on_fire(timer)
+            if stop and stop():
+                break
+        return self.now
+
+
+class SimulatedPlayer(QFrame):
+    """
+    VideoPlayer 대신 쓰는 가짜 플레이어 - 웹 뷰/썸네일 없이 재생 상태만 기록
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, order, url, title, record, parent=None):
+        super().__init__(parent)
+        self.order = order
+        self.url = url
+        self.title = title
+        self.record = record
+        self.is_zoomed = False
+        self.is_playing = False
+        self.volume = None
+        self.is_released = False
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def toggle_play(self):
+        self.is_playing = not self.is_playing
+        self.record("play" if self.is_playing else "stop", self)
+
+    def release(self):
+        self.is_playing = False
+        self.is_released = True
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def zoom_in(self):
+        if not self.is_zoomed:
+            self.is_zoomed = True
+            self.record("zoom", self)
+
+    def zoom_out(self):
+        self.is_zoomed = False
+
+
+class PageSimulation:
+    """
+    WorkoutPage 하나를 가상 시간으로 끝까지 실행하고 이벤트 기록을 만든다.
+
+    기록 항목: {'t': 가상 시각(ms), 'event': 'label'|'zoom'|'play'|'stop'|'complete', ...}
+    start_at을 주면 동기화 모드로 실행 (가상 시각 기준 초, 음수면 이미 진행 중인 일정에 합류)
+    """
+
+    def __init__(self, engine, page_id, width=1080, height=1920, start_at=None):
+        from page import WorkoutPage
+
+        self.clock = VirtualClock()
+        self.trace = []
+        self.completed_at = None
+        self._labels = {}
+
+        self.page = WorkoutPage(
+            engine, page_id,
+            timer_factory=self.clock.timer,
+            player_factory=self.create_player,
+            start_at=start_at,
+            monotonic=self.clock.monotonic
+        )
+        self.page.resize(width, height)
+        self.page.page_completed.connect(self.on_page_completed)
+        self.clock.on_fire = lambda timer: self.record_labels()
+
+    def create_player(self, order, url, title, parent):
+        return SimulatedPlayer(order, url, title, self.record_player, parent)
+
+    def record(self, event, **data):
+        self.trace.append({'t': self.clock.now, 'event': event, **data})
+
+    def record_player(self, event, player):
+        tile = self.page.video_players.index(player) if player in self.page.video_players else None
+        self.record(event, tile=tile, order=player.order, title=player.title)
+
+    def record_labels(self):
+        # 바뀐 레이블만 기록 (헤더 카운트다운 + 칸별 남은 시간)
+        labels = [('header', self.page.timer_display.text())]
+        labels += [(f"tile{i}", player.timer_label.text()) for i, player in enumerate(self.page.video_players)]
+        for target, text in labels:
+            if self._labels.get(target) != text:
+                self._labels[target] = text
+                self.record('label', target=target, text=text)
+
+    def on_page_completed(self, page_id):
+        self.completed_at = self.clock.now
+        self.record('complete', page_id=page_id)
+
+    def run(self, until=MAX_VIRTUAL_MS):
+        started = time.perf_counter()
+        self.record_labels()
+        self.clock.run(until, stop=lambda: self.completed_at is not None)
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        return {
+            'page_id': self.page.page_id,
+            'completed': self.completed_at is not None,
+            'virtual_ms': self.clock.now,
+            'wall_ms': round(wall_ms, 3),
+            'timer_fires': self.clock.fired,
+            'transitions': [entry for entry in self.trace if entry['event'] == 'zoom'],
+            'trace': self.trace,
+        }
+
+    def close(self):
+        self.page.complete_page()
+        self.page.close()  # WorkoutPage.teardown()
+
+
+def simulate_page(engine, page_id, until=MAX_VIRTUAL_MS):
+    """
+    페이지를 시뮬레이션하고 결과를 반환 (QApplication이 먼저 있어야 함)
+    """
+    simulation = PageSimulation(engine, page_id)
+    try:
+        return simulation.run(until)
+    finally:
+        simulation.close()
+
+
+def format_ms(ms):
+    seconds = ms // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}.{ms % 1000:03d}"
+
+
+def main(argv=None):
+    """
+    페이지 실행 시뮬레이션 명령
+    """
+    parser = argparse.ArgumentParser(description="페이지 실행 시뮬레이션 (가상 시간, 화면 없이 실행)")
+    parser.add_argument("page_ids", nargs="*", type=int, help="시뮬레이션할 페이지 ID (기본값: 전체)")
+    parser.add_argument("--db", help="데이터베이스 파일 (기본값: 앱 DB)")
+    parser.add_argument("--json", action="store_true", help="전체 기록을 JSON으로 출력")
+    parser.add_argument("--trace", action="store_true", help="이벤트 기록 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="페이지 로그 출력")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from sqlalchemy.orm import sessionmaker
+    from models import init_db
+    import repository
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    engine = init_db(args.db)
+    page_ids = args.page_ids
+    if not page_ids:
+        session = sessionmaker(bind=engine)()
+        page_ids = [page['id'] for page in repository.list_pages(session)]
+        session.close()
+
+    results = [simulate_page(engine, page_id) for page_id in page_ids]
+    app.processEvents()
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        for result in results:
+            status = "완료" if result['completed'] else "미완료"
+            print(
+                f"페이지 {result['page_id']}: {status}, 가상 시간 {format_ms(result['virtual_ms'])}, "
+                f"전환 {len(result['transitions'])}회, 타이머 {result['timer_fires']}회, 실행 {result['wall_ms']:.1f}ms"
+            )
+            if args.trace:
+                for entry in result['trace']:
+                    details = ", ".join(f"{key}={value}" for key, value in entry.items() if key not in ('t', 'event'))
+                    print(f"  {format_ms(entry['t'])} {entry['event']:8s} {details}")
+
+    return 0 if all(result['completed'] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -165,9 +165,8 @@ def setup_test_data(session):
     # 비디오 추가
     if not videos:
         logger.info("비디오 데이터 추가 중...")
-        for video_data in test_videos:
-            video = Video(**video_data)
-            session.add(video)
+        # 한 번의 executemany INSERT로 추가
+        session.execute(Video.__table__.insert(), test_videos)
         session.commit()
         logger.info(f"{len(test_videos)}개 테스트 비디오 추가 완료")
     
@@ -178,18 +177,19 @@ def setup_test_data(session):
         all_videos = session.query(Video).all()
         
         # 페이지당 3개씩 영상 할당
+        assignments = []
         for page_id in range(1, 4):
             # 각 페이지에 3개씩 할당 (순환)
             start_idx = (page_id - 1) * 3
             for i in range(3):
                 video_idx = (start_idx + i) % len(all_videos)
-                page_video = PageVideo(
-                    page_id=page_id,
-                    video_id=all_videos[video_idx].id,
-                    order=i
-                )
-                session.add(page_video)
+                assignments.append({
+                    'page_id': page_id,
+                    'video_id': all_videos[video_idx].id,
+                    'order': i
+                })
         
+        session.execute(PageVideo.__table__.insert(), assignments)
         session.commit()
         logger.info("페이지당 3개씩 비디오 할당 완료")
 
@@ -0,0 +1,24 @@
+import os
+import pytest
+from sqlalchemy.orm import sessionmaker
+from models import init_db
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return init_db(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(["tests"])
@@ -0,0 +1,57 @@
+import time
+import pytest
+from PyQt5.QtTest import QTest
+from models import Video
+import repository
+
+
+def wait_until(condition, timeout_ms=5000):
+    # 작업 스레드의 결과가 이벤트 루프로 전달될 때까지 대기
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        QTest.qWait(20)
+
+
+@pytest.fixture
+def admin(qapp, engine, session):
+    from admin import AdminWindow
+
+    repository.add_page(session, "빈 페이지 1")
+    repository.add_page(session, "빈 페이지 2")
+    session.add(Video(title="스쿼트", url="https://www.youtube.com/watch?v=aaaaaaaaaaa"))
+    session.commit()
+
+    window = AdminWindow(engine)
+    window.show()
+    window.tabs.setCurrentWidget(window.page_settings_tab)
+    wait_until(lambda: window.shown_page_id is not None)
+    yield window
+    window.close()
+    for service in (window.data_service, window.health_service, window.search_service):
+        service.wait_for_done()
+    window.deleteLater()
+
+
+def show_page(window, index):
+    window.page_combo.setCurrentIndex(index)
+    page_id = window.page_combo.currentData()
+    wait_until(lambda: window.shown_page_id == page_id)
+    return page_id
+
+
+def test_untouched_slots_of_empty_page_are_not_an_edit(admin):
+    first_page = admin.shown_page_id
+    assert len(admin.slot_rows) == 3
+
+    show_page(admin, 1)
+    show_page(admin, 0)
+    admin.stash_page_edits()
+    assert admin.page_edits == {}
+    assert admin.shown_page_id == first_page
+
+
+def test_choosing_a_video_on_empty_page_is_an_edit(admin, session):
+    video_id = session.query(Video.id).scalar()
+    admin.slot_rows[0].picker.set_video_id(video_id)
+    assert list(admin.page_edits) == [admin.shown_page_id]
@@ -0,0 +1,85 @@
+import io
+import json
+import pytest
+from models import Video
+import catalog_io
+
+
+def jsonl(*records):
+    lines = [record if isinstance(record, str) else json.dumps(record, ensure_ascii=False) for record in records]
+    return catalog_io.iter_raw_records(io.StringIO("\n".join(lines) + "\n"), 'jsonl')
+
+
+# --- normalize_record ---
+
+def test_normalize_record_canonicalizes_url():
+    video_id, record = catalog_io.normalize_record(
+        {'title': " 스쿼트 ", 'url': "https://youtu.be/abcdefghijk", 'duration': "5:30"}
+    )
+    assert video_id == "abcdefghijk"
+    assert record == {'title': "스쿼트", 'url': "https://www.youtube.com/watch?v=abcdefghijk",
+                      'exercise_type': None, 'difficulty': None, 'duration': 5.5}
+
+
+def test_normalize_record_coerces_non_string_values():
+    _, record = catalog_io.normalize_record(
+        {'title': 123, 'url': "abcdefghijk", 'exercise_type': 4, 'difficulty': 2.5, 'duration': 3}
+    )
+    assert (record['title'], record['exercise_type'], record['difficulty'], record['duration']) == ("123", "4", "2.5", 3.0)
+
+
+@pytest.mark.parametrize("raw", [
+    {'title': "", 'url': "abcdefghijk"},
+    {'title': None, 'url': "abcdefghijk"},
+    {'title': "제목", 'url': "https://example.com/video"},
+    {'title': "제목", 'url': 12345},
+    {'title': "제목", 'url': "abcdefghijk", 'duration': "길다"},
+    ["목록"],
+])
+def test_normalize_record_rejects_invalid(raw):
+    with pytest.raises(ValueError):
+        catalog_io.normalize_record(raw)
+
+
+# --- import_records ---
+
+def test_import_counts_and_skips_invalid_rows(session):
+    stats = catalog_io.import_records(session, jsonl(
+        {'title': 123, 'url': "aaaaaaaaaaa"},
+        {'title': "주소 없음"},
+        "{깨진 줄",
+        {'title': "정상", 'url': "bbbbbbbbbbb", 'difficulty': 1},
+    ))
+    assert (stats['read'], stats['inserted'], stats['invalid'], stats['duplicates']) == (4, 2, 2, 0)
+    assert len(stats['errors']) == 2
+    assert session.query(Video).count() == 2
+
+
+def test_import_dedups_within_and_across_batches(session):
+    stats = catalog_io.import_records(session, jsonl(
+        {'title': "첫 번째", 'url': "aaaaaaaaaaa"},
+        {'title': "같은 배치 중복", 'url': "https://youtu.be/aaaaaaaaaaa"},
+        {'title': "두 번째", 'url': "bbbbbbbbbbb"},
+        {'title': "다음 배치 중복", 'url': "https://www.youtube.com/watch?v=aaaaaaaaaaa"},
+    ), batch_size=2)
+    assert (stats['inserted'], stats['duplicates']) == (2, 2)
+    assert sorted(title for (title,) in session.query(Video.title)) == ["두 번째", "첫 번째"]
+
+
+def test_import_dedups_against_existing_urls(session):
+    # 관리자 화면에서 표준이 아닌 형태로 입력한 기존 영상
+    session.add(Video(title="기존", url="https://youtu.be/aaaaaaaaaaa"))
+    session.commit()
+
+    stats = catalog_io.import_records(session, jsonl(
+        {'title': "중복", 'url': "https://m.youtube.com/watch?v=aaaaaaaaaaa"},
+        {'title': "새 영상", 'url': "ccccccccccc"},
+    ))
+    assert (stats['inserted'], stats['duplicates']) == (1, 1)
+
+
+def test_import_csv(session):
+    fp = io.StringIO("title,url,exercise_type,difficulty,duration\n런지,ddddddddddd,근력,쉬움,4\n")
+    stats = catalog_io.import_records(session, catalog_io.iter_raw_records(fp, 'csv'))
+    assert stats['inserted'] == 1
+    assert session.query(Video.exercise_type, Video.duration).one() == ("근력", 4.0)
@@ -0,0 +1,32 @@
+import time
+from PyQt5.QtTest import QTest
+from launcher import ScreenLauncher, ProcessScreen
+
+
+def wait_until(condition, timeout_ms=5000):
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        QTest.qWait(20)
+
+
+def test_screen_that_fails_to_start_does_not_block_sync_start(qapp, engine, monkeypatch):
+    monkeypatch.setattr(ProcessScreen, 'program', "/nonexistent/python")
+    launcher = ScreenLauncher(engine, [(0, 1)], processes=True, sync=True)
+    events = []
+    launcher.event_occurred.connect(events.append)
+    launcher.start()
+    assert launcher.sync_pending
+
+    wait_until(lambda: launcher.statuses.get(0, {}).get('state') == 'failed')
+    assert not launcher.sync_pending and launcher.start_at is not None
+    assert launcher.running_screens() == set()
+    assert events[-1]['state'] == 'failed' and events[-1]['error']
+
+    # 실패한 화면에는 명령을 쌓아 두지 않음
+    launcher.request_status()
+    assert launcher.screens[0].pending == []
+
+    started = time.monotonic()
+    launcher.shutdown()
+    assert time.monotonic() - started < 1
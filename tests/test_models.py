@@ -0,0 +1,21 @@
+from models import Video, Page, PageVideo, PAGE_ORDER_INDEX, ensure_schema
+
+
+def test_page_order_index_renumbers_duplicates_without_losing_rows(engine, session):
+    # 순서 고유 인덱스가 생기기 전의 DB (같은 페이지에 같은 순서 값이 중복)
+    session.connection().exec_driver_sql(f"DROP INDEX {PAGE_ORDER_INDEX}")
+    videos = [Video(title=f"영상 {i}", url=f"https://www.youtube.com/watch?v=video{i:06d}") for i in range(5)]
+    page, other = Page(name="중복 페이지"), Page(name="정상 페이지")
+    session.add_all(videos + [page, other])
+    session.flush()
+    for order, video in [(1, videos[0]), (2, videos[1]), (2, videos[2]), (3, videos[3]), (3, videos[4])]:
+        session.add(PageVideo(page_id=page.id, video_id=video.id, order=order))
+        session.flush()
+    session.add(PageVideo(page_id=other.id, video_id=videos[0].id, order=0))
+    session.commit()
+
+    ensure_schema(engine)
+
+    rows = session.query(PageVideo.order, PageVideo.video_id).filter_by(page_id=page.id).order_by(PageVideo.order).all()
+    assert rows == [(1, videos[0].id), (2, videos[1].id), (3, videos[2].id), (4, videos[3].id), (5, videos[4].id)]
+    assert session.query(PageVideo.order).filter_by(page_id=other.id).all() == [(0,)]
@@ -0,0 +1,13 @@
+import page
+
+
+def test_embed_html_enables_js_api_with_current_volume():
+    html = page.embed_html("abcdefghijk", 30)
+    assert "/embed/abcdefghijk?autoplay=1&controls=1&modestbranding=1&rel=0&enablejsapi=1" in html
+    assert "var volume = 30;" in html
+    assert "var volume = null;" in page.embed_html("abcdefghijk")
+
+
+def test_volume_script_calls_embed_page_function():
+    assert page.volume_script(45) == "setVolume(45);"
+    assert "function setVolume(value)" in page.embed_html("abcdefghijk", 45)
@@ -0,0 +1,208 @@
+import json
+import time
+import socket
+import struct
+import base64
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtTest import QTest
+from remote_api import RemoteControlServer, MAX_BODY_BYTES, OP_TEXT, OP_CLOSE
+
+TOKEN = "test-token"
+
+
+class FakeTarget(QObject):
+    event_occurred = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def execute(self, message):
+        self.messages.append(message)
+        return {'state': 'idle', 'volume': message.get('volume')}
+
+
+@pytest.fixture
+def target(qapp):
+    return FakeTarget()
+
+
+@pytest.fixture
+def server(target):
+    server = RemoteControlServer(target, "127.0.0.1", 0, TOKEN)
+    server.start()
+    yield server
+    server.stop()
+
+
+def wait_result(future, timeout_ms=5000):
+    # 명령은 GUI 스레드에서 실행되므로 응답을 기다리는 동안 Qt 이벤트를 처리
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not future.done():
+        assert time.monotonic() < deadline, "시간 초과"
+        QTest.qWait(10)
+    return future.result()
+
+
+def connect(server):
+    return socket.create_connection(("127.0.0.1", server.port), timeout=5)
+
+
+def read_response(sock):
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.lower().split(": ", 1) for line in lines[1:])
+    length = int(headers.get("content-length", 0))
+    while len(body) < length:
+        body += sock.recv(4096)
+    return int(lines[0].split()[1]), headers, body
+
+
+def send_request(server, method, path, headers=None, body=b""):
+    sock = connect(server)
+    with sock:
+        headers = {'Host': f"127.0.0.1:{server.port}", 'Connection': "close", **(headers or {})}
+        if body:
+            headers['Content-Length'] = str(len(body))
+        head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        sock.sendall(f"{method} {path} HTTP/1.1\r\n{head}\r\n".encode("latin-1") + body)
+        status, _, body = read_response(sock)
+    return status, json.loads(body)
+
+
+def request(server, method, path, headers=None, body=b""):
+    with ThreadPoolExecutor(1) as executor:
+        return wait_result(executor.submit(send_request, server, method, path, headers, body))
+
+
+def authorization(token=TOKEN):
+    return {'Authorization': f"Bearer {token}"}
+
+
+def test_missing_token_is_rejected(server, target):
+    status, payload = request(server, "GET", "/status")
+    assert status == 401 and payload['ok'] is False
+    assert target.messages == []
+
+
+def test_wrong_token_is_rejected(server, target):
+    assert request(server, "GET", "/status", authorization("wrong"))[0] == 401
+    assert request(server, "GET", "/status", {'Authorization': f"Basic {TOKEN}"})[0] == 401
+    # 쿼리 문자열의 토큰은 받지 않음
+    assert request(server, "GET", f"/status?token={TOKEN}")[0] == 401
+    assert target.messages == []
+
+
+def test_request_with_origin_is_rejected(server, target):
+    status, _ = request(server, "GET", "/status", {**authorization(), 'Origin': "https://www.youtube.com"})
+    assert status == 403
+    assert target.messages == []
+
+
+@pytest.mark.parametrize("host", ["evil.example.com:{port}", "127.0.0.1:1", "127.0.0.1"])
+def test_request_with_bad_host_is_rejected(server, target, host):
+    status, _ = request(server, "GET", "/status", {**authorization(), 'Host': host.format(port=server.port)})
+    assert status == 403
+    assert target.messages == []
+
+
+def test_post_without_json_content_type_is_rejected(server, target):
+    status, _ = request(server, "POST", "/volume", authorization(), b'{"volume": 30}')
+    assert status == 415
+    assert target.messages == []
+
+
+def test_allowed_command_runs_on_target(server, target):
+    headers = {**authorization(), 'Content-Type': "application/json"}
+    status, payload = request(server, "POST", "/volume", headers, b'{"volume": 30}')
+    assert status == 200
+    assert payload == {'ok': True, 'result': {'state': 'idle', 'volume': 30}}
+    assert target.messages == [{'command': 'volume', 'volume': 30}]
+
+
+def test_localhost_host_is_allowed_on_loopback(server, target):
+    status, _ = request(server, "GET", "/status", {**authorization(), 'Host': f"localhost:{server.port}"})
+    assert status == 200
+
+
+def mask_frame(opcode, payload, length=None):
+    # 클라이언트 프레임 (마스크 0000 - 내용은 그대로)
+    length = len(payload) if length is None else length
+    return struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, length) + b"\0\0\0\0" + payload
+
+
+def read_frame(sock):
+    first, second = sock.recv(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", sock.recv(2))
+    payload = b""
+    while len(payload) < length:
+        payload += sock.recv(length - len(payload))
+    return first & 0x0F, payload
+
+
+def open_websocket(server):
+    sock = connect(server)
+    key = base64.b64encode(b"0123456789abcdef").decode()
+    sock.sendall(
+        f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{server.port}\r\nAuthorization: Bearer {TOKEN}\r\n"
+        f"Upgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n\r\n".encode("latin-1")
+    )
+    status, _, rest = read_response(sock)
+    assert status == 101 and rest == b""
+    return sock
+
+
+def test_websocket_oversized_message_closes_with_1009(server):
+    def run():
+        sock = open_websocket(server)
+        with sock:
+            frames = [read_frame(sock)]  # 연결 직후 상태
+            sock.sendall(mask_frame(OP_TEXT, b"", MAX_BODY_BYTES + 1))
+            frames.append(read_frame(sock))
+            return frames
+
+    with ThreadPoolExecutor(1) as executor:
+        (opcode, payload), (close, reason) = wait_result(executor.submit(run))
+    assert json.loads(payload)['event'] == 'status'
+    assert close == OP_CLOSE
+    assert struct.unpack("!H", reason[:2])[0] == 1009
+
+
+def test_websocket_close_is_echoed(server):
+    def run():
+        sock = open_websocket(server)
+        with sock:
+            read_frame(sock)
+            sock.sendall(mask_frame(OP_CLOSE, struct.pack("!H", 1000)))
+            frame = read_frame(sock)
+            sock.settimeout(2)
+            return frame, sock.recv(1)  # 응답 후 서버가 연결을 닫음
+
+    with ThreadPoolExecutor(1) as executor:
+        (close, payload), rest = wait_result(executor.submit(run))
+    assert close == OP_CLOSE and struct.unpack("!H", payload)[0] == 1000
+    assert rest == b""
+
+
+def test_websocket_without_token_is_rejected(server):
+    def run():
+        sock = connect(server)
+        with sock:
+            sock.sendall(
+                f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{server.port}\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Key: x\r\n\r\n".encode("latin-1")
+            )
+            return read_response(sock)[0]
+
+    with ThreadPoolExecutor(1) as executor:
+        assert wait_result(executor.submit(run)) == 401
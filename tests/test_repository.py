@@ -0,0 +1,152 @@
+import pytest
+from models import Video, Page, PageVideo, SEARCH_TABLE
+import repository
+
+
+def add_videos(session, *titles):
+    videos = [Video(title=title, url=f"https://www.youtube.com/watch?v=video{i:06d}", exercise_type="근력",
+                    difficulty="중간") for i, title in enumerate(titles)]
+    session.add_all(videos)
+    session.commit()
+    return [video.id for video in videos]
+
+
+def add_page(session, *rows):
+    page = Page(name="테스트 페이지")
+    session.add(page)
+    session.flush()
+    for order, video_id, display_number in rows:
+        session.add(PageVideo(page_id=page.id, video_id=video_id, order=order, display_number=display_number))
+    session.commit()
+    return page.id
+
+
+# --- build_page_assignments / diff_page_assignments ---
+
+def test_build_reuses_stored_orders_and_appends():
+    stored = [{'order': 0, 'video_id': 1, 'display_number': 1}, {'order': 1, 'video_id': 2, 'display_number': 2}]
+    assignments = repository.build_page_assignments(stored, [(5, 1), (6, 2), (7, 3)])
+    assert [(a['order'], a['video_id'], a['display_number']) for a in assignments] == [(0, 5, 1), (1, 6, 2), (2, 7, 3)]
+
+
+def test_build_with_no_stored_rows_starts_at_one():
+    assignments = repository.build_page_assignments([], [(5, 1)])
+    assert assignments == [{'order': 1, 'video_id': 5, 'display_number': 1}]
+
+
+def test_diff_classifies_rows():
+    stored = [
+        {'order': 1, 'video_id': 1, 'display_number': 1},
+        {'order': 2, 'video_id': 2, 'display_number': 2},
+        {'order': 3, 'video_id': 3, 'display_number': 3},
+    ]
+    edited = [
+        {'order': 1, 'video_id': 1, 'display_number': 1},  # 그대로
+        {'order': 2, 'video_id': 9, 'display_number': 2},  # 영상 변경
+        {'order': 4, 'video_id': 4, 'display_number': 4},  # 추가
+    ]
+    inserts, updates, deletes, unchanged = repository.diff_page_assignments(stored, edited)
+    assert [a['order'] for a in inserts] == [4]
+    assert [a['order'] for a in updates] == [2]
+    assert deletes == [3]
+    assert unchanged == 1
+
+
+def test_diff_rejects_duplicate_orders():
+    edited = [{'order': 1, 'video_id': 1, 'display_number': 1}, {'order': 1, 'video_id': 2, 'display_number': 2}]
+    with pytest.raises(ValueError):
+        repository.diff_page_assignments([], edited)
+
+
+def test_diff_treats_null_display_number_as_position():
+    stored = [{'order': 0, 'video_id': 1, 'display_number': None}, {'order': 1, 'video_id': 2, 'display_number': None}]
+    edited = [{'order': 0, 'video_id': 1, 'display_number': 1}, {'order': 1, 'video_id': 2, 'display_number': 2}]
+    assert repository.diff_page_assignments(stored, edited) == ([], [], [], 2)
+
+
+def test_diff_updates_null_row_whose_position_changes():
+    # 앞 칸을 지우면 NULL 행의 위치가 바뀌므로 지정한 번호를 저장해야 함
+    stored = [{'order': 1, 'video_id': 1, 'display_number': None}, {'order': 2, 'video_id': 2, 'display_number': None}]
+    edited = [{'order': 2, 'video_id': 2, 'display_number': 2}]
+    inserts, updates, deletes, unchanged = repository.diff_page_assignments(stored, edited)
+    assert updates == edited
+    assert deletes == [1]
+
+
+def test_untouched_slots():
+    blank = repository.build_page_assignments([], [(None, 1), (None, 2), (None, 3)])
+    assert repository.is_untouched_slots(blank)
+    assert repository.is_untouched_slots([])
+    assert not repository.is_untouched_slots(repository.build_page_assignments([], [(None, 1), (5, 2)]))
+    assert not repository.is_untouched_slots(repository.build_page_assignments([], [(None, 1), (None, 7)]))
+
+
+# --- save_page_assignments / 표시 번호 ---
+
+def test_save_leaves_null_display_numbers_unchanged(session):
+    first, second = add_videos(session, "영상 1", "영상 2")
+    page_id = add_page(session, (0, first, None), (1, second, None))
+
+    stored = repository.get_page_assignments(session, page_id)
+    assert [a['display_number'] for a in stored] == [1, 2]
+
+    stats = repository.save_page_assignments(session, page_id, stored)
+    assert stats == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 2}
+
+
+def test_playlist_and_assignments_share_display_fallback(session):
+    first, second = add_videos(session, "영상 1", "영상 2")
+    page_id = add_page(session, (1, first, None), (2, second, 7))
+
+    playlist = repository.load_page_playlist(session, page_id)
+    assignments = repository.get_page_assignments(session, page_id)
+    assert [v['display_number'] for v in playlist] == [a['display_number'] for a in assignments] == [1, 7]
+
+
+def test_save_applies_diff(session):
+    first, second, third = add_videos(session, "영상 1", "영상 2", "영상 3")
+    page_id = add_page(session, (1, first, 1), (2, second, 2))
+
+    stored = repository.get_page_assignments(session, page_id)
+    assignments = repository.build_page_assignments(stored, [(first, 1), (third, 2), (second, 3)])
+    stats = repository.save_page_assignments(session, page_id, assignments)
+    session.commit()
+
+    assert stats == {'inserted': 1, 'updated': 1, 'deleted': 0, 'unchanged': 1}
+    assert [(v['video_id'], v['display_number']) for v in repository.load_page_playlist(session, page_id)] == \
+        [(first, 1), (third, 2), (second, 3)]
+
+
+# --- search_videos ---
+
+def test_search_uses_full_text_index(session):
+    add_videos(session, "아침 스트레칭", "저녁 스트레칭", "복부 운동")
+    titles = {record['title'] for record in repository.search_videos(session, "스트레칭")}
+    assert titles == {"아침 스트레칭", "저녁 스트레칭"}
+
+
+def test_search_short_keyword_matches_id_and_like(session):
+    ids = add_videos(session, "HIIT", "요가")
+    assert [record['id'] for record in repository.search_videos(session, str(ids[1]))] == [ids[1]]
+    assert [record['title'] for record in repository.search_videos(session, "요가")] == ["요가"]
+
+
+def test_search_falls_back_without_index_and_keeps_pending_work(session):
+    add_videos(session, "아침 스트레칭")
+    connection = session.connection()
+    for suffix in ("ai", "ad", "au"):
+        connection.exec_driver_sql(f"DROP TRIGGER videos_search_{suffix}")
+    connection.exec_driver_sql(f"DROP TABLE {SEARCH_TABLE}")
+    session.commit()
+
+    session.add(Video(title="저녁 스트레칭", url="https://www.youtube.com/watch?v=pending0001"))
+    titles = {record['title'] for record in repository.search_videos(session, "스트레칭")}
+    assert titles == {"아침 스트레칭", "저녁 스트레칭"}
+
+    # LIKE 검색으로 대체해도 세션의 다른 작업은 롤백되지 않음
+    session.commit()
+    assert session.query(Video).filter_by(title="저녁 스트레칭").count() == 1
+
+
+def test_search_empty_keyword():
+    assert repository.search_videos(None, "  ") == []
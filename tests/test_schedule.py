@@ -0,0 +1,72 @@
+from schedule import ScheduleEntry, ScheduleIndex, MINUTES_PER_DAY, MINUTES_PER_WEEK
+
+
+def entry(entry_id, weekday, start, end, page_id=1, priority=0):
+    return ScheduleEntry(entry_id, weekday, start, end, page_id, priority)
+
+
+def week_minute(weekday, hour, minute=0):
+    return weekday * MINUTES_PER_DAY + hour * 60 + minute
+
+
+def test_empty_schedule():
+    index = ScheduleIndex([])
+    assert index.lookup(week_minute(2, 10)) is None
+    assert index.next_change(week_minute(2, 10)) is None
+
+
+def test_overnight_entry_ends_next_day():
+    night = entry(1, 2, 22 * 60, 2 * 60)  # 수 22:00 - 목 02:00
+    index = ScheduleIndex([night])
+    assert index.lookup(week_minute(2, 21, 59)) is None
+    assert index.lookup(week_minute(2, 23)) == night
+    assert index.lookup(week_minute(3, 1, 59)) == night
+    assert index.lookup(week_minute(3, 2)) is None
+
+
+def test_sunday_night_wraps_to_monday():
+    night = entry(1, 6, 23 * 60, 1 * 60)  # 일 23:00 - 월 01:00
+    index = ScheduleIndex([night])
+    assert index.lookup(week_minute(6, 23, 30)) == night
+    assert index.lookup(week_minute(0, 0, 30)) == night
+    assert index.lookup(week_minute(0, 1)) is None
+    # 주 경계를 넘은 시각도 같은 주간 시각으로 조회
+    assert index.lookup(MINUTES_PER_WEEK + 30) == night
+
+
+def test_higher_priority_wins_overlap():
+    low = entry(1, 0, 9 * 60, 12 * 60, page_id=1, priority=0)
+    high = entry(2, 0, 10 * 60, 11 * 60, page_id=2, priority=5)
+    index = ScheduleIndex([high, low])
+    assert index.lookup(week_minute(0, 9, 30)) == low
+    assert index.lookup(week_minute(0, 10, 30)) == high
+    assert index.lookup(week_minute(0, 11, 30)) == low
+
+
+def test_priority_tie_prefers_later_entry():
+    first = entry(1, 0, 9 * 60, 12 * 60, page_id=1)
+    later = entry(2, 0, 9 * 60, 12 * 60, page_id=2)
+    assert ScheduleIndex([later, first]).lookup(week_minute(0, 10)) == later
+    assert ScheduleIndex([first, later]).lookup(week_minute(0, 10)) == later
+
+
+def test_next_change_within_week():
+    morning = entry(1, 1, 9 * 60, 10 * 60)
+    index = ScheduleIndex([morning])
+    assert index.next_change(week_minute(1, 8)) == (week_minute(1, 9), morning)
+    assert index.next_change(week_minute(1, 9, 30)) == (week_minute(1, 10), None)
+
+
+def test_next_change_wraps_to_next_week():
+    monday = entry(1, 0, 9 * 60, 10 * 60)
+    index = ScheduleIndex([monday])
+    when, upcoming = index.next_change(week_minute(4, 12))
+    assert when == MINUTES_PER_WEEK + week_minute(0, 9)
+    assert upcoming == monday
+
+
+def test_next_change_skips_boundaries_with_same_winner():
+    low = entry(1, 0, 9 * 60, 12 * 60, priority=0)
+    hidden = entry(2, 0, 10 * 60, 11 * 60, priority=-1)  # 우선순위가 낮아 가려진 편성
+    index = ScheduleIndex([low, hidden])
+    assert index.next_change(week_minute(0, 9, 30)) == (week_minute(0, 12), None)
@@ -0,0 +1,207 @@
+import pytest
+from config_service import get_config_service
+from models import Video, Page, PageVideo
+from simulation import PageSimulation
+
+
+@pytest.fixture
+def make_page(qapp, engine, session):
+    get_config_service(engine).save({'start_countdown': 3, 'zoom_duration': 10})
+
+    def make_page(*videos):
+        # videos: (제목, 길이(분) 또는 None)
+        page = Page(name="시뮬레이션")
+        session.add(page)
+        session.flush()
+        for order, (title, duration) in enumerate(videos, 1):
+            video = Video(title=title, url=f"https://www.youtube.com/watch?v={title:0>11}", duration=duration)
+            session.add(video)
+            session.flush()
+            session.add(PageVideo(page_id=page.id, video_id=video.id, order=order))
+        session.commit()
+        return page.id
+    return make_page
+
+
+@pytest.fixture
+def simulate(engine):
+    simulations = []
+
+    def simulate(page_id, start_at=None):
+        simulation = PageSimulation(engine, page_id, start_at=start_at)
+        simulations.append(simulation)
+        return simulation
+    yield simulate
+    for simulation in simulations:
+        simulation.close()
+
+
+def events(trace, *names):
+    return [(entry['t'], entry['event'], entry.get('title', entry.get('text'))) for entry in trace
+            if entry['event'] in names]
+
+
+def labels(trace, target):
+    return [(entry['t'], entry['text']) for entry in trace if entry['event'] == 'label' and entry['target'] == target]
+
+
+def test_countdown_ticks_every_second(make_page, simulate):
+    result = simulate(make_page(("first", 0.05))).run()
+    assert labels(result['trace'], 'header') == [(0, "00:03"), (1000, "00:02"), (2000, "00:01"), (3000, "START")]
+
+
+def test_segments_run_in_order_with_their_durations(make_page, simulate):
+    result = simulate(make_page(("first", 0.05), ("second", None), ("third", 0.1))).run()
+
+    # 카운트다운 3초 + 첫 확대 지연 100ms 뒤 시작, 영상 길이(없으면 확대 유지 시간)마다 전환
+    assert events(result['trace'], 'zoom') == [(3100, 'zoom', "first"), (6100, 'zoom', "second"),
+                                              (16100, 'zoom', "third")]
+    assert events(result['trace'], 'play', 'stop')[:4] == [
+        (3100, 'play', "first"), (6100, 'stop', "first"), (6100, 'play', "second"), (16100, 'stop', "second"),
+    ]
+    assert labels(result['trace'], 'tile0') == [(0, "3s"), (4100, "2s"), (5100, "1s"), (6100, "DONE")]
+    assert result['completed']
+    assert result['virtual_ms'] < 16100 + 6000 + 1000
+
+
+def test_empty_page_does_not_complete(make_page, simulate):
+    result = simulate(make_page()).run(until=60000)
+    assert not result['completed']
+    assert events(result['trace'], 'zoom') == []
+
+
+def test_pending_playlist_applies_at_segment_boundary(make_page, simulate, session):
+    page_id = make_page(("first", 0.05), ("second", 0.05), ("third", 0.05))
+    simulation = simulate(page_id)
+    page = simulation.page
+    simulation.run(until=4000)  # 첫 영상 재생 중
+    first_player, second_player = page.video_players[:2]
+
+    # 재생 중에 두 번째 칸의 영상을 바꿈
+    replacement = Video(title="replaced", url="https://www.youtube.com/watch?v=replacedvid", duration=0.05)
+    session.add(replacement)
+    session.flush()
+    session.query(PageVideo).filter_by(page_id=page_id, order=2).update({'video_id': replacement.id})
+    session.commit()
+    page.on_database_changed(frozenset({'page_videos'}))
+
+    # 재생 중인 영상은 끊지 않고 대기
+    assert page.pending_videos is not None
+    assert page.video_players[1] is second_player
+
+    result = simulation.run()
+    assert page.pending_videos is None
+    assert page.video_players[0] is first_player  # 바뀌지 않은 칸은 그대로
+    assert second_player not in page.video_players
+    assert events(result['trace'], 'zoom') == [(3100, 'zoom', "first"), (6100, 'zoom', "replaced"),
+                                              (9100, 'zoom', "third")]
+    assert result['completed']
+
+
+def test_teardown_releases_watcher_and_players(make_page, simulate):
+    simulation = simulate(make_page(("first", 0.05), ("second", 0.05)))
+    page = simulation.page
+    watcher = page.change_watcher
+    assert watcher.users == 1 and watcher.timer.isActive()
+    simulation.run(until=4000)
+    players = list(page.video_players)
+
+    page.teardown()
+    assert watcher.users == 0
+    assert not watcher.timer.isActive() and watcher.connection is None
+    assert page.video_players == []
+    assert all(player.is_released and not player.is_playing for player in players)
+    assert not any(timer.isActive() for timer in (page.countdown_timer, page.zoom_timer, page.video_timer))
+
+    page.teardown()  # 여러 번 호출해도 참조 수는 그대로
+    assert watcher.users == 0
+
+
+def test_load_page_reuses_window_and_releases_old_players(make_page, simulate):
+    first_page = make_page(("first", 0.05), ("second", 0.05))
+    next_page = make_page(("next", 0.05))
+    simulation = simulate(first_page)
+    page = simulation.page
+    simulation.run(until=4000)
+    old_players = list(page.video_players)
+
+    page.prepare_page(next_page)
+    prepared_players = list(page.prepared_page[3])
+    page.load_page(next_page)
+
+    assert all(player.is_released for player in old_players)
+    assert page.video_players == prepared_players and not any(player.is_released for player in prepared_players)
+    assert page.change_watcher.users == 1  # 창을 재사용하므로 감시도 그대로
+
+    simulation.trace.clear()
+    start = simulation.clock.now
+    result = simulation.run()
+    assert [(t - start, title) for t, _, title in events(result['trace'], 'zoom')] == [(3100, "next")]
+    assert result['completed']
+
+    watcher = page.change_watcher
+    page.teardown()
+    assert watcher.users == 0
+    assert all(player.is_released for player in prepared_players)
+
+
+def test_teardown_releases_prepared_page(make_page, simulate):
+    simulation = simulate(make_page(("first", 0.05)))
+    page = simulation.page
+    page.prepare_page(make_page(("next", 0.05)))
+    prepared_players = list(page.prepared_page[3])
+
+    page.teardown()
+    assert page.prepared_page is None
+    assert all(player.is_released for player in prepared_players)
+
+
+# --- 동기화 모드 (공통 시작 시각 start_at) ---
+
+def test_synchronized_start_matches_unsynchronized_schedule(make_page, simulate):
+    page_id = make_page(("first", 0.05), ("second", None))
+    plain = simulate(page_id).run()
+    synced = simulate(page_id, start_at=0).run()
+    assert events(synced['trace'], 'zoom', 'complete') == events(plain['trace'], 'zoom', 'complete')
+
+
+def test_late_screen_joins_countdown_in_progress(make_page, simulate):
+    result = simulate(make_page(("first", 0.05)), start_at=-1.5).run()
+    # 생성 직후 기록된 첫 레이블 다음, 같은 시각에 합류 타이머가 남은 카운트다운으로 바꿈
+    assert labels(result['trace'], 'header') == [(0, "00:03"), (0, "00:02"), (500, "00:01"), (1500, "START")]
+    assert events(result['trace'], 'zoom') == [(1600, 'zoom', "first")]
+
+
+def test_late_screen_jumps_to_current_segment(make_page, simulate):
+    # 카운트다운 3초, 영상 3100-6100, 6100-16100, 16100-19100 중 8.6초 지점에 합류
+    simulation = simulate(make_page(("first", 0.05), ("second", None), ("third", 0.05)), start_at=-8.6)
+    result = simulation.run()
+
+    # 지나간 영상은 재생하지 않고 두 번째 영상 남은 시간부터 표시
+    assert events(result['trace'], 'zoom', 'play')[:2] == [(0, 'zoom', "second"), (0, 'play', "second")]
+    assert "first" not in [title for _, _, title in events(result['trace'], 'play')]
+    assert labels(result['trace'], 'header') == [(0, "00:03"), (0, "START")]
+    assert labels(result['trace'], 'tile0') == [(0, "3s"), (0, "DONE")]
+    assert labels(result['trace'], 'tile1')[:4] == [(0, "10s"), (0, "8s"), (500, "7s"), (1500, "6s")]
+    assert events(result['trace'], 'zoom')[1:] == [(7500, 'zoom', "third")]
+    assert result['completed']
+
+
+def test_late_screen_after_schedule_end_completes(make_page, simulate):
+    result = simulate(make_page(("first", 0.05)), start_at=-60).run()
+    assert events(result['trace'], 'zoom', 'play', 'complete') == [(0, 'complete', None)]
+    assert result['timer_fires'] == 1  # 합류 타이머만 실행
+
+
+# --- 볼륨 ---
+
+def test_volume_reaches_players_from_remote_command_and_config(make_page, simulate, engine):
+    page = simulate(make_page(("first", 0.05), ("second", 0.05))).page
+    assert [player.volume for player in page.video_players] == [50, 50]
+
+    page.set_volume(30)  # 원격 제어 volume 명령
+    assert [player.volume for player in page.video_players] == [30, 30]
+
+    get_config_service(engine).save({'volume': 70})  # 설정 변경 반영
+    assert [player.volume for player in page.video_players] == [70, 70]
+    assert page.playback_status()['volume'] == 70
@@ -0,0 +1,167 @@
+import os
+import logging
+import urllib.request
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, QRect, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QApplication
+import youtube
+
+logger = logging.getLogger("DreamBodyVideo.Thumbnails")
+
+# 목록용 썸네일 로더
+# - 화면에 그려지는 행만 요청하고, 워커 스레드에서 행 높이 크기로 바로 디코딩
+# - 캐시에 없는 썸네일은 내려받아 ~/.dreambody_cache에 저장 (재생 페이지와 공유)
+# - 디코딩된 이미지는 개수 제한이 있는 LRU 캐시에 보관
+
+DOWNLOAD_TIMEOUT = 5
+
+
+class _ThumbnailSignals(QObject):
+    loaded = pyqtSignal(str, QImage)
+    failed = pyqtSignal(str)
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, video_id, size, signals):
+        super().__init__()
+        self.video_id = video_id
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        try:
+            path = youtube.thumbnail_cache_path(self.video_id)
+            if not os.path.exists(path):
+                self.download(path)
+            image = self.decode(path)
+        except Exception as e:
+            logger.debug(f"썸네일 로드 실패 ({self.video_id}): {e}")
+            image = None
+
+        try:
+            if image is None or image.isNull():
+                self.signals.failed.emit(self.video_id)
+            else:
+                self.signals.loaded.emit(self.video_id, image)
+        except RuntimeError:
+            pass  # 애플리케이션 종료 중
+
+    def download(self, path):
+        os.makedirs(youtube.CACHE_DIR, exist_ok=True)
+        with urllib.request.urlopen(youtube.thumbnail_url(self.video_id), timeout=DOWNLOAD_TIMEOUT) as response:
+            data = response.read()
+
+        # 다른 곳에서 읽는 도중 반쯤 쓰인 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{os.getpid()}.part"
+        with open(temp_path, 'wb') as fp:
+            fp.write(data)
+        os.replace(temp_path, path)
+
+    def decode(self, path):
+        # 원본 크기로 디코딩하지 않고 목표 크기로 줄여서 읽음
+        reader = QImageReader(path)
+        original = reader.size()
+        if original.isValid():
+            reader.setScaledSize(original.scaled(self.size, Qt.KeepAspectRatio))
+        return reader.read()
+
+
+class ThumbnailCache(QObject):
+    """
+    YouTube 영상 ID별 썸네일 QPixmap 캐시.
+
+    pixmap()은 캐시에 있으면 바로 돌려주고, 없으면 로드를 예약한 뒤 None을 반환한다.
+    로드가 끝나면 thumbnail_ready 시그널이 발생한다. 대기 중인 요청은 가장 최근 것부터 처리하며,
+    max_pending을 넘으면 오래된 요청(이미 화면 밖으로 스크롤된 행)을 버린다.
+    """
+    thumbnail_ready = pyqtSignal(str)
+
+    def __init__(self, size, max_items=300, max_workers=4, max_pending=64, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.max_items = max_items
+        self.max_pending = max_pending
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers)
+
+        self._pixmaps = OrderedDict()
+        self._pending = OrderedDict()
+        self._running = set()
+        self._failed = set()
+
+        self.signals = _ThumbnailSignals()
+        self.signals.loaded.connect(self._on_loaded)
+        self.signals.failed.connect(self._on_failed)
+
+    def pixmap(self, video_id):
+        pixmap = self._pixmaps.get(video_id)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(video_id)
+            return pixmap
+
+        if video_id not in self._failed and video_id not in self._running:
+            self._request(video_id)
+        return None
+
+    def clear(self):
+        self._pixmaps.clear()
+        self._pending.clear()
+        self._failed.clear()
+
+    def _request(self, video_id):
+        self._pending[video_id] = True
+        self._pending.move_to_end(video_id)
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._pending and len(self._running) < self.pool.maxThreadCount():
+            video_id, _ = self._pending.popitem(last=True)
+            self._running.add(video_id)
+            self.pool.start(_ThumbnailTask(video_id, self.size, self.signals))
+
+    def _on_loaded(self, video_id, image):
+        self._running.discard(video_id)
+        self._pixmaps[video_id] = QPixmap.fromImage(image)
+        while len(self._pixmaps) > self.max_items:
+            self._pixmaps.popitem(last=False)
+        self._dispatch()
+        self.thumbnail_ready.emit(video_id)
+
+    def _on_failed(self, video_id):
+        self._running.discard(video_id)
+        self._failed.add(video_id)
+        self._dispatch()
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """
+    썸네일 열 그리기. 뷰는 화면에 보이는 셀만 그리므로 보이는 행의 썸네일만 요청된다.
+    index.data(role)는 YouTube 영상 ID를 돌려주어야 한다.
+    """
+
+    def __init__(self, cache, role, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.role = role
+
+    def paint(self, painter, option, index):
+        # 선택 배경 등 기본 항목 모양만 그림
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        video_id = index.data(self.role)
+        pixmap = self.cache.pixmap(video_id) if video_id else None
+        if pixmap is None:
+            return
+
+        target = QRect(0, 0, pixmap.width(), pixmap.height())
+        target.moveCenter(option.rect.center())
+        painter.drawPixmap(target, pixmap)
+
+    def sizeHint(self, option, index):
+        return QSize(self.cache.size)
@@ -0,0 +1,305 @@
+import logging
+from PyQt5.QtCore import Qt, QAbstractTableModel, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+import repository
+import youtube
+from health_check import STATUS_LABELS, is_broken
+
+logger = logging.getLogger("DreamBodyVideo.VideoModels")
+
+# (헤더, 레코드 키, 기본 열 너비)
+COLUMNS = [
+    ("ID", 'id', 60),
+    ("썸네일", 'thumbnail', 80),
+    ("제목", 'title', 280),
+    ("URL", 'url', 320),
+    ("운동 타입", 'exercise_type', 100),
+    ("난이도", 'difficulty', 80),
+    ("길이(분:초)", 'duration', 90),
+    ("링크 상태", 'health_status', 90),
+]
+
+
+# 썸네일 열에서 YouTube 영상 ID를 돌려주는 역할
+THUMBNAIL_ROLE = Qt.UserRole + 1
+
+
+def column_for_key(key):
+    return next(column for column, (_, column_key, _) in enumerate(COLUMNS) if column_key == key)
+
+
+def format_duration(duration):
+    # 길이를 분:초 형식으로 표시
+    if duration is None:
+        return ""
+    minutes = int(duration)
+    seconds = int((duration - minutes) * 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def descending_ranges(rows):
+    """행 번호들을 뒤에서부터 (시작, 끝) 연속 구간으로 묶는다 (앞쪽 행 번호가 바뀌지 않도록)."""
+    ranges = []
+    for row in sorted(set(rows), reverse=True):
+        if ranges and row == ranges[-1][0] - 1:
+            ranges[-1][0] = row
+        else:
+            ranges.append([row, row])
+    return [tuple(r) for r in ranges]
+
+
+class VideoTableModel(QAbstractTableModel):
+    """
+    영상 목록 모델 - 뷰가 스크롤할 때마다 한 페이지씩 워커 스레드에서 가져온다.
+    """
+    loading_changed = pyqtSignal(bool)
+    total_changed = pyqtSignal(int)
+
+    def __init__(self, data_service, page_size=200, parent=None):
+        super().__init__(parent)
+        self.data_service = data_service
+        self.page_size = page_size
+        self.records = []
+        self.row_by_id = {}
+        self.total = None
+        self._has_more = True
+        self._loading = False
+        self._generation = 0
+
+    # --- Qt 모델 인터페이스 ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        record = self.records[index.row()]
+        key = COLUMNS[index.column()][1]
+
+        if key == 'thumbnail':
+            return youtube.extract_video_id(record['url']) if role == THUMBNAIL_ROLE else None
+
+        if key == 'health_status':
+            status = record.get('health_status')
+            if role == Qt.DisplayRole:
+                return STATUS_LABELS.get(status, "미검사" if status is None else status)
+            if role == Qt.ForegroundRole and is_broken(status):
+                return QColor("#c00")
+            if role == Qt.ToolTipRole and record.get('health_checked_at'):
+                return f"마지막 검사: {record['health_checked_at']:%Y-%m-%d %H:%M} (UTC)"
+
+        if role == Qt.DisplayRole:
+            value = record[key]
+            if key == 'duration':
+                return format_duration(value)
+            return "" if value is None else str(value)
+        if role == Qt.UserRole:
+            return record
+        if role == Qt.TextAlignmentRole and key in ('id', 'duration', 'health_status'):
+            return Qt.AlignCenter
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+
+        after_id = self.records[-1]['id'] if self.records else None
+        generation = self._generation
+        self._set_loading(True)
+
+        self.data_service.submit(
+            repository.fetch_videos_page, after_id, self.page_size,
+            on_result=lambda page: self._on_page_loaded(generation, page),
+            on_error=lambda error: self._on_page_failed(generation, error)
+        )
+
+    # --- 데이터 로딩 ---
+
+    def refresh(self):
+        # 진행 중인 요청 결과는 무시하도록 세대 번호 증가
+        self._generation += 1
+        self.beginResetModel()
+        self.records = []
+        self.row_by_id = {}
+        self._has_more = True
+        self._loading = False
+        self.endResetModel()
+
+        generation = self._generation
+        self.data_service.submit(
+            repository.count_videos,
+            on_result=lambda total: self._on_total_loaded(generation, total)
+        )
+        self.fetchMore()
+
+    def _set_loading(self, loading):
+        if self._loading != loading:
+            self._loading = loading
+            self.loading_changed.emit(loading)
+
+    def _on_total_loaded(self, generation, total):
+        if generation == self._generation:
+            self.total = total
+            self.total_changed.emit(total)
+
+    def _on_page_loaded(self, generation, page):
+        if generation != self._generation:
+            return
+
+        self._has_more = len(page) == self.page_size
+        if page:
+            first = len(self.records)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self.records.extend(page)
+            for row, record in enumerate(page, first):
+                self.row_by_id[record['id']] = row
+            self.endInsertRows()
+        logger.info(f"영상 {len(page)}개 로드 (누적 {len(self.records)}개)")
+        self._set_loading(False)
+
+    def _on_page_failed(self, generation, error):
+        if generation == self._generation:
+            self._set_loading(False)
+
+    def record(self, row):
+        if 0 <= row < len(self.records):
+            return self.records[row]
+        return None
+
+    def is_loading(self):
+        return self._loading
+
+    # --- 변경 사항 반영 (전체 다시 읽기 없이 해당 행만 갱신) ---
+
+    def _set_total(self, total):
+        if self.total is not None:
+            self.total = total
+            self.total_changed.emit(total)
+
+    def insert_record(self, record):
+        if self.total is not None:
+            self._set_total(self.total + 1)
+
+        # 아직 가져오지 않은 페이지가 있으면 새 영상(가장 큰 ID)은 스크롤 시 함께 로드됨
+        if self._has_more or record['id'] in self.row_by_id:
+            return
+
+        row = len(self.records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.records.append(record)
+        self.row_by_id[record['id']] = row
+        self.endInsertRows()
+
+    def update_record(self, record):
+        row = self.row_by_id.get(record['id'])
+        if row is None:
+            return
+
+        self.records[row] = record
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+
+    def update_records(self, records):
+        # 변경된 행 범위를 한 번의 dataChanged로 알림
+        rows = []
+        for record in records:
+            row = self.row_by_id.get(record['id'])
+            if row is not None:
+                self.records[row] = record
+                rows.append(row)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(COLUMNS) - 1))
+
+    def remove_ids(self, video_ids):
+        rows = [self.row_by_id[video_id] for video_id in video_ids if video_id in self.row_by_id]
+        if self.total is not None:
+            self._set_total(max(0, self.total - len(video_ids)))
+        if not rows:
+            return
+
+        # 연속된 행은 한 번에 제거
+        for start, end in descending_ranges(rows):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self.records[start:end + 1]
+            self.endRemoveRows()
+
+        self.row_by_id = {record['id']: row for row, record in enumerate(self.records)}
+
+
+class VideoChoiceModel(QAbstractListModel):
+    """
+    영상 선택 콤보박스들이 함께 사용하는 (ID, 제목) 목록 모델. 0번 행은 "선택 안 함".
+    """
+    NONE_TEXT = "-- 선택 안 함 --"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.choices = []
+        self.row_by_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.choices) + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        # 편집 가능한 콤보박스는 EditRole로 항목 이름을 읽음
+        row = index.row()
+        if row == 0:
+            return self.NONE_TEXT if role in (Qt.DisplayRole, Qt.EditRole) else None
+
+        choice = self.choices[row - 1]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return f"{choice['id']}: {choice['title']}"
+        if role == Qt.UserRole:
+            return choice['id']
+        return None
+
+    def set_choices(self, choices):
+        self.beginResetModel()
+        self.choices = list(choices)
+        self._reindex()
+        self.endResetModel()
+
+    def _reindex(self):
+        self.row_by_id = {choice['id']: row for row, choice in enumerate(self.choices, 1)}
+
+    def row_for_id(self, video_id):
+        # 선택 안 함 또는 목록에 없는 ID는 0번 행
+        return self.row_by_id.get(video_id, 0)
+
+    def upsert_choice(self, record):
+        choice = {'id': record['id'], 'title': record['title']}
+        row = self.row_by_id.get(choice['id'])
+        if row is not None:
+            self.choices[row - 1] = choice
+            self.dataChanged.emit(self.index(row), self.index(row))
+            return
+
+        row = len(self.choices) + 1
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.choices.append(choice)
+        self.row_by_id[choice['id']] = row
+        self.endInsertRows()
+
+    def remove_ids(self, video_ids):
+        rows = [self.row_by_id[video_id] for video_id in video_ids if video_id in self.row_by_id]
+        for start, end in descending_ranges(rows):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self.choices[start - 1:end]
+            self.endRemoveRows()
+        if rows:
+            self._reindex()
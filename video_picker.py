@@ -0,0 +1,113 @@
+import logging
+from PyQt5.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtWidgets import QComboBox, QCompleter
+import repository
+
+logger = logging.getLogger("DreamBodyVideo.VideoPicker")
+
+
+class VideoSearchModel(QAbstractListModel):
+    """검색 결과 목록 (자동 완성 팝업용)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        result = self.results[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            details = " / ".join(value for value in (result['exercise_type'], result['difficulty']) if value)
+            text = f"{result['id']}: {result['title']}"
+            return f"{text}  ({details})" if details else text
+        if role == Qt.UserRole:
+            return result['id']
+        return None
+
+    def set_results(self, results):
+        self.beginResetModel()
+        self.results = results
+        self.endResetModel()
+
+
+class VideoPicker(QComboBox):
+    """
+    검색 가능한 영상 선택 콤보박스.
+
+    목록은 공유 VideoChoiceModel을 사용하고, 입력한 글자는 DB의 전문 검색 인덱스로 조회해
+    자동 완성 팝업에 표시한다. 선택한 ID는 모델의 ID→행 인덱스로 바로 찾는다.
+    """
+    video_changed = pyqtSignal(object)  # 선택된 영상 ID (선택 안 함이면 None)
+
+    SEARCH_DELAY_MS = 150
+    RESULT_LIMIT = 50
+
+    def __init__(self, choice_model, data_service, parent=None):
+        super().__init__(parent)
+        self.choice_model = choice_model
+        self.data_service = data_service
+        self._search_generation = 0
+
+        self.setModel(choice_model)
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.NoInsert)
+        self.lineEdit().setPlaceholderText("제목, 운동 타입, 난이도로 검색")
+
+        # 서버(DB) 쪽에서 걸러진 결과를 그대로 보여주는 자동 완성
+        self.search_model = VideoSearchModel(self)
+        self.search_completer = QCompleter(self.search_model, self)
+        self.search_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.search_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.search_completer.activated[QModelIndex].connect(self.on_search_result_activated)
+        self.setCompleter(self.search_completer)
+
+        # 입력이 멈춘 뒤 검색 (타이핑마다 쿼리하지 않도록)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.lineEdit().textEdited.connect(lambda _text: self.search_timer.start())
+        self.lineEdit().editingFinished.connect(self.restore_current_text)
+        self.currentIndexChanged.connect(lambda _index: self.video_changed.emit(self.video_id()))
+
+    def video_id(self):
+        return self.currentData()
+
+    def set_video_id(self, video_id):
+        self.setCurrentIndex(self.choice_model.row_for_id(video_id))
+
+    def run_search(self):
+        keyword = self.lineEdit().text()
+        self._search_generation += 1
+        generation = self._search_generation
+
+        self.data_service.submit(
+            repository.search_videos, keyword, self.RESULT_LIMIT,
+            on_result=lambda results: self.on_search_results(generation, results)
+        )
+
+    def on_search_results(self, generation, results):
+        # 가장 최근 입력에 대한 결과만 표시
+        if generation != self._search_generation or not self.lineEdit().hasFocus():
+            return
+
+        self.search_model.set_results(results)
+        if results:
+            self.search_completer.complete()
+
+    def on_search_result_activated(self, index):
+        video_id = index.data(Qt.UserRole)
+        self.set_video_id(video_id)
+        # 자동 완성이 입력란에 쓴 검색 결과 문자열을 선택 항목 이름으로 교체
+        QTimer.singleShot(0, self.restore_current_text)
+
+    def restore_current_text(self):
+        # 검색어 입력 후 선택 없이 벗어나면 현재 선택된 영상 이름으로 되돌림
+        if self.currentIndex() >= 0:
+            self.lineEdit().setText(self.itemText(self.currentIndex()))
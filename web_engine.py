@@ -0,0 +1,35 @@
+import logging
+
+logger = logging.getLogger("DreamBodyVideo.WebEngine")
+
+# QtWebEngine 초기화
+# - 모듈 import는 QApplication 생성 전에 해야 하므로 preload()만 시작 시 호출
+# - 전역 설정은 처음 웹 뷰를 만들 때 configure()로 한 번만 적용 (관리자 창 시작을 늦추지 않도록)
+
+_configured = False
+
+
+def preload():
+    # QtWebEngineWidgets는 QCoreApplication이 만들어지기 전에 import되어야 함
+    import PyQt5.QtWebEngineWidgets  # noqa: F401
+
+
+def configure():
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+
+    logger.info("WebEngine 설정 구성")
+    settings = QWebEngineSettings.globalSettings()
+    settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
+    settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
+    settings.setAttribute(QWebEngineSettings.PluginsEnabled, True)
+    settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
+    settings.setAttribute(QWebEngineSettings.JavascriptCanAccessClipboard, True)
+    settings.setAttribute(QWebEngineSettings.FullScreenSupportEnabled, True)
+    settings.setAttribute(QWebEngineSettings.PlaybackRequiresUserGesture, False)
+    settings.setAttribute(QWebEngineSettings.WebGLEnabled, True)
+    settings.setAttribute(QWebEngineSettings.Accelerated2dCanvasEnabled, True)
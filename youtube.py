@@ -0,0 +1,89 @@
+import os
+import re
+from urllib.parse import quote
+
+# YouTube URL/썸네일 관련 공통 함수 (Qt 없이 사용 가능)
+
+CACHE_DIR = os.environ.get('DREAMBODY_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.dreambody_cache')
+
+# 썸네일/oEmbed/임베드 주소
+# DREAMBODY_YOUTUBE_BASE 환경 변수(또는 set_base())로 로컬 테스트 서버(youtube_standin.py)를 가리킬 수 있음
+BASE_ENV = 'DREAMBODY_YOUTUBE_BASE'
+DEFAULT_THUMBNAIL_BASE = "https://img.youtube.com/vi"
+DEFAULT_OEMBED_BASE = "https://www.youtube.com/oembed"
+DEFAULT_EMBED_BASE = "https://www.youtube.com/embed"
+
+THUMBNAIL_BASE = DEFAULT_THUMBNAIL_BASE
+OEMBED_BASE = DEFAULT_OEMBED_BASE
+EMBED_BASE = DEFAULT_EMBED_BASE
+
+# 유튜브 URL 패턴
+VIDEO_ID_PATTERNS = [
+    re.compile(r'(?:https?:\/\/)?(?:www\.|m\.)?youtube\.com\/watch\?(?:[^#\s]*&)?v=([A-Za-z0-9_-]+)'),
+    re.compile(r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([A-Za-z0-9_-]+)'),
+    re.compile(r'(?:https?:\/\/)?(?:www\.)?youtube(?:-nocookie)?\.com\/(?:embed|shorts|live)\/([A-Za-z0-9_-]+)'),
+]
+
+# 영상 ID만 입력한 경우 (YouTube ID는 11자)
+BARE_VIDEO_ID = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+
+def extract_video_id(url):
+    if not url:
+        return None
+
+    url = url.strip()
+    for pattern in VIDEO_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+
+    if BARE_VIDEO_ID.match(url):
+        return url
+    return None
+
+
+def canonical_url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def normalize_url(url):
+    """
+    여러 형태의 YouTube URL을 (영상 ID, 표준 URL)로 변환. 인식할 수 없으면 ValueError.
+    """
+    video_id = extract_video_id(url)
+    if not video_id:
+        raise ValueError(f"YouTube URL이 아닙니다: {url}")
+    return video_id, canonical_url(video_id)
+
+
+def set_base(base):
+    """
+    모든 YouTube 주소를 base 아래(base/vi, base/oembed, base/embed)로 바꿈. None이면 실제 주소로 되돌림.
+    """
+    global THUMBNAIL_BASE, OEMBED_BASE, EMBED_BASE
+
+    if base:
+        base = base.rstrip('/')
+        THUMBNAIL_BASE, OEMBED_BASE, EMBED_BASE = f"{base}/vi", f"{base}/oembed", f"{base}/embed"
+    else:
+        THUMBNAIL_BASE, OEMBED_BASE, EMBED_BASE = DEFAULT_THUMBNAIL_BASE, DEFAULT_OEMBED_BASE, DEFAULT_EMBED_BASE
+
+
+set_base(os.environ.get(BASE_ENV))
+
+
+def thumbnail_url(video_id, base=None):
+    return f"{base or THUMBNAIL_BASE}/{video_id}/mqdefault.jpg"
+
+
+def oembed_url(video_id, base=None):
+    return f"{base or OEMBED_BASE}?format=json&url={quote(canonical_url(video_id), safe='')}"
+
+
+def embed_url(video_id):
+    return f"{EMBED_BASE}/{video_id}"
+
+
+def thumbnail_cache_path(video_id):
+    return os.path.join(CACHE_DIR, f"{video_id}.jpg")
@@ -0,0 +1,436 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import json
+import time
+import base64
+import random
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import youtube
+
+logger = logging.getLogger("DreamBodyVideo.Standin")
+
+# 로컬 YouTube 대역 서버 (성능 측정/테스트를 네트워크 없이 재현 가능하게 실행)
+#
+#   /vi/<ID>/<이름>.jpg   썸네일 (JPEG, 크기 지정 가능)
+#   /oembed?url=...       oEmbed (영상 없음 404, 퍼가기 금지 401)
+#   /embed/<ID>           임베드 페이지 (가짜 플레이어, 상태를 document.title/postMessage로 알림,
+#                         enablejsapi=1이면 postMessage 명령(setVolume 등) 처리)
+#   /iframe_api           YT.Player(onReady/onStateChange/onError)를 흉내 내는 스크립트
+#   /__stats              경로별 요청 수 (JSON)
+#
+# 앱에서 사용: DREAMBODY_YOUTUBE_BASE=http://127.0.0.1:<포트> (youtube.set_base()와 같음)
+# 응답 지연(latency/jitter), 대역폭 제한, 무작위 오류를 설정할 수 있고 seed로 재현 가능.
+
+DEFAULT_PORT = 8765
+CHUNK_SIZE = 4096
+
+# 16x9 회색 JPEG - 썸네일 크기는 COM 세그먼트로 채워 맞춤
+THUMBNAIL_JPEG = base64.b64decode(
+    "/9j/4AAQSkZJRgABAQEAZABkAAD/2wBDABALDA4MChAODQ4SERATGCgaGBYWGDEjJR0oOjM9PDkzODdASFxOQERXRTc4UG1RV19iZ2hnPk1x"
+    "eXBkeFxlZ2P/2wBDARESEhgVGC8aGi9jQjhCY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2P/wAAR"
+    "CAAJABADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEG"
+    "E1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWG"
+    "h4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEB"
+    "AQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYk"
+    "NOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0"
+    "tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwCpRRRWxif/2Q=="
+)
+
+# YouTube 플레이어 오류 코드
+ERROR_NOT_FOUND = 100
+ERROR_EMBED_DISABLED = 150
+
+IFRAME_API_JS = """(function () {
+  var CONFIG = %(config)s;
+  var State = { UNSTARTED: -1, ENDED: 0, PLAYING: 1, PAUSED: 2, BUFFERING: 3, CUED: 5 };
+
+  function Player(element, options) {
+    var self = this;
+    options = options || {};
+    this.events = options.events || {};
+    this.vars = options.playerVars || {};
+    this.videoId = options.videoId;
+    this.state = State.UNSTARTED;
+    this.volume = 100;
+    this.muted = !!this.vars.mute;
+    this.time = 0;
+    this.startedAt = null;
+    this.timers = [];
+
+    var host = typeof element === "string" ? document.getElementById(element) : element;
+    this.frame = document.createElement("div");
+    this.frame.style.cssText = "width:100%%;height:100%%;background:#1e2a38;color:#fff;" +
+      "display:flex;align-items:center;justify-content:center;font:16px Arial,sans-serif";
+    this.frame.textContent = "stand-in " + this.videoId;
+    host.appendChild(this.frame);
+
+    setTimeout(function () {
+      var code = !self.videoId ? 2 : CONFIG.errors[self.videoId];
+      if (code) {
+        self._fire("onError", code);
+        return;
+      }
+      self.ready = true;
+      self._fire("onReady");
+      if (self.vars.autoplay) self.playVideo();
+    }, CONFIG.readyDelay);
+  }
+
+  Player.prototype._fire = function (name, data) {
+    if (this.events[name]) this.events[name]({ target: this, data: data });
+  };
+  Player.prototype._setState = function (state) {
+    this.state = state;
+    this._fire("onStateChange", state);
+  };
+  Player.prototype._later = function (fn, ms) {
+    this.timers.push(setTimeout(fn.bind(this), ms));
+  };
+  Player.prototype._clear = function () {
+    this.timers.forEach(clearTimeout);
+    this.timers = [];
+  };
+  Player.prototype.playVideo = function () {
+    if (!this.ready || this.state === State.PLAYING) return;
+    if (this.state === State.ENDED) this.time = 0;
+    this._clear();
+    this._setState(State.BUFFERING);
+    this._later(function () {
+      this.startedAt = Date.now() - this.time * 1000;
+      this._setState(State.PLAYING);
+      this._later(function () {
+        this.time = CONFIG.duration;
+        this._setState(State.ENDED);
+      }, (CONFIG.duration - this.time) * 1000);
+    }, CONFIG.bufferDelay);
+  };
+  Player.prototype.pauseVideo = function () {
+    this.time = this.getCurrentTime();
+    this._clear();
+    this._setState(State.PAUSED);
+  };
+  Player.prototype.stopVideo = function () {
+    this.time = 0;
+    this._clear();
+    this._setState(State.CUED);
+  };
+  Player.prototype.seekTo = function (seconds) {
+    var playing = this.state === State.PLAYING;
+    this.time = Math.max(0, Math.min(seconds, CONFIG.duration));
+    if (playing) {
+      this.state = State.PAUSED;
+      this.playVideo();
+    }
+  };
+  Player.prototype.getCurrentTime = function () {
+    if (this.state !== State.PLAYING) return this.time;
+    return Math.min((Date.now() - this.startedAt) / 1000, CONFIG.duration);
+  };
+  Player.prototype.getDuration = function () { return CONFIG.duration; };
+  Player.prototype.getPlayerState = function () { return this.state; };
+  Player.prototype.getVideoData = function () { return { video_id: this.videoId }; };
+  Player.prototype.setVolume = function (value) { this.volume = value; };
+  Player.prototype.getVolume = function () { return this.volume; };
+  Player.prototype.mute = function () { this.muted = true; };
+  Player.prototype.unMute = function () { this.muted = false; };
+  Player.prototype.isMuted = function () { return this.muted; };
+  Player.prototype.destroy = function () {
+    this._clear();
+    if (this.frame.parentNode) this.frame.parentNode.removeChild(this.frame);
+  };
+
+  window.YT = { Player: Player, PlayerState: State, loaded: 1 };
+  if (typeof window.onYouTubeIframeAPIReady === "function") {
+    setTimeout(window.onYouTubeIframeAPIReady, 0);
+  }
+})();
+"""
+
+EMBED_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>standin:loading</title>
+<style>html, body, #player {{ margin: 0; width: 100%; height: 100%; overflow: hidden; background: #000; }}</style>
+</head>
+<body>
+<div id="player"></div>
+<script>
+  // 상태를 제목으로 알리고, iframe 안이면 부모 문서에도 postMessage로 전달
+  // (QWebEngineView.titleChanged 등으로 재생 시작 시점 측정 가능)
+  function report(status) {{
+    document.title = "standin:" + status;
+    if (window.parent !== window) window.parent.postMessage({{ standin: status }}, "*");
+  }}
+  var player = null;
+  function onYouTubeIframeAPIReady() {{
+    player = new YT.Player("player", {{
+      videoId: "{video_id}",
+      playerVars: {{ autoplay: {autoplay}, mute: {mute} }},
+      events: {{
+        onReady: function () {{
+          report("ready");
+          if ({jsapi} && window.parent !== window) window.parent.postMessage(JSON.stringify({{ event: "onReady" }}), "*");
+        }},
+        onStateChange: function (event) {{ report("state:" + event.data); }},
+        onError: function (event) {{ report("error:" + event.data); }}
+      }}
+    }});
+  }}
+  // enablejsapi=1이면 부모 문서가 postMessage로 보낸 명령을 실행 (YouTube 임베드 플레이어와 같은 형식)
+  window.addEventListener("message", function (event) {{
+    var data;
+    try {{ data = typeof event.data === "string" ? JSON.parse(event.data) : event.data; }} catch (e) {{ return; }}
+    if (!{jsapi} || !player || !data || data.event !== "command" || typeof player[data.func] !== "function") return;
+    player[data.func].apply(player, data.args || []);
+    if (data.func === "setVolume") report("volume:" + player.getVolume());
+  }});
+</script>
+<script src="/iframe_api"></script>
+</body>
+</html>
+"""
+
+
+def padded_jpeg(size):
+    """
+    SOI 바로 뒤에 디코딩에 영향이 없는 COM(주석) 세그먼트를 넣어 size 바이트 이상으로 맞춤
+    """
+    padding = []
+    remaining = size - len(THUMBNAIL_JPEG)
+    while remaining > 0:
+        length = min(max(remaining - 4, 0), 65533)
+        padding.append(b"\xff\xfe" + (length + 2).to_bytes(2, "big") + b"\0" * length)
+        remaining -= length + 4
+    return THUMBNAIL_JPEG[:2] + b"".join(padding) + THUMBNAIL_JPEG[2:]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "DreamBodyStandin/1.0"
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_HEAD(self):
+        self.handle_request(send_body=False)
+
+    def do_GET(self):
+        self.handle_request(send_body=True)
+
+    def handle_request(self, send_body):
+        standin = self.server.standin
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        route = parts[0] if parts else ""
+
+        if route == "__stats":
+            return self.respond(200, "application/json", json.dumps(standin.stats()).encode(), send_body, throttle=False)
+
+        standin.count(route)
+        standin.delay()
+        status = standin.injected_error()
+        if status:
+            return self.respond(status, "text/plain", b"injected error", send_body)
+
+        if route == "vi" and len(parts) >= 3:
+            if parts[1] in standin.missing:
+                return self.respond(404, "text/plain", b"not found", send_body)
+            return self.respond(200, "image/jpeg", standin.thumbnail, send_body)
+
+        if route == "oembed":
+            video_id = youtube.extract_video_id(parse_qs(url.query).get("url", [""])[0])
+            if not video_id or video_id in standin.missing:
+                return self.respond(404, "text/plain", b"Not Found", send_body)
+            if video_id in standin.embed_disabled:
+                return self.respond(401, "text/plain", b"Unauthorized", send_body)
+            body = json.dumps({
+                "title": f"Stand-in {video_id}", "type": "video", "provider_name": "YouTube",
+                "thumbnail_url": f"{standin.base_url}/vi/{video_id}/hqdefault.jpg"
+            })
+            return self.respond(200, "application/json", body.encode(), send_body)
+
+        if route == "embed" and len(parts) >= 2:
+            query = parse_qs(url.query)
+            html = EMBED_HTML.format(
+                video_id=parts[1].replace('"', ""),
+                autoplay=1 if query.get("autoplay", ["0"])[0] == "1" else 0,
+                mute=1 if query.get("mute", ["0"])[0] == "1" else 0,
+                jsapi=1 if query.get("enablejsapi", ["0"])[0] == "1" else 0,
+            )
+            return self.respond(200, "text/html; charset=utf-8", html.encode(), send_body)
+
+        if route == "iframe_api":
+            return self.respond(200, "application/javascript", standin.iframe_api().encode(), send_body)
+
+        self.respond(404, "text/plain", b"unknown path", send_body)
+
+    def respond(self, status, content_type, body, send_body, throttle=True):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if not send_body:
+            return
+
+        try:
+            if throttle and self.server.standin.bandwidth:
+                # 대역폭 제한: 조각마다 전송 시간만큼 쉬며 보냄
+                for start in range(0, len(body), CHUNK_SIZE):
+                    chunk = body[start:start + CHUNK_SIZE]
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    time.sleep(len(chunk) / self.server.standin.bandwidth)
+            else:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 먼저 끊음
+
+
+class YouTubeStandin:
+    """
+    로컬 YouTube 대역 서버. start()로 백그라운드 스레드에서 실행하고 base_url을 앱에 넘긴다.
+
+    latency_ms/jitter_ms: 응답 전 지연, bandwidth: 초당 바이트 (0이면 제한 없음),
+    error_rate: 무작위로 error_status를 돌려줄 비율, missing/embed_disabled: 문제가 있는 영상 ID.
+    설정값은 실행 중에도 바꿀 수 있다.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, bandwidth=0,
+                 error_rate=0.0, error_status=503, thumbnail_size=12000, ready_delay_ms=50,
+                 buffer_delay_ms=100, duration=60, missing=(), embed_disabled=(), seed=None):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.thumbnail = padded_jpeg(thumbnail_size)
+        self.ready_delay_ms = ready_delay_ms
+        self.buffer_delay_ms = buffer_delay_ms
+        self.duration = duration
+        self.missing = set(missing)
+        self.embed_disabled = set(embed_disabled)
+
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self
+        self.port = self.httpd.server_port
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="youtube-standin", daemon=True)
+        self.thread.start()
+        logger.info(f"YouTube 대역 서버 시작: {self.base_url}")
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
+            logger.info("YouTube 대역 서버 종료")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def count(self, route):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            return dict(self.requests)
+
+    def reset_stats(self):
+        with self.lock:
+            self.requests.clear()
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        delay_ms = max(self.latency_ms + jitter, 0)
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+
+    def injected_error(self):
+        if not self.error_rate:
+            return None
+        with self.lock:
+            return self.error_status if self.random.random() < self.error_rate else None
+
+    def iframe_api(self):
+        errors = {video_id: ERROR_NOT_FOUND for video_id in self.missing}
+        errors.update({video_id: ERROR_EMBED_DISABLED for video_id in self.embed_disabled})
+        config = {
+            "readyDelay": self.ready_delay_ms, "bufferDelay": self.buffer_delay_ms,
+            "duration": self.duration, "errors": errors
+        }
+        return IFRAME_API_JS % {"config": json.dumps(config)}
+
+
+def main(argv=None):
+    """
+    YouTube 대역 서버 실행 명령
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    parser = argparse.ArgumentParser(description="로컬 YouTube 대역 서버 (썸네일/oEmbed/임베드/iframe_api)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="응답 지연 편차 (± ms)")
+    parser.add_argument("--bandwidth", type=float, default=0, help="대역폭 제한 (KB/s, 0이면 제한 없음)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="무작위 오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--thumbnail-size", type=int, default=12000, help="썸네일 크기 (바이트)")
+    parser.add_argument("--ready-delay", type=int, default=50, help="플레이어 onReady까지 시간 (ms)")
+    parser.add_argument("--buffer-delay", type=int, default=100, help="재생 요청 후 PLAYING까지 시간 (ms)")
+    parser.add_argument("--duration", type=float, default=60, help="가짜 영상 길이 (초)")
+    parser.add_argument("--missing", nargs="*", default=[], metavar="ID", help="없는 영상으로 응답할 ID")
+    parser.add_argument("--embed-disabled", nargs="*", default=[], metavar="ID", help="퍼가기 금지로 응답할 ID")
+    parser.add_argument("--seed", type=int, help="지연/오류 난수 시드 (재현용)")
+    args = parser.parse_args(argv)
+
+    standin = YouTubeStandin(
+        args.host, args.port, args.latency, args.jitter, args.bandwidth * 1024,
+        args.error_rate, args.error_status, args.thumbnail_size, args.ready_delay,
+        args.buffer_delay, args.duration, args.missing, args.embed_disabled, args.seed
+    )
+    standin.start()
+    logger.info(f"앱에서 사용: {youtube.BASE_ENV}={standin.base_url}")
+
+    try:
+        standin.thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())